@@ -59,6 +59,10 @@ def _execute_domain_ddl(conn, domain_name: str) -> None:
     )
     conn.execute(sa.text(create_table_sql))
 
+    # 1b. Create DEFAULT partition for month-partitioned tables (no-op otherwise)
+    for partition_sql in ddl_generator.generate_partitions_ddl(domain_name):
+        conn.execute(sa.text(partition_sql))
+
     # 2. Create Indexes
     index_sqls = ddl_generator.generate_indexes_ddl(domain_name)
     for index_sql in index_sqls:
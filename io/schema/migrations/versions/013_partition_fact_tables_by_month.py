@@ -0,0 +1,209 @@
+"""Range-partition domain fact tables by 月度.
+
+Refreshing a month of business.规模明细 / business.收入明细 used to DELETE
+and re-INSERT the month, leaving dead tuples behind for VACUUM. With one
+partition per month the loader (``refresh_strategy="partition_swap"``)
+builds the new month in a detached table and swaps it in with
+``ATTACH PARTITION``.
+
+This migration converts every registry domain with a ``partition_column``
+that still has a plain table:
+1. Rename the existing table (and its indexes) out of the way
+2. Create the partitioned table, DEFAULT partition and one partition per
+   month present in the data, using the DDL Generator
+3. Copy rows (keeping ids), reset the identity sequence
+4. Recreate indexes and the updated_at trigger, drop the old table
+
+Revision ID: 20261016_000013
+Revises: 20260228_000012
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_000013"
+down_revision = "20260228_000012"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(conn, table_name: str, schema: str) -> bool:
+    """Check if a table exists in the given schema."""
+    result = conn.execute(
+        sa.text(
+            """
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_schema = :schema AND table_name = :table
+        )
+        """
+        ),
+        {"schema": schema, "table": table_name},
+    )
+    return result.scalar()
+
+
+def _is_partitioned(conn, table_name: str, schema: str) -> bool:
+    """Check if a table is a partitioned (parent) table."""
+    result = conn.execute(
+        sa.text(
+            """
+            SELECT EXISTS (
+                SELECT 1
+                FROM pg_partitioned_table p
+                JOIN pg_class c ON c.oid = p.partrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = :schema AND c.relname = :table
+            )
+            """
+        ),
+        {"schema": schema, "table": table_name},
+    )
+    return bool(result.scalar())
+
+
+def _columns(conn, table_name: str, schema: str) -> list[str]:
+    """Column names of a table in ordinal order."""
+    result = conn.execute(
+        sa.text(
+            """
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_schema = :schema AND table_name = :table
+            ORDER BY ordinal_position
+            """
+        ),
+        {"schema": schema, "table": table_name},
+    )
+    return [row[0] for row in result]
+
+
+def _move_aside(conn, schema: str, table: str, new_name: str) -> None:
+    """Rename a table and its indexes so their names can be reused."""
+    indexes = conn.execute(
+        sa.text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE schemaname = :schema AND tablename = :table ORDER BY indexname"
+        ),
+        {"schema": schema, "table": table},
+    ).fetchall()
+    for position, (index_name,) in enumerate(indexes):
+        conn.execute(
+            sa.text(
+                f'ALTER INDEX {schema}."{index_name}" '
+                f'RENAME TO "{new_name}_i{position}"'
+            )
+        )
+    conn.execute(sa.text(f'ALTER TABLE {schema}."{table}" RENAME TO "{new_name}"'))
+
+
+def _copy_rows(conn, schema: str, source: str, target: str) -> None:
+    """Copy shared columns keeping identity values, then reset the sequence."""
+    target_columns = set(_columns(conn, target, schema))
+    shared = [c for c in _columns(conn, source, schema) if c in target_columns]
+    col_list = ", ".join(f'"{c}"' for c in shared)
+    conn.execute(
+        sa.text(
+            f'INSERT INTO {schema}."{target}" ({col_list}) OVERRIDING SYSTEM VALUE '
+            f'SELECT {col_list} FROM {schema}."{source}"'
+        )
+    )
+    if "id" in shared:
+        conn.execute(
+            sa.text(
+                f"SELECT setval(pg_get_serial_sequence('{schema}.\"{target}\"', 'id'), "
+                f'COALESCE((SELECT MAX(id) FROM {schema}."{target}"), 0) + 1, false)'
+            )
+        )
+
+
+def _partition_domain(conn, domain_name: str) -> None:
+    """Convert one domain table to monthly range partitions."""
+    from work_data_hub.infrastructure.schema import ddl_generator, get_domain
+
+    schema = get_domain(domain_name)
+    table, pg_schema = schema.pg_table, schema.pg_schema
+    if not _table_exists(conn, table, pg_schema) or _is_partitioned(
+        conn, table, pg_schema
+    ):
+        return
+
+    legacy = f"{table}_legacy"
+    _move_aside(conn, pg_schema, table, legacy)
+
+    conn.execute(sa.text(ddl_generator.generate_create_table_ddl(domain_name)))
+    for partition_sql in ddl_generator.generate_partitions_ddl(domain_name):
+        conn.execute(sa.text(partition_sql))
+    months = conn.execute(
+        sa.text(
+            f"SELECT DISTINCT date_trunc('month', \"{schema.partition_column}\")::date "
+            f'FROM {pg_schema}."{legacy}" '
+            f'WHERE "{schema.partition_column}" IS NOT NULL'
+        )
+    ).fetchall()
+    for (month,) in months:
+        conn.execute(
+            sa.text(ddl_generator.generate_month_partition_ddl(domain_name, month))
+        )
+
+    _copy_rows(conn, pg_schema, legacy, table)
+
+    for index_sql in ddl_generator.generate_indexes_ddl(domain_name):
+        conn.execute(sa.text(index_sql))
+    for trigger_sql in ddl_generator.generate_triggers_ddl(domain_name):
+        conn.execute(sa.text(trigger_sql))
+    conn.execute(sa.text(f'DROP TABLE {pg_schema}."{legacy}"'))
+
+
+def _unpartition_domain(conn, domain_name: str) -> None:
+    """Convert one partitioned domain table back to a plain table."""
+    from work_data_hub.infrastructure.schema import ddl_generator, get_domain
+
+    schema = get_domain(domain_name)
+    table, pg_schema = schema.pg_table, schema.pg_schema
+    if not _is_partitioned(conn, table, pg_schema):
+        return
+
+    plain = f"{table}_plain"
+    conn.execute(
+        sa.text(
+            f'CREATE TABLE {pg_schema}."{plain}" (LIKE {pg_schema}."{table}" '
+            f"INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING GENERATED)"
+        )
+    )
+    conn.execute(sa.text(f'ALTER TABLE {pg_schema}."{plain}" ADD PRIMARY KEY (id)'))
+    _copy_rows(conn, pg_schema, table, plain)
+    conn.execute(sa.text(f'DROP TABLE {pg_schema}."{table}" CASCADE'))
+    conn.execute(sa.text(f'ALTER TABLE {pg_schema}."{plain}" RENAME TO "{table}"'))
+
+    for index_sql in ddl_generator.generate_indexes_ddl(domain_name):
+        conn.execute(sa.text(index_sql))
+    for trigger_sql in ddl_generator.generate_triggers_ddl(domain_name):
+        conn.execute(sa.text(trigger_sql))
+
+
+def _partitioned_domains() -> list[str]:
+    from work_data_hub.infrastructure.schema import get_domain, list_domains
+
+    return [name for name in list_domains() if get_domain(name).partition_column]
+
+
+def upgrade() -> None:
+    """Partition registry fact tables by month."""
+    conn = op.get_bind()
+    for domain_name in _partitioned_domains():
+        _partition_domain(conn, domain_name)
+
+
+def downgrade() -> None:
+    """Merge month partitions back into plain tables.
+
+    The primary key returns to (id); indexes and triggers are recreated
+    from the Domain Registry.
+    """
+    conn = op.get_bind()
+    for domain_name in _partitioned_domains():
+        _unpartition_domain(conn, domain_name)
@@ -0,0 +1,197 @@
+"""
+Pipeline Copy Mode Benchmark Script
+
+Compares ``domain.pipelines.core.Pipeline`` execution with the default
+``copy_mode="defensive"`` against ``copy_mode="zero_copy"`` on a synthetic
+annuity-sized month. Each mode runs in a fresh interpreter so that peak RSS
+is not polluted by the other run.
+
+Reported per mode:
+- wall time of ``Pipeline.run``
+- peak RSS of the process (platform high-water mark)
+- peak traced allocations (tracemalloc, includes numpy buffers)
+
+Usage:
+    PYTHONPATH=src uv run scripts/performance/pipeline_copy_mode_benchmark.py
+    PYTHONPATH=src uv run scripts/performance/pipeline_copy_mode_benchmark.py \
+        --rows 300000 --steps 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from work_data_hub.domain.pipelines.core import Pipeline
+from work_data_hub.domain.pipelines.pipeline_config import PipelineConfig, StepConfig
+from work_data_hub.domain.pipelines.types import DataFrameStep, PipelineContext
+
+MODES = ("defensive", "zero_copy")
+
+
+class ScaleColumnStep(DataFrameStep):
+    """Pure step: returns a new frame with one rescaled amount column."""
+
+    mutates_input = False
+
+    def __init__(self, index: int):
+        self._name = f"scale_{index}"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def execute(
+        self, dataframe: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        return dataframe.assign(期末资产规模=dataframe["期末资产规模"] * 1.0001)
+
+
+class FlagColumnStep(DataFrameStep):
+    """Mutating step: writes a flag column in place (copied by the executor)."""
+
+    def __init__(self):
+        self._name = "flag_positive"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def execute(
+        self, dataframe: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        dataframe["is_positive"] = dataframe["期末资产规模"] > 0
+        return dataframe
+
+
+def _build_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    frame = pd.DataFrame(
+        {
+            "月度": np.full(rows, "2025-10-01"),
+            "计划代码": rng.integers(0, 5_000, rows).astype(str),
+            "客户名称": rng.integers(0, 50_000, rows).astype(str),
+            "业务类型": rng.choice(["企年受托", "企年投资", "职年受托"], rows),
+        }
+    )
+    for column in ("期初资产规模", "期末资产规模", "供款", "流失", "待遇支付"):
+        frame[column] = rng.normal(1_000_000, 250_000, rows)
+    return frame
+
+
+def _build_pipeline(mode: str, steps: int) -> Pipeline:
+    transform_steps: List[DataFrameStep] = [
+        ScaleColumnStep(index) for index in range(steps - 1)
+    ]
+    transform_steps.append(FlagColumnStep())
+    config = PipelineConfig(
+        name=f"copy_mode_benchmark_{mode}",
+        steps=[
+            StepConfig(name=step.name, import_path=f"benchmark.{step.name}")
+            for step in transform_steps
+        ],
+        copy_mode=mode,
+    )
+    return Pipeline(steps=transform_steps, config=config)
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        import resource
+
+        # Linux reports KiB, macOS reports bytes
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    except ImportError:
+        import psutil
+
+        return int(getattr(psutil.Process().memory_info(), "peak_wset", 0))
+
+
+def run_single(mode: str, rows: int, steps: int) -> Dict[str, Any]:
+    """Run one mode in the current process and return its measurements."""
+    frame = _build_frame(rows)
+    pipeline = _build_pipeline(mode, steps)
+    rss_before = _peak_rss_bytes()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = pipeline.run(frame)
+    wall_seconds = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "mode": mode,
+        "rows": len(result.output_data),
+        "steps": steps,
+        "wall_seconds": round(wall_seconds, 4),
+        "peak_rss_mb": round(_peak_rss_bytes() / (1024 * 1024), 1),
+        "peak_rss_growth_mb": round(
+            (_peak_rss_bytes() - rss_before) / (1024 * 1024), 1
+        ),
+        "traced_peak_mb": round(traced_peak / (1024 * 1024), 1),
+    }
+
+
+def compare(rows: int, steps: int) -> List[Dict[str, Any]]:
+    """Run every mode in its own subprocess and collect the measurements."""
+    results = []
+    for mode in MODES:
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--mode",
+                mode,
+                "--rows",
+                str(rows),
+                "--steps",
+                str(steps),
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--steps", type=int, default=6)
+    parser.add_argument("--mode", choices=MODES, help="Run a single mode only")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_single(args.mode, args.rows, args.steps)))
+        return
+
+    results = compare(args.rows, args.steps)
+    baseline = results[0]
+    print(f"rows={args.rows} steps={args.steps}")
+    print(f"{'mode':<10} {'wall_s':>8} {'peak_rss_mb':>12} {'traced_mb':>10}")
+    for item in results:
+        print(
+            f"{item['mode']:<10} {item['wall_seconds']:>8} "
+            f"{item['peak_rss_mb']:>12} {item['traced_peak_mb']:>10}"
+        )
+    candidate = results[-1]
+    speedup = baseline["wall_seconds"] / max(candidate["wall_seconds"], 1e-9)
+    saved_mb = baseline["traced_peak_mb"] - candidate["traced_peak_mb"]
+    print(
+        f"zero_copy vs defensive: wall x{speedup:.2f}, traced peak -{saved_mb:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
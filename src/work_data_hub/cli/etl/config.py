@@ -79,10 +79,12 @@ def build_run_config(args: argparse.Namespace, domain: str) -> Dict[str, Any]:
 
             # Try to get pk from output config (may not exist in all configs)
             pk = getattr(domain_cfg.output, "pk", [])
+            load_method = getattr(domain_cfg.output, "load_method", "values")
         else:
             # Fallback for legacy domains without output config
             table = f'"{domain}"'
             pk = []
+            load_method = "values"
 
         # Runtime override via --pk (only affects delete_insert mode)
         pk_override = _parse_pk_override(getattr(args, "pk", None))
@@ -93,10 +95,12 @@ def build_run_config(args: argparse.Namespace, domain: str) -> Dict[str, Any]:
         print(f"Warning: Could not load domain config for {domain}: {e}")
         table = f'"{domain}"'
         pk = []
+        load_method = "values"
     except Exception as e:
         print(f"Warning: Unexpected error loading config for {domain}: {e}")
         table = f'"{domain}"'
         pk = []
+        load_method = "values"
 
     # Build discover_files_op config with optional period and selection strategy
     discover_config: Dict[str, Any] = {"domain": domain}
@@ -108,6 +112,8 @@ def build_run_config(args: argparse.Namespace, domain: str) -> Dict[str, Any]:
     # Sprint Change Proposal 2026-01-08: Direct file processing
     if hasattr(args, "file") and args.file:
         discover_config["file_path"] = args.file
+    if getattr(args, "no_read_cache", False):
+        discover_config["use_read_cache"] = False
 
     # Story 7.5-5: Extract session_id for unified failure logging
     session_id = getattr(args, "session_id", None)
@@ -120,6 +126,7 @@ def build_run_config(args: argparse.Namespace, domain: str) -> Dict[str, Any]:
                     "table": table,
                     "mode": args.mode,
                     "pk": pk,
+                    "load_method": load_method,
                     "plan_only": effective_plan_only,
                     "skip": getattr(args, "skip_facts", False),
                     # session_id only used by processing ops, not LoadConfig
@@ -182,6 +189,8 @@ def build_run_config(args: argparse.Namespace, domain: str) -> Dict[str, Any]:
         sample_value = getattr(args, "sample", None)
         if sample_value:
             read_data_config["sample"] = sample_value
+        if getattr(args, "no_read_cache", False):
+            read_data_config["use_read_cache"] = False
         run_config["ops"]["read_data_op"] = {"config": read_data_config}
 
     # Phase 4 Enhancement: Always pass domain to backfill op
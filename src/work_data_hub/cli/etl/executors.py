@@ -6,6 +6,7 @@ Story 7.5-4: Rich Terminal UX Enhancement - Console abstraction integration.
 """
 
 import argparse
+from contextlib import nullcontext
 
 from .config import build_run_config
 from .console import get_console
@@ -294,14 +295,32 @@ def _execute_single_domain(args: argparse.Namespace, domain: str) -> int:  # noq
 
         instance = DagsterInstance.ephemeral() if debug_mode else None
 
+        from work_data_hub.infrastructure.transforms.profiling import (
+            profile_pipelines,
+        )
+
+        profiling = (
+            profile_pipelines(capture_step=getattr(args, "profile_step", None))
+            if getattr(args, "profile", False)
+            else nullcontext()
+        )
+
         # Story 7.5-4 AC-2: Live status display during job execution
-        with console.status(f"[bold green]Processing {domain}..."):
+        with (
+            profiling as profile_report,
+            console.status(f"[bold green]Processing {domain}..."),
+        ):
             result = selected_job.execute_in_process(
                 run_config=run_config,
                 instance=instance,
                 raise_on_error=args.raise_on_error,
             )
 
+        if profile_report is not None:
+            console.print(f"\n📈 Pipeline Profile ({domain}):")
+            # Plain print keeps the JSON machine-readable (no Rich markup)
+            print(profile_report.to_json())
+
         # Report results
         if result.success:
             console.print("✅ Job completed successfully")
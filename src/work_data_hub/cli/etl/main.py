@@ -243,6 +243,16 @@ def main(argv: Optional[List[str]] = None) -> int:  # noqa: PLR0911, PLR0912, PL
         ),
     )
 
+    parser.add_argument(
+        "--no-read-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Always re-parse Excel files instead of using the parsed-sheet cache "
+            "(cache is opt-in via WDH_READ_CACHE_ENABLED / WDH_READ_CACHE_DIR)"
+        ),
+    )
+
     # Advanced options
     parser.add_argument(
         "--debug",
@@ -274,6 +284,22 @@ def main(argv: Optional[List[str]] = None) -> int:  # noqa: PLR0911, PLR0912, PL
         help="Disable automatic EQC token refresh at startup",
     )
 
+    # Per-step transform pipeline profiling
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help=(
+            "Profile transform pipeline steps (wall/CPU time, rows, memory) "
+            "and print a JSON report after each domain"
+        ),
+    )
+    parser.add_argument(
+        "--profile-step",
+        default=None,
+        help="Step name to capture with cProfile (requires --profile)",
+    )
+
     # Story 6.2-P16 AC-2: Database connection diagnostics
     parser.add_argument(
         "--check-db",
@@ -317,6 +343,9 @@ def main(argv: Optional[List[str]] = None) -> int:  # noqa: PLR0911, PLR0912, PL
         if not Path(file_path).exists():
             parser.error(f"File not found: {file_path}")
 
+    if getattr(args, "profile_step", None) and not getattr(args, "profile", False):
+        parser.error("--profile-step requires --profile")
+
     # Validate domain arguments
     if not args.domains and not args.all_domains:
         parser.error("Either --domains or --all-domains must be specified")
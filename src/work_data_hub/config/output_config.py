@@ -108,3 +108,32 @@ def get_domain_output_config(
         raise ValueError(
             f"Failed to load configuration for domain '{domain_name}': {e}"
         )
+
+
+def get_domain_refresh_strategy(
+    domain_name: str,
+    config_path: str = "config/data_sources.yml",
+) -> str:
+    """
+    Get the refresh strategy (output.refresh_strategy) for a domain.
+
+    Args:
+        domain_name: Domain identifier (e.g., "annuity_performance")
+        config_path: Path to data_sources.yml file (default: "config/data_sources.yml")
+
+    Returns:
+        "delete" or "partition_swap"; "delete" when the domain or its output
+        configuration is missing
+    """
+    try:
+        domain_config = get_domain_config_v2(domain_name, config_path)
+    except DataSourcesValidationError as e:
+        logger.debug(
+            "output.config.refresh_strategy_default",
+            domain=domain_name,
+            error=str(e),
+        )
+        return "delete"
+    if domain_config.output is None:
+        return "delete"
+    return domain_config.output.refresh_strategy
@@ -176,6 +176,32 @@ class Settings(BaseSettings):
         default=4, description="Maximum number of concurrent processing workers"
     )
 
+    excel_reader_engine: Literal["auto", "openpyxl", "calamine", "pandas"] = Field(
+        default="auto",
+        description=(
+            "Workbook engine for ExcelReader.read_sheet "
+            "(auto = calamine when python-calamine is installed)"
+        ),
+    )
+
+    # Parsed-sheet cache (io/readers/read_cache.py)
+    read_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Cache parsed Excel sheets on disk keyed by workbook content hash "
+            "(when enabled, bypass per run with `etl --no-read-cache`)"
+        ),
+    )
+    read_cache_dir: str = Field(
+        default=".cache/parsed_sheets",
+        description="Directory for the parsed-sheet cache",
+    )
+    read_cache_max_mb: int = Field(
+        default=1024,
+        ge=1,
+        description="Size bound (MB) of the parsed-sheet cache, LRU evicted",
+    )
+
     # Development settings
     dev_sample_size: Optional[int] = Field(
         default=None,
@@ -225,6 +251,15 @@ class Settings(BaseSettings):
         default=3, description="Maximum retry attempts for EQC API requests"
     )
 
+    eqc_sync_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Concurrent EQC lookups during company ID resolution "
+            "(all requests share the eqc_rate_limit window)"
+        ),
+    )
+
     eqc_base_url: str = Field(
         default="https://eqc.pingan.com", description="EQC API base URL"
     )
@@ -293,6 +328,29 @@ class Settings(BaseSettings):
         description="Use shared pipeline framework for annuity performance processing",
     )
 
+    # Local enrichment_index snapshot (infrastructure/enrichment/index_snapshot.py)
+    enrichment_snapshot_enabled: bool = Field(
+        default=False,
+        description=(
+            "Serve enrichment_index lookups from a local memory-mapped snapshot "
+            "and query Postgres only for misses"
+        ),
+    )
+    enrichment_snapshot_path: str = Field(
+        default=".cache/enrichment_index.arrow",
+        description="File holding the enrichment_index snapshot",
+    )
+    enrichment_snapshot_max_staleness_seconds: int = Field(
+        default=900,
+        ge=0,
+        description="Incrementally refresh the snapshot when older than this",
+    )
+    enrichment_snapshot_full_refresh_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Rebuild the snapshot from a full dump after this many hours",
+    )
+
     # Story 6.2.4: Reference Sync Configuration
     reference_sync_enabled: bool = Field(
         default=True,
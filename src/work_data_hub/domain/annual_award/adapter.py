@@ -84,9 +84,7 @@ class AnnualAwardService:
 
             # Build EQC config from context
             eqc_config = (
-                context.eqc_config
-                if context.eqc_config
-                else EqcLookupConfig.disabled()
+                context.eqc_config if context.eqc_config else EqcLookupConfig.disabled()
             )
 
             # Build and execute pipeline
@@ -109,7 +107,7 @@ class AnnualAwardService:
             result_df = pipeline.execute(df, pipeline_context)
 
             # Convert to models
-            records, failed_count = convert_dataframe_to_models(result_df)
+            records, failed_df = convert_dataframe_to_models(result_df)
 
             elapsed_ms = (time.perf_counter() - start) * 1000
 
@@ -117,7 +115,7 @@ class AnnualAwardService:
                 records=records,
                 total_input=len(rows),
                 total_output=len(records),
-                failed_count=failed_count,
+                failed_count=len(failed_df),
                 processing_time_ms=elapsed_ms,
             )
 
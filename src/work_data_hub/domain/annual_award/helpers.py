@@ -11,12 +11,14 @@ from typing import Any, List, Optional, Protocol, Tuple
 
 import pandas as pd
 import structlog
-from pydantic import ValidationError
 
 from work_data_hub.domain.annual_award.models import AnnualAwardOut
 from work_data_hub.domain.pipelines.types import ErrorContext
 from work_data_hub.infrastructure.helpers import normalize_month
-from work_data_hub.infrastructure.validation import export_error_csv
+from work_data_hub.infrastructure.validation import (
+    export_error_csv,
+    validate_model_batch,
+)
 from work_data_hub.utils.date_parser import parse_chinese_date
 
 logger = logging.getLogger(__name__)
@@ -112,46 +114,20 @@ def map_branch_code(df: pd.DataFrame) -> pd.DataFrame:
 
 def convert_dataframe_to_models(
     df: pd.DataFrame,
-) -> Tuple[List[AnnualAwardOut], int]:
+) -> Tuple[List[AnnualAwardOut], pd.DataFrame]:
     """Convert DataFrame rows to AnnualAwardOut models.
 
     Returns:
-        Tuple of (list of valid records, count of failed records)
+        Tuple of (list of valid records, failed rows with an ``error`` column)
     """
-    records: List[AnnualAwardOut] = []
-    failed_count = 0
-    allowed_fields = set(AnnualAwardOut.model_fields.keys())
-
-    for idx, row in df.iterrows():
-        try:
-            row_dict = {
-                key: (None if pd.isna(val) else val)
-                for key, val in row.to_dict().items()
-            }
-            row_dict = {k: v for k, v in row_dict.items() if k in allowed_fields}
-
-            # Required fields check
-            if not row_dict.get("上报月份") or not row_dict.get("业务类型"):
-                failed_count += 1
-                continue
-            if not row_dict.get("上报客户名称"):
-                failed_count += 1
-                continue
-
-            record = AnnualAwardOut(**row_dict)
-            records.append(record)
-        except ValidationError as exc:
-            event_logger.bind(domain="annual_award", step="convert_to_models").debug(
-                "Row validation failed", row_index=idx, error=str(exc)
-            )
-            failed_count += 1
-        except Exception as exc:
-            event_logger.bind(domain="annual_award", step="convert_to_models").warning(
-                "Row unexpected error", row_index=idx, error=str(exc)
-            )
-            failed_count += 1
-
-    return records, failed_count
+    batch = validate_model_batch(
+        df, AnnualAwardOut, required=["上报月份", "业务类型", "上报客户名称"]
+    )
+    if not batch.failed.empty:
+        event_logger.bind(domain="annual_award", step="convert_to_models").debug(
+            "Rows failed validation", failed=len(batch.failed)
+        )
+    return batch.records, batch.failed
 
 
 def export_failed_records_csv(
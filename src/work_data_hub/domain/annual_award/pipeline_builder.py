@@ -30,7 +30,7 @@ from work_data_hub.infrastructure.transforms import (
     Pipeline,
     TransformStep,  # Story 7.4-6: Shared helper for plan code defaults
 )
-from work_data_hub.utils.date_parser import parse_chinese_date
+from work_data_hub.utils.date_parser import parse_chinese_date_series
 
 from .constants import (
     BUSINESS_TYPE_CODE_MAPPING,
@@ -53,14 +53,14 @@ def _clean_customer_name_column(df: pd.DataFrame) -> pd.Series:
 
     Implements requirement #3: Generate cleaned 客户名称 from 上报客户名称.
     """
-    from work_data_hub.infrastructure.cleansing import normalize_customer_name
+    from work_data_hub.infrastructure.cleansing import normalize_customer_names
 
     if "上报客户名称" not in df.columns:
         return pd.Series([None] * len(df), index=df.index)
 
-    return df["上报客户名称"].apply(
-        lambda x: normalize_customer_name(x) if isinstance(x, str) and x else None
-    )
+    raw = df["上报客户名称"]
+    has_name = raw.map(lambda x: isinstance(x, str) and bool(x))
+    return normalize_customer_names(raw).where(has_name, None)
 
 
 def _apply_business_type_normalization(df: pd.DataFrame) -> pd.Series:
@@ -425,7 +425,7 @@ def build_bronze_to_silver_pipeline(
         # Step 5: Date parsing for 上报月份
         CalculationStep(
             {
-                "上报月份": lambda df: df["上报月份"].apply(parse_chinese_date)
+                "上报月份": lambda df: parse_chinese_date_series(df["上报月份"])
                 if "上报月份" in df.columns
                 else df.get("上报月份"),
             }
@@ -433,9 +433,7 @@ def build_bronze_to_silver_pipeline(
         # Step 6: Date parsing for 中标日期
         CalculationStep(
             {
-                "中标日期": lambda df: df["中标日期"].apply(
-                    lambda x: parse_chinese_date(x) if x and str(x).strip() else None
-                )
+                "中标日期": lambda df: parse_chinese_date_series(df["中标日期"])
                 if "中标日期" in df.columns
                 else pd.Series([None] * len(df), index=df.index),
             }
@@ -107,7 +107,7 @@ class AnnualLossService:
             result_df = pipeline.execute(df, pipeline_context)
 
             # Convert to models
-            records, failed_count = convert_dataframe_to_models(result_df)
+            records, failed_df = convert_dataframe_to_models(result_df)
 
             elapsed_ms = (time.perf_counter() - start) * 1000
 
@@ -115,7 +115,7 @@ class AnnualLossService:
                 records=records,
                 total_input=len(rows),
                 total_output=len(records),
-                failed_count=failed_count,
+                failed_count=len(failed_df),
                 processing_time_ms=elapsed_ms,
             )
 
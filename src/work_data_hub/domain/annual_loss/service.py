@@ -248,15 +248,14 @@ def _process_source_sheet(
     result_df, _ = validate_gold_dataframe(result_df)
 
     # Convert to models
-    records, failed_count = convert_dataframe_to_models(result_df)
+    records, failed_df = convert_dataframe_to_models(result_df)
+    failed_count = len(failed_df)
 
     processing_time_ms = int((time.perf_counter() - start_time) * 1000)
 
-    # Export failed records if any
+    # Export the rows that failed validation, with their error
     if failed_count > 0:
-        failed_df = df.iloc[len(records) :]  # Simple approximation
-        if not failed_df.empty:
-            export_failed_records_csv(failed_df, f"{sheet_type}_{month}")
+        export_failed_records_csv(failed_df, f"{sheet_type}_{month}")
 
     return AnnualLossProcessingResult(
         records=records,
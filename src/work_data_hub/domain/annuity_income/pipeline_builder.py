@@ -24,7 +24,7 @@ from work_data_hub.infrastructure.transforms import (
     apply_plan_code_defaults,
     apply_portfolio_code_defaults,
 )
-from work_data_hub.utils.date_parser import parse_chinese_date
+from work_data_hub.utils.date_parser import parse_chinese_date_series
 
 from .constants import (
     BUSINESS_TYPE_CODE_MAPPING,
@@ -192,7 +192,7 @@ def build_bronze_to_silver_pipeline(
     1. MappingStep: Column rename (机构 → 机构代码, 计划号 → 计划代码)
     2. CalculationStep: Plan code normalization (计划代码 → uppercase)
     3. CalculationStep: 机构代码 from 机构名称 via COMPANY_BRANCH_MAPPING
-    4. CalculationStep: Date parsing for 月度 (parse_chinese_date)
+    4. CalculationStep: Date parsing for 月度 (parse_chinese_date_series)
     5. CalculationStep: 机构代码 default to 'G00' (replace 'null' string + fillna)
     6. CalculationStep: Customer/income defaults (客户名称 from 计划名称,
        income nulls → 0) - Story 7.5-2
@@ -231,7 +231,7 @@ def build_bronze_to_silver_pipeline(
         # Step 4: Date parsing (月度: Chinese format → datetime)
         CalculationStep(
             {
-                "月度": lambda df: df["月度"].apply(parse_chinese_date)
+                "月度": lambda df: parse_chinese_date_series(df["月度"])
                 if "月度" in df.columns
                 else df["月度"],
             }
@@ -303,7 +303,7 @@ def build_bronze_to_silver_pipeline(
         DropStep(list(LEGACY_COLUMNS_TO_DELETE)),
     ]
 
-    pipeline = Pipeline(steps)
+    pipeline = Pipeline(steps, dead_columns=LEGACY_COLUMNS_TO_DELETE)
 
     logger.bind(domain="annuity_income", step="build_pipeline").info(
         "Built bronze_to_silver pipeline",
@@ -3,12 +3,15 @@ from __future__ import annotations
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import structlog
 
-from work_data_hub.config import get_domain_output_config
+from work_data_hub.config import (
+    get_domain_output_config,
+    get_domain_refresh_strategy,
+)
 from work_data_hub.config.settings import get_settings  # Story 7.3-6: For DB connection
 from work_data_hub.domain.pipelines.types import DomainPipelineResult, PipelineContext
 from work_data_hub.infrastructure.constants import DROP_RATE_THRESHOLD
@@ -20,15 +23,16 @@ from work_data_hub.infrastructure.validation import (
     ErrorType,
     FailedRecord,
     FailureExporter,
+    models_to_dataframe,
 )
 
 from .helpers import (
     FileDiscoveryProtocol,
-    convert_dataframe_to_models,
     export_unknown_names_csv,
     normalize_month,
     run_discovery,
     summarize_enrichment,
+    validate_output_frame,
 )
 from .models import AnnuityIncomeOut, ProcessingResultWithEnrichment
 from .pipeline_builder import (
@@ -85,6 +89,7 @@ def process_annuity_income(
     export_unknown_names: bool = True,
     upsert_keys: Optional[List[str]] = None,
     refresh_keys: Optional[List[str]] = None,
+    refresh_strategy: Optional[str] = None,
     is_validation_mode: bool = True,
 ) -> DomainPipelineResult:
     """
@@ -103,6 +108,8 @@ def process_annuity_income(
         sync_lookup_budget: Maximum synchronous EQC lookups allowed
         export_unknown_names: Whether to export unresolved company names to CSV
         upsert_keys: Columns for upsert operation (default: 月度, 计划代码, company_id)
+        refresh_strategy: "delete" or "partition_swap" for the refresh load
+            (default: output.refresh_strategy in data_sources.yml)
 
     Expected Inputs:
         Bronze DataFrame from discovered Excel file (sheet: 收入明细)
@@ -152,14 +159,14 @@ def process_annuity_income(
         domain=domain,
         month=normalized_month,
     )
-    processing = process_with_enrichment(
+    processing, dataframe = _process_rows(
         discovery_result.df.to_dict(orient="records"),
         data_source=str(discovery_result.file_path),
         enrichment_service=enrichment_service,
         sync_lookup_budget=sync_lookup_budget,
         export_unknown_names=export_unknown_names,
+        session_id=None,
     )
-    dataframe = _records_to_dataframe(processing.records)
 
     # Choose loading mode based on configuration
     if ENABLE_UPSERT_MODE:
@@ -183,6 +190,7 @@ def process_annuity_income(
             table=table_name,
             schema=schema,
             refresh_keys=actual_refresh_keys,
+            refresh_strategy=refresh_strategy or get_domain_refresh_strategy(domain),
         )
     duration_ms = (time.perf_counter() - start_time) * 1000
     rows_failed = max(discovery_result.row_count - len(processing.records), 0)
@@ -254,16 +262,38 @@ def process_with_enrichment(
     Returns:
         ProcessingResultWithEnrichment containing validated records and stats
     """
+    processing, _ = _process_rows(
+        rows,
+        data_source=data_source,
+        enrichment_service=enrichment_service,
+        sync_lookup_budget=sync_lookup_budget,
+        export_unknown_names=export_unknown_names,
+        session_id=session_id,
+    )
+    return processing
+
+
+def _process_rows(
+    rows: List[Dict[str, Any]],
+    *,
+    data_source: str,
+    enrichment_service: Optional["CompanyEnrichmentService"],
+    sync_lookup_budget: int,
+    export_unknown_names: bool,
+    session_id: Optional[str],
+) -> Tuple[ProcessingResultWithEnrichment, pd.DataFrame]:
+    """Run the pipeline; returns the processing result and the load frame."""
     if not rows:
         logger.bind(domain="annuity_income", step="process_with_enrichment").info(
             "No rows provided for processing"
         )
-        return ProcessingResultWithEnrichment(
+        empty = ProcessingResultWithEnrichment(
             records=[],
             data_source=data_source,
             unknown_names_csv=None,
             processing_time_ms=0,
         )
+        return empty, pd.DataFrame()
 
     # Story 7.3-6: Initialize mapping_repository for database cache lookup
     mapping_repository: Optional[CompanyMappingRepository] = None
@@ -319,7 +349,8 @@ def process_with_enrichment(
         # This catches issues that Pydantic row-by-row validation misses
         result_df, _ = validate_gold_dataframe(result_df)
 
-        records, unknown_names = convert_dataframe_to_models(result_df)
+        batch, unknown_names = validate_output_frame(result_df)
+        records = batch.records
 
         dropped_count = len(rows) - len(records)
         if dropped_count > 0:
@@ -381,13 +412,14 @@ def process_with_enrichment(
             processing_time_ms=processing_time_ms,
         )
 
-        return ProcessingResultWithEnrichment(
+        processing = ProcessingResultWithEnrichment(
             records=records,
             enrichment_stats=enrichment_stats,
             unknown_names_csv=csv_path,
             data_source=data_source,
             processing_time_ms=processing_time_ms,
         )
+        return processing, batch.valid
     finally:
         # Story 7.3-6: ALWAYS cleanup connection
         if repo_connection is not None:
@@ -400,11 +432,5 @@ def process_with_enrichment(
 
 def _records_to_dataframe(records: List[AnnuityIncomeOut]) -> pd.DataFrame:
     """Convert list of AnnuityIncomeOut models to DataFrame for warehouse loading."""
-    if not records:
-        return pd.DataFrame()
-
-    df = pd.DataFrame(
-        [r.model_dump(mode="json", by_alias=True, exclude_none=True) for r in records]
-    )
     # Now 计划代码 is the standard column name (no need for legacy conversion)
-    return df
+    return models_to_dataframe(records, AnnuityIncomeOut)
@@ -5,7 +5,6 @@ from typing import Any, List, Optional, Protocol, Tuple
 
 import pandas as pd
 import structlog
-from pydantic import ValidationError
 
 from work_data_hub.domain.annuity_performance.models import (
     AnnuityPerformanceOut,
@@ -15,7 +14,11 @@ from work_data_hub.domain.pipelines.types import ErrorContext
 
 # Shared helper imported from infrastructure (Story 5.5.4 extraction)
 from work_data_hub.infrastructure.helpers import normalize_month
-from work_data_hub.infrastructure.validation import export_error_csv
+from work_data_hub.infrastructure.validation import (
+    ModelBatchResult,
+    export_error_csv,
+    validate_model_batch,
+)
 from work_data_hub.utils.date_parser import (
     parse_chinese_date,
     parse_report_date,
@@ -48,41 +51,40 @@ def run_discovery(
         raise
 
 
-def convert_dataframe_to_models(
+def validate_output_frame(
     df: pd.DataFrame,
-) -> Tuple[List[AnnuityPerformanceOut], List[str]]:
-    records: List[AnnuityPerformanceOut] = []
-    unknown_names: List[str] = []
-    allowed_fields = set(AnnuityPerformanceOut.model_fields.keys())
-
-    for idx, row in df.iterrows():
-        try:
-            row_dict = {
-                key: (None if pd.isna(val) else val)
-                for key, val in row.to_dict().items()
-            }
-            row_dict = {k: v for k, v in row_dict.items() if k in allowed_fields}
-            if not row_dict.get("计划代码") or row_dict.get("月度") is None:
-                continue
-
-            # type ignore: Dynamic dictionary unpacking for Pydantic model
-            record = AnnuityPerformanceOut(**row_dict)  # type: ignore[arg-type]
-            records.append(record)
+) -> Tuple[ModelBatchResult[AnnuityPerformanceOut], List[str]]:
+    """Validate pipeline output against AnnuityPerformanceOut as one batch.
+
+    Returns:
+        Tuple of (batch with the load-ready ``valid`` frame, the ``failed``
+        rows and the records, customer names assigned a temporary company ID)
+    """
+    batch = validate_model_batch(
+        df, AnnuityPerformanceOut, required=["计划代码"], not_null=["月度"]
+    )
+    if not batch.failed.empty:
+        event_logger.bind(domain="annuity_performance", step="convert_to_models").debug(
+            "Rows dropped during validation", failed=len(batch.failed)
+        )
 
+    unknown_names: List[str] = []
+    if "客户名称" in df.columns:
+        customer_names = df["客户名称"].to_numpy()
+        for record, position in zip(batch.records, batch.positions):
             if record.company_id and record.company_id.startswith("IN"):
-                customer_name = row_dict.get("客户名称")
-                if customer_name:
+                customer_name = customer_names[position]
+                if not pd.isna(customer_name) and customer_name:
                     unknown_names.append(str(customer_name))
-        except ValidationError as exc:
-            event_logger.bind(
-                domain="annuity_performance", step="convert_to_models"
-            ).debug("Row validation failed", row_index=idx, error=str(exc))
-        except Exception as exc:  # pragma: no cover - defensive logging
-            event_logger.bind(
-                domain="annuity_performance", step="convert_to_models"
-            ).warning("Row unexpected error", row_index=idx, error=str(exc))
 
-    return records, unknown_names
+    return batch, unknown_names
+
+
+def convert_dataframe_to_models(
+    df: pd.DataFrame,
+) -> Tuple[List[AnnuityPerformanceOut], List[str]]:
+    batch, unknown_names = validate_output_frame(df)
+    return batch.records, unknown_names
 
 
 def export_unknown_names_csv(
@@ -145,5 +147,6 @@ __all__ = [
     "parse_report_period",
     "run_discovery",
     "summarize_enrichment",
+    "validate_output_frame",
     "parse_chinese_date",
 ]
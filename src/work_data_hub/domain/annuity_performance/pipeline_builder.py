@@ -24,7 +24,7 @@ from work_data_hub.infrastructure.transforms import (
     apply_plan_code_defaults,
     apply_portfolio_code_defaults,
 )
-from work_data_hub.utils.date_parser import parse_chinese_date
+from work_data_hub.utils.date_parser import parse_chinese_date_series
 
 from .constants import (
     BUSINESS_TYPE_CODE_MAPPING,
@@ -172,7 +172,7 @@ def build_bronze_to_silver_pipeline(
         # Step 7: Date parsing (月度: 202412 → datetime)
         CalculationStep(
             {
-                "月度": lambda df: df["月度"].apply(parse_chinese_date)
+                "月度": lambda df: parse_chinese_date_series(df["月度"])
                 if "月度" in df.columns
                 else pd.Series([None] * len(df)),
             }
@@ -218,7 +218,7 @@ def build_bronze_to_silver_pipeline(
         DropStep(list(LEGACY_COLUMNS_TO_DELETE)),
     ]
 
-    pipeline = Pipeline(steps)
+    pipeline = Pipeline(steps, dead_columns=LEGACY_COLUMNS_TO_DELETE)
     logger.bind(domain="annuity_performance", step="build_pipeline").info(
         "Built bronze_to_silver pipeline",
         step_count=len(steps),
@@ -3,12 +3,15 @@ from __future__ import annotations
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import structlog
 
-from work_data_hub.config import get_domain_output_config
+from work_data_hub.config import (
+    get_domain_output_config,
+    get_domain_refresh_strategy,
+)
 from work_data_hub.config.settings import get_settings
 from work_data_hub.domain.pipelines.types import DomainPipelineResult, PipelineContext
 from work_data_hub.infrastructure.constants import DROP_RATE_THRESHOLD
@@ -24,13 +27,13 @@ from work_data_hub.infrastructure.validation import (
 from .constants import DEFAULT_REFRESH_KEYS, DEFAULT_UPSERT_KEYS
 from .helpers import (
     FileDiscoveryProtocol,
-    convert_dataframe_to_models,
     export_unknown_names_csv,
     normalize_month,
     run_discovery,
     summarize_enrichment,
+    validate_output_frame,
 )
-from .models import AnnuityPerformanceOut, ProcessingResultWithEnrichment
+from .models import ProcessingResultWithEnrichment
 from .pipeline_builder import (
     build_bronze_to_silver_pipeline,
     load_plan_override_mapping,
@@ -75,6 +78,7 @@ def process_annuity_performance(
     export_unknown_names: bool = True,
     upsert_keys: Optional[List[str]] = None,
     refresh_keys: Optional[List[str]] = None,
+    refresh_strategy: Optional[str] = None,
     is_validation_mode: bool = True,
 ) -> DomainPipelineResult:
     # Load output configuration from data_sources.yml if not explicitly provided
@@ -100,14 +104,15 @@ def process_annuity_performance(
         domain=domain,
         month=normalized_month,
     )
-    processing = process_with_enrichment(
+    processing, dataframe = _process_rows(
         discovery_result.df.to_dict(orient="records"),
         data_source=str(discovery_result.file_path),
+        eqc_config=None,
         enrichment_service=enrichment_service,
         sync_lookup_budget=sync_lookup_budget,
         export_unknown_names=export_unknown_names,
+        session_id=None,
     )
-    dataframe = _records_to_dataframe(processing.records)
 
     # Choose loading mode based on configuration
     if ENABLE_UPSERT_MODE:
@@ -133,6 +138,7 @@ def process_annuity_performance(
             table=table_name,
             schema=schema,
             refresh_keys=actual_refresh_keys,
+            refresh_strategy=refresh_strategy or get_domain_refresh_strategy(domain),
         )
     duration_ms = (time.perf_counter() - start_time) * 1000
     rows_failed = max(discovery_result.row_count - len(processing.records), 0)
@@ -183,16 +189,40 @@ def process_with_enrichment(
     export_unknown_names: bool = True,
     session_id: Optional[str] = None,  # Story 7.5-5: Unified failure logging
 ) -> ProcessingResultWithEnrichment:
+    processing, _ = _process_rows(
+        rows,
+        data_source=data_source,
+        eqc_config=eqc_config,
+        enrichment_service=enrichment_service,
+        sync_lookup_budget=sync_lookup_budget,
+        export_unknown_names=export_unknown_names,
+        session_id=session_id,
+    )
+    return processing
+
+
+def _process_rows(
+    rows: List[Dict[str, Any]],
+    *,
+    data_source: str,
+    eqc_config: Optional["EqcLookupConfig"],
+    enrichment_service: Optional["CompanyEnrichmentService"],
+    sync_lookup_budget: int,
+    export_unknown_names: bool,
+    session_id: Optional[str],
+) -> Tuple[ProcessingResultWithEnrichment, pd.DataFrame]:
+    """Run the pipeline; returns the processing result and the load frame."""
     if not rows:
         logger.bind(domain="annuity_performance", step="process_with_enrichment").info(
             "No rows provided for processing"
         )
-        return ProcessingResultWithEnrichment(
+        empty = ProcessingResultWithEnrichment(
             records=[],
             data_source=data_source,
             unknown_names_csv=None,
             processing_time_ms=0,
         )
+        return empty, pd.DataFrame()
 
     plan_overrides = load_plan_override_mapping()
 
@@ -252,7 +282,8 @@ def process_with_enrichment(
         input_df = pd.DataFrame(rows)
         result_df = pipeline.execute(input_df.copy(), context)
         # Keep all original records - no aggregation for business detail data
-        records, unknown_names = convert_dataframe_to_models(result_df)
+        batch, unknown_names = validate_output_frame(result_df)
+        records = batch.records
     finally:
         if repo_connection is not None:
             try:
@@ -313,23 +344,11 @@ def process_with_enrichment(
         processing_time_ms=processing_time_ms,
     )
 
-    return ProcessingResultWithEnrichment(
+    processing = ProcessingResultWithEnrichment(
         records=records,
         enrichment_stats=enrichment_stats,
         unknown_names_csv=csv_path,
         data_source=data_source,
         processing_time_ms=processing_time_ms,
     )
-
-
-def _records_to_dataframe(records: List[AnnuityPerformanceOut]) -> pd.DataFrame:
-    return (
-        pd.DataFrame(
-            [
-                r.model_dump(mode="json", by_alias=True, exclude_none=True)
-                for r in records
-            ]
-        )
-        if records
-        else pd.DataFrame()
-    )
+    return processing, batch.valid
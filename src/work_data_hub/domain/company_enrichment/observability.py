@@ -10,7 +10,7 @@ Story 6.8: Enrichment Observability and Export
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -29,6 +29,10 @@ class EnrichmentStats:
         sync_budget_used: Number of synchronous lookup budget consumed
         async_queued: Number of requests queued for async processing
         queue_depth_after: Queue depth after pipeline completion
+        worker_throughput: Per-worker queue processing counters
+            (``{"worker": {"processed": n, "seconds": s}}``)
+        queue_drain_eta_seconds: Latest estimate of the time needed to drain
+            the pending queue at the observed throughput
 
     Examples:
         >>> stats = EnrichmentStats(total_lookups=100, cache_hits=85)
@@ -46,6 +50,8 @@ class EnrichmentStats:
     async_queued: int = 0
     queue_depth_after: int = 0
     hit_type_counts: Dict[str, int] = field(default_factory=dict)
+    worker_throughput: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    queue_drain_eta_seconds: Optional[float] = None
 
     @property
     def cache_hit_rate(self) -> float:
@@ -71,6 +77,22 @@ class EnrichmentStats:
             return 0.0
         return self.temp_ids_generated / self.total_lookups
 
+    def worker_rates(self) -> Dict[str, float]:
+        """
+        Requests processed per second of busy time, by worker.
+
+        Returns:
+            Mapping of worker name to throughput (0.0 when no time recorded)
+        """
+        return {
+            worker: (
+                counters["processed"] / counters["seconds"]
+                if counters["seconds"] > 0
+                else 0.0
+            )
+            for worker, counters in self.worker_throughput.items()
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary for JSON logging.
@@ -78,6 +100,7 @@ class EnrichmentStats:
         Returns:
             Dictionary with all metrics including computed rates
         """
+        rates = self.worker_rates()
         return {
             "total_lookups": self.total_lookups,
             "cache_hits": self.cache_hits,
@@ -89,6 +112,19 @@ class EnrichmentStats:
             "async_queued": self.async_queued,
             "queue_depth_after": self.queue_depth_after,
             "hit_type_counts": self.hit_type_counts,
+            "worker_throughput": {
+                worker: {
+                    "processed": int(counters["processed"]),
+                    "seconds": round(counters["seconds"], 3),
+                    "per_second": round(rates[worker], 3),
+                }
+                for worker, counters in self.worker_throughput.items()
+            },
+            "queue_drain_eta_seconds": (
+                None
+                if self.queue_drain_eta_seconds is None
+                else round(self.queue_drain_eta_seconds, 1)
+            ),
             # Compatibility fields for ResolutionStatistics-style breakdowns
             "yaml_hits": self.hit_type_counts,
             "db_cache_hits": self.cache_hits,
@@ -112,6 +148,12 @@ class EnrichmentStats:
         for k, v in other.hit_type_counts.items():
             merged_counts[k] = merged_counts.get(k, 0) + v
 
+        merged_workers = _copy_worker_throughput(self.worker_throughput)
+        for worker, counters in other.worker_throughput.items():
+            target = merged_workers.setdefault(worker, {"processed": 0, "seconds": 0.0})
+            target["processed"] += counters["processed"]
+            target["seconds"] += counters["seconds"]
+
         return EnrichmentStats(
             total_lookups=self.total_lookups + other.total_lookups,
             cache_hits=self.cache_hits + other.cache_hits,
@@ -121,9 +163,17 @@ class EnrichmentStats:
             async_queued=self.async_queued + other.async_queued,
             queue_depth_after=other.queue_depth_after,  # Take latest
             hit_type_counts=merged_counts,
+            worker_throughput=merged_workers,
+            queue_drain_eta_seconds=other.queue_drain_eta_seconds,  # Take latest
         )
 
 
+def _copy_worker_throughput(
+    worker_throughput: Dict[str, Dict[str, float]],
+) -> Dict[str, Dict[str, float]]:
+    return {worker: dict(counters) for worker, counters in worker_throughput.items()}
+
+
 @dataclass
 class UnknownCompanyRecord:
     """
@@ -245,6 +295,34 @@ class EnrichmentObserver:
         with self._lock:
             self._stats.queue_depth_after = depth
 
+    def record_worker_throughput(
+        self, worker: str, processed: int = 1, seconds: float = 0.0
+    ) -> None:
+        """
+        Record queue requests handled by one worker and the time spent.
+
+        Args:
+            worker: Worker name (e.g. thread name)
+            processed: Number of requests handled
+            seconds: Busy time spent on them
+        """
+        with self._lock:
+            counters = self._stats.worker_throughput.setdefault(
+                worker, {"processed": 0, "seconds": 0.0}
+            )
+            counters["processed"] += processed
+            counters["seconds"] += seconds
+
+    def set_queue_drain_eta(self, seconds: Optional[float]) -> None:
+        """
+        Set the estimated time to drain the pending queue.
+
+        Args:
+            seconds: Estimated seconds remaining (None when unknown)
+        """
+        with self._lock:
+            self._stats.queue_drain_eta_seconds = seconds
+
     def get_stats(self) -> EnrichmentStats:
         """
         Get current enrichment statistics.
@@ -262,6 +340,10 @@ class EnrichmentObserver:
                 async_queued=self._stats.async_queued,
                 queue_depth_after=self._stats.queue_depth_after,
                 hit_type_counts=self._stats.hit_type_counts.copy(),
+                worker_throughput=_copy_worker_throughput(
+                    self._stats.worker_throughput
+                ),
+                queue_drain_eta_seconds=self._stats.queue_drain_eta_seconds,
             )
 
     def get_unknown_companies(self) -> List[UnknownCompanyRecord]:
@@ -0,0 +1,316 @@
+"""
+Worker-pool draining of the EQC lookup queue.
+
+``CompanyEnrichmentService.process_lookup_queue(workers > 1)`` hands each
+dequeued batch to ``ConcurrentQueueDrainer``: only the EQC calls run on the
+thread pool, while cache writes and the status update stay on the calling
+thread because they share the (not thread-safe) psycopg2 connection. The
+status update for a whole batch is one ``mark_request_batch`` statement.
+
+Several processes may also drain the same queue: ``LookupQueue.dequeue``
+claims rows with ``FOR UPDATE SKIP LOCKED``, so each batch goes to exactly
+one process.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .lookup_queue import (
+    MAX_RETRY_ATTEMPTS,
+    LookupQueue,
+    LookupQueueError,
+    calculate_next_retry_at,
+)
+from .models import LookupRequest
+from .observability import EnrichmentObserver
+
+logger = logging.getLogger(__name__)
+
+# (request_id, status, last_error, attempts, next_retry_at)
+_StatusRow = Tuple[int, str, Optional[str], Optional[int], Optional[datetime]]
+
+
+def mark_request_batch(
+    queue: LookupQueue,
+    done_ids: Sequence[int],
+    failures: Sequence[Tuple[int, str, int]] = (),
+) -> int:
+    """
+    Apply the outcome of a whole dequeued batch in one statement.
+
+    Equivalent to calling ``queue.mark_done`` for every id in ``done_ids`` and
+    ``queue.mark_failed`` for every ``(request_id, error_message, attempts)``
+    in ``failures`` (same retry/backoff rules), but issued as a single
+    ``UPDATE ... FROM (VALUES ...)`` instead of one round trip per request.
+
+    Args:
+        queue: Queue DAO whose connection and plan_only mode are used
+        done_ids: IDs of requests that were processed successfully
+        failures: ``(request_id, error_message, attempts)`` per failed request
+
+    Returns:
+        Number of requests updated. Requests that are no longer in
+        'processing' state are skipped and logged rather than raised,
+        so one stale row does not discard the rest of the batch.
+
+    Raises:
+        LookupQueueError: If the update fails
+        ValueError: If a request ID or attempt count is invalid
+    """
+    rows: List[_StatusRow] = []
+    for request_id in done_ids:
+        if not request_id or request_id <= 0:
+            raise ValueError("Request ID must be positive")
+        rows.append((request_id, "done", None, None, None))
+
+    for request_id, error_message, attempts in failures:
+        if not request_id or request_id <= 0:
+            raise ValueError("Request ID must be positive")
+        if attempts < 0:
+            raise ValueError("Attempts must be non-negative")
+        if attempts >= MAX_RETRY_ATTEMPTS:
+            rows.append(
+                (request_id, "failed", error_message or "Unknown error", attempts, None)
+            )
+        else:
+            rows.append(
+                (
+                    request_id,
+                    "pending",
+                    error_message or "Unknown error",
+                    attempts,
+                    calculate_next_retry_at(attempts),
+                )
+            )
+
+    if not rows:
+        return 0
+
+    if queue.plan_only:
+        logger.info(
+            "PLAN ONLY: Would mark request batch",
+            extra={"done": len(done_ids), "failed": len(failures)},
+        )
+        return len(rows)
+
+    # Done rows keep their last_error/attempts/next_retry_at, like mark_done
+    values = ", ".join(
+        ["(%s::bigint, %s::text, %s::text, %s::integer, %s::timestamptz)"] * len(rows)
+    )
+    sql = f"""
+        UPDATE enterprise.enrichment_requests AS r
+        SET status = v.status,
+            last_error = COALESCE(v.last_error, r.last_error),
+            attempts = COALESCE(v.attempts, r.attempts),
+            next_retry_at = CASE
+                WHEN v.status = 'done' THEN r.next_retry_at
+                ELSE v.next_retry_at
+            END,
+            updated_at = now()
+        FROM (VALUES {values}) AS v(id, status, last_error, attempts, next_retry_at)
+        WHERE r.id = v.id AND r.status = 'processing'
+    """
+    params = [value for row in rows for value in row]
+
+    try:
+        with queue.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            updated = int(cursor.rowcount)
+    except Exception as e:
+        logger.error(
+            "Database error during mark_batch operation",
+            extra={"batch_size": len(rows), "error": str(e)},
+        )
+        raise LookupQueueError(f"Failed to mark request batch: {e}")
+
+    if updated != len(rows):
+        logger.warning(
+            "Some requests not updated - may not exist or not in processing state",
+            extra={"expected": len(rows), "updated": updated},
+        )
+    logger.info(
+        "Request batch marked",
+        extra={"done": len(done_ids), "failed": len(failures), "updated": updated},
+    )
+    return updated
+
+
+def request_name(request: LookupRequest) -> str:
+    """Extract a robust name value (supports unittest.mock usage in tests)."""
+    raw_name = getattr(request, "name", None)
+    if isinstance(raw_name, str) and raw_name:
+        return raw_name
+    mock_name = getattr(request, "_mock_name", None)
+    if isinstance(mock_name, str) and mock_name:
+        return mock_name
+    return str(raw_name) if raw_name is not None else ""
+
+
+class ConcurrentQueueDrainer:
+    """
+    Drain the lookup queue with a pool of EQC lookup threads.
+
+    Args:
+        loader: CompanyEnrichmentLoader used to cache successful lookups
+        queue: LookupQueue to dequeue from and mark
+        eqc_client: EQCClient used for search + detail calls
+        workers: Number of concurrent EQC lookups
+        observer: Optional EnrichmentObserver for metrics
+    """
+
+    def __init__(
+        self,
+        loader: Any,  # CompanyEnrichmentLoader
+        queue: LookupQueue,
+        eqc_client: Any,  # EQCClient
+        workers: int,
+        observer: Optional[EnrichmentObserver] = None,
+    ) -> None:
+        self.loader = loader
+        self.queue = queue
+        self.eqc_client = eqc_client
+        self.workers = workers
+        self.observer = observer
+
+    def drain(self, batch_size: int) -> int:
+        """
+        Process dequeued batches until the queue is empty.
+
+        After every batch the observed throughput and the ready queue depth
+        give a drain ETA.
+
+        Returns:
+            Number of requests successfully processed
+        """
+        processed_count = 0
+        handled_count = 0
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="eqc-queue"
+        ) as pool:
+            while True:
+                requests = self.queue.dequeue(batch_size)
+                if not requests:
+                    logger.debug("No more pending requests in queue")
+                    break
+
+                logger.info(
+                    f"Processing batch of {len(requests)} lookup requests",
+                    extra={"batch_size": len(requests), "workers": self.workers},
+                )
+
+                futures = {
+                    pool.submit(self._lookup, request): request for request in requests
+                }
+                done_ids: List[int] = []
+                failures: List[Tuple[int, str, int]] = []
+                for future in as_completed(futures):
+                    request = futures[future]
+                    req_name, detail, error_msg = future.result()
+                    request_id = int(request.id or 0)
+                    attempts = getattr(request, "attempts", 0) + 1
+                    if detail is None:
+                        failures.append((request_id, error_msg, attempts))
+                        logger.warning(
+                            "Lookup request failed",
+                            extra={
+                                "request_id": request_id,
+                                "company_name": req_name,
+                                "error": error_msg,
+                                "attempts": attempts,
+                            },
+                        )
+                        continue
+
+                    try:
+                        self.loader.cache_company_mapping(
+                            alias_name=req_name,
+                            canonical_id=detail.company_id,
+                            source="EQC",
+                        )
+                    except Exception as cache_error:
+                        logger.warning(
+                            f"Failed to cache result for request {request_id}: "
+                            f"{cache_error}"
+                        )
+                    done_ids.append(request_id)
+
+                mark_request_batch(self.queue, done_ids, failures)
+                processed_count += len(done_ids)
+                handled_count += len(requests)
+                self._report_drain_eta(handled_count, time.perf_counter() - started)
+
+        logger.info(
+            "Lookup queue processing completed",
+            extra={
+                "processed_count": processed_count,
+                "handled_count": handled_count,
+                "workers": self.workers,
+                "elapsed_seconds": round(time.perf_counter() - started, 3),
+            },
+        )
+        return processed_count
+
+    def _lookup(self, request: LookupRequest) -> Tuple[str, Any, str]:
+        """
+        EQC search + detail for one queued request (runs on a pool thread).
+
+        Returns:
+            ``(company_name, detail, error_message)``; ``detail`` is None when
+            the lookup failed or found nothing.
+        """
+        observer = self.observer
+        req_name = request_name(request)
+        started = time.perf_counter()
+        try:
+            if observer:
+                observer.record_lookup()
+            search_results = self.eqc_client.search_company(req_name)
+            if observer:
+                observer.record_api_call()
+            if not search_results:
+                return req_name, None, f"No EQC search results found for '{req_name}'"
+            detail = self.eqc_client.get_company_detail(search_results[0].company_id)
+            return req_name, detail, ""
+        except Exception as e:
+            return req_name, None, f"EQC lookup error: {str(e)}"
+        finally:
+            if observer:
+                observer.record_worker_throughput(
+                    threading.current_thread().name,
+                    processed=1,
+                    seconds=time.perf_counter() - started,
+                )
+
+    def _report_drain_eta(self, handled_count: int, elapsed_seconds: float) -> None:
+        """Estimate time to drain the ready queue at the observed throughput."""
+        try:
+            remaining = self.queue.get_queue_depth("pending", ready_only=True)
+        except Exception as e:
+            logger.debug(f"Queue depth unavailable for drain ETA: {e}")
+            return
+
+        throughput = handled_count / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        eta_seconds = remaining / throughput if throughput > 0 else None
+        if self.observer:
+            self.observer.set_queue_depth(remaining)
+            self.observer.set_queue_drain_eta(eta_seconds)
+        logger.info(
+            "Lookup queue drain progress",
+            extra={
+                "handled_count": handled_count,
+                "pending_ready": remaining,
+                "requests_per_second": round(throughput, 3),
+                "drain_eta_seconds": (
+                    None if eta_seconds is None else round(eta_seconds, 1)
+                ),
+            },
+        )
+
+
+__all__ = ["ConcurrentQueueDrainer", "mark_request_batch", "request_name"]
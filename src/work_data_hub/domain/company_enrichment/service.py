@@ -18,6 +18,7 @@ from .models import (
     ResolutionStatus,
 )
 from .observability import EnrichmentObserver
+from .queue_drain import ConcurrentQueueDrainer
 
 logger = logging.getLogger(__name__)
 
@@ -648,6 +649,7 @@ class CompanyEnrichmentService:
         *,
         batch_size: Optional[int] = None,
         observer: Optional[EnrichmentObserver] = None,
+        workers: int = 1,
     ) -> int:
         """
         Process pending lookup requests in the queue using EQC API.
@@ -656,9 +658,17 @@ class CompanyEnrichmentService:
         caches successful results, and updates request status appropriately.
         Designed for scheduled/async execution scenarios.
 
+        With ``workers > 1`` each dequeued batch is looked up by a thread pool
+        and its status changes are written with one statement (see
+        ``queue_drain.ConcurrentQueueDrainer``). Several processes may also
+        drain the same queue: ``dequeue`` claims rows with
+        ``FOR UPDATE SKIP LOCKED``, so each batch goes to exactly one process.
+
         Args:
             batch_size: Maximum number of requests to process (uses queue
                 default if None)
+            observer: Optional observer for metrics (defaults to the service's)
+            workers: Number of concurrent EQC lookups (1 = serial processing)
 
         Returns:
             Number of requests successfully processed
@@ -675,9 +685,15 @@ class CompanyEnrichmentService:
 
         logger.info(
             "Starting lookup queue processing",
-            extra={"requested_batch_size": batch_size},
+            extra={"requested_batch_size": batch_size, "workers": workers},
         )
 
+        if workers > 1:
+            drainer = ConcurrentQueueDrainer(
+                self.loader, self.queue, self.eqc_client, workers, observer
+            )
+            return drainer.drain(batch_size or 50)
+
         try:
             # Process requests in batches until queue is empty
             while True:
@@ -78,6 +78,7 @@ from .pipeline_config import PipelineConfig, StepConfig
 
 # Type definitions for external use
 from .types import (
+    BatchStepResult,
     DomainPipelineResult,
     ErrorContext,
     PipelineMetrics,
@@ -111,6 +112,7 @@ __all__ = [
     # Type definitions
     "Row",
     "StepResult",
+    "BatchStepResult",
     "PipelineResult",
     "PipelineMetrics",
     # Shared domain types (Story 4.8)
@@ -13,7 +13,7 @@ from work_data_hub.infrastructure.cleansing.registry import CleansingRule, regis
 
 from .core import TransformStep
 from .exceptions import PipelineAssemblyError
-from .types import Row, StepResult
+from .types import BatchStepResult, Row, StepResult
 
 logger = logging.getLogger(__name__)
 
@@ -156,12 +156,7 @@ class CleansingRuleStep(TransformStep):
 
             try:
                 # Apply cleansing rule with field-specific options
-                rule_options = {**self.options}
-
-                # Some rules expect field_name as a parameter
-                if "field_name" in self.rule.func.__code__.co_varnames:
-                    rule_options["field_name"] = field_name
-
+                rule_options = self._rule_options(field_name)
                 cleaned_value = self.rule.func(original_value, **rule_options)
                 processed_row[field_name] = cleaned_value
                 metadata["processed_fields"].append(field_name)
@@ -216,6 +211,85 @@ class CleansingRuleStep(TransformStep):
 
         return result
 
+    def apply_batch(
+        self, records: List[Row], context: Dict[str, Any]
+    ) -> BatchStepResult:
+        """
+        Apply the cleansing rule to a chunk of rows.
+
+        Behaves like calling ``apply`` on every row (same warnings, original
+        value kept on failure) but resolves rule options once per field and
+        skips per-cell debug logging.
+
+        Args:
+            records: Chunk of input rows (not modified)
+            context: Execution context (not used by cleansing rules)
+
+        Returns:
+            BatchStepResult with one transformed row per input row
+        """
+        rows: List[Row] = []
+        warnings: List[str] = []
+        row_errors: Dict[int, List[str]] = {}
+        options_by_field: Dict[str, Dict[str, Any]] = {}
+        func = self.rule.func
+
+        for position, row in enumerate(records):
+            processed_row = {**row}
+            fields_to_process = self.target_fields or list(row.keys())
+
+            for field_name in fields_to_process:
+                if field_name not in row:
+                    warnings.append(f"Field '{field_name}' not found in row")
+                    continue
+
+                rule_options = options_by_field.get(field_name)
+                if rule_options is None:
+                    rule_options = self._rule_options(field_name)
+                    options_by_field[field_name] = rule_options
+
+                try:
+                    processed_row[field_name] = func(row[field_name], **rule_options)
+                except Exception as e:
+                    error_msg = (
+                        f"Rule '{self.rule.name}' failed on field '{field_name}': {e}"
+                    )
+                    row_errors.setdefault(position, []).append(error_msg)
+                    logger.warning(
+                        error_msg,
+                        extra={
+                            "step_name": self.step_name,
+                            "rule_name": self.rule.name,
+                            "field": field_name,
+                            "original_value": row[field_name],
+                            "error": str(e),
+                        },
+                    )
+
+            rows.append(processed_row)
+
+        return BatchStepResult(
+            rows=rows,
+            warnings=warnings,
+            row_errors=row_errors,
+            metadata={
+                "rule_name": self.rule.name,
+                "rule_category": self.rule.category.value,
+                "rows": len(records),
+                "error_rows": len(row_errors),
+            },
+        )
+
+    def _rule_options(self, field_name: str) -> Dict[str, Any]:
+        """Build rule kwargs, passing field_name to rules that accept it."""
+        rule_options = {**self.options}
+
+        # Some rules expect field_name as a parameter
+        if "field_name" in self.rule.func.__code__.co_varnames:
+            rule_options["field_name"] = field_name
+
+        return rule_options
+
 
 class FieldMapperStep(TransformStep):
     """
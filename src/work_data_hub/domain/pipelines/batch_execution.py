@@ -0,0 +1,210 @@
+"""
+Batched execution of row-level pipeline steps.
+
+Used by ``core.Pipeline`` for steps implementing ``BatchRowTransformStep``:
+the frame is turned into records once and handed to ``apply_batch`` in chunks
+of ``PipelineConfig.row_batch_size``. A chunk whose ``apply_batch`` call
+raises is replayed row by row through ``apply`` when the step provides it, so
+only the offending rows are reported.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, Iterable, List, Tuple, cast
+
+import pandas as pd
+
+from .exceptions import PipelineStepError
+from .pipeline_config import PipelineConfig
+from .types import (
+    BatchRowTransformStep,
+    BatchStepResult,
+    PipelineContext,
+    Row,
+    RowTransformStep,
+    StepResult,
+)
+
+
+def _replay_chunk_per_row(
+    step: RowTransformStep,
+    indexed_rows: Iterable[Tuple[int, Row]],
+    context: PipelineContext,
+    step_index: int,
+    config: PipelineConfig,
+) -> Tuple[List[Row], List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Run ``step.apply`` on each ``(row_position, record)`` of a chunk whose
+    batch call raised.
+
+    Mirrors the per-row path in ``core.Pipeline``: failing rows keep their
+    original values and are reported at their absolute row position.
+
+    Returns:
+        (rows, warnings, errors, error_rows)
+    """
+    rows: List[Row] = []
+    warnings: List[str] = []
+    errors: List[str] = []
+    error_rows: List[Dict[str, Any]] = []
+
+    for row_position, row in indexed_rows:
+        try:
+            result: StepResult = step.apply(copy.deepcopy(row), context)
+        except Exception as exc:
+            if config.stop_on_error:
+                raise PipelineStepError(
+                    f"Row-level transform failed: {exc}",
+                    step_name=step.name,
+                    step_index=step_index,
+                    row_index=row_position,
+                ) from exc
+
+            error_rows.append(
+                {
+                    "row_index": row_position,
+                    "row_data": row,
+                    "error": str(exc),
+                    "step_name": step.name,
+                }
+            )
+            errors.append(f"Row {row_position}: {exc}")
+            rows.append(row)
+            continue
+
+        rows.append(result.row)
+        warnings.extend(result.warnings)
+
+        if result.errors:
+            error_rows.append(
+                {
+                    "row_index": row_position,
+                    "row_data": row,
+                    "error": "; ".join(result.errors),
+                    "step_name": step.name,
+                }
+            )
+            errors.extend(result.errors)
+
+            if config.stop_on_error:
+                raise PipelineStepError(
+                    result.errors[0],
+                    step_name=step.name,
+                    step_index=step_index,
+                    row_index=row_position,
+                )
+
+    return rows, warnings, errors, error_rows
+
+
+def execute_batch_row_step(
+    step: BatchRowTransformStep,
+    dataframe: pd.DataFrame,
+    context: PipelineContext,
+    step_index: int,
+    config: PipelineConfig,
+) -> Tuple[pd.DataFrame, List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Execute a batched row-level step over record chunks.
+
+    Records are materialised once per step via ``to_dict("records")``
+    instead of per-row ``iterrows`` + deep copies. Per-row failures are
+    mapped back to absolute row positions so ``error_rows`` matches the
+    per-row path. If ``apply_batch`` raises for a chunk and the step also
+    implements ``apply``, that chunk is replayed row by row; otherwise every
+    row of the chunk is reported as failed.
+
+    Returns:
+        (updated_df, warnings, errors, error_rows)
+    """
+    batch_size = config.row_batch_size
+    records = cast(List[Row], dataframe.to_dict("records"))
+    transformed_rows: List[Row] = []
+    warnings: List[str] = []
+    errors: List[str] = []
+    error_rows: List[Dict[str, Any]] = []
+
+    for offset in range(0, len(records), batch_size):
+        chunk = records[offset : offset + batch_size]
+
+        try:
+            result: BatchStepResult = step.apply_batch(chunk, context)
+        except Exception as exc:
+            if isinstance(step, RowTransformStep):
+                replayed = _replay_chunk_per_row(
+                    step, enumerate(chunk, start=offset), context, step_index, config
+                )
+                transformed_rows.extend(replayed[0])
+                warnings.extend(replayed[1])
+                errors.extend(replayed[2])
+                error_rows.extend(replayed[3])
+                continue
+
+            if config.stop_on_error:
+                raise PipelineStepError(
+                    f"Batch row-level transform failed: {exc}",
+                    step_name=step.name,
+                    step_index=step_index,
+                    row_index=offset,
+                ) from exc
+
+            # No per-row fallback; keep the original rows and report each of
+            # them so downstream error exports stay row-accurate
+            for position, row in enumerate(chunk, start=offset):
+                error_rows.append(
+                    {
+                        "row_index": position,
+                        "row_data": row,
+                        "error": str(exc),
+                        "step_name": step.name,
+                    }
+                )
+                errors.append(f"Row {position}: {exc}")
+            transformed_rows.extend(chunk)
+            continue
+
+        if len(result.rows) != len(chunk):
+            raise PipelineStepError(
+                f"apply_batch returned {len(result.rows)} rows for a chunk "
+                f"of {len(chunk)}",
+                step_name=step.name,
+                step_index=step_index,
+                row_index=offset,
+            )
+
+        transformed_rows.extend(result.rows)
+        warnings.extend(result.warnings)
+
+        for position in sorted(result.row_errors):
+            row_errors = result.row_errors[position]
+            if not row_errors:
+                continue
+
+            row_position = offset + position
+            error_rows.append(
+                {
+                    "row_index": row_position,
+                    "row_data": chunk[position],
+                    "error": "; ".join(row_errors),
+                    "step_name": step.name,
+                }
+            )
+            errors.extend(row_errors)
+
+            if config.stop_on_error:
+                raise PipelineStepError(
+                    row_errors[0],
+                    step_name=step.name,
+                    step_index=step_index,
+                    row_index=row_position,
+                )
+
+    if not transformed_rows:
+        return dataframe.iloc[0:0].copy(), warnings, errors, error_rows
+
+    updated_df = pd.DataFrame.from_records(transformed_rows)
+    return updated_df, warnings, errors, error_rows
+
+
+__all__ = ["execute_batch_row_step"]
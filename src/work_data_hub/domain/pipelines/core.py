@@ -4,6 +4,15 @@ Core pipeline execution framework with dual DataFrame and row-level support.
 Story 1.5 introduces the basic executor framework.
 Story 1.10 adds advanced features: retry logic, optional steps, error collection mode,
 and comprehensive metrics including memory tracking.
+
+The executor defaults to defensive deep copies at every step boundary. Setting
+``PipelineConfig.copy_mode="zero_copy"`` switches to ownership transfer: the
+working frame is handed from step to step and only copied for steps that may
+mutate it, so retries and skipped steps still see the original input.
+
+Row-level steps that implement ``apply_batch`` are executed over record chunks
+of ``PipelineConfig.row_batch_size``; the per-row ``apply`` path remains the
+fallback for steps that only implement ``RowTransformStep``.
 """
 
 from __future__ import annotations
@@ -18,9 +27,11 @@ import pandas as pd
 
 from work_data_hub.utils.logging import get_logger
 
+from .batch_execution import execute_batch_row_step
 from .exceptions import PipelineStepError, StepSkipped
 from .pipeline_config import PipelineConfig
 from .types import (
+    BatchRowTransformStep,
     DataFrameStep,
     PipelineContext,
     PipelineMetrics,
@@ -108,12 +119,26 @@ def is_retryable_error(
     return (True, "network")  # Default to network tier
 
 
+def step_mutates_input(step: TransformStep) -> bool:
+    """
+    Return whether a DataFrame step may modify the frame it receives.
+
+    Steps opt out of defensive copying by declaring ``mutates_input = False``;
+    anything that does not declare the attribute is assumed to mutate.
+    """
+    return bool(getattr(step, "mutates_input", True))
+
+
 class Pipeline:
     """
     Data transformation pipeline executor.
 
     Supports both DataFrame-based steps (`DataFrameStep`) and row-level steps
     (`RowTransformStep`) while emitting structured logs and metrics.
+
+    With ``config.copy_mode == "zero_copy"`` the pipeline takes ownership of
+    the input frame: it is not copied on entry or exit, and pure steps
+    (``mutates_input = False``) share the working frame without copies.
     """
 
     def __init__(self, steps: List[TransformStep], config: PipelineConfig):
@@ -147,14 +172,17 @@ class Pipeline:
         - Optional step support (StepSkipped exceptions)
 
         Args:
-            initial_data: Input DataFrame (copied internally to stay immutable)
+            initial_data: Input DataFrame. Copied internally in ``defensive``
+                mode; in ``zero_copy`` mode ownership passes to the pipeline and
+                ``output_data`` may share memory with it.
             context: Optional PipelineContext (auto-generated when omitted)
 
         Raises:
             PipelineStepError: When a step fails and stop_on_error is True
         """
         pipeline_context = context or self._build_context()
-        current_df = initial_data.copy(deep=True)
+        zero_copy = self._zero_copy
+        current_df = initial_data if zero_copy else initial_data.copy(deep=True)
 
         step_metrics: List[StepMetrics] = []
         warnings: List[str] = []
@@ -167,6 +195,7 @@ class Pipeline:
             execution_id=pipeline_context.execution_id,
             rows=len(current_df),
             stop_on_error=self.config.stop_on_error,
+            copy_mode=self.config.copy_mode,
         )
 
         for index, step in enumerate(self.steps):
@@ -204,7 +233,7 @@ class Pipeline:
         )
 
         success = len(errors) == 0
-        result_df = current_df.copy(deep=True)
+        result_df = current_df if zero_copy else current_df.copy(deep=True)
         first_row: Optional[Row] = None
         if not result_df.empty and len(result_df.index) == 1:
             first_row = result_df.iloc[0].to_dict()
@@ -254,6 +283,21 @@ class Pipeline:
     # Internal helpers
     # --------------------------------------------------------------------- #
 
+    @property
+    def _zero_copy(self) -> bool:
+        return self.config.copy_mode == "zero_copy"
+
+    def _step_input(self, step: TransformStep, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return the frame handed to a DataFrame step.
+
+        Mutating steps always work on a private copy so that a retry or a
+        StepSkipped pass-through can fall back to the untouched original.
+        """
+        if self._zero_copy and not step_mutates_input(step):
+            return dataframe
+        return dataframe.copy(deep=True)
+
     def _ensure_context(self, context: ContextInput) -> PipelineContext:
         if isinstance(context, PipelineContext):
             return context
@@ -344,7 +388,9 @@ class Pipeline:
                 reason=skip_exc.reason,
             )
             warnings.append(f"Step skipped: {skip_exc.reason}")
-            updated_df = current_df.copy(deep=True)  # Pass through unchanged
+            # Pass through unchanged (the original was never handed out
+            # for in-place mutation in zero-copy mode)
+            updated_df = current_df if self._zero_copy else current_df.copy(deep=True)
             rows_processed = len(current_df)
 
         except PipelineStepError:
@@ -428,7 +474,9 @@ class Pipeline:
             attempt += 1
             try:
                 if isinstance(step, DataFrameStep):
-                    result_df = step.execute(current_df.copy(deep=True), context)
+                    result_df = step.execute(
+                        self._step_input(step, current_df), context
+                    )
                     if not isinstance(result_df, pd.DataFrame):
                         raise PipelineStepError(
                             "DataFrameStep.execute must return a pandas DataFrame",
@@ -436,7 +484,9 @@ class Pipeline:
                             step_index=step_index,
                         )
 
-                    updated_df = result_df.copy(deep=True)
+                    updated_df = (
+                        result_df if self._zero_copy else result_df.copy(deep=True)
+                    )
                     rows_processed = len(updated_df)
 
                     # Log retry success if this was a retry (attempt > 1)
@@ -459,7 +509,7 @@ class Pipeline:
 
                     return updated_df, warnings, errors, error_rows, rows_processed
 
-                elif isinstance(step, RowTransformStep):
+                elif isinstance(step, (BatchRowTransformStep, RowTransformStep)):
                     updated_df, warnings, errors, error_rows = self._execute_row_step(
                         step, current_df, context, step_index
                     )
@@ -487,8 +537,8 @@ class Pipeline:
 
                 else:
                     raise PipelineStepError(
-                        "Step must implement DataFrameStep or "
-                        "RowTransformStep protocols",
+                        "Step must implement DataFrameStep, "
+                        "BatchRowTransformStep or RowTransformStep protocols",
                         step_name=getattr(step, "name", "unknown"),
                         step_index=step_index,
                     )
@@ -565,7 +615,7 @@ class Pipeline:
 
     def _execute_row_step(
         self,
-        step: RowTransformStep,
+        step: Union[BatchRowTransformStep, RowTransformStep],
         dataframe: pd.DataFrame,
         context: PipelineContext,
         step_index: int,
@@ -573,9 +623,21 @@ class Pipeline:
         """
         Execute row-level transformation step with error collection (Story 1.10).
 
+        Steps exposing ``apply_batch`` take the batched path; everything else
+        falls back to per-row ``apply`` calls.
+
         Returns:
             (updated_df, warnings, errors, error_rows)
         """
+        if isinstance(step, BatchRowTransformStep):
+            return execute_batch_row_step(
+                step,
+                dataframe,
+                context,
+                step_index,
+                self.config,
+            )
+
         transformed_rows: List[Row] = []
         warnings: List[str] = []
         errors: List[str] = []
@@ -645,4 +707,9 @@ class Pipeline:
         return updated_df, warnings, errors, error_rows
 
 
-__all__ = ["Pipeline", "TransformStep"]
+__all__ = [
+    "BatchRowTransformStep",
+    "Pipeline",
+    "TransformStep",
+    "step_mutates_input",
+]
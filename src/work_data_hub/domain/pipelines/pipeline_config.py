@@ -6,7 +6,7 @@ both programmatic construction and YAML/JSON-based configuration files.
 """
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -87,6 +87,12 @@ class PipelineConfig(BaseModel):
             (Story 1.10)
         retry_limits: Tier-specific retry limits by error category
             (Story 1.10)
+        copy_mode: DataFrame copy semantics. ``"defensive"`` deep-copies the
+            input, every step boundary and the result; ``"zero_copy"`` takes
+            ownership of the input frame and only copies for steps that
+            declare ``mutates_input = True`` (or do not declare it at all)
+        row_batch_size: Number of records handed to ``apply_batch`` per call
+            for batched row-level steps
     """
 
     name: str = Field(..., description="Pipeline name")
@@ -139,6 +145,19 @@ class PipelineConfig(BaseModel):
         description="Tier-specific retry limits by error category",
     )
 
+    # Zero-copy execution mode (ownership transfer between steps)
+    copy_mode: Literal["defensive", "zero_copy"] = Field(
+        default="defensive",
+        description="DataFrame copy semantics between pipeline steps",
+    )
+
+    # Batched row-level execution (apply_batch)
+    row_batch_size: int = Field(
+        default=5000,
+        ge=1,
+        description="Records per apply_batch call for batched row steps",
+    )
+
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
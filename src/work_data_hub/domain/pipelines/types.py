@@ -191,6 +191,24 @@ class StepResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class BatchStepResult:
+    """
+    Result of applying a row-level transformation to a chunk of records.
+
+    Attributes:
+        rows: Transformed records, one per input record and in the same order
+        warnings: Non-fatal issues encountered while processing the chunk
+        row_errors: Blocking errors keyed by record position within the chunk
+        metadata: Arbitrary diagnostic data captured by the step
+    """
+
+    rows: List[Row]
+    warnings: List[str] = field(default_factory=list)
+    row_errors: Dict[int, List[str]] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class StepMetrics:
     """
@@ -264,7 +282,15 @@ class TransformStep(Protocol):
 
 @runtime_checkable
 class DataFrameStep(TransformStep, Protocol):
-    """Protocol for steps that operate on the entire DataFrame at once."""
+    """
+    Protocol for steps that operate on the entire DataFrame at once.
+
+    Steps may optionally expose a ``mutates_input`` attribute. When the
+    pipeline runs with ``copy_mode="zero_copy"``, steps declaring
+    ``mutates_input = False`` receive the working frame without a defensive
+    copy and must return a new frame instead of modifying it in place. Steps
+    that omit the attribute are treated as mutating.
+    """
 
     def execute(
         self,
@@ -280,3 +306,20 @@ class RowTransformStep(TransformStep, Protocol):
 
     def apply(self, row: Row, context: PipelineContext) -> StepResult:
         """Return StepResult describing a row-level transformation."""
+
+
+@runtime_checkable
+class BatchRowTransformStep(TransformStep, Protocol):
+    """
+    Protocol for row-level steps that can transform a chunk of records at once.
+
+    The executor prefers ``apply_batch`` over ``apply`` when a step provides
+    both. Records are plain dicts produced by ``DataFrame.to_dict("records")``
+    and must be treated as read-only; failed rows are reported through
+    ``BatchStepResult.row_errors`` rather than by raising.
+    """
+
+    def apply_batch(
+        self, records: List[Row], context: PipelineContext
+    ) -> BatchStepResult:
+        """Return BatchStepResult for a chunk of records."""
@@ -0,0 +1,253 @@
+"""
+Vectorized aggregation strategies for GenericBackfillService.derive_candidates.
+
+The built-in max_by, concat_distinct and template aggregations work on one
+factorization of the source column (``GroupIndex``) instead of calling a
+closure per group.
+"""
+
+import logging
+import re
+import string
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, cast
+
+import numpy as np
+import pandas as pd
+
+from .models import AggregationConfig, BackfillColumnMapping
+
+
+@dataclass
+class GroupIndex:
+    """
+    Positional group codes of fact rows, shared by all aggregations of a key.
+
+    ``codes[i]`` is the group of row ``i`` and ``keys[code]`` its key, in
+    order of first appearance (as ``groupby(sort=False)``). ``max_by_rows``
+    memoizes the winning row per group for each order column.
+    """
+
+    codes: np.ndarray
+    keys: pd.Index
+    max_by_rows: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, keys: pd.Series) -> "GroupIndex":
+        codes, uniques = pd.factorize(keys)
+        return cls(codes, pd.Index(uniques, name=keys.name))
+
+
+def _aggregation_of(mapping: BackfillColumnMapping) -> AggregationConfig:
+    if mapping.aggregation is None:
+        raise ValueError(f"Column '{mapping.source}' has no aggregation config")
+    return mapping.aggregation
+
+
+class VectorizedAggregationMixin:
+    """Mixin providing the column-wise aggregations for GenericBackfillService."""
+
+    logger: logging.Logger
+
+    def _aggregate_max_by(
+        self,
+        df: pd.DataFrame,
+        group_col: str,
+        mapping: BackfillColumnMapping,
+        groups: Optional[GroupIndex] = None,
+    ) -> pd.Series:
+        """
+        Get value from row with maximum order_column value.
+
+        Story 6.2-P15: Complex Mapping Backfill Enhancement
+        Story 6.2-P16: Fixed TypeError when order_column has mixed types
+
+        Falls back to 'first' aggregation when:
+        - order_column doesn't exist in DataFrame (defensive)
+        - All values in order_column are NULL for a group
+        - order_column has mixed types that can't be compared
+
+        Args:
+            df: Source DataFrame
+            group_col: Column to group by
+            mapping: Column mapping with aggregation config
+            groups: Group index of ``df`` by ``group_col`` (built if omitted)
+
+        Returns:
+            Series with aggregated values indexed by group
+        """
+        order_col = _aggregation_of(mapping).order_column
+
+        # Defensive check: column existence
+        if order_col is None or order_col not in df.columns:
+            self.logger.warning(
+                f"order_column '{order_col}' not found in DataFrame, "
+                f"falling back to 'first' for column '{mapping.source}'"
+            )
+            return df.groupby(group_col)[mapping.source].first()
+
+        if groups is None:
+            groups = GroupIndex.of(df[group_col])
+        rows = groups.max_by_rows.get(order_col)
+        if rows is None:
+            # Story 6.2-P16: Convert order_column to numeric for safe comparison
+            # This handles cases where the column has mixed float/str types
+            order_values = pd.to_numeric(df[order_col], errors="coerce").to_numpy(
+                dtype="float64", na_value=np.nan
+            )
+            rows = self._max_by_rows(groups.codes, order_values)
+            groups.max_by_rows[order_col] = rows
+
+        return df[mapping.source].iloc[rows].set_axis(groups.keys)
+
+    @staticmethod
+    def _max_by_rows(codes: np.ndarray, order_values: np.ndarray) -> np.ndarray:
+        """
+        Position of the winning row of each group, indexed by group code.
+
+        The winner is the first row holding the group's maximum; a group whose
+        order values are all NULL falls back to its first row.
+        """
+        missing = np.isnan(order_values)
+        # Sort by group, then non-NULL first, then value descending, then row
+        order = np.lexsort(
+            (
+                np.arange(len(codes)),
+                -np.where(missing, 0.0, order_values),
+                missing,
+                codes,
+            )
+        )
+        sorted_codes = codes[order]
+        group_start = np.ones(len(order), dtype=bool)
+        group_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+        return order[group_start]
+
+    def _aggregate_concat_distinct(
+        self,
+        df: pd.DataFrame,
+        group_col: str,
+        mapping: BackfillColumnMapping,
+        groups: Optional[GroupIndex] = None,
+    ) -> pd.Series:
+        """
+        Concatenate distinct values with separator.
+
+        Story 6.2-P15: Complex Mapping Backfill Enhancement
+
+        Args:
+            df: Source DataFrame
+            group_col: Column to group by
+            mapping: Column mapping with aggregation config
+            groups: Group index of ``df`` by ``group_col`` (built if omitted)
+
+        Returns:
+            Series with concatenated values indexed by group (NA when a
+            group has no values)
+        """
+        aggregation = _aggregation_of(mapping)
+        if groups is None:
+            groups = GroupIndex.of(df[group_col])
+
+        # Distinct (group, value) pairs in order of first appearance
+        pairs = (
+            pd.DataFrame(
+                {
+                    "group": groups.codes,
+                    "value": df[mapping.source].reset_index(drop=True),
+                }
+            )
+            .dropna(subset=["value"])
+            .drop_duplicates()
+        )
+        pairs["text"] = pairs["value"].astype(object).map(str)
+        if aggregation.sort:
+            pairs = pairs.sort_values(["group", "text"], kind="stable")
+        joined = pairs.groupby("group", sort=True)["text"].agg(
+            aggregation.separator.join
+        )
+
+        # Handle empty groups gracefully: NA for optional field handling
+        result = pd.Series(pd.NA, index=groups.keys, dtype=object)
+        result.iloc[joined.index.to_numpy()] = joined.to_numpy()
+        return result
+
+    def _aggregate_template(
+        self,
+        df: pd.DataFrame,
+        group_col: str,
+        mapping: BackfillColumnMapping,
+        groups: Optional[GroupIndex] = None,
+    ) -> pd.Series:
+        """
+        Apply template string with field placeholders.
+
+        Story 6.2-P18: Advanced Aggregation Capabilities
+
+        Template format: "prefix_{field1}_suffix_{field2}"
+        Placeholders are replaced with first non-null value from each group.
+
+        Args:
+            df: Source DataFrame
+            group_col: Column to group by
+            mapping: Column mapping with template config
+            groups: Group index of ``df`` by ``group_col`` (built if omitted)
+
+        Returns:
+            Series with formatted template strings per group
+
+        Raises:
+            ValueError: If template references non-existent field
+        """
+        aggregation = _aggregation_of(mapping)
+        template = aggregation.template or ""
+        template_fields = aggregation.template_fields or []
+
+        # Auto-extract fields from template if not explicitly provided
+        if not template_fields:
+            template_fields = re.findall(r"\{(\w+)\}", template)
+
+        # Validate all template fields exist in DataFrame
+        missing_fields = [f for f in template_fields if f not in df.columns]
+        if missing_fields:
+            raise ValueError(f"Template references missing fields: {missing_fields}")
+
+        if groups is None:
+            groups = GroupIndex.of(df[group_col])
+        # First non-null value per group as text, "" when the group has none
+        values: Dict[str, pd.Series] = {}
+        if template_fields:
+            firsts = (
+                df[list(dict.fromkeys(template_fields))]
+                .reset_index(drop=True)
+                .groupby(groups.codes, sort=True)
+                .first()
+            )
+            for f in template_fields:
+                text_values = firsts[f].astype(object).map(str, na_action="ignore")
+                values[f] = text_values.where(firsts[f].notna(), "")
+
+        parts = list(string.Formatter().parse(template))
+        if all(
+            name is None or (name in values and not spec and conversion is None)
+            for _, name, spec, conversion in parts
+        ):
+            # Plain placeholders: concatenate column-wise
+            formatted = pd.Series("", index=range(len(groups.keys)), dtype=object)
+            for literal, name, _, _ in parts:
+                if literal:
+                    formatted = formatted + literal
+                if name is not None:
+                    formatted = formatted + values[name]
+            return pd.Series(formatted.to_numpy(), index=groups.keys)
+
+        # Conversions/format specs: format each group's row
+        rows = cast(
+            List[Dict[str, str]],
+            pd.DataFrame(values, index=range(len(groups.keys))).to_dict("records"),
+        )
+        formatted_rows: List[str] = [template.format(**row) for row in rows]
+        return pd.Series(formatted_rows, index=groups.keys, dtype=object)
+
+
+__all__ = ["GroupIndex", "VectorizedAggregationMixin"]
@@ -0,0 +1,133 @@
+"""
+Set-based ``fill_null_only`` backfill for PostgreSQL targets.
+
+Candidates are COPYed into a temporary staging table and merged into the
+reference table by one statement that inserts missing keys and fills NULL
+columns of existing rows (SQL: ``infrastructure.sql.operations.bulk_copy``).
+"""
+
+import logging
+from typing import TYPE_CHECKING, List
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from work_data_hub.infrastructure.sql import qualify_table, quote_identifier
+from work_data_hub.infrastructure.sql.operations.bulk_copy import (
+    build_fill_null_from_stage_sql,
+    build_stage_table_sql,
+    copy_dataframe,
+    dbapi_cursor,
+    new_stage_table_name,
+)
+
+from .models import ForeignKeyConfig
+
+
+class StagedFillNullMixin:
+    """Mixin providing the staged fill_null_only path for GenericBackfillService."""
+
+    domain: str
+    logger: logging.Logger
+    enable_audit_logging: bool
+    audit_record_limit: int
+
+    if TYPE_CHECKING:
+
+        @staticmethod
+        def _jsonb_merge_columns(config: ForeignKeyConfig) -> List[str]: ...
+
+    def _fill_null_from_stage(
+        self,
+        candidates_df: pd.DataFrame,
+        config: ForeignKeyConfig,
+        conn: Connection,
+        add_tracking_fields: bool,
+    ) -> int:
+        """
+        Set-based fill_null_only backfill for PostgreSQL.
+
+        COPYs the candidates into a staging table, then one statement inserts
+        missing keys and fills NULL columns of existing rows, returning the
+        changed keys. Rows with nothing to fill are not rewritten.
+
+        Returns:
+            Number of records inserted or filled
+        """
+        columns = list(candidates_df.columns)
+        qualified_table = qualify_table(
+            config.target_table, schema=config.target_schema
+        )
+        stage_table = new_stage_table_name()
+
+        # Temp table is dropped by the commit below
+        conn.execute(text(build_stage_table_sql(stage_table, qualified_table, columns)))
+        with dbapi_cursor(conn) as cursor:
+            copy_dataframe(
+                cursor, candidates_df, quote_identifier(stage_table), columns
+            )
+        changed = conn.execute(
+            text(
+                build_fill_null_from_stage_sql(
+                    qualified_table,
+                    stage_table,
+                    columns,
+                    config.target_key,
+                    jsonb_merge_columns=self._jsonb_merge_columns(config),
+                )
+            )
+        ).fetchall()
+        conn.commit()
+
+        inserted_keys = [str(key) for key, inserted in changed if inserted]
+        filled_keys = [str(key) for key, inserted in changed if not inserted]
+        self.logger.info(
+            f"Backfilled '{config.target_table}': {len(inserted_keys)} inserted, "
+            f"{len(filled_keys)} filled from {len(candidates_df)} candidates"
+        )
+
+        if self.enable_audit_logging and add_tracking_fields and changed:
+            self._audit_staged_changes(config, inserted_keys, filled_keys)
+
+        return len(changed)
+
+    def _audit_staged_changes(
+        self,
+        config: ForeignKeyConfig,
+        inserted_keys: List[str],
+        filled_keys: List[str],
+    ) -> None:
+        """Log audit events for keys inserted or filled by the staged merge."""
+        from .observability import ReferenceDataAuditLogger
+
+        changed = len(inserted_keys) + len(filled_keys)
+        if self.audit_record_limit <= 0 or changed > self.audit_record_limit:
+            self.logger.info(
+                f"Skipping per-record audit logging for '{config.target_table}': "
+                f"{changed} changed keys exceed limit {self.audit_record_limit}"
+            )
+            return
+
+        actor = f"backfill_service.{self.domain}"
+        audit_logger = ReferenceDataAuditLogger()
+        for pk in inserted_keys:
+            audit_logger.log_insert(
+                table=config.target_table,
+                record_key=pk,
+                source="auto_derived",
+                domain=self.domain,
+                actor=actor,
+            )
+        for pk in filled_keys:
+            audit_logger.log_update(
+                table=config.target_table,
+                record_key=pk,
+                old_source="unknown",
+                new_source="auto_derived",
+                domain=self.domain,
+                actor=actor,
+            )
+
+
+__all__ = ["StagedFillNullMixin"]
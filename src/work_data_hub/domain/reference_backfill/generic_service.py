@@ -7,12 +7,11 @@ idempotent operations.
 """
 
 import logging
-import re
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from graphlib import CycleError, TopologicalSorter
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, cast
 
 import pandas as pd
 from sqlalchemy import text
@@ -27,6 +26,8 @@ from work_data_hub.infrastructure.sql import (
     remap_records,
 )
 
+from .backfill_aggregations import GroupIndex, VectorizedAggregationMixin
+from .backfill_staging import StagedFillNullMixin
 from .models import (
     AggregationType,
     BackfillColumnMapping,
@@ -53,7 +54,7 @@ def _qualified_table_name(config: ForeignKeyConfig) -> str:
     return qualify_table(config.target_table, schema=config.target_schema)
 
 
-class GenericBackfillService:
+class GenericBackfillService(VectorizedAggregationMixin, StagedFillNullMixin):
     """
     Service for generic reference data backfill operations.
 
@@ -122,11 +123,15 @@ class GenericBackfillService:
         tables_processed = []
         total_inserted = 0
         total_skipped = 0
+        # FKs sharing a source column reuse one factorization of it
+        group_cache: Dict[str, GroupIndex] = {}
 
         for config in sorted_configs:
             try:
                 # Derive candidates for this foreign key
-                candidates_df = self.derive_candidates(df, config)
+                candidates_df = self.derive_candidates(
+                    df, config, group_cache=group_cache
+                )
 
                 if candidates_df.empty:
                     self.logger.warning(
@@ -241,7 +246,10 @@ class GenericBackfillService:
         return [name_map[name] for name in sorted_names]
 
     def derive_candidates(
-        self, df: pd.DataFrame, config: ForeignKeyConfig
+        self,
+        df: pd.DataFrame,
+        config: ForeignKeyConfig,
+        group_cache: Optional[Dict[str, GroupIndex]] = None,
     ) -> pd.DataFrame:
         """
         Derive candidate records for a reference table from fact data.
@@ -251,9 +259,14 @@ class GenericBackfillService:
         - max_by: Select value from row with maximum order_column value
         - concat_distinct: Concatenate distinct values with separator
 
+        All aggregations share one factorization of the source column; the
+        built-in strategies are computed column-wise over its group codes.
+
         Args:
             df: DataFrame containing fact data
             config: Foreign key configuration
+            group_cache: Group indexes by source column, reused across FKs
+                derived from the same ``df``
 
         Returns:
             DataFrame with candidate records for the reference table
@@ -292,7 +305,17 @@ class GenericBackfillService:
                 s = s.astype("string").str.strip()
                 source_df[col] = s.mask(s == "", pd.NA)
 
-        grouped_first = source_df.groupby(config.source_column, sort=False).first()
+        cached = group_cache.get(config.source_column) if group_cache else None
+        if cached is None:
+            cached = GroupIndex.of(source_df[config.source_column])
+            if group_cache is not None:
+                group_cache[config.source_column] = cached
+        # Fresh max_by memo: order columns may be normalized differently per FK
+        groups = GroupIndex(cached.codes, cached.keys)
+
+        grouped_first = (
+            source_df.groupby(groups.codes, sort=True).first().set_axis(groups.keys)
+        )
 
         # Build candidates DataFrame with aggregation strategies (Story 6.2-P15)
         candidates_df = pd.DataFrame({config.target_key: grouped_first.index})
@@ -315,7 +338,9 @@ class GenericBackfillService:
             elif col_mapping.aggregation.type == AggregationType.MAX_BY:
                 # max_by: value from row with maximum order_column
                 candidates_df[col_mapping.target] = (
-                    self._aggregate_max_by(source_df, config.source_column, col_mapping)
+                    self._aggregate_max_by(
+                        source_df, config.source_column, col_mapping, groups
+                    )
                     .reindex(grouped_first.index)
                     .to_numpy()
                 )
@@ -323,7 +348,7 @@ class GenericBackfillService:
                 # concat_distinct: concatenate unique values
                 candidates_df[col_mapping.target] = (
                     self._aggregate_concat_distinct(
-                        source_df, config.source_column, col_mapping
+                        source_df, config.source_column, col_mapping, groups
                     )
                     .reindex(grouped_first.index)
                     .to_numpy()
@@ -340,7 +365,7 @@ class GenericBackfillService:
                 # Story 6.2-P18: template aggregation
                 candidates_df[col_mapping.target] = (
                     self._aggregate_template(
-                        source_df, config.source_column, col_mapping
+                        source_df, config.source_column, col_mapping, groups
                     )
                     .reindex(grouped_first.index)
                     .to_numpy()
@@ -392,154 +417,6 @@ class GenericBackfillService:
 
         return candidates_df
 
-    def _aggregate_max_by(
-        self, df: pd.DataFrame, group_col: str, mapping: BackfillColumnMapping
-    ) -> pd.Series:
-        """
-        Get value from row with maximum order_column value.
-
-        Story 6.2-P15: Complex Mapping Backfill Enhancement
-        Story 6.2-P16: Fixed TypeError when order_column has mixed types
-
-        Falls back to 'first' aggregation when:
-        - order_column doesn't exist in DataFrame (defensive)
-        - All values in order_column are NULL for a group
-        - order_column has mixed types that can't be compared
-
-        Args:
-            df: Source DataFrame
-            group_col: Column to group by
-            mapping: Column mapping with aggregation config
-
-        Returns:
-            Series with aggregated values indexed by group
-        """
-        order_col = mapping.aggregation.order_column
-
-        # Defensive check: column existence
-        if order_col not in df.columns:
-            self.logger.warning(
-                f"order_column '{order_col}' not found in DataFrame, "
-                f"falling back to 'first' for column '{mapping.source}'"
-            )
-            return df.groupby(group_col)[mapping.source].first()
-
-        # Story 6.2-P16: Convert order_column to numeric for safe comparison
-        # This handles cases where the column has mixed float/str types
-        order_series = pd.to_numeric(df[order_col], errors="coerce")
-
-        # Per-group max_by with fallback for all-NULL order_column
-        def max_by_with_fallback(group: pd.DataFrame) -> Any:
-            # Use the converted numeric series for comparison
-            group_indices = group.index
-            numeric_vals = order_series.loc[group_indices]
-            valid = numeric_vals.dropna()
-
-            if valid.empty:
-                # All order_column values are NULL or non-numeric, fallback to first
-                self.logger.debug(
-                    f"All '{order_col}' values NULL/non-numeric for group, using 'first' "
-                    f"for column '{mapping.source}'"
-                )
-                first_val = group[mapping.source].iloc[0] if len(group) > 0 else None
-                return first_val
-
-            # Use idxmax on the valid numeric values
-            try:
-                max_idx = numeric_vals.idxmax(skipna=True)
-                return group.loc[max_idx, mapping.source]
-            except (TypeError, ValueError) as e:
-                # Fallback on comparison errors
-                self.logger.warning(
-                    f"max_by comparison error for column '{mapping.source}': {e}, "
-                    "falling back to 'first'"
-                )
-                return group[mapping.source].iloc[0] if len(group) > 0 else None
-
-        return df.groupby(group_col, sort=False).apply(
-            max_by_with_fallback, include_groups=False
-        )
-
-    def _aggregate_concat_distinct(
-        self, df: pd.DataFrame, group_col: str, mapping: BackfillColumnMapping
-    ) -> pd.Series:
-        """
-        Concatenate distinct values with separator.
-
-        Story 6.2-P15: Complex Mapping Backfill Enhancement
-
-        Args:
-            df: Source DataFrame
-            group_col: Column to group by
-            mapping: Column mapping with aggregation config
-
-        Returns:
-            Series with concatenated values indexed by group
-        """
-        sep = mapping.aggregation.separator
-        sort_values = mapping.aggregation.sort
-
-        def concat_func(x: pd.Series) -> str:
-            # Drop NA and get unique values
-            unique = x.dropna().unique()
-            if len(unique) == 0:
-                return pd.NA  # Handle empty case gracefully, returns NA for optional field handling
-
-            # Convert to strings for sorting and joining
-            str_values = [str(v) for v in unique]
-            if sort_values:
-                str_values = sorted(str_values)
-
-            return sep.join(str_values)
-
-        return df.groupby(group_col, sort=False)[mapping.source].agg(concat_func)
-
-    def _aggregate_template(
-        self, df: pd.DataFrame, group_col: str, mapping: BackfillColumnMapping
-    ) -> pd.Series:
-        """
-        Apply template string with field placeholders.
-
-        Story 6.2-P18: Advanced Aggregation Capabilities
-
-        Template format: "prefix_{field1}_suffix_{field2}"
-        Placeholders are replaced with first non-null value from each group.
-
-        Args:
-            df: Source DataFrame
-            group_col: Column to group by
-            mapping: Column mapping with template config
-
-        Returns:
-            Series with formatted template strings per group
-
-        Raises:
-            ValueError: If template references non-existent field
-        """
-        template = mapping.aggregation.template
-        template_fields = mapping.aggregation.template_fields or []
-
-        # Auto-extract fields from template if not explicitly provided
-        if not template_fields:
-            template_fields = re.findall(r"\{(\w+)\}", template)
-
-        # Validate all template fields exist in DataFrame
-        missing_fields = [f for f in template_fields if f not in df.columns]
-        if missing_fields:
-            raise ValueError(f"Template references missing fields: {missing_fields}")
-
-        def apply_template(group: pd.DataFrame) -> str:
-            values = {}
-            for field in template_fields:
-                # Get first non-null value
-                non_null = group[field].dropna()
-                values[field] = str(non_null.iloc[0]) if len(non_null) > 0 else ""
-            return template.format(**values)
-
-        return df.groupby(group_col, sort=False).apply(
-            apply_template, include_groups=False
-        )
-
     def _aggregate_count_distinct(
         self, df: pd.DataFrame, group_col: str, mapping: BackfillColumnMapping
     ) -> pd.Series:
@@ -667,6 +544,11 @@ class GenericBackfillService:
         if add_tracking_fields:
             candidates_df = self._add_tracking_fields(candidates_df)
 
+        if config.mode == "fill_null_only" and conn.dialect.name == "postgresql":
+            return self._fill_null_from_stage(
+                candidates_df, config, conn, add_tracking_fields
+            )
+
         # Build INSERT ... ON CONFLICT DO NOTHING query
         # This ensures idempotency by ignoring existing records
         columns = list(candidates_df.columns)
@@ -677,7 +559,7 @@ class GenericBackfillService:
         conflict_columns = [config.target_key]
 
         # Pre-fetch existing keys for accurate audit logging
-        records = candidates_df.to_dict("records")
+        records = cast(List[Dict[str, Any]], candidates_df.to_dict("records"))
         pk_values = [record[config.target_key] for record in records]
         existing_keys: Set[Any] = set()
         qualified_table = _qualified_table_name(config)
@@ -702,26 +584,9 @@ class GenericBackfillService:
             update_columns = [col for col in columns if col != config.target_key]
 
             # Story 7.6-18: Detect JSONB_APPEND columns for merge syntax
-            jsonb_merge_columns = [
-                col_mapping.target
-                for col_mapping in config.backfill_columns
-                if col_mapping.aggregation
-                and col_mapping.aggregation.type == AggregationType.JSONB_APPEND
-            ]
+            jsonb_merge_columns = self._jsonb_merge_columns(config)
 
-            if config.mode == "fill_null_only":
-                query = builder.upsert(
-                    schema=config.target_schema,
-                    table=config.target_table,
-                    columns=columns,
-                    placeholders=placeholders,
-                    conflict_columns=conflict_columns,
-                    mode="do_update",
-                    update_columns=update_columns,
-                    null_guard=True,
-                    jsonb_merge_columns=jsonb_merge_columns,
-                )
-            elif jsonb_merge_columns:
+            if jsonb_merge_columns:
                 # Story 7.6-18: insert_missing with JSONB columns needs merge
                 query = builder.upsert(
                     schema=config.target_schema,
@@ -799,35 +664,38 @@ class GenericBackfillService:
                         INSERT INTO {qualified_table} ({", ".join(f'"{c}"' for c in columns)})
                         VALUES ({", ".join(placeholders)})
                     """
-                    records = new_records_df.to_dict("records")
-                    insert_result = conn.execute(text(insert_query), records)
+                    records = cast(
+                        List[Dict[str, Any]], new_records_df.to_dict("records")
+                    )
+                    insert_result = conn.execute(
+                        text(insert_query), remap_records(records, col_param_map)
+                    )
                     conn.commit()
                     rowcount = getattr(insert_result, "rowcount", None)
                     inserted += rowcount if isinstance(rowcount, int) else len(records)
 
-                # Update existing rows where columns are NULL and candidate has value
+                # Fill NULL columns of existing rows with one executemany UPDATE
                 existing_df = candidates_df[~mask]
-                for record in existing_df.to_dict("records"):
-                    pk_value = record[config.target_key]
-                    update_fragments = []
-                    params: Dict[str, Any] = {"pk": pk_value}
-                    for col in columns:
-                        if col == config.target_key:
-                            continue
-                        value = record[col]
-                        if value is None:
-                            continue
-                        update_fragments.append(f"{col} = :{col}")
-                        params[col] = value
-                    if update_fragments:
-                        update_query = f"""
-                            UPDATE {qualified_table}
-                            SET {", ".join(update_fragments)}
-                            WHERE {config.target_key} = :pk AND (
-                                {" OR ".join([f"{col} IS NULL" for col in params if col != "pk"])}
-                            )
-                        """
-                        conn.execute(text(update_query), params)
+                update_columns = [c for c in columns if c != config.target_key]
+                if not existing_df.empty and update_columns:
+                    fills = ", ".join(
+                        f'"{c}" = COALESCE("{c}", :{col_param_map[c]})'
+                        for c in update_columns
+                    )
+                    null_check = " OR ".join(f'"{c}" IS NULL' for c in update_columns)
+                    key_param = col_param_map[config.target_key]
+                    update_query = f"""
+                        UPDATE {qualified_table} SET {fills}
+                        WHERE "{config.target_key}" = :{key_param}
+                        AND ({null_check})
+                    """
+                    existing_records = cast(
+                        List[Dict[str, Any]], existing_df.to_dict("records")
+                    )
+                    conn.execute(
+                        text(update_query),
+                        remap_records(existing_records, col_param_map),
+                    )
                 conn.commit()
 
                 # Return combined count (inserted records only; updates are idempotent fills)
@@ -887,6 +755,16 @@ class GenericBackfillService:
 
         return inserted_count
 
+    @staticmethod
+    def _jsonb_merge_columns(config: ForeignKeyConfig) -> List[str]:
+        """Target columns aggregated with JSONB_APPEND (merged, not overwritten)."""
+        return [
+            col_mapping.target
+            for col_mapping in config.backfill_columns
+            if col_mapping.aggregation
+            and col_mapping.aggregation.type == AggregationType.JSONB_APPEND
+        ]
+
     @staticmethod
     def _non_blank_mask(series: pd.Series) -> pd.Series:
         """
@@ -600,7 +600,7 @@ class ReferenceDataAuditLogger:
     Logs all modifications to reference tables with structured events.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the audit logger."""
         self.logger = structlog.get_logger(__name__)
 
@@ -171,6 +171,21 @@ class ReferenceSyncTableConfig(BaseModel):
         le=50000,
         description="Optional batch size override for this table (falls back to global batch_size)",
     )
+    load_method: Literal["values", "copy"] = Field(
+        default="values",
+        description=(
+            "values: parameterized INSERT statements; copy: COPY FROM STDIN, "
+            "upserts merged from a staging table (PostgreSQL targets)"
+        ),
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Fetch and load in batch_size chunks via a server-side cursor",
+    )
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="Names of table syncs that must finish before this one starts",
+    )
 
     @field_validator("name", "target_table", "primary_key")
     @classmethod
@@ -211,10 +226,16 @@ class ReferenceSyncConfig(BaseModel):
     def validate_tables(
         cls, v: List[ReferenceSyncTableConfig]
     ) -> List[ReferenceSyncTableConfig]:
-        """Validate table names are unique."""
+        """Validate table names are unique and dependencies are known."""
         if v:
             names = [table.name for table in v]
             if len(names) != len(set(names)):
                 duplicates = [name for name in names if names.count(name) > 1]
                 raise ValueError(f"Duplicate table sync names found: {duplicates}")
+            for table in v:
+                unknown = [dep for dep in table.depends_on if dep not in names]
+                if unknown:
+                    raise ValueError(
+                        f"Table sync '{table.name}' depends on unknown syncs: {unknown}"
+                    )
         return v
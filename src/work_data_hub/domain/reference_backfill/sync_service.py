@@ -4,18 +4,32 @@ Reference sync service for pre-loading authoritative data.
 This module provides a service for syncing reference data from authoritative
 sources (Legacy MySQL, config files) to implement the Pre-load layer of the
 hybrid reference data strategy (AD-011).
+
+Tables are synced in dependency waves (``depends_on``); within a wave up to
+``concurrency`` tables run at once, each on its own pooled connection.
+Tables with ``streaming`` enabled are fetched and loaded chunk by chunk;
+``load_method: copy`` loads PostgreSQL targets with COPY and merges upserts
+from a staging table in one statement.
 """
 
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol, Set
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Set
 
 import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.engine import Connection
 
 from .sync_models import ReferenceSyncTableConfig
+from .sync_staging import StagedUpsertMixin
+from .sync_streaming import StreamingDataSourceAdapter, StreamingSyncMixin
+from .sync_waves import (
+    ConnectionFactory,
+    WaveSyncMixin,
+    plan_sync_waves,
+    run_sync_waves,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +45,7 @@ class SyncResult:
     sync_mode: str
     duration_seconds: float
     error: Optional[str] = None
+    wave: int = 0
 
 
 class DataSourceAdapter(Protocol):
@@ -57,7 +72,7 @@ class DataSourceAdapter(Protocol):
         ...
 
 
-class ReferenceSyncService:
+class ReferenceSyncService(WaveSyncMixin, StreamingSyncMixin, StagedUpsertMixin):
     """
     Service for syncing reference data from authoritative sources.
 
@@ -85,13 +100,21 @@ class ReferenceSyncService:
         configs: List[ReferenceSyncTableConfig],
         adapters: Dict[str, DataSourceAdapter],
         conn: Connection,
+        *,
         plan_only: bool = False,
         state: Optional[Dict[str, Any]] = None,
         default_batch_size: Optional[int] = None,
+        concurrency: int = 1,
+        connection_factory: Optional[ConnectionFactory] = None,
     ) -> List[SyncResult]:
         """
         Sync all configured reference tables.
 
+        Tables run in dependency waves (see ``plan_sync_waves``). With
+        ``concurrency > 1`` and a ``connection_factory``, the tables of a wave
+        are synced by a bounded thread pool, each worker on its own
+        connection; otherwise every table is synced serially on ``conn``.
+
         Args:
             configs: List of table sync configurations
             adapters: Dictionary mapping source_type to adapter instances
@@ -99,86 +122,90 @@ class ReferenceSyncService:
             plan_only: If True, only plan without executing
             state: Optional per-table state, keyed by config.name
             default_batch_size: Optional global batch size override
+            concurrency: Maximum number of tables synced at the same time
+            connection_factory: Opens a dedicated connection per worker
+                (e.g. ``engine.connect``); required for concurrent sync
 
         Returns:
-            List of sync results for each table
+            List of sync results for each table, in ``configs`` order
 
         Raises:
-            ValueError: If adapter not found for source type
+            ValueError: If table dependencies form a cycle
         """
+        waves = plan_sync_waves(configs)
+        workers = max(1, min(concurrency, max((len(w) for w in waves), default=1)))
+        if connection_factory is None:
+            workers = 1
+
         self.logger.info(
             f"Starting reference sync for domain '{self.domain}' "
-            f"with {len(configs)} table configs"
+            f"with {len(configs)} table configs in {len(waves)} waves "
+            f"(concurrency: {workers})"
         )
+        start_time = time.time()
 
-        results = []
-        for config in configs:
-            # Get adapter for this source type
-            adapter = adapters.get(config.source_type)
-            if adapter is None:
-                error_msg = (
-                    f"No adapter found for source type '{config.source_type}'. "
-                    f"Available adapters: {list(adapters.keys())}"
-                )
-                self.logger.error(error_msg)
-                results.append(
-                    SyncResult(
-                        table=config.target_table,
-                        source_type=config.source_type,
-                        rows_synced=0,
-                        rows_deleted=0,
-                        sync_mode=config.sync_mode,
-                        duration_seconds=0.0,
-                        error=error_msg,
-                    )
-                )
-                continue
-
-            # Sync this table
-            try:
-                result = self.sync_table(
-                    config=config,
-                    adapter=adapter,
-                    conn=conn,
+        def run(config: ReferenceSyncTableConfig, wave: int) -> SyncResult:
+            state_for_table = (state or {}).get(config.name)
+            if workers == 1 or connection_factory is None:
+                return self._sync_one(
+                    config,
+                    conn,
+                    adapters,
                     plan_only=plan_only,
-                    state_for_table=(state or {}).get(config.name),
+                    state_for_table=state_for_table,
                     default_batch_size=default_batch_size,
+                    wave=wave,
                 )
-                results.append(result)
-            except Exception as e:
-                self.logger.error(
-                    f"Error syncing table '{config.target_table}': {e}",
-                    exc_info=True,
-                )
-                results.append(
-                    SyncResult(
-                        table=config.target_table,
-                        source_type=config.source_type,
-                        rows_synced=0,
-                        rows_deleted=0,
-                        sync_mode=config.sync_mode,
-                        duration_seconds=0.0,
-                        error=str(e),
-                    )
-                )
+            return self._sync_on_own_connection(
+                connection_factory,
+                config,
+                adapters,
+                plan_only=plan_only,
+                state_for_table=state_for_table,
+                default_batch_size=default_batch_size,
+                wave=wave,
+            )
+
+        results_by_name = run_sync_waves(waves, run, workers=workers)
+        results = [results_by_name[config.name] for config in configs]
 
         # Log summary
         total_synced = sum(r.rows_synced for r in results)
         total_deleted = sum(r.rows_deleted for r in results)
         failed_count = sum(1 for r in results if r.error is not None)
+        timings = ", ".join(f"{r.table}={r.duration_seconds:.2f}s" for r in results)
 
         self.logger.info(
             f"Reference sync completed: {total_synced} rows synced, "
-            f"{total_deleted} rows deleted, {failed_count} failures"
+            f"{total_deleted} rows deleted, {failed_count} failures "
+            f"in {time.time() - start_time:.2f}s ({timings})"
         )
 
         return results
 
+    @staticmethod
+    def _table_result(
+        config: ReferenceSyncTableConfig,
+        duration: float,
+        *,
+        rows_synced: int = 0,
+        rows_deleted: int = 0,
+    ) -> SyncResult:
+        return SyncResult(
+            table=config.target_table,
+            source_type=config.source_type,
+            rows_synced=rows_synced,
+            rows_deleted=rows_deleted,
+            sync_mode=config.sync_mode,
+            duration_seconds=duration,
+        )
+
     def sync_table(
         self,
         config: ReferenceSyncTableConfig,
         adapter: DataSourceAdapter,
         conn: Connection,
+        *,
         plan_only: bool = False,
         state_for_table: Optional[Dict[str, Any]] = None,
         default_batch_size: Optional[int] = None,
@@ -215,6 +242,17 @@ class ReferenceSyncService:
         )
 
         try:
+            if config.streaming and isinstance(adapter, StreamingDataSourceAdapter):
+                return self._sync_streamed(
+                    config,
+                    adapter,
+                    conn,
+                    plan_only=plan_only,
+                    state_for_table=state_for_table,
+                    batch_size=batch_size,
+                    start_time=start_time,
+                )
+
             # Fetch data from source
             df = adapter.fetch_data(config, state=state_for_table)
 
@@ -349,6 +387,26 @@ class ReferenceSyncService:
             config: Table sync configuration
             conn: Database connection
 
+        Returns:
+            Tuple of (rows_deleted, rows_inserted)
+        """
+        return self._sync_delete_insert_chunks([df], config, conn, batch_size)
+
+    def _sync_delete_insert_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        config: ReferenceSyncTableConfig,
+        conn: Connection,
+        batch_size: int,
+    ) -> tuple[int, int]:
+        """
+        Delete all existing records and insert ``chunks`` in one transaction.
+
+        Args:
+            chunks: DataFrames with reference data, consumed one at a time
+            config: Table sync configuration
+            conn: Database connection
+
         Returns:
             Tuple of (rows_deleted, rows_inserted)
         """
@@ -391,8 +449,12 @@ class ReferenceSyncService:
                         actor=f"sync_service.{self.domain}",
                     )
 
-            # Insert new records in batches
-            rows_inserted = self._batch_insert(df, config, conn, batch_size=batch_size)
+            # Insert new records in batches; commit only with the delete
+            rows_inserted = 0
+            for chunk in chunks:
+                rows_inserted += self._batch_insert(
+                    chunk, config, conn, batch_size=batch_size, commit=False
+                )
 
             # Log audit events for inserted records
             if audit_logger and rows_inserted > 0:
@@ -442,6 +504,9 @@ class ReferenceSyncService:
         Returns:
             Number of rows synced (inserted or updated)
         """
+        if self._uses_copy(config, conn):
+            return self._sync_upsert_staged(df, config, conn, batch_size=batch_size)
+
         full_table_name = f'"{config.target_schema}"."{config.target_table}"'
         columns = list(df.columns)
         placeholders = [f":{col}" for col in columns]
@@ -638,6 +703,8 @@ class ReferenceSyncService:
         config: ReferenceSyncTableConfig,
         conn: Connection,
         batch_size: int = 5000,
+        *,
+        commit: bool = True,
     ) -> int:
         """
         Insert records in batches.
@@ -647,6 +714,8 @@ class ReferenceSyncService:
             config: Table sync configuration
             conn: Database connection
             batch_size: Number of records per batch
+            commit: Commit after the last batch; False leaves it to the
+                caller's transaction
 
         Returns:
             Total number of rows inserted
@@ -656,6 +725,13 @@ class ReferenceSyncService:
 
         full_table_name = f'"{config.target_schema}"."{config.target_table}"'
         columns = list(df.columns)
+
+        if self._uses_copy(config, conn):
+            total_inserted = self._copy_insert(df, config, conn, batch_size)
+            if commit:
+                conn.commit()
+            return total_inserted
+
         placeholders = [f":{col}" for col in columns]
 
         insert_query = f"""
@@ -679,6 +755,7 @@ class ReferenceSyncService:
                 f"Inserted batch {i // batch_size + 1}: {batch_inserted} rows"
             )
 
-        conn.commit()
+        if commit:
+            conn.commit()
 
         return total_inserted
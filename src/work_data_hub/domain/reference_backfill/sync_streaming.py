@@ -0,0 +1,165 @@
+"""
+Chunked reference sync for tables with ``streaming`` enabled.
+
+Adapters that implement ``fetch_batches`` yield the source table in
+``batch_size`` DataFrames; ``StreamingSyncMixin`` loads them one at a time so
+memory stays bounded by the batch size instead of the table size.
+"""
+
+import itertools
+import logging
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
+
+import pandas as pd
+from sqlalchemy.engine import Connection
+
+from .sync_models import ReferenceSyncTableConfig
+
+if TYPE_CHECKING:
+    from .sync_service import SyncResult
+
+
+@runtime_checkable
+class StreamingDataSourceAdapter(Protocol):
+    """Protocol for adapters that can also stream reference data in chunks."""
+
+    def fetch_batches(
+        self,
+        table_config: ReferenceSyncTableConfig,
+        state: Optional[Dict[str, Any]] = None,
+        batch_size: int = 5000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield reference data as DataFrames of at most ``batch_size`` rows.
+
+        Raises:
+            Exception: If data fetch fails
+        """
+        ...
+
+
+class StreamingSyncMixin:
+    """
+    Mixin providing the chunked sync path for ReferenceSyncService.
+
+    Relies on the host class for tracking fields, length warnings, the
+    delete_insert / upsert writers and result construction.
+    """
+
+    logger: logging.Logger
+
+    if TYPE_CHECKING:
+
+        def _add_authoritative_tracking_fields(
+            self, df: pd.DataFrame
+        ) -> pd.DataFrame: ...
+
+        def _warn_if_string_columns_exceed_limit(
+            self, df: pd.DataFrame, limit: int = 255
+        ) -> None: ...
+
+        def _sync_delete_insert_chunks(
+            self,
+            chunks: Iterable[pd.DataFrame],
+            config: ReferenceSyncTableConfig,
+            conn: Connection,
+            batch_size: int,
+        ) -> tuple[int, int]: ...
+
+        def _sync_upsert(
+            self,
+            df: pd.DataFrame,
+            config: ReferenceSyncTableConfig,
+            conn: Connection,
+            batch_size: int,
+        ) -> int: ...
+
+        @staticmethod
+        def _table_result(
+            config: ReferenceSyncTableConfig,
+            duration: float,
+            *,
+            rows_synced: int = 0,
+            rows_deleted: int = 0,
+        ) -> SyncResult: ...
+
+    def _sync_streamed(
+        self,
+        config: ReferenceSyncTableConfig,
+        adapter: StreamingDataSourceAdapter,
+        conn: Connection,
+        *,
+        plan_only: bool,
+        state_for_table: Optional[Dict[str, Any]],
+        batch_size: int,
+        start_time: float,
+    ) -> "SyncResult":
+        """
+        Sync a table chunk by chunk from ``adapter.fetch_batches``.
+
+        Memory stays bounded by ``batch_size``: upsert writes each chunk as it
+        arrives, delete_insert deletes once and inserts every chunk inside a
+        single transaction.
+        """
+        prepared = (
+            self._prepare_chunk(chunk)
+            for chunk in adapter.fetch_batches(
+                config, state=state_for_table, batch_size=batch_size
+            )
+            if not chunk.empty
+        )
+        first = next(prepared, None)
+        if first is None:
+            self.logger.warning(
+                f"No data fetched for table '{config.target_table}' "
+                f"from {config.source_type}"
+            )
+            return self._table_result(config, time.time() - start_time)
+        chunks: Iterator[pd.DataFrame] = itertools.chain([first], prepared)
+
+        if plan_only:
+            rows = sum(len(chunk) for chunk in chunks)
+            self.logger.info(
+                f"Plan-only mode: Would sync {rows} rows to '{config.target_table}'"
+            )
+            return self._table_result(config, time.time() - start_time)
+
+        if config.sync_mode == "delete_insert":
+            rows_deleted, rows_synced = self._sync_delete_insert_chunks(
+                chunks, config, conn, batch_size=batch_size
+            )
+        else:  # upsert
+            rows_deleted = 0
+            rows_synced = 0
+            for chunk in chunks:
+                rows_synced += self._sync_upsert(
+                    chunk, config, conn, batch_size=batch_size
+                )
+
+        duration = time.time() - start_time
+        self.logger.info(
+            f"Table '{config.target_table}' synced in chunks: {rows_synced} rows, "
+            f"{rows_deleted} deleted, {duration:.2f}s"
+        )
+        return self._table_result(
+            config, duration, rows_synced=rows_synced, rows_deleted=rows_deleted
+        )
+
+    def _prepare_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Add tracking fields and length warnings to one streamed chunk."""
+        chunk = self._add_authoritative_tracking_fields(chunk)
+        self._warn_if_string_columns_exceed_limit(chunk)
+        return chunk
+
+
+__all__ = ["StreamingDataSourceAdapter", "StreamingSyncMixin"]
@@ -0,0 +1,223 @@
+"""
+Dependency-wave scheduling for ReferenceSyncService.sync_all.
+
+Table syncs are grouped into waves by ``depends_on``; the tables of one wave
+are independent of each other and run on a bounded thread pool, each worker
+on a connection of its own.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from sqlalchemy.engine import Connection
+
+from .sync_models import ReferenceSyncTableConfig
+
+if TYPE_CHECKING:
+    from .sync_service import DataSourceAdapter, SyncResult
+
+# Opens a dedicated connection for one worker, e.g. ``engine.connect``
+ConnectionFactory = Callable[[], ContextManager[Connection]]
+
+ResultT = TypeVar("ResultT")
+
+
+def plan_sync_waves(
+    configs: List[ReferenceSyncTableConfig],
+) -> List[List[ReferenceSyncTableConfig]]:
+    """
+    Group table configs into waves that respect ``depends_on``.
+
+    Every table lands in the first wave after all of its dependencies;
+    tables of one wave are independent of each other and may run
+    concurrently. Dependencies on syncs not in ``configs`` are ignored.
+
+    Raises:
+        ValueError: If the dependencies form a cycle
+    """
+    names = {config.name for config in configs}
+    remaining = list(configs)
+    done: Set[str] = set()
+    waves: List[List[ReferenceSyncTableConfig]] = []
+    while remaining:
+        wave = [
+            config
+            for config in remaining
+            if all(dep in done or dep not in names for dep in config.depends_on)
+        ]
+        if not wave:
+            cycle = [config.name for config in remaining]
+            raise ValueError(f"Circular depends_on between table syncs: {cycle}")
+        waves.append(wave)
+        done.update(config.name for config in wave)
+        remaining = [config for config in remaining if config.name not in done]
+    return waves
+
+
+def run_sync_waves(
+    waves: List[List[ReferenceSyncTableConfig]],
+    run: Callable[[ReferenceSyncTableConfig, int], ResultT],
+    *,
+    workers: int,
+) -> Dict[str, ResultT]:
+    """
+    Call ``run(config, wave_number)`` for every table, one wave after another.
+
+    With ``workers > 1`` the tables of a wave run on a thread pool of that
+    size and the next wave starts once all of them finished.
+
+    Returns:
+        Results keyed by config.name
+    """
+    results: Dict[str, ResultT] = {}
+    if workers <= 1:
+        for wave_number, wave in enumerate(waves):
+            for config in wave:
+                results[config.name] = run(config, wave_number)
+        return results
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="reference-sync"
+    ) as executor:
+        for wave_number, wave in enumerate(waves):
+            futures = {
+                config.name: executor.submit(run, config, wave_number)
+                for config in wave
+            }
+            for name, future in futures.items():
+                results[name] = future.result()
+    return results
+
+
+class WaveSyncMixin:
+    """
+    Mixin running one table of a wave for ReferenceSyncService.
+
+    Failures of a table (missing adapter, no connection, sync errors) become
+    an error result for that table so the other tables of the wave go on.
+    """
+
+    logger: logging.Logger
+
+    if TYPE_CHECKING:
+
+        def sync_table(
+            self,
+            config: ReferenceSyncTableConfig,
+            adapter: DataSourceAdapter,
+            conn: Connection,
+            *,
+            plan_only: bool = False,
+            state_for_table: Optional[Dict[str, Any]] = None,
+            default_batch_size: Optional[int] = None,
+        ) -> SyncResult: ...
+
+        @staticmethod
+        def _table_result(
+            config: ReferenceSyncTableConfig,
+            duration: float,
+            *,
+            rows_synced: int = 0,
+            rows_deleted: int = 0,
+        ) -> SyncResult: ...
+
+    def _sync_on_own_connection(
+        self,
+        connection_factory: ConnectionFactory,
+        config: ReferenceSyncTableConfig,
+        adapters: Dict[str, "DataSourceAdapter"],
+        *,
+        plan_only: bool,
+        state_for_table: Optional[Dict[str, Any]],
+        default_batch_size: Optional[int],
+        wave: int,
+    ) -> "SyncResult":
+        """Sync one table on a connection opened for this worker only."""
+        start_time = time.time()
+        try:
+            with connection_factory() as worker_conn:
+                return self._sync_one(
+                    config,
+                    worker_conn,
+                    adapters,
+                    plan_only=plan_only,
+                    state_for_table=state_for_table,
+                    default_batch_size=default_batch_size,
+                    wave=wave,
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Could not open a connection for table '{config.target_table}': {e}"
+            )
+            return self._failed_result(config, str(e), start_time, wave=wave)
+
+    def _sync_one(
+        self,
+        config: ReferenceSyncTableConfig,
+        conn: Connection,
+        adapters: Dict[str, "DataSourceAdapter"],
+        *,
+        plan_only: bool,
+        state_for_table: Optional[Dict[str, Any]],
+        default_batch_size: Optional[int],
+        wave: int,
+    ) -> "SyncResult":
+        """Sync one table, turning failures into an error result."""
+        start_time = time.time()
+
+        # Get adapter for this source type
+        adapter = adapters.get(config.source_type)
+        if adapter is None:
+            error_msg = (
+                f"No adapter found for source type '{config.source_type}'. "
+                f"Available adapters: {list(adapters.keys())}"
+            )
+            self.logger.error(error_msg)
+            return self._failed_result(config, error_msg, start_time, wave=wave)
+
+        try:
+            result = self.sync_table(
+                config=config,
+                adapter=adapter,
+                conn=conn,
+                plan_only=plan_only,
+                state_for_table=state_for_table,
+                default_batch_size=default_batch_size,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error syncing table '{config.target_table}': {e}",
+                exc_info=True,
+            )
+            return self._failed_result(config, str(e), start_time, wave=wave)
+
+        result.wave = wave
+        return result
+
+    def _failed_result(
+        self,
+        config: ReferenceSyncTableConfig,
+        error: str,
+        start_time: float,
+        *,
+        wave: int,
+    ) -> "SyncResult":
+        result = self._table_result(config, time.time() - start_time)
+        result.error = error
+        result.wave = wave
+        return result
+
+
+__all__ = ["ConnectionFactory", "WaveSyncMixin", "plan_sync_waves", "run_sync_waves"]
@@ -38,12 +38,17 @@ Usage:
 from typing import Any, Dict
 
 # 导出主要的公共 API
+from work_data_hub.infrastructure.cleansing.compiler import (
+    CompiledRuleChain,
+    compile_rule_chain,
+)
 from work_data_hub.infrastructure.cleansing.integrations.pydantic_adapter import (
     decimal_fields_cleaner,
     simple_field_validator,
 )
 from work_data_hub.infrastructure.cleansing.normalizers import (
     normalize_customer_name,
+    normalize_customer_names,
 )
 from work_data_hub.infrastructure.cleansing.registry import (
     CleansingRegistry,
@@ -96,6 +101,8 @@ __all__: list[str] = [
     "CleansingRule",
     "CleansingRegistry",
     "get_cleansing_registry",
+    "CompiledRuleChain",
+    "compile_rule_chain",
     # Pydantic 集成
     "decimal_fields_cleaner",
     "simple_field_validator",
@@ -109,6 +116,7 @@ __all__: list[str] = [
     "trim_whitespace",
     "normalize_company_name",
     "normalize_customer_name",  # Unified function (replaces all three legacy functions)
+    "normalize_customer_names",
     "parse_chinese_date_value",
     # 预配置清洗器
     "annuity_decimal_cleaner",
@@ -0,0 +1,191 @@
+"""
+清洗规则链编译器。
+
+``registry.apply_rules`` 在每个单元格上重复解析规则配置、查找规则并过滤
+kwargs。本模块把一条规则链（如 cleansing_rules.yml 中某个字段的配置）
+一次性编译为可调用对象：
+
+- 标量调用 ``chain(value)``：与 ``registry.apply_rules(value, specs)`` 结果一致
+- 列级调用 ``chain.apply_series(series)``：与
+  ``series.apply(lambda v: registry.apply_rules(v, specs))`` 结果一致，但
+    - 字符串先去重，整条规则链只在不同的字符串值上执行一次
+    - 注册了 ``series_func`` 的规则按列向量化执行，其余规则逐值执行
+
+规则必须是逐元素的纯函数（输出只取决于该单元格的值与 kwargs），
+这也是去重与向量化结果一致的前提。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from work_data_hub.infrastructure.cleansing.registry import (
+    CleansingRegistry,
+    CleansingRule,
+    RuleSpec,
+    get_cleansing_registry,
+)
+
+
+def string_mask(series: pd.Series) -> np.ndarray:
+    """返回标记 ``str`` 元素的布尔数组（与标量规则的 isinstance 判断一致）"""
+    return np.fromiter(
+        (isinstance(value, str) for value in series.to_numpy(dtype=object)),
+        dtype=bool,
+        count=len(series),
+    )
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """已解析的单条规则（规则对象 + 过滤后的 kwargs）"""
+
+    rule: CleansingRule
+    kwargs: Dict[str, Any]
+
+    def __call__(self, value: Any) -> Any:
+        try:
+            return self.rule.func(value, **self.kwargs)
+        except Exception as exc:
+            raise ValueError(
+                f"Cleansing rule '{self.rule.name}' failed for value '{value}': {exc}"
+            ) from exc
+
+    def apply_series(self, series: pd.Series) -> pd.Series:
+        """执行列级实现（调用方需确认 ``rule.series_func`` 存在）"""
+        series_func = self.rule.series_func
+        if series_func is None:
+            raise TypeError(f"Cleansing rule '{self.rule.name}' has no series_func")
+        try:
+            result: pd.Series = series_func(series, **self.kwargs)
+        except Exception as exc:
+            raise ValueError(
+                f"Cleansing rule '{self.rule.name}' failed for column "
+                f"'{series.name}': {exc}"
+            ) from exc
+        return result
+
+
+# 执行分段：单条向量化规则，或连续的一组标量规则
+_Segment = Union[CompiledRule, Tuple[CompiledRule, ...]]
+
+
+class CompiledRuleChain:
+    """
+    编译后的规则链
+
+    Example:
+        >>> chain = compile_rule_chain(["trim_whitespace", "normalize_company_name"])
+        >>> chain("  中国平安-已转出 ")
+        '中国平安'
+        >>> df["客户名称"] = chain.apply_series(df["客户名称"])
+    """
+
+    def __init__(self, rules: Sequence[CompiledRule]):
+        self.rules: Tuple[CompiledRule, ...] = tuple(rules)
+        self._segments = self._build_segments(self.rules)
+
+    @staticmethod
+    def _build_segments(rules: Sequence[CompiledRule]) -> List[_Segment]:
+        segments: List[_Segment] = []
+        scalar_run: List[CompiledRule] = []
+        for compiled in rules:
+            if compiled.rule.series_func is None:
+                scalar_run.append(compiled)
+                continue
+            if scalar_run:
+                segments.append(tuple(scalar_run))
+                scalar_run = []
+            segments.append(compiled)
+        if scalar_run:
+            segments.append(tuple(scalar_run))
+        return segments
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __call__(self, value: Any) -> Any:
+        for compiled in self.rules:
+            value = compiled(value)
+        return value
+
+    def apply_series(self, series: pd.Series) -> pd.Series:
+        """
+        对整列执行规则链
+
+        结果的 dtype 推断与 ``Series.apply`` 一致（如全部为 float 时返回 float64）。
+        扩展 dtype（category、string、Int64 等）退回逐元素执行。
+        """
+        if not self.rules or series.empty:
+            return series.copy()
+        if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            return series.apply(self)
+
+        values = series.to_numpy(dtype=object, copy=True)
+        is_str = string_mask(series)
+        if is_str.any():
+            # 仅对 str 去重：1 / 1.0 / True 彼此相等但规则输出可能不同
+            codes, uniques = pd.factorize(values[is_str])
+            cleaned = self._run_segments(np.asarray(uniques, dtype=object))
+            values[is_str] = cleaned[codes]
+        if not is_str.all():
+            values[~is_str] = self._run_segments(values[~is_str])
+
+        result = pd.Series(values, index=series.index, name=series.name, dtype=object)
+        return result.infer_objects()
+
+    def _run_segments(self, values: np.ndarray) -> np.ndarray:
+        for segment in self._segments:
+            if isinstance(segment, CompiledRule):
+                current = pd.Series(values, dtype=object)
+                values = segment.apply_series(current).to_numpy(dtype=object)
+            else:
+                values = _apply_scalar_rules(values, segment)
+        return values
+
+
+def _apply_scalar_rules(
+    values: np.ndarray, rules: Tuple[CompiledRule, ...]
+) -> np.ndarray:
+    """逐元素执行一组连续的标量规则"""
+    out = np.empty(len(values), dtype=object)
+    for position, value in enumerate(values):
+        for compiled in rules:
+            value = compiled(value)
+        out[position] = value
+    return out
+
+
+def compile_rule_chain(
+    rule_specs: Sequence[RuleSpec],
+    common_kwargs: Optional[Dict[str, Any]] = None,
+    cleansing_registry: Optional[CleansingRegistry] = None,
+) -> CompiledRuleChain:
+    """
+    将规则配置编译为可复用的规则链
+
+    Args:
+        rule_specs: 规则名称或 ``{"name": ..., "kwargs": {...}}`` 配置
+        common_kwargs: 注入到每个规则的共享关键字参数（如 field_name）
+        cleansing_registry: 使用的注册表（默认全局注册表）
+
+    Raises:
+        ValueError: 规则未注册或配置格式无效
+    """
+    active_registry = cleansing_registry or get_cleansing_registry()
+    resolved = active_registry.resolve_rules(rule_specs, **(common_kwargs or {}))
+    return CompiledRuleChain(
+        [CompiledRule(rule=rule, kwargs=kwargs) for rule, kwargs in resolved]
+    )
+
+
+__all__ = [
+    "CompiledRule",
+    "CompiledRuleChain",
+    "compile_rule_chain",
+    "string_mask",
+]
@@ -5,6 +5,7 @@ for consistent name handling across the entire codebase.
 
 Primary export:
     normalize_customer_name: Unified normalization function
+    normalize_customer_names: Column-wise variant (deduplicates first)
 """
 
 from work_data_hub.infrastructure.cleansing.normalizers.customer_name import (
@@ -13,10 +14,12 @@ from work_data_hub.infrastructure.cleansing.normalizers.customer_name import (
     PROTECTED_NAMES,
     STATUS_MARKERS,
     normalize_customer_name,
+    normalize_customer_names,
 )
 
 __all__ = [
     "normalize_customer_name",
+    "normalize_customer_names",
     "STATUS_MARKERS",
     "INVALID_PLACEHOLDERS",
     "ENTERPRISE_TYPES",
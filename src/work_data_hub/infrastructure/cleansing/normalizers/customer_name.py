@@ -16,13 +16,25 @@ Usage:
 
     normalized = normalize_customer_name("中国平安-已转出")
     # Returns: "中国平安"
+
+    # Column-wise: each distinct name is normalized once
+    df["客户名称"] = normalize_customer_names(df["客户名称"])
+
+Performance:
+    All patterns are compiled once at import time and results are memoized
+    per raw name (names repeat heavily across rows), so repeated calls from
+    cleansing, temp-ID generation and the DB strategy cost a dict lookup.
 """
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List
 
+import numpy as np
+import pandas as pd
+
 from work_data_hub.infrastructure.cleansing.constants import (
     FULLWIDTH_CHAR_END,
     FULLWIDTH_CHAR_START,
@@ -85,6 +97,22 @@ STATUS_MARKERS: List[str] = [
 # Sort by length descending for greedy matching
 _STATUS_MARKERS_SORTED = sorted(STATUS_MARKERS, key=len, reverse=True)
 
+# (marker, start, end, bracket) patterns, applied in _STATUS_MARKERS_SORTED
+# order. Stripping one marker can expose another, so the sequential order is
+# part of the behaviour and the patterns are not merged into one alternation.
+_STATUS_MARKER_PATTERNS = [
+    (
+        marker,
+        # e.g., "已转出-中国平安" → "中国平安"
+        re.compile(rf"^[\(\（]?{re.escape(marker)}[\)\）]?[\-]?"),
+        # e.g., "中国平安-已转出" / "中国平安——待转出" → "中国平安"
+        re.compile(rf"[—\-\(\（]{re.escape(marker)}[\)\）]?$"),
+        # e.g., "中国平安（已转出）" → "中国平安"
+        re.compile(rf"[\(\（]{re.escape(marker)}[\)\）]$"),
+    )
+    for marker in _STATUS_MARKERS_SORTED
+]
+
 # =============================================================================
 # Enterprise Types to PRESERVE (legal entity structure indicators)
 # =============================================================================
@@ -134,6 +162,26 @@ PROTECTED_NAMES: List[str] = [
 # Create a set for O(1) lookup, normalized to uppercase for matching
 _PROTECTED_NAMES_SET = {name.upper() for name in PROTECTED_NAMES}
 
+_INVALID_PLACEHOLDERS_SET = frozenset(INVALID_PLACEHOLDERS)
+
+# Upper bound on memoized raw names (a few MB at typical name lengths)
+NORMALIZE_CACHE_SIZE = 65536
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_BRACKET_RE = re.compile(r"^[（\(][^）\)]*[）\)]")
+_BUSINESS_SUFFIX_RE = re.compile(
+    r"(?:\(团托\)|（团托）|-[A-Za-z][A-Za-z0-9]*|-\d+|-养老|-福利)$"
+)
+_TRAILING_PARENTHESIS_RE = re.compile(r"[（\(]([^）\)]+)[）\)]$")
+_TRAILING_PUNCTUATION_RE = re.compile(r"[—\-\.。]+$")
+_TRAILING_DASHES_RE = re.compile(r"[—\-]+$")
+_DECORATIVE_TABLE = str.maketrans("", "", _DECORATIVE_CHARS)
+# Full-width ASCII → half-width, as a single str.translate table
+_FULLWIDTH_TABLE = {
+    code: code - FULLWIDTH_TO_HALFWIDTH_OFFSET
+    for code in range(FULLWIDTH_CHAR_START, FULLWIDTH_CHAR_END + 1)
+}
+
 
 def _clean_trailing_parenthesis(name: str) -> str:
     """Remove trailing parenthesized suffixes unless they contain enterprise types.
@@ -161,7 +209,7 @@ def _clean_trailing_parenthesis(name: str) -> str:
         '中心'
     """
     # Match trailing parenthesized content: （...） or (...)
-    match = re.search(r"[（\(]([^）\)]+)[）\)]$", name)
+    match = _TRAILING_PARENTHESIS_RE.search(name)
     if not match:
         return name
 
@@ -219,6 +267,12 @@ def normalize_customer_name(name: str | None) -> str:
     if not isinstance(name, str):
         return ""
 
+    return _normalize_str(name)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_str(name: str) -> str:
+    """Memoized body of :func:`normalize_customer_name` for ``str`` input."""
     # 0. Check for protected names - skip all cleaning, only apply UPPERCASE
     # This allows exact matches to bypass all transformations
     name_upper = name.strip().upper()
@@ -226,73 +280,54 @@ def normalize_customer_name(name: str | None) -> str:
         return name_upper
 
     # 1. Check for invalid placeholders (before any processing)
-    if name.strip() in INVALID_PLACEHOLDERS:
+    if name.strip() in _INVALID_PLACEHOLDERS_SET:
         return ""
 
     result = name
 
     # 2. Remove all whitespace (including full-width spaces)
     result = result.replace("\u3000", " ")  # Full-width space → half-width
-    result = re.sub(r"\s+", "", result)
+    result = _WHITESPACE_RE.sub("", result)
 
     # 3. Remove decorative characters
-    for char in _DECORATIVE_CHARS:
-        result = result.replace(char, "")
+    result = result.translate(_DECORATIVE_TABLE)
 
     # 4. Remove leading bracket content (may contain status markers)
     # e.g., "(原)中国平安" → "中国平安"
-    result = re.sub(r"^[（\(][^）\)]*[）\)]", "", result)
+    result = _LEADING_BRACKET_RE.sub("", result, count=1)
 
     # 5. Remove business-specific patterns and suffixes
-    result = re.sub(r"及下属子企业", "", result)
+    result = result.replace("及下属子企业", "")
     # Remove patterns like: (团托), -ChinaHolding, -BSU280, -养老, -福利
-    result = re.sub(
-        r"(?:\(团托\)|（团托）|-[A-Za-z][A-Za-z0-9]*|-\d+|-养老|-福利)$", "", result
-    )
+    result = _BUSINESS_SUFFIX_RE.sub("", result)
 
     # 6. Remove status markers from start and end
-    for marker in _STATUS_MARKERS_SORTED:
-        # Pattern for status at start (with optional brackets and separator)
-        # e.g., "已转出-中国平安" → "中国平安"
-        pattern_start = rf"^[\(\（]?{re.escape(marker)}[\)\）]?[\-]?"
-        result = re.sub(pattern_start, "", result)
-
-        # Pattern for status at end (with optional separators and brackets)
-        # e.g., "中国平安-已转出" → "中国平安"
-        # Also handle em-dash: "中国平安——待转出" → "中国平安"
-        pattern_end = rf"[—\-\(\（]{re.escape(marker)}[\)\）]?$"
-        result = re.sub(pattern_end, "", result)
-
-        # Pattern for status in brackets at end
-        # e.g., "中国平安（已转出）" → "中国平安"
-        pattern_bracket = rf"[\(\（]{re.escape(marker)}[\)\）]$"
-        result = re.sub(pattern_bracket, "", result)
+    for marker, pattern_start, pattern_end, pattern_bracket in _STATUS_MARKER_PATTERNS:
+        # Every pattern contains the marker literally
+        if marker not in result:
+            continue
+        result = pattern_start.sub("", result)
+        result = pattern_end.sub("", result)
+        result = pattern_bracket.sub("", result)
 
     # 6.5 Clean trailing parenthesized suffixes but preserve enterprise types
     # e.g., "公司（集团）" → "公司" but "公司（普通合伙）" stays
     result = _clean_trailing_parenthesis(result)
 
     # 7. Full-width ASCII → Half-width conversion
-    result = "".join(
-        [
-            chr(ord(char) - FULLWIDTH_TO_HALFWIDTH_OFFSET)
-            if FULLWIDTH_CHAR_START <= ord(char) <= FULLWIDTH_CHAR_END
-            else char
-            for char in result
-        ]
-    )
+    result = result.translate(_FULLWIDTH_TABLE)
 
     # 8. Normalize brackets to Chinese full-width
     result = result.replace("(", "（").replace(")", "）")
 
     # 9. Remove trailing punctuation and empty brackets
-    result = re.sub(r"[—\-\.。]+$", "", result)  # Remove trailing dash, em-dash, period
-    result = re.sub(r"（）$", "", result)  # Remove empty Chinese brackets
+    # Remove trailing dash, em-dash, period
+    result = _TRAILING_PUNCTUATION_RE.sub("", result)
+    result = result.removesuffix("（）")  # Remove empty Chinese brackets
     # Only remove orphaned/unmatched trailing brackets, not paired ones with content
     # e.g., "公司）" → "公司" but "公司（集团）" stays as is
-    result = re.sub(
-        r"[—\-]+$", "", result
-    )  # Remove trailing dashes (regular and em-dash)
+    # Remove trailing dashes (regular and em-dash)
+    result = _TRAILING_DASHES_RE.sub("", result)
 
     # 10. UPPERCASE conversion (decision: 2026-01-05)
     result = result.upper()
@@ -300,8 +335,30 @@ def normalize_customer_name(name: str | None) -> str:
     return result
 
 
+def normalize_customer_names(names: pd.Series) -> pd.Series:
+    """Normalize a column of customer names, each distinct value once.
+
+    Equivalent to ``names.map(normalize_customer_name)`` but deduplicates
+    first, which matters because the same customer appears on many rows.
+
+    Args:
+        names: Raw customer/company names (any dtype; non-strings become "").
+
+    Returns:
+        Object Series of normalized names with the input's index and name.
+    """
+    codes, uniques = pd.factorize(names, use_na_sentinel=False)
+    normalized = np.array(
+        [normalize_customer_name(value) for value in uniques], dtype=object
+    )
+    return pd.Series(
+        normalized[codes], index=names.index, name=names.name, dtype=object
+    )
+
+
 __all__ = [
     "normalize_customer_name",
+    "normalize_customer_names",
     "STATUS_MARKERS",
     "INVALID_PLACEHOLDERS",
     "ENTERPRISE_TYPES",
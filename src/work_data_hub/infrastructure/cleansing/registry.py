@@ -13,7 +13,17 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from threading import RLock
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import yaml
 
@@ -39,6 +49,8 @@ class CleansingRule:
     category: RuleCategory
     func: Callable[..., Any]
     description: str
+    # 可选的列级（pd.Series）实现，语义必须与 func 逐元素执行完全一致
+    series_func: Optional[Callable[..., Any]] = None
 
     def __post_init__(self) -> None:
         """验证规则的有效性"""
@@ -99,6 +111,20 @@ class CleansingRegistry:
             self._rule_signatures.pop(rule.name, None)
         logger.debug(f"Registered cleansing rule: {rule.name} ({rule.category.value})")
 
+    def register_series_func(self, name: str, func: Callable[..., Any]) -> None:
+        """
+        为已注册规则绑定列级向量化实现
+
+        Args:
+            name: 规则名称
+            func: 接收 object dtype 的 pd.Series（及规则 kwargs），返回同长度 Series
+        """
+        rule = self.get_rule(name)
+        if rule is None:
+            raise ValueError(f"Cleansing rule '{name}' not registered")
+        rule.series_func = func
+        logger.debug(f"Registered series implementation for rule: {name}")
+
     def get_rule(self, name: str) -> Optional[CleansingRule]:
         """根据名称获取清洗规则"""
         return self._rules.get(name)
@@ -164,28 +190,60 @@ class CleansingRegistry:
             return result
 
         for spec in rule_specs:
-            if isinstance(spec, str):
-                rule_name: Optional[str] = spec
-                rule_kwargs: Dict[str, Any] = {}
-            elif isinstance(spec, dict):
-                rule_name = spec.get("name")
-                rule_kwargs = spec.get("kwargs", {})
-                if not rule_name:
-                    raise ValueError("Rule specification missing 'name'")
-            else:
-                raise ValueError(
-                    f"Invalid rule specification {spec!r}. Expected string or mapping."
-                )
-
-            # Ensure rule_name is not None before using it
-            if rule_name is None:
-                raise ValueError("Rule name cannot be None")
-
+            rule_name, rule_kwargs = self._parse_rule_spec(spec)
             merged_kwargs = {**rule_kwargs, **common_kwargs}
             result = self.apply_rule(result, rule_name, **merged_kwargs)
 
         return result
 
+    def resolve_rules(
+        self,
+        rule_specs: Sequence[RuleSpec],
+        **common_kwargs: Any,
+    ) -> List[Tuple[CleansingRule, Dict[str, Any]]]:
+        """
+        解析规则链：一次性完成规则查找和 kwargs 合并/过滤
+
+        供编译后的规则链使用，避免在每个单元格上重复解析。
+
+        Returns:
+            (规则, 过滤后的 kwargs) 列表，顺序与 rule_specs 一致
+        """
+        resolved: List[Tuple[CleansingRule, Dict[str, Any]]] = []
+        for spec in rule_specs:
+            rule_name, rule_kwargs = self._parse_rule_spec(spec)
+            rule = self.get_rule(rule_name)
+            if not rule:
+                available = sorted(self._rules.keys())
+                raise ValueError(
+                    f"Cleansing rule '{rule_name}' not registered. "
+                    f"Available: {available}"
+                )
+            merged_kwargs = {**rule_kwargs, **common_kwargs}
+            resolved.append((rule, self._filter_kwargs(rule_name, merged_kwargs)))
+        return resolved
+
+    @staticmethod
+    def _parse_rule_spec(spec: RuleSpec) -> Tuple[str, Dict[str, Any]]:
+        if isinstance(spec, str):
+            rule_name: Optional[str] = spec
+            rule_kwargs: Dict[str, Any] = {}
+        elif isinstance(spec, dict):
+            rule_name = spec.get("name")
+            rule_kwargs = spec.get("kwargs", {})
+            if not rule_name:
+                raise ValueError("Rule specification missing 'name'")
+        else:
+            raise ValueError(
+                f"Invalid rule specification {spec!r}. Expected string or mapping."
+            )
+
+        # Ensure rule_name is not None before using it
+        if rule_name is None:
+            raise ValueError("Rule name cannot be None")
+
+        return rule_name, rule_kwargs
+
     def _filter_kwargs(self, rule_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         if not kwargs:
             return {}
@@ -343,6 +401,26 @@ def rule(
     return decorator
 
 
+def series_rule(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    列级实现注册装饰器
+
+    为已通过 ``@rule`` 注册的规则绑定 pd.Series 级别的快速实现，
+    编译后的规则链（见 ``cleansing.compiler``）会优先使用它。
+
+    Example:
+        @series_rule("trim_whitespace")
+        def trim_whitespace_series(series):
+            ...
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        registry.register_series_func(name, func)
+        return func
+
+    return decorator
+
+
 def get_cleansing_registry() -> CleansingRegistry:
     """便于依赖注入的辅助函数"""
     return registry
@@ -8,12 +8,20 @@
 import re
 import unicodedata
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
+
+from work_data_hub.infrastructure.cleansing.compiler import (
+    compile_rule_chain,
+    string_mask,
+)
 from work_data_hub.infrastructure.cleansing.registry import (
     RuleCategory,
     get_cleansing_registry,
     rule,
+    series_rule,
 )
 
 # 字段精度配置 - 可以通过配置文件外部化
@@ -40,6 +48,22 @@ NULL_PLACEHOLDERS = {"", "-", "N/A", "无", "暂无", "null", "NULL", "None"}
 # 货币符号 - 可扩展
 CURRENCY_SYMBOLS = {"¥", "$", "￥", "€", "£", "₽"}
 
+_CURRENCY_SYMBOLS_PATTERN = re.compile(
+    "[" + "".join(re.escape(symbol) for symbol in sorted(CURRENCY_SYMBOLS)) + "]"
+)
+
+# "万/亿" 单位后缀及倍数（匹配顺序与 convert_chinese_amount_units 一致）
+_AMOUNT_UNIT_MULTIPLIERS = {
+    "万元": 10_000.0,
+    "万": 10_000.0,
+    "亿元": 100_000_000.0,
+    "亿": 100_000_000.0,
+}
+_AMOUNT_UNIT_PATTERN = r"(?s)^(.*)(万元|万|亿元|亿)\Z"
+
+# 可直接交给 float() 的普通数值字符串（仅 ASCII 数字）
+_PLAIN_NUMBER_PATTERN = r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+
 DEFAULT_SCHEMA_NUMERIC_RULES: List[Any] = [
     "standardize_null_values",
     "remove_currency_symbols",
@@ -76,6 +100,22 @@ def remove_currency_symbols(value: Any) -> Any:
     return cleaned
 
 
+@series_rule("remove_currency_symbols")
+def remove_currency_symbols_series(series: pd.Series) -> pd.Series:
+    """remove_currency_symbols 的列级实现。"""
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+    result = series.copy()
+    result[mask] = (
+        series[mask]
+        .str.strip()
+        .str.replace(_CURRENCY_SYMBOLS_PATTERN, "", regex=True)
+        .to_numpy()
+    )
+    return result
+
+
 @rule(
     name="clean_comma_separated_number",
     category=RuleCategory.NUMERIC,
@@ -101,6 +141,27 @@ def clean_comma_separated_number(value: Any) -> Any:
     return cleaned
 
 
+@series_rule("clean_comma_separated_number")
+def clean_comma_separated_number_series(series: pd.Series) -> pd.Series:
+    """clean_comma_separated_number 的列级实现。"""
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+    cleaned = (
+        series[mask]
+        .str.strip()
+        .str.replace(",", "", regex=False)
+        .str.replace(" ", "", regex=False)
+        .str.replace("\u3000", "", regex=False)
+    )
+    is_null = cleaned.isin(NULL_PLACEHOLDERS) | cleaned.str.lower().isin(
+        NULL_PLACEHOLDERS
+    )
+    result = series.copy()
+    result[mask] = cleaned.where(~is_null, None).to_numpy()
+    return result
+
+
 @rule(
     name="convert_chinese_amount_units",
     category=RuleCategory.NUMERIC,
@@ -155,6 +216,57 @@ def convert_chinese_amount_units(value: Any) -> Any:
     return float(candidate) * multiplier
 
 
+@series_rule("convert_chinese_amount_units")
+def convert_chinese_amount_units_series(series: pd.Series) -> pd.Series:
+    """
+    convert_chinese_amount_units 的列级实现
+
+    单位后缀、分隔符和占位符用正则一次性处理；数值部分不是普通数字的
+    字符串（如 "1.2.3万"）交回标量实现，由其给出相同的结果或异常。
+    """
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+
+    values = series.to_numpy(dtype=object, copy=True)
+    originals = values[mask]
+    normalized = pd.Series(originals, dtype=object).str.normalize("NFKC").str.strip()
+    parts = normalized.str.extract(_AMOUNT_UNIT_PATTERN)
+    has_unit = parts[1].notna().to_numpy()
+
+    out = originals.copy()
+    out[(normalized == "").to_numpy()] = None
+    if has_unit.any():
+        candidate = (
+            parts.loc[has_unit, 0]
+            .str.strip()
+            .str.replace(",", "", regex=False)
+            .str.replace(" ", "", regex=False)
+            .str.replace("\u3000", "", regex=False)
+        )
+        is_null = candidate.isin(NULL_PLACEHOLDERS) | candidate.str.lower().isin(
+            NULL_PLACEHOLDERS
+        )
+        candidate = candidate.str.replace(r"[^0-9.+-]", "", regex=True)
+        is_null |= candidate.isin({"", "+", "-", ".", "+.", "-."})
+        is_number = ~is_null & candidate.str.fullmatch(_PLAIN_NUMBER_PATTERN)
+
+        multiplier = parts.loc[has_unit, 1].map(_AMOUNT_UNIT_MULTIPLIERS)
+        converted = np.full(len(candidate), None, dtype=object)
+        converted[is_number.to_numpy()] = (
+            candidate[is_number].to_numpy(dtype=float)
+            * multiplier[is_number].to_numpy(dtype=float)
+        ).astype(object)
+        undecided = ~(is_null | is_number).to_numpy()
+        unit_originals = originals[has_unit]
+        for position in np.flatnonzero(undecided):
+            converted[position] = convert_chinese_amount_units(unit_originals[position])
+        out[has_unit] = converted
+
+    values[mask] = out
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
 @rule(
     name="handle_percentage_conversion",
     category=RuleCategory.NUMERIC,
@@ -206,6 +318,42 @@ def handle_percentage_conversion(value: Any, field_name: str = "") -> Union[floa
     return value  # type: ignore[no-any-return]
 
 
+@series_rule("handle_percentage_conversion")
+def handle_percentage_conversion_series(
+    series: pd.Series, field_name: str = ""
+) -> pd.Series:
+    """
+    handle_percentage_conversion 的列级实现
+
+    非收益率字段只需 NFKC 规范化字符串并转换含 "%" 的值；
+    收益率字段还要逐值判断数值大小，直接复用标量实现。
+    """
+    if "收益率" in field_name or "rate" in field_name.lower():
+        return pd.Series(
+            [handle_percentage_conversion(value, field_name) for value in series],
+            index=series.index,
+            name=series.name,
+            dtype=object,
+        )
+
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+    normalized = series[mask].str.normalize("NFKC")
+    result = series.copy()
+    result[mask] = normalized.to_numpy()
+
+    percent = normalized.str.contains("%", regex=False).to_numpy(dtype=bool)
+    converted: List[float] = []
+    for value in normalized.to_numpy()[percent]:
+        try:
+            converted.append(float(value.replace("%", "").strip()) / 100.0)
+        except ValueError:
+            raise ValueError(f"Invalid percentage format: {value}")
+    result.iloc[np.flatnonzero(mask)[percent]] = converted
+    return result
+
+
 @rule(
     name="standardize_null_values",
     category=RuleCategory.VALIDATION,
@@ -230,6 +378,21 @@ def standardize_null_values(value: Any) -> Optional[Any]:
     return value
 
 
+@series_rule("standardize_null_values")
+def standardize_null_values_series(series: pd.Series) -> pd.Series:
+    """standardize_null_values 的列级实现。"""
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+    is_null = np.zeros(len(series), dtype=bool)
+    is_null[mask] = series[mask].str.strip().isin(NULL_PLACEHOLDERS).to_numpy()
+    if not is_null.any():
+        return series
+    result = series.copy()
+    result[is_null] = None
+    return result
+
+
 @rule(
     name="decimal_quantization",
     category=RuleCategory.NUMERIC,
@@ -359,6 +522,72 @@ def comprehensive_decimal_cleaning(
         )
 
 
+@series_rule("comprehensive_decimal_cleaning")
+def comprehensive_decimal_cleaning_series(
+    series: pd.Series,
+    field_name: str = "",
+    precision: Optional[int] = None,
+    handle_percentage: bool = True,
+    precision_config: Optional[Dict[str, int]] = None,
+) -> pd.Series:
+    """
+    comprehensive_decimal_cleaning 的列级实现
+
+    空值、货币符号、千位分隔符和百分比按列处理；Decimal 量化仍调用
+    decimal_quantization，保证结果与标量实现逐值一致（字符串只量化一次）。
+    出错时对原始值重跑标量实现，以抛出相同的异常信息。
+    """
+    prepared = standardize_null_values_series(
+        clean_comma_separated_number_series(
+            remove_currency_symbols_series(standardize_null_values_series(series))
+        )
+    )
+    if handle_percentage:
+        prepared = handle_percentage_conversion_series(prepared, field_name)
+
+    def quantize(cleaned: Any) -> Optional[Decimal]:
+        if cleaned is None:
+            return None
+        if isinstance(cleaned, str):
+            float(cleaned)
+        quantized: Optional[Decimal] = decimal_quantization(
+            cleaned,
+            field_name=field_name,
+            precision=precision,
+            precision_config=precision_config,
+        )
+        return quantized
+
+    values = prepared.to_numpy(dtype=object, copy=True)
+    is_str = string_mask(prepared)
+    codes = np.zeros(len(values), dtype=np.intp)
+    if is_str.any():
+        string_codes, uniques = pd.factorize(values[is_str])
+        codes[is_str] = string_codes
+        targets = list(uniques) + list(values[~is_str])
+        codes[~is_str] = np.arange(len(uniques), len(targets))
+    else:
+        targets = list(values)
+        codes = np.arange(len(values))
+
+    results = np.empty(len(targets), dtype=object)
+    for target, cleaned in enumerate(targets):
+        try:
+            results[target] = quantize(cleaned)
+        except (ValueError, TypeError):
+            first = int(np.flatnonzero(codes == target)[0])
+            comprehensive_decimal_cleaning(
+                series.iloc[first],
+                field_name=field_name,
+                precision=precision,
+                handle_percentage=handle_percentage,
+                precision_config=precision_config,
+            )
+            raise
+
+    return pd.Series(results[codes], index=series.index, name=series.name, dtype=object)
+
+
 def clean_numeric_for_schema(
     value: Any,
     field_name: str,
@@ -398,6 +627,64 @@ def clean_numeric_for_schema(
         ) from exc
 
 
+def clean_numeric_series_for_schema(
+    series: pd.Series,
+    field_name: str,
+    *,
+    domain: str = "annuity_performance",
+    registry: Optional[Any] = None,
+    fallback_rules: Optional[List[Any]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    clean_numeric_for_schema 的列级实现
+
+    规则链编译后按列执行，结果中的 None、数值和普通数字字符串直接转为
+    float；其余单元格（规则链报错、Decimal、无法直接判定的字符串等）
+    标记为未判定，由调用方逐值调用 clean_numeric_for_schema，
+    从而保留逐行的无效值报告。
+
+    Returns:
+        (values, decided)：float 数组，以及标记已判定单元格的布尔数组
+    """
+    registry = registry or get_cleansing_registry()
+    rules = registry.get_domain_rules(domain, field_name)
+    if not rules:
+        rules = fallback_rules or DEFAULT_SCHEMA_NUMERIC_RULES
+
+    values = np.full(len(series), np.nan)
+    decided = np.zeros(len(series), dtype=bool)
+    try:
+        chain = compile_rule_chain(rules, {"field_name": field_name}, registry)
+        cleaned = chain.apply_series(series).to_numpy(dtype=object)
+    except ValueError:
+        # 任一单元格失败时整列交给标量路径逐行定位
+        return values, decided
+
+    is_none = np.fromiter(
+        (value is None for value in cleaned), dtype=bool, count=len(cleaned)
+    )
+    is_number = np.fromiter(
+        (isinstance(value, (int, float, np.integer, np.floating)) for value in cleaned),
+        dtype=bool,
+        count=len(cleaned),
+    )
+    values[is_number] = cleaned[is_number].astype(float)
+
+    is_str = string_mask(pd.Series(cleaned, dtype=object))
+    if is_str.any():
+        plain = np.zeros(len(cleaned), dtype=bool)
+        plain[is_str] = (
+            pd.Series(cleaned[is_str], dtype=object)
+            .str.fullmatch(_PLAIN_NUMBER_PATTERN)
+            .to_numpy(dtype=bool)
+        )
+        values[plain] = cleaned[plain].astype(float)
+        decided |= plain
+
+    decided |= is_none | is_number
+    return values, decided
+
+
 # 便捷函数 - 为特定领域提供预配置的清洗函数
 def create_domain_decimal_cleaner(
     precision_config: Dict[str, int],
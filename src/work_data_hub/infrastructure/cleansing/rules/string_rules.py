@@ -10,10 +10,23 @@ from __future__ import annotations
 import warnings
 from typing import Any
 
+import pandas as pd
+
+from work_data_hub.infrastructure.cleansing.compiler import string_mask
 from work_data_hub.infrastructure.cleansing.normalizers import (
     normalize_customer_name,
+    normalize_customer_names,
+)
+from work_data_hub.infrastructure.cleansing.registry import (
+    RuleCategory,
+    rule,
+    series_rule,
+)
+
+_DEPRECATION_MESSAGE = (
+    "normalize_company_name is deprecated. "
+    "Use normalize_customer_name from infrastructure.cleansing.normalizers instead."
 )
-from work_data_hub.infrastructure.cleansing.registry import RuleCategory, rule
 
 
 @rule(
@@ -33,6 +46,19 @@ def trim_whitespace(value: Any) -> Any:
     return normalized.strip()
 
 
+@series_rule("trim_whitespace")
+def trim_whitespace_series(series: pd.Series) -> pd.Series:
+    """trim_whitespace 的列级实现。"""
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+    result = series.copy()
+    result[mask] = (
+        series[mask].str.replace("\u3000", " ", regex=False).str.strip().to_numpy()
+    )
+    return result
+
+
 @rule(
     name="normalize_company_name",
     category=RuleCategory.STRING,
@@ -52,13 +78,25 @@ def normalize_company_name(value: Any) -> Any:
     if not isinstance(value, str):
         return value
 
-    warnings.warn(
-        "normalize_company_name is deprecated. "
-        "Use normalize_customer_name from infrastructure.cleansing.normalizers instead.",
-        DeprecationWarning,
-        stacklevel=2,
-    )
+    warnings.warn(_DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=2)
     return normalize_customer_name(value)
 
 
-__all__ = ["trim_whitespace", "normalize_company_name"]
+@series_rule("normalize_company_name")
+def normalize_company_name_series(series: pd.Series) -> pd.Series:
+    """normalize_company_name 的列级实现（相同名称只规范化一次）。"""
+    mask = string_mask(series)
+    if not mask.any():
+        return series
+    warnings.warn(_DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=2)
+    result = series.copy()
+    result[mask] = normalize_customer_names(series[mask]).to_numpy()
+    return result
+
+
+__all__ = [
+    "trim_whitespace",
+    "trim_whitespace_series",
+    "normalize_company_name",
+    "normalize_company_name_series",
+]
@@ -37,6 +37,8 @@ class EqcLookupConfig:
             should be skipped regardless of other settings.
         sync_budget: Maximum number of synchronous EQC API calls allowed per
             batch resolution. 0 disables sync lookups.
+        sync_concurrency: Maximum EQC lookups in flight at once during batch
+            resolution (all share one rate limiter). 1 looks names up serially.
         auto_create_provider: Whether CompanyIdResolver should auto-create
             EqcProvider when mapping_repository is available. Only takes effect
             when enabled=True.
@@ -62,6 +64,7 @@ class EqcLookupConfig:
 
     enabled: bool = False
     sync_budget: int = 0
+    sync_concurrency: int = 4
     auto_create_provider: bool = False
     export_unknown_names: bool = True
     auto_refresh_token: bool = True
@@ -180,6 +183,7 @@ class EqcLookupConfig:
             return cls(
                 enabled=enabled,
                 sync_budget=getattr(settings, "company_sync_lookup_limit", 5),
+                sync_concurrency=getattr(settings, "eqc_sync_concurrency", 4),
                 auto_create_provider=enabled,  # Auto-create when enabled
                 export_unknown_names=True,
                 auto_refresh_token=True,
@@ -218,6 +222,7 @@ class EqcLookupConfig:
         return cls(
             enabled=data.get("enabled", False),
             sync_budget=data.get("sync_budget", 0),
+            sync_concurrency=data.get("sync_concurrency", 4),
             auto_create_provider=data.get("auto_create_provider", False),
             export_unknown_names=data.get("export_unknown_names", True),
             auto_refresh_token=data.get("auto_refresh_token", True),
@@ -242,6 +247,7 @@ class EqcLookupConfig:
         return {
             "enabled": self.enabled,
             "sync_budget": self.sync_budget,
+            "sync_concurrency": self.sync_concurrency,
             "auto_create_provider": self.auto_create_provider,
             "export_unknown_names": self.export_unknown_names,
             "auto_refresh_token": self.auto_refresh_token,
@@ -0,0 +1,183 @@
+"""
+Bounded-concurrency batch lookup for EqcProvider.
+
+``ConcurrentLookupMixin`` adds ``lookup_many`` to the provider: up to
+``max_workers`` EQC requests run on a thread pool while budget accounting and
+database caching stay on the calling thread. The findDepart/findLabels
+payloads of each request are kept thread-local so concurrent calls do not
+overwrite each other.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from work_data_hub.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from work_data_hub.infrastructure.enrichment.eqc_provider import CompanyInfo
+    from work_data_hub.infrastructure.enrichment.mapping_repository import (
+        CompanyMappingRepository,
+    )
+
+logger = get_logger(__name__)
+
+DEFAULT_LOOKUP_CONCURRENCY = 4
+
+RawPayload = Optional[Dict[str, Any]]
+# (result, raw search json, (raw business info, raw biz label))
+FetchResult = Tuple[Optional["CompanyInfo"], RawPayload, Tuple[RawPayload, RawPayload]]
+
+
+class ConcurrentLookupMixin:
+    """Mixin providing thread-pool batch lookups for EqcProvider."""
+
+    remaining_budget: int
+    mapping_repository: Optional["CompanyMappingRepository"]
+    _call_state: threading.local
+
+    if TYPE_CHECKING:
+
+        def lookup(self, company_name: str) -> Optional["CompanyInfo"]: ...
+
+        def _can_lookup(self) -> bool: ...
+
+        def _call_api_with_retry(
+            self, company_name: str
+        ) -> Tuple[Optional["CompanyInfo"], RawPayload]: ...
+
+        def _cache_result(
+            self,
+            company_name: str,
+            result: "CompanyInfo",
+            raw_json: RawPayload = None,
+        ) -> None: ...
+
+    @property
+    def _raw_business_info(self) -> RawPayload:
+        raw: RawPayload = getattr(self._call_state, "raw_business_info", None)
+        return raw
+
+    @_raw_business_info.setter
+    def _raw_business_info(self, value: RawPayload) -> None:
+        self._call_state.raw_business_info = value
+
+    @property
+    def _raw_biz_label(self) -> RawPayload:
+        raw: RawPayload = getattr(self._call_state, "raw_biz_label", None)
+        return raw
+
+    @_raw_biz_label.setter
+    def _raw_biz_label(self, value: RawPayload) -> None:
+        self._call_state.raw_biz_label = value
+
+    def lookup_many(
+        self,
+        company_names: Sequence[str],
+        max_workers: int = DEFAULT_LOOKUP_CONCURRENCY,
+        on_result: Optional[Callable[[str, Optional["CompanyInfo"]], None]] = None,
+    ) -> Dict[str, Optional["CompanyInfo"]]:
+        """
+        Look up several names with up to ``max_workers`` requests in flight.
+
+        Budget is reserved on the calling thread before each request is
+        submitted, so exactly one unit is consumed per issued lookup (as with
+        ``lookup``) and never more than ``remaining_budget``. All workers
+        share the client's sliding-window rate limiter. Successful results are
+        cached on the calling thread because the repository connection is not
+        thread-safe.
+
+        Args:
+            company_names: Names to look up, in priority order.
+            max_workers: Maximum concurrent requests (<= 1 looks up serially).
+            on_result: Optional callback invoked on the calling thread as each
+                lookup completes (e.g. progress reporting).
+
+        Returns:
+            Mapping of name -> CompanyInfo (None when not found or failed).
+            Names that were not attempted (budget exhausted, provider disabled)
+            are absent.
+        """
+        results: Dict[str, Optional["CompanyInfo"]] = {}
+        if max_workers <= 1:
+            for company_name in company_names:
+                if not self._can_lookup():
+                    break
+                try:
+                    results[company_name] = self.lookup(company_name)
+                except Exception as e:
+                    logger.warning(
+                        "eqc_provider.lookup_failed",
+                        error_type=type(e).__name__,
+                    )
+                    results[company_name] = None
+                if on_result:
+                    on_result(company_name, results[company_name])
+            return results
+
+        pending: Iterator[str] = iter(company_names)
+        in_flight: Dict[Future[FetchResult], str] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="eqc-lookup"
+        ) as pool:
+            while True:
+                while len(in_flight) < max_workers and self._can_lookup():
+                    next_name = next(pending, None)
+                    if next_name is None:
+                        break
+                    self.remaining_budget -= 1
+                    in_flight[pool.submit(self._fetch, next_name)] = next_name
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    company_name = in_flight.pop(future)
+                    result = self._collect(company_name, future)
+                    results[company_name] = result
+                    if on_result:
+                        on_result(company_name, result)
+
+        logger.info(
+            "eqc_provider.lookup_many_completed",
+            requested=len(company_names),
+            attempted=len(results),
+            found=sum(1 for result in results.values() if result),
+            max_workers=max_workers,
+            remaining_budget=self.remaining_budget,
+        )
+        return results
+
+    def _collect(
+        self, company_name: str, future: "Future[FetchResult]"
+    ) -> Optional["CompanyInfo"]:
+        """Take a finished lookup_many request and cache it (calling thread)."""
+        try:
+            result, raw_json, raw_extras = future.result()
+        except Exception as e:
+            logger.warning(
+                "eqc_provider.lookup_failed",
+                error_type=type(e).__name__,
+            )
+            return None
+        if result and self.mapping_repository:
+            self._raw_business_info, self._raw_biz_label = raw_extras
+            self._cache_result(company_name, result, raw_json)
+        return result
+
+    def _fetch(self, company_name: str) -> FetchResult:
+        """Worker-thread body of lookup_many: API calls only, no DB access."""
+        result, raw_json = self._call_api_with_retry(company_name)
+        return result, raw_json, (self._raw_business_info, self._raw_biz_label)
+
+
+__all__ = ["ConcurrentLookupMixin", "DEFAULT_LOOKUP_CONCURRENCY"]
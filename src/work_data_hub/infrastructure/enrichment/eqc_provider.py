@@ -9,6 +9,7 @@ Architecture Reference: AD-002 (Temporary ID Generation), AD-010 (Infrastructure
 
 Features:
 - Budget-limited API calls (default: 5 per session)
+- Bounded-concurrency batch lookup sharing the client's rate limiter
 - 5-second timeout per request with fail-fast behavior
 - 2 retries on network timeout (not on 4xx errors)
 - Automatic result caching to database
@@ -20,13 +21,17 @@ Security:
 - Only logs counts and status codes
 """
 
+import threading
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol
 
 import requests
 
 from work_data_hub.config.settings import get_settings
+from work_data_hub.infrastructure.enrichment.eqc_lookup_pool import (
+    ConcurrentLookupMixin,
+)
 from work_data_hub.infrastructure.enrichment.normalizer import normalize_for_temp_id
 from work_data_hub.io.connectors.eqc_client import (  # noqa: TID251 - Infrastructure needs EQC client
     EQCAuthenticationError,
@@ -198,7 +203,7 @@ def validate_eqc_token(token: str, base_url: str) -> bool:
         return True
 
 
-class EqcProvider:
+class EqcProvider(ConcurrentLookupMixin):
     """
     EQC platform API provider for company ID lookup.
 
@@ -255,6 +260,8 @@ class EqcProvider:
         self.mapping_repository = mapping_repository
         self._disabled = False
         self.client: Optional[EQCClient] = None
+        # Per-thread scratch space for findDepart/findLabels responses
+        self._call_state = threading.local()
 
         # Story 7.1-8: Load EQC confidence config for dynamic confidence scoring
         if eqc_confidence_config is None:
@@ -308,23 +315,15 @@ class EqcProvider:
             validate_on_init=validate_on_init,
         )
 
-    def lookup(self, company_name: str) -> Optional[CompanyInfo]:
-        """
-        Look up company information from EQC API.
-
-        Args:
-            company_name: Company name to look up.
-
-        Returns:
-            CompanyInfo if found, None if not found or error.
-        """
+    def _can_lookup(self) -> bool:
+        """Check disabled state, budget and token before issuing a lookup."""
         # Check if provider is disabled (after 401)
         if self._disabled:
             logger.debug(
                 "eqc_provider.disabled",
                 msg="Provider disabled for session due to previous 401",
             )
-            return None
+            return False
 
         # Check budget
         if self.remaining_budget <= 0:
@@ -333,7 +332,7 @@ class EqcProvider:
                 msg="EQC sync budget exhausted",
                 budget=self.budget,
             )
-            return None
+            return False
 
         # Check token
         if not self.token:
@@ -341,6 +340,21 @@ class EqcProvider:
                 "eqc_provider.no_token",
                 msg="No API token configured",
             )
+            return False
+
+        return True
+
+    def lookup(self, company_name: str) -> Optional[CompanyInfo]:
+        """
+        Look up company information from EQC API.
+
+        Args:
+            company_name: Company name to look up.
+
+        Returns:
+            CompanyInfo if found, None if not found or error.
+        """
+        if not self._can_lookup():
             return None
 
         # Make API call with retry
@@ -357,7 +371,7 @@ class EqcProvider:
 
     def _call_api_with_retry(
         self, company_name: str
-    ) -> tuple[Optional[CompanyInfo], Optional[dict]]:
+    ) -> tuple[Optional[CompanyInfo], Optional[Dict[str, Any]]]:
         """
         Call EQC API with retry logic for network timeouts.
 
@@ -395,7 +409,7 @@ class EqcProvider:
 
     def _call_api(
         self, company_name: str
-    ) -> tuple[Optional[CompanyInfo], Optional[dict]]:
+    ) -> tuple[Optional[CompanyInfo], Optional[Dict[str, Any]]]:
         """
         Make API calls to EQC search, findDepart, and findLabels endpoints.
 
@@ -483,7 +497,7 @@ class EqcProvider:
         self,
         company_name: str,
         result: CompanyInfo,
-        raw_json: Optional[dict] = None,
+        raw_json: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Cache successful lookup result to database (non-blocking).
@@ -752,7 +766,7 @@ class EqcProvider:
             )
 
 
-def _extract_match_type_from_raw_json(raw_json: Optional[dict]) -> str:
+def _extract_match_type_from_raw_json(raw_json: Optional[Dict[str, Any]]) -> str:
     """
     Extract EQC match quality from raw API response (Story 7.1-8).
 
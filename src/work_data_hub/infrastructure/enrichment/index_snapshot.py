@@ -0,0 +1,529 @@
+"""
+Local snapshot of enterprise.enrichment_index.
+
+enrichment_index changes slowly (EQC backflow, domain learning, hit-count
+bumps), yet every ETL run re-queries it through
+``lookup_enrichment_index_batch`` and ``CacheWarmer``. This module keeps a
+full copy of the table in one Arrow IPC file that is memory-mapped on load:
+
+- Rows are sorted by a stable 64-bit hash of ``(lookup_type, lookup_key)``;
+  a batch of keys is resolved with one ``np.searchsorted`` over the mapped
+  hash column followed by an exact key comparison (no per-row SQL).
+- The first refresh dumps the whole table. Later refreshes fetch only rows
+  with ``updated_at`` at or after the stored watermark (minus a small overlap)
+  and merge in the rows that actually changed.
+  ``update_hit_count`` and the insert upsert both bump ``updated_at``, so the
+  watermark also covers hit-count changes.
+- Deletions are not visible through the watermark: when the merged row count
+  differs from ``COUNT(*)`` (or the snapshot is older than the full-refresh
+  interval) the snapshot is rebuilt from a full dump.
+
+``SnapshotMappingRepository`` wraps a ``CompanyMappingRepository`` so that
+``CompanyIdResolver`` consults the snapshot first and only sends misses to
+Postgres. Snapshot failures never fail a resolution; they are logged and the
+resolver falls back to the database.
+"""
+
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from sqlalchemy import text
+
+from work_data_hub.utils.logging import get_logger
+
+from .types import EnrichmentIndexRecord, LookupType
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+    from work_data_hub.infrastructure.enrichment.mapping_repository import (
+        CompanyMappingRepository,
+    )
+
+logger = get_logger(__name__)
+
+# Bump when the file layout changes so old snapshots are rebuilt
+SNAPSHOT_FORMAT_VERSION = 1
+
+_META_VERSION = b"wdh.snapshot_version"
+_META_WATERMARK = b"wdh.watermark"
+_META_BUILT_AT = b"wdh.built_at"
+
+_KEY_SEPARATOR = "\x1f"
+
+# Re-read rows slightly older than the watermark: ``updated_at = NOW()`` is the
+# writer's transaction start, which can precede a snapshot taken before commit
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+_RECORD_COLUMNS = [
+    "lookup_key",
+    "lookup_type",
+    "company_id",
+    "confidence",
+    "source",
+    "source_domain",
+    "source_table",
+    "hit_count",
+    "last_hit_at",
+    "created_at",
+    "updated_at",
+]
+
+_SELECT_COLUMNS = ", ".join(_RECORD_COLUMNS)
+
+_FULL_DUMP_SQL = text(f"""
+    SELECT {_SELECT_COLUMNS}
+    FROM enterprise.enrichment_index
+""")
+
+_DELTA_SQL = text(f"""
+    SELECT {_SELECT_COLUMNS}
+    FROM enterprise.enrichment_index
+    WHERE updated_at >= :watermark
+""")
+
+_COUNT_SQL = text("SELECT COUNT(*) FROM enterprise.enrichment_index")
+
+
+def key_hashes(lookup_types: Iterable[str], lookup_keys: Iterable[str]) -> np.ndarray:
+    """Stable uint64 hashes of ``(lookup_type, lookup_key)`` pairs."""
+    combined = np.array(
+        [
+            f"{lookup_type}{_KEY_SEPARATOR}{lookup_key}"
+            for lookup_type, lookup_key in zip(lookup_types, lookup_keys)
+        ],
+        dtype=object,
+    )
+    if not len(combined):
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_array(combined, categorize=False)
+
+
+@dataclass
+class SnapshotStats:
+    """Lookup and refresh counters for one snapshot instance (process-local)."""
+
+    hits: int = 0
+    misses: int = 0
+    full_refreshes: int = 0
+    incremental_refreshes: int = 0
+    rows_refreshed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class EnrichmentIndexSnapshot:
+    """
+    Memory-mapped, incrementally refreshed copy of enrichment_index.
+
+    Keys passed to :meth:`lookup_batch` must already be normalized the way
+    they are stored (see ``CompanyMappingRepository._normalize_lookup_key``).
+
+    Example:
+        >>> snapshot = EnrichmentIndexSnapshot(Path(".cache/enrichment_index.arrow"))
+        >>> snapshot.refresh(connection)
+        'full'
+        >>> snapshot.lookup_batch({LookupType.PLAN_CODE: ["FP0001"]})
+        {(<LookupType.PLAN_CODE: 'plan_code'>, 'FP0001'): EnrichmentIndexRecord(...)}
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_staleness_seconds: float = 900,
+        full_refresh_interval_seconds: float = 24 * 3600,
+    ) -> None:
+        self.path = Path(path)
+        self.max_staleness_seconds = max_staleness_seconds
+        self.full_refresh_interval_seconds = full_refresh_interval_seconds
+        self.stats = SnapshotStats()
+        self._table: Optional[pa.Table] = None
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._watermark: Optional[datetime] = None
+        self._built_at: Optional[float] = None
+        self._refreshed_at: Optional[float] = None
+
+    # ------------------------------------------------------------------ state
+
+    @property
+    def loaded(self) -> bool:
+        return self._table is not None
+
+    @property
+    def row_count(self) -> int:
+        return 0 if self._table is None else self._table.num_rows
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        return self._watermark
+
+    @property
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the snapshot was last synchronized with Postgres."""
+        if self._refreshed_at is None:
+            return None
+        return max(0.0, time.time() - self._refreshed_at)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Staleness, size and hit-rate metrics for logging/statistics."""
+        staleness = self.staleness_seconds
+        return {
+            "row_count": self.row_count,
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "staleness_seconds": None if staleness is None else round(staleness, 1),
+            **self.stats.to_dict(),
+        }
+
+    def load(self) -> bool:
+        """Memory-map the snapshot file; False when missing or unusable."""
+        try:
+            with pa.memory_map(str(self.path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid, OSError):
+            return False
+
+        metadata = table.schema.metadata or {}
+        if metadata.get(_META_VERSION) != str(SNAPSHOT_FORMAT_VERSION).encode():
+            logger.info(
+                "enrichment_index_snapshot.format_mismatch", path=str(self.path)
+            )
+            return False
+
+        watermark = metadata.get(_META_WATERMARK, b"").decode()
+        self._watermark = datetime.fromisoformat(watermark) if watermark else None
+        self._built_at = float(metadata[_META_BUILT_AT].decode())
+        # File mtime records the last successful refresh (incremental or full)
+        self._refreshed_at = self.path.stat().st_mtime
+        self._set_table(table)
+        return True
+
+    def _set_table(self, table: pa.Table) -> None:
+        self._table = table
+        self._hashes = table.column("key_hash").to_numpy()
+
+    # ---------------------------------------------------------------- refresh
+
+    def refresh_if_stale(self, connection: "Connection") -> str:
+        """Refresh only when older than ``max_staleness_seconds``."""
+        if not self.loaded:
+            self.load()
+        staleness = self.staleness_seconds
+        if staleness is not None and staleness < self.max_staleness_seconds:
+            return "fresh"
+        return self.refresh(connection)
+
+    def refresh(self, connection: "Connection") -> str:
+        """
+        Bring the snapshot up to date with enrichment_index.
+
+        Returns:
+            "full", "incremental" or "unchanged".
+        """
+        if not self.loaded:
+            self.load()
+        if (
+            self._table is None
+            or self._watermark is None
+            or self._built_at is None
+            or time.time() - self._built_at >= self.full_refresh_interval_seconds
+        ):
+            return self._full_refresh(connection)
+
+        delta = _rows_to_frame(
+            connection.execute(
+                _DELTA_SQL, {"watermark": self._watermark - WATERMARK_OVERLAP}
+            )
+        )
+        changed = delta[self._differs(delta)]
+        db_count = connection.execute(_COUNT_SQL).scalar_one()
+        if changed.empty and db_count == self.row_count:
+            self._refreshed_at = time.time()
+            os.utime(self.path)
+            return "unchanged"
+
+        current = self._table.drop_columns(["key_hash"]).to_pandas()
+        merged = pd.concat([current, changed], ignore_index=True).drop_duplicates(
+            subset=["lookup_type", "lookup_key"], keep="last"
+        )
+        if len(merged) != db_count:
+            # Rows were deleted (or written concurrently): rebuild from scratch
+            logger.info(
+                "enrichment_index_snapshot.count_mismatch",
+                snapshot_rows=len(merged),
+                table_rows=db_count,
+            )
+            return self._full_refresh(connection)
+
+        self._write(merged, built_at=self._built_at)
+        self.stats.incremental_refreshes += 1
+        self.stats.rows_refreshed += len(changed)
+        logger.info(
+            "enrichment_index_snapshot.incremental_refresh",
+            changed_rows=len(changed),
+            row_count=self.row_count,
+        )
+        return "incremental"
+
+    def _full_refresh(self, connection: "Connection") -> str:
+        frame = _rows_to_frame(connection.execute(_FULL_DUMP_SQL))
+        self._write(frame, built_at=time.time())
+        self.stats.full_refreshes += 1
+        self.stats.rows_refreshed += len(frame)
+        logger.info("enrichment_index_snapshot.full_refresh", row_count=len(frame))
+        return "full"
+
+    def _write(self, frame: pd.DataFrame, built_at: float) -> None:
+        frame = frame.assign(
+            key_hash=key_hashes(frame["lookup_type"], frame["lookup_key"])
+        ).sort_values("key_hash", kind="stable", ignore_index=True)
+
+        updated_at = pd.to_datetime(frame["updated_at"], utc=True).dropna()
+        watermark = updated_at.max().to_pydatetime() if len(updated_at) else None
+        if watermark is None:
+            watermark = self._watermark
+
+        table = pa.Table.from_pandas(frame, preserve_index=False).combine_chunks()
+        table = table.replace_schema_metadata(
+            {
+                _META_VERSION: str(SNAPSHOT_FORMAT_VERSION),
+                _META_WATERMARK: watermark.isoformat() if watermark else "",
+                _META_BUILT_AT: repr(built_at),
+            }
+        )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, self.path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        self._watermark = watermark
+        self._built_at = built_at
+        self._refreshed_at = time.time()
+        # Re-map the file just written instead of keeping the in-memory copy
+        if not self.load():
+            self._set_table(table)
+
+    def _differs(self, delta: pd.DataFrame) -> np.ndarray:
+        """Mask of delta rows that are new or differ from the stored row."""
+        if delta.empty:
+            return np.zeros(0, dtype=bool)
+        fresh = pa.Table.from_pandas(delta, preserve_index=False).to_pylist()
+        stored = self._find_rows(delta["lookup_type"].tolist(), delta["lookup_key"])
+        return np.array(
+            [stored.get(position) != row for position, row in enumerate(fresh)],
+            dtype=bool,
+        )
+
+    def _find_rows(
+        self, lookup_types: List[str], lookup_keys: Iterable[str]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Stored rows (without ``key_hash``) by position of the requested pair."""
+        keys = [str(key) for key in lookup_keys]
+        if self._table is None or not keys:
+            return {}
+        wanted = key_hashes(lookup_types, keys)
+        left = np.searchsorted(self._hashes, wanted, side="left")
+        right = np.searchsorted(self._hashes, wanted, side="right")
+
+        candidates = [
+            (position, row)
+            for position in np.flatnonzero(right > left)
+            for row in range(left[position], right[position])
+        ]
+        if not candidates:
+            return {}
+        rows = self._table.take([row for _, row in candidates]).to_pylist()
+        found: Dict[int, Dict[str, Any]] = {}
+        for (position, _), row in zip(candidates, rows):
+            if (row["lookup_type"], row["lookup_key"]) != (
+                lookup_types[position],
+                keys[position],
+            ):
+                continue  # hash collision
+            row.pop("key_hash")
+            found[int(position)] = row
+        return found
+
+    # ----------------------------------------------------------------- lookup
+
+    def lookup_batch(
+        self,
+        keys_by_type: Mapping[LookupType, Iterable[str]],
+    ) -> Dict[Tuple[LookupType, str], EnrichmentIndexRecord]:
+        """
+        Resolve normalized keys against the snapshot.
+
+        Returns the same shape as ``lookup_enrichment_index_batch``; keys that
+        are not in the snapshot are simply absent.
+        """
+        pairs = list(
+            {
+                (lookup_type, str(key))
+                for lookup_type, keys in keys_by_type.items()
+                for key in keys
+            }
+        )
+        if not pairs or self._table is None:
+            self.stats.misses += len(pairs)
+            return {}
+
+        found = self._find_rows(
+            [lookup_type.value for lookup_type, _ in pairs],
+            [key for _, key in pairs],
+        )
+        results: Dict[Tuple[LookupType, str], EnrichmentIndexRecord] = {}
+        for row in found.values():
+            record = EnrichmentIndexRecord.from_dict(row)
+            results[(record.lookup_type, record.lookup_key)] = record
+
+        self.stats.hits += len(results)
+        self.stats.misses += len(pairs) - len(results)
+        return results
+
+
+def _rows_to_frame(result: Any) -> pd.DataFrame:
+    rows = result.mappings().all()
+    frame = pd.DataFrame(
+        {column: [row[column] for row in rows] for column in _RECORD_COLUMNS},
+        columns=_RECORD_COLUMNS,
+    )
+    # Decimal confidence is stored as text so it round-trips exactly
+    frame["confidence"] = frame["confidence"].map(
+        lambda value: None if value is None else str(value)
+    )
+    frame["hit_count"] = frame["hit_count"].fillna(0).astype("int64")
+    for column in ("last_hit_at", "created_at", "updated_at"):
+        frame[column] = pd.to_datetime(frame[column], utc=True).dt.as_unit("us")
+    for column in ("lookup_key", "lookup_type", "company_id", "source"):
+        frame[column] = frame[column].astype(object)
+    return frame
+
+
+class SnapshotMappingRepository:
+    """
+    Read-through view of a ``CompanyMappingRepository``.
+
+    ``lookup_enrichment_index_batch`` is answered from the snapshot and only
+    the misses are queried in Postgres. Every other attribute (writes,
+    ``update_hit_count``, ``connection`` ...) is delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        repository: "CompanyMappingRepository",
+        snapshot: EnrichmentIndexSnapshot,
+    ) -> None:
+        self.repository = repository
+        self.snapshot = snapshot
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.repository, name)
+
+    def lookup_enrichment_index_batch(
+        self,
+        keys_by_type: Dict[LookupType, List[str]],
+    ) -> Dict[Tuple[LookupType, str], EnrichmentIndexRecord]:
+        normalize = self.repository._normalize_lookup_key
+        normalized: Dict[LookupType, Dict[str, List[str]]] = {}
+        for lookup_type, keys in keys_by_type.items():
+            by_key = normalized.setdefault(lookup_type, {})
+            for key in keys:
+                by_key.setdefault(normalize(key, lookup_type), []).append(key)
+
+        try:
+            results = self.snapshot.lookup_batch(normalized)
+        except Exception as exc:
+            logger.warning("enrichment_index_snapshot.lookup_failed", error=str(exc))
+            return self.repository.lookup_enrichment_index_batch(keys_by_type)
+
+        missing: Dict[LookupType, List[str]] = {}
+        for lookup_type, by_key in normalized.items():
+            for key, originals in by_key.items():
+                if (lookup_type, key) not in results:
+                    missing.setdefault(lookup_type, []).extend(originals)
+
+        if missing:
+            results.update(self.repository.lookup_enrichment_index_batch(missing))
+        logger.debug(
+            "enrichment_index_snapshot.lookup_batch",
+            snapshot_hits=len(results),
+            forwarded_keys=sum(len(keys) for keys in missing.values()),
+        )
+        return results
+
+
+_DEFAULT_SNAPSHOTS: Dict[str, EnrichmentIndexSnapshot] = {}
+
+
+def build_index_snapshot(settings: Any) -> Optional[EnrichmentIndexSnapshot]:
+    """
+    Build the snapshot configured by ``settings`` (None when disabled).
+
+    Reuses one instance per path so hit/miss counters and the mapped file are
+    shared by every resolver in the process.
+    """
+    if getattr(settings, "enrichment_snapshot_enabled", False) is not True:
+        return None
+    path = getattr(settings, "enrichment_snapshot_path", None)
+    if not isinstance(path, str):
+        return None
+
+    key = str(Path(path).resolve())
+    snapshot = _DEFAULT_SNAPSHOTS.get(key)
+    if snapshot is None:
+        snapshot = EnrichmentIndexSnapshot(
+            Path(key),
+            max_staleness_seconds=settings.enrichment_snapshot_max_staleness_seconds,
+            full_refresh_interval_seconds=(
+                settings.enrichment_snapshot_full_refresh_hours * 3600
+            ),
+        )
+        _DEFAULT_SNAPSHOTS[key] = snapshot
+    return snapshot
+
+
+def get_default_index_snapshot() -> Optional[EnrichmentIndexSnapshot]:
+    """Return the snapshot configured in application settings (None if disabled)."""
+    from work_data_hub.config.settings import get_settings
+
+    return build_index_snapshot(get_settings())
+
+
+__all__ = [
+    "SNAPSHOT_FORMAT_VERSION",
+    "WATERMARK_OVERLAP",
+    "EnrichmentIndexSnapshot",
+    "SnapshotMappingRepository",
+    "SnapshotStats",
+    "build_index_snapshot",
+    "get_default_index_snapshot",
+    "key_hashes",
+]
@@ -10,7 +10,7 @@ Story 7.3: Infrastructure Layer Decomposition
 
 import logging
 import os
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, cast
 
 import pandas as pd
 
@@ -26,6 +26,9 @@ from ..types import (
 if TYPE_CHECKING:
     from work_data_hub.domain.company_enrichment.service import CompanyEnrichmentService
     from work_data_hub.infrastructure.enrichment.eqc_provider import EqcProvider
+    from work_data_hub.infrastructure.enrichment.index_snapshot import (
+        EnrichmentIndexSnapshot,
+    )
     from work_data_hub.infrastructure.enrichment.mapping_repository import (
         CompanyMappingRepository,
     )
@@ -91,6 +94,8 @@ class CompanyIdResolver:
         yaml_overrides: Optional[Dict[str, Dict[str, str]]] = None,
         mapping_repository: Optional["CompanyMappingRepository"] = None,
         eqc_provider: Optional["EqcProvider"] = None,
+        *,
+        index_snapshot: Optional["EnrichmentIndexSnapshot"] = None,
     ) -> None:
         """
         Initialize the CompanyIdResolver.
@@ -112,6 +117,9 @@ class CompanyIdResolver:
             eqc_provider: Optional EqcProvider for EQC sync lookup.
                 If not provided AND eqc_config.should_auto_create_provider is True,
                 will create one using settings + mapping_repository.
+            index_snapshot: Optional local EnrichmentIndexSnapshot consulted
+                before Postgres for enrichment_index lookups. If not provided,
+                the snapshot configured in settings is used (disabled by default).
 
         Example:
             >>> # For tests - disable EQC
@@ -198,6 +206,10 @@ class CompanyIdResolver:
                 "enrichment_service will be IGNORED per eqc_config.",
             )
 
+        # Local enrichment_index snapshot: serve DB cache lookups from disk and
+        # send only misses to Postgres. EqcProvider keeps the raw repository.
+        self.index_snapshot = self._attach_index_snapshot(index_snapshot)
+
         # Initialize YAML overrides
         if yaml_overrides is None:
             # Auto-load YAML if not provided
@@ -219,6 +231,45 @@ class CompanyIdResolver:
         self.salt = os.environ.get(SALT_ENV_VAR, DEFAULT_SALT)
         self._check_salt_safety()
 
+    def _attach_index_snapshot(
+        self, index_snapshot: Optional["EnrichmentIndexSnapshot"]
+    ) -> Optional["EnrichmentIndexSnapshot"]:
+        """Refresh the snapshot and wrap mapping_repository with it."""
+        if self.mapping_repository is None:
+            return None
+        try:
+            from work_data_hub.infrastructure.enrichment.index_snapshot import (
+                SnapshotMappingRepository,
+                get_default_index_snapshot,
+            )
+
+            if index_snapshot is None:
+                index_snapshot = get_default_index_snapshot()
+            if index_snapshot is None:
+                return None
+            refresh = index_snapshot.refresh_if_stale(
+                self.mapping_repository.connection
+            )
+        except Exception as e:
+            logger.warning(
+                "company_id_resolver.index_snapshot_unavailable",
+                error=str(e),
+                msg="Falling back to direct enrichment_index queries",
+            )
+            return None
+
+        logger.info(
+            "company_id_resolver.index_snapshot_attached",
+            refresh=refresh,
+            **index_snapshot.metrics(),
+        )
+        # Duck-typed proxy: delegates everything but the batch lookup
+        self.mapping_repository = cast(
+            "CompanyMappingRepository",
+            SnapshotMappingRepository(self.mapping_repository, index_snapshot),
+        )
+        return index_snapshot
+
     def _check_salt_safety(self) -> None:
         """Log warning if using default salt in non-development environment."""
         if self.salt == DEFAULT_SALT:
@@ -494,6 +545,9 @@ class CompanyIdResolver:
         # Count unresolved
         stats.unresolved = result_df[strategy.output_column].isna().sum()
 
+        if self.index_snapshot is not None:
+            stats.index_snapshot_stats = self.index_snapshot.metrics()
+
         logger.info(
             "company_id_resolver.batch_resolution_complete",
             total_rows=stats.total_rows,
@@ -503,6 +557,7 @@ class CompanyIdResolver:
             eqc_sync_hits=stats.eqc_sync_hits,
             temp_ids_generated=stats.temp_ids_generated,
             unresolved=stats.unresolved,
+            index_snapshot=stats.index_snapshot_stats or None,
         )
 
         return ResolutionResult(data=result_df, statistics=stats)
@@ -13,11 +13,14 @@ Story 7.3: Infrastructure Layer Decomposition
 import logging
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from work_data_hub.infrastructure.cleansing.normalizers import (
+    normalize_customer_names,
+)
 from work_data_hub.utils.logging import get_logger
 
-from ..normalizer import normalize_for_temp_id
 from ..types import (
     EnrichmentIndexRecord,
     LookupType,
@@ -70,6 +73,90 @@ def resolve_via_db_cache(
     )
 
 
+# Priority order and labels for enrichment_index lookups
+_PRIORITY_ORDER = [
+    LookupType.PLAN_CODE,
+    LookupType.CUSTOMER_NAME,
+    LookupType.PLAN_CUSTOMER,
+    LookupType.FORMER_NAME,
+]
+_LABEL_BY_TYPE = {
+    LookupType.PLAN_CODE: "plan_code",
+    LookupType.CUSTOMER_NAME: "customer_name",
+    LookupType.PLAN_CUSTOMER: "plan_customer",
+    LookupType.FORMER_NAME: "former_name",
+}
+_PATH_LABEL_BY_TYPE = {
+    LookupType.PLAN_CODE: "DB-P1",
+    LookupType.CUSTOMER_NAME: "DB-P2",
+    LookupType.PLAN_CUSTOMER: "DB-P3",
+    LookupType.FORMER_NAME: "DB-P4",
+}
+# Cache entries that are placeholders rather than company IDs
+_INVALID_SENTINELS = {"N", "NA", "N/A", "NONE", "NULL", "NAN"}
+
+# Per-priority outcome codes (combined base-3 into one code per row)
+_MISS, _INVALID, _HIT = 0, 1, 2
+_OUTCOME_NAMES = {_MISS: "MISS", _INVALID: "INVALID", _HIT: "HIT"}
+
+
+def _empty_hits() -> Dict[str, int]:
+    return {label: 0 for label in _LABEL_BY_TYPE.values()}
+
+
+def _column_or_none(frame: pd.DataFrame, column: str) -> pd.Series:
+    if column in frame.columns:
+        return frame[column]
+    return pd.Series(None, index=frame.index, dtype=object)
+
+
+def _build_candidate_keys(
+    frame: pd.DataFrame, strategy: ResolutionStrategy
+) -> Dict[LookupType, pd.Series]:
+    """
+    Build the per-priority lookup key columns (None where no key applies).
+
+    P1 uses the raw plan code; P2/P4 use the normalized customer name;
+    P3 combines both as ``"{plan_code}|{normalized_customer}"``.
+    """
+    plan_raw = _column_or_none(frame, strategy.plan_code_column)
+    customer_raw = _column_or_none(frame, strategy.customer_name_column)
+
+    plan_valid = plan_raw.notna()
+    plan_key = pd.Series(None, index=frame.index, dtype=object)
+    plan_key[plan_valid] = plan_raw[plan_valid].map(str)
+
+    normalized = pd.Series(None, index=frame.index, dtype=object)
+    customer_valid = customer_raw.notna()
+    if customer_valid.any():
+        # Each distinct name is normalized once
+        names = normalize_customer_names(customer_raw[customer_valid].map(str))
+        normalized[customer_valid] = names.where(names != "", None)
+    has_customer = normalized.notna()
+
+    plan_customer = pd.Series(None, index=frame.index, dtype=object)
+    both = plan_valid & has_customer
+    plan_customer[both] = plan_key[both] + "|" + normalized[both]
+
+    return {
+        LookupType.PLAN_CODE: plan_key,
+        LookupType.CUSTOMER_NAME: normalized,
+        LookupType.PLAN_CUSTOMER: plan_customer,
+        LookupType.FORMER_NAME: normalized,
+    }
+
+
+def _decision_path(code: int) -> str:
+    """Render the decision path for a base-3 combined outcome code."""
+    segments: List[str] = []
+    for position, lookup_type in enumerate(_PRIORITY_ORDER):
+        outcome = (code // 3**position) % 3
+        segments.append(f"{_PATH_LABEL_BY_TYPE[lookup_type]}:{_OUTCOME_NAMES[outcome]}")
+        if outcome == _HIT:
+            break
+    return "→".join(segments)
+
+
 def _resolve_via_enrichment_index(
     df: pd.DataFrame,
     mask_unresolved: pd.Series,
@@ -82,56 +169,27 @@ def _resolve_via_enrichment_index(
 
     Simplified priority order: plan_code → customer_name → plan_customer → former_name.
 
+    Set-based: key columns are built once for all unresolved rows, joined
+    against the batch lookup result per LookupType, and the first valid hit
+    in priority order is taken with ``combine_first``.
+
     Note: account_name and account_number removed - account_name merged with
     customer_name (same semantic), account_number unreliable for matching.
     """
-    keys_by_type: Dict[LookupType, set[str]] = {
-        LookupType.PLAN_CODE: set(),
-        LookupType.CUSTOMER_NAME: set(),
-        LookupType.PLAN_CUSTOMER: set(),
-        LookupType.FORMER_NAME: set(),
-    }
-
-    for idx in df[mask_unresolved].index:
-        row = df.loc[idx]
-        plan_code = row.get(strategy.plan_code_column)
-        customer_name = row.get(strategy.customer_name_column)
-
-        if pd.notna(plan_code):
-            keys_by_type[LookupType.PLAN_CODE].add(str(plan_code))
-        if pd.notna(customer_name):
-            normalized_customer = normalize_for_temp_id(str(customer_name))
-            if normalized_customer:
-                keys_by_type[LookupType.CUSTOMER_NAME].add(normalized_customer)
-                if pd.notna(plan_code):
-                    plan_customer_key = f"{plan_code}|{normalized_customer}"
-                    keys_by_type[LookupType.PLAN_CUSTOMER].add(plan_customer_key)
-
-    # Remove empty entry types to avoid unnecessary UNNEST arrays
-    keys_by_type = {
-        key_type: list(keys) for key_type, keys in keys_by_type.items() if keys
-    }
-
+    unresolved = df[mask_unresolved]
+    candidate_keys = _build_candidate_keys(unresolved, strategy)
+
+    # FORMER_NAME keys are not requested (only matched if the repository
+    # returns them); remove empty entry types to avoid unnecessary UNNEST arrays
+    keys_by_type: Dict[LookupType, List[str]] = {}
+    for lookup_type in _PRIORITY_ORDER[:3]:
+        keys = candidate_keys[lookup_type].dropna().unique().tolist()
+        if keys:
+            keys_by_type[lookup_type] = keys
+
+    hits_by_priority = _empty_hits()
     if not keys_by_type:
-        return (
-            pd.Series(pd.NA, index=df.index, dtype=object),
-            {
-                "plan_code": 0,
-                "customer_name": 0,
-                "plan_customer": 0,
-                "former_name": 0,
-            },
-        )
-
-    resolved = pd.Series(pd.NA, index=df.index, dtype=object)
-    used_keys: list[tuple[LookupType, str]] = []
-    hits_by_priority: Dict[str, int] = {
-        "plan_code": 0,
-        "customer_name": 0,
-        "plan_customer": 0,
-        "former_name": 0,
-    }
-    decision_paths: Dict[int, str] = {}
+        return pd.Series(pd.NA, index=df.index, dtype=object), hits_by_priority
 
     try:
         results = mapping_repository.lookup_enrichment_index_batch(keys_by_type)
@@ -140,83 +198,77 @@ def _resolve_via_enrichment_index(
             "company_id_resolver.enrichment_index_query_failed",
             error=str(e),
         )
-        return (
-            pd.Series(pd.NA, index=df.index, dtype=object),
-            hits_by_priority,
+        return pd.Series(pd.NA, index=df.index, dtype=object), hits_by_priority
+
+    # Valid company_id per (lookup_type, key); invalid cache entries tracked apart
+    company_ids: Dict[LookupType, Dict[str, str]] = {t: {} for t in _PRIORITY_ORDER}
+    invalid_keys: Dict[LookupType, set[str]] = {t: set() for t in _PRIORITY_ORDER}
+    for result_key, record in results.items():
+        if not isinstance(record, EnrichmentIndexRecord):
+            continue
+        lookup_type, key = result_key
+        if lookup_type not in company_ids:
+            continue
+        company_id = str(record.company_id).strip()
+        if not company_id or company_id.upper() in _INVALID_SENTINELS:
+            invalid_keys[lookup_type].add(key)
+        else:
+            company_ids[lookup_type][key] = company_id
+
+    # Join each key column against the lookup result
+    combined_code = np.zeros(len(unresolved), dtype=np.int64)
+    winner_position = np.full(len(unresolved), -1, dtype=np.int64)
+    hit_ids: List[pd.Series] = []
+    for position, lookup_type in enumerate(_PRIORITY_ORDER):
+        keys = candidate_keys[lookup_type]
+        ids = keys.map(company_ids[lookup_type])
+        is_hit = ids.notna().to_numpy()
+        outcome = np.where(
+            is_hit,
+            _HIT,
+            np.where(keys.isin(invalid_keys[lookup_type]).to_numpy(), _INVALID, _MISS),
         )
+        combined_code += outcome * 3**position
+        winner_position[is_hit & (winner_position < 0)] = position
+        hit_ids.append(ids)
 
-    # Apply priority order per row
-    priority_order = [
-        LookupType.PLAN_CODE,
-        LookupType.CUSTOMER_NAME,
-        LookupType.PLAN_CUSTOMER,
-        LookupType.FORMER_NAME,
-    ]
-    label_by_type = {
-        LookupType.PLAN_CODE: "plan_code",
-        LookupType.CUSTOMER_NAME: "customer_name",
-        LookupType.PLAN_CUSTOMER: "plan_customer",
-        LookupType.FORMER_NAME: "former_name",
-    }
-    path_label_by_type = {
-        LookupType.PLAN_CODE: "DB-P1",
-        LookupType.CUSTOMER_NAME: "DB-P2",
-        LookupType.PLAN_CUSTOMER: "DB-P3",
-        LookupType.FORMER_NAME: "DB-P4",
-    }
-
-    for idx in df[mask_unresolved].index:
-        row = df.loc[idx]
-        plan_code = row.get(strategy.plan_code_column)
-        customer_name = row.get(strategy.customer_name_column)
-        normalized_customer = (
-            normalize_for_temp_id(str(customer_name)) if pd.notna(customer_name) else ""
-        )
+    # First hit in priority order wins
+    winner_ids = hit_ids[0]
+    for ids in hit_ids[1:]:
+        winner_ids = winner_ids.combine_first(ids)
 
-        candidate_keys = {
-            LookupType.PLAN_CODE: str(plan_code) if pd.notna(plan_code) else None,
-            LookupType.CUSTOMER_NAME: normalized_customer or None,
-            LookupType.PLAN_CUSTOMER: f"{plan_code}|{normalized_customer}"
-            if pd.notna(plan_code) and normalized_customer
-            else None,
-            LookupType.FORMER_NAME: normalized_customer or None,
-        }
-
-        path_segments: List[str] = []
-
-        for lookup_type in priority_order:
-            key = candidate_keys.get(lookup_type)
-            label = path_label_by_type[lookup_type]
-            priority_key = label_by_type[lookup_type]
-            if not key:
-                path_segments.append(f"{label}:MISS")
-                continue
+    resolved = pd.Series(pd.NA, index=df.index, dtype=object)
+    has_hit = winner_position >= 0
+    resolved.loc[unresolved.index[has_hit]] = winner_ids.to_numpy(dtype=object)[has_hit]
+
+    for position, lookup_type in enumerate(_PRIORITY_ORDER):
+        hits = int((winner_position == position).sum())
+        hits_by_priority[_LABEL_BY_TYPE[lookup_type]] = hits
+
+    # One (lookup_type, key) per hit row, in row order
+    key_arrays = [candidate_keys[t].to_numpy(dtype=object) for t in _PRIORITY_ORDER]
+    used_keys: list[tuple[LookupType, str]] = [
+        (_PRIORITY_ORDER[position], key_arrays[position][row])
+        for row, position in enumerate(winner_position)
+        if position >= 0
+    ]
 
-            record = results.get((lookup_type, key))
-            if isinstance(record, EnrichmentIndexRecord):
-                company_id = str(record.company_id).strip()
-                # Validate cache entries: reject obvious placeholders like 'N' or empty values.
-                invalid_sentinels = {"N", "NA", "N/A", "NONE", "NULL", "NAN"}
-                if not company_id or company_id.upper() in invalid_sentinels:
-                    path_segments.append(f"{label}:INVALID")
-                    continue
-                resolved.loc[idx] = company_id
-                used_keys.append((lookup_type, key))
-                hits_by_priority[priority_key] += 1
-                path_segments.append(f"{label}:HIT")
-                break
-            else:
-                path_segments.append(f"{label}:MISS")
-
-        decision_paths[idx] = "→".join(path_segments)
+    path_by_code = {int(code): _decision_path(int(code)) for code in set(combined_code)}
+    decision_paths: Dict[int, str] = dict(
+        zip(unresolved.index, (path_by_code[int(code)] for code in combined_code))
+    )
 
+    # structlog output ends up in the same stdlib logger; skip building
+    # per-row events when DEBUG would drop them anyway
+    emit_structured = _stdlib_logger.isEnabledFor(logging.DEBUG)
     for row_idx, path in decision_paths.items():
-        logger.debug(
-            "company_id_resolver.db_cache_decision_path",
-            index=int(row_idx),
-            path=path,
-            decision_path=path,
-        )
+        if emit_structured:
+            logger.debug(
+                "company_id_resolver.db_cache_decision_path",
+                index=int(row_idx),
+                path=path,
+                decision_path=path,
+            )
         _stdlib_logger.debug(
             "company_id_resolver.db_cache_decision_path index=%s path=%s",
             int(row_idx),
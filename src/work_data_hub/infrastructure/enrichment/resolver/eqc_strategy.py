@@ -152,33 +152,31 @@ def _resolve_via_eqc_provider(
     )
     reporter.start()
 
-    for normalized_name, indices in indices_by_name.items():
-        # Check if provider still has budget
-        if not eqc_provider.is_available:
-            break
-
-        try:
-            # EqcProvider.lookup() handles budget, caching, and errors internally
-            result = eqc_provider.lookup(exemplar_raw_by_name[normalized_name])
-
-            if result:
-                for idx in indices:
-                    resolved.loc[idx] = result.company_id
-                eqc_hits += len(indices)
-                # Story 7.1-14: Update progress with cache hit (EQC returned result)
-                reporter.update(cache_hit=True, api_call=True)
-            else:
-                # Story 7.1-14: Update progress with cache miss (no result)
-                reporter.update(cache_hit=False, api_call=True)
+    def _report(_name: str, result: Optional[Any]) -> None:
+        # Story 7.1-14: cache hit when EQC returned a result, miss otherwise
+        reporter.update(cache_hit=bool(result), api_call=True)
+
+    # EqcProvider.lookup_many() handles budget, caching, rate limiting and
+    # errors; up to sync_concurrency requests are in flight at once and names
+    # beyond the budget are not attempted.
+    try:
+        results = eqc_provider.lookup_many(
+            list(exemplar_raw_by_name.values()),
+            max_workers=eqc_config.sync_concurrency,
+            on_result=_report,
+        )
+    except Exception as e:
+        logger.warning(
+            "company_id_resolver.eqc_provider_lookup_failed",
+            error_type=type(e).__name__,
+        )
+        results = {}
 
-        except Exception as e:
-            logger.warning(
-                "company_id_resolver.eqc_provider_lookup_failed",
-                error_type=type(e).__name__,
-            )
-            # Story 7.1-14: Update progress even on failure
-            reporter.update(cache_hit=False, api_call=True)
-            # Continue to next name - don't block pipeline
+    for normalized_name, indices in indices_by_name.items():
+        result = results.get(exemplar_raw_by_name[normalized_name])
+        if result:
+            resolved.loc[indices] = result.company_id
+            eqc_hits += len(indices)
 
     # Story 7.1-14 AC-4: Finish progress reporting
     reporter.finish()
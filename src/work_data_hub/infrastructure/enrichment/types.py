@@ -109,6 +109,8 @@ class ResolutionStatistics:
         budget_remaining: Remaining EQC lookup budget (Story 6.4).
         backflow_stats: Backflow operation statistics (Story 6.4).
         async_queued: Number of requests enqueued for async enrichment (Story 6.5).
+        index_snapshot_stats: Local enrichment_index snapshot metrics
+            (staleness, hit rate); empty when the snapshot is disabled.
     """
 
     total_rows: int = 0
@@ -144,6 +146,9 @@ class ResolutionStatistics:
     # Story 6.1.3: Domain learning statistics
     domain_learning_stats: Dict[str, Any] = field(default_factory=dict)
 
+    # Local enrichment_index snapshot metrics (staleness, hit rate)
+    index_snapshot_stats: Dict[str, Any] = field(default_factory=dict)
+
     @property
     def db_cache_hits_total(self) -> int:
         """Total DB cache hits across all priorities (compatibility helper)."""
@@ -181,6 +186,7 @@ class ResolutionStatistics:
             "async_queued": self.async_queued,
             "default_fallback_hits": self.default_fallback_hits,
             "domain_learning": self.domain_learning_stats,
+            "index_snapshot": self.index_snapshot_stats,
             # Backward compatibility
             "plan_override_hits": self.yaml_hits.get("plan", self.plan_override_hits),
         }
@@ -64,6 +64,8 @@ class DomainSchema:
     bronze_required: List[str] = field(default_factory=list)
     gold_required: List[str] = field(default_factory=list)
     numeric_columns: List[str] = field(default_factory=list)
+    # DATE column the table is range-partitioned by, one partition per month
+    partition_column: Optional[str] = None
 
 
 __all__ = [
@@ -6,6 +6,7 @@ Extracted from domain_registry.py for clean separation of SQL generation logic.
 
 from __future__ import annotations
 
+import datetime as dt
 from typing import List
 
 from work_data_hub.infrastructure.sql.core.identifier import (
@@ -46,10 +47,15 @@ def generate_create_table_ddl(domain_name: str, if_not_exists: bool = False) ->
     - If primary_key is "id", generates INTEGER IDENTITY PRIMARY KEY
     - Otherwise, generates business key as PRIMARY KEY with correct type,
       and adds "id" as a separate IDENTITY column for internal use
+
+    Domains with a ``partition_column`` get ``PARTITION BY RANGE`` on it; the
+    primary key then includes the partition column, as PostgreSQL requires.
     """
     schema = get_domain(domain_name)
     qualified_table = qualify_table(schema.pg_table, schema.pg_schema)
     quoted_pk = quote_identifier(schema.primary_key)
+    partitioned = schema.partition_column is not None
+    inline_pk = "" if partitioned else " PRIMARY KEY"
 
     lines: List[str] = []
     lines.append(f"-- Table: {qualified_table}")
@@ -60,7 +66,7 @@ def generate_create_table_ddl(domain_name: str, if_not_exists: bool = False) ->
     # Story 7.5: Handle both id-based and business-key-based primary keys
     if schema.primary_key == "id":
         # Standard id-based primary key with IDENTITY
-        lines.append(f"  {quoted_pk} INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,")
+        lines.append(f"  {quoted_pk} INTEGER GENERATED ALWAYS AS IDENTITY{inline_pk},")
     else:
         # Business key as primary key - add id column for internal use first
         lines.append('  "id" INTEGER GENERATED ALWAYS AS IDENTITY,')
@@ -68,10 +74,10 @@ def generate_create_table_ddl(domain_name: str, if_not_exists: bool = False) ->
         pk_col = next((c for c in schema.columns if c.name == schema.primary_key), None)
         if pk_col:
             pk_sql_type = _column_type_to_sql(pk_col)
-            lines.append(f"  {quoted_pk} {pk_sql_type} NOT NULL PRIMARY KEY,")
+            lines.append(f"  {quoted_pk} {pk_sql_type} NOT NULL{inline_pk},")
         else:
             # Fallback: assume STRING if not found in columns
-            lines.append(f"  {quoted_pk} VARCHAR NOT NULL PRIMARY KEY,")
+            lines.append(f"  {quoted_pk} VARCHAR NOT NULL{inline_pk},")
 
     lines.append("")
     lines.append("  -- Business columns")
@@ -86,12 +92,71 @@ def generate_create_table_ddl(domain_name: str, if_not_exists: bool = False) ->
     lines.append("")
     lines.append("  -- Audit columns")
     lines.append('  "created_at" TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,')
-    lines.append('  "updated_at" TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP')
-    lines.append(");")
+    if schema.partition_column is not None:
+        quoted_partition = quote_identifier(schema.partition_column)
+        lines.append(
+            '  "updated_at" TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,'
+        )
+        lines.append("")
+        lines.append(f"  PRIMARY KEY ({quoted_pk}, {quoted_partition})")
+        lines.append(f") PARTITION BY RANGE ({quoted_partition});")
+    else:
+        lines.append(
+            '  "updated_at" TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP'
+        )
+        lines.append(");")
 
     return "\n".join(lines)
 
 
+def month_partition_name(table: str, month_start: dt.date) -> str:
+    """Name of the partition holding one month, e.g. ``规模明细_202401``."""
+    return f"{table}_{month_start:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    """Name of the DEFAULT partition catching months without a partition."""
+    return f"{table}_default"
+
+
+def generate_partitions_ddl(domain_name: str) -> List[str]:
+    """Generate the DEFAULT partition of a month-partitioned domain table.
+
+    Month partitions are created by the loader when a month is first
+    swapped in; until then rows land in the DEFAULT partition. Returns an
+    empty list for unpartitioned domains.
+    """
+    schema = get_domain(domain_name)
+    if schema.partition_column is None:
+        return []
+    qualified_table = qualify_table(schema.pg_table, schema.pg_schema)
+    default_table = qualify_table(
+        default_partition_name(schema.pg_table), schema.pg_schema
+    )
+    return [
+        f"CREATE TABLE IF NOT EXISTS {default_table} "
+        f"PARTITION OF {qualified_table} DEFAULT;"
+    ]
+
+
+def generate_month_partition_ddl(domain_name: str, month: dt.date) -> str:
+    """Generate the partition holding the month that contains ``month``."""
+    schema = get_domain(domain_name)
+    if schema.partition_column is None:
+        raise ValueError(f"Domain '{domain_name}' is not partitioned")
+    start = month.replace(day=1)
+    end = (start.replace(day=28) + dt.timedelta(days=4)).replace(day=1)
+    qualified_table = qualify_table(schema.pg_table, schema.pg_schema)
+    partition_table = qualify_table(
+        month_partition_name(schema.pg_table, start), schema.pg_schema
+    )
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_table} "
+        f"PARTITION OF {qualified_table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}');"
+    )
+
+
 def generate_indexes_ddl(domain_name: str) -> List[str]:
     """Generate INDEX creation statements."""
     schema = get_domain(domain_name)
@@ -159,6 +224,11 @@ def generate_create_table_sql(domain_name: str) -> str:
     parts.append(generate_create_table_ddl(domain_name, if_not_exists=False))
     parts.append("")
 
+    partitions = generate_partitions_ddl(domain_name)
+    if partitions:
+        parts.extend(partitions)
+        parts.append("")
+
     indexes = generate_indexes_ddl(domain_name)
     if indexes:
         parts.extend(indexes)
@@ -173,8 +243,12 @@ def generate_create_table_sql(domain_name: str) -> str:
 
 
 __all__ = [
+    "default_partition_name",
     "generate_create_table_sql",
     "generate_create_table_ddl",
     "generate_indexes_ddl",
+    "generate_month_partition_ddl",
+    "generate_partitions_ddl",
     "generate_triggers_ddl",
+    "month_partition_name",
 ]
@@ -21,6 +21,7 @@ register_domain(
         primary_key="id",
         delete_scope_key=["月度", "业务类型", "计划类型"],
         composite_key=["月度", "计划代码", "组合代码", "company_id"],
+        partition_column="月度",
         bronze_required=[
             "月度",
             "计划代码",
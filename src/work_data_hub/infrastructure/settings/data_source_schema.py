@@ -161,6 +161,17 @@ class OutputConfig(BaseModel):
     pk: List[str] = Field(
         default_factory=list, description="Primary key columns for delete_insert mode"
     )
+    load_method: Literal["values", "copy"] = Field(
+        "values",
+        description="Bulk load method: 'values' (execute_values) or 'copy' "
+        "(COPY FROM STDIN)",
+    )
+    refresh_strategy: Literal["delete", "partition_swap"] = Field(
+        "delete",
+        description="Refresh strategy of the domain services' refresh loads: "
+        "'delete' (DELETE ... USING the refresh keys) or 'partition_swap' "
+        "(swap whole month partitions; table must be partitioned by month)",
+    )
 
 
 class DomainConfigV2(BaseModel):
@@ -324,7 +335,8 @@ class DataSourceConfigV2(BaseModel):
         """
         # Story 6.2-P14: Added version 1.1 for defaults support
         # Story 7.4-2: Added version 1.2 for requires_backfill field
-        supported_versions = ["1.0", "1.1", "1.2"]
+        # Version 1.3: Added output.load_method and output.refresh_strategy
+        supported_versions = ["1.0", "1.1", "1.2", "1.3"]
         if v not in supported_versions:
             raise ValueError(
                 f"Unsupported schema version '{v}'. "
@@ -0,0 +1,328 @@
+"""
+COPY FROM STDIN and staging-table SQL for PostgreSQL bulk loads.
+
+``DataFrameCopyReader`` renders a DataFrame chunk by chunk as COPY text
+(via ``DataFrame.to_csv``) and hands it to ``cursor.copy_expert`` through
+``read()``; at most one chunk of text is held in memory. Upserts COPY into a
+temporary staging table and merge it with a single
+``INSERT ... SELECT ... ON CONFLICT``.
+
+Used by the warehouse loader (``io.loader.copy_builder``) and by the
+reference sync service.
+"""
+
+import csv
+import datetime as dt
+import json
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.engine import Connection
+
+from work_data_hub.infrastructure.sql.core.identifier import quote_identifier
+
+# NULL marker of the COPY text format
+COPY_NULL = r"\N"
+
+# Bytes requested per read() by copy_expert
+COPY_READ_SIZE = 1 << 16
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _escape_text(value: str) -> str:
+    return value.translate(_TEXT_ESCAPES)
+
+
+def _copy_text(value: Any) -> Optional[str]:
+    """Render one object-dtype value as COPY text (None stays NULL)."""
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, (bool, np.bool_)):
+        text = "t" if value else "f"
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value, ensure_ascii=False)
+    elif isinstance(value, (float, np.floating)):
+        if np.isnan(value):
+            return None
+        # 1.0 must load into integer columns, as it does through VALUES
+        text = str(int(value)) if float(value).is_integer() else repr(float(value))
+    elif isinstance(value, (dt.datetime, pd.Timestamp)):
+        text = value.isoformat(sep=" ")
+    else:
+        text = str(value)
+    return _escape_text(text)
+
+
+def format_copy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a frame into values ``to_csv`` writes as valid COPY text.
+
+    Numeric and datetime columns are left to pandas (vectorized); only
+    object columns are rendered value by value. Missing values are left as
+    NA and written as ``\\N``.
+    """
+    formatted: Dict[Any, pd.Series] = {}
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_bool_dtype(series.dtype):
+            formatted[column] = series.map({True: "t", False: "f"})
+        elif pd.api.types.is_float_dtype(series.dtype):
+            values = series.to_numpy(dtype="float64", na_value=np.nan)
+            present = values[~np.isnan(values)]
+            # inf cannot be cast to Int64; such columns stay float
+            if (
+                len(present)
+                and np.isfinite(present).all()
+                and np.array_equal(present, np.trunc(present))
+            ):
+                formatted[column] = series.astype("Int64")
+            else:
+                formatted[column] = series
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype) or (
+            pd.api.types.is_numeric_dtype(series.dtype)
+        ):
+            formatted[column] = series
+        else:
+            formatted[column] = series.astype(object).map(
+                _copy_text, na_action="ignore"
+            )
+    return pd.DataFrame(formatted, index=df.index, columns=list(df.columns))
+
+
+class DataFrameCopyReader:
+    """
+    File-like reader producing COPY text for ``cursor.copy_expert``.
+
+    Example:
+        >>> reader = DataFrameCopyReader(df[columns], chunk_rows=5000)
+        >>> cursor.copy_expert(build_copy_sql('"business"."规模明细"', columns), reader)
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = 5000):
+        self._chunks = self._render(df, max(1, chunk_rows))
+        self._buffer = ""
+        self.rows_rendered = 0
+
+    def _render(self, df: pd.DataFrame, chunk_rows: int) -> Iterator[str]:
+        for start in range(0, len(df), chunk_rows):
+            chunk = format_copy_frame(df.iloc[start : start + chunk_rows])
+            self.rows_rendered += len(chunk)
+            yield chunk.to_csv(
+                sep="\t",
+                header=False,
+                index=False,
+                na_rep=COPY_NULL,
+                quoting=csv.QUOTE_NONE,  # escaping is done by _escape_text
+                lineterminator="\n",
+            )
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def build_copy_sql(qualified_table: str, columns: Sequence[str]) -> str:
+    """
+    Build a COPY FROM STDIN statement (text format).
+
+    Example:
+        >>> build_copy_sql('"public"."t"', ["id", "name"])
+        'COPY "public"."t" ("id","name") FROM STDIN'
+    """
+    col_list = ",".join(quote_identifier(col) for col in columns)
+    return f"COPY {qualified_table} ({col_list}) FROM STDIN"
+
+
+def copy_dataframe(
+    cursor: Any,
+    df: pd.DataFrame,
+    qualified_table: str,
+    columns: Sequence[str],
+    chunk_rows: int = 5000,
+) -> int:
+    """
+    COPY ``df[columns]`` into ``qualified_table``.
+
+    Returns:
+        Number of rows copied (as reported by the server when available)
+    """
+    if df.empty:
+        return 0
+    reader = DataFrameCopyReader(df[list(columns)], chunk_rows=chunk_rows)
+    cursor.copy_expert(
+        build_copy_sql(qualified_table, columns), reader, size=COPY_READ_SIZE
+    )
+    rowcount = getattr(cursor, "rowcount", -1)
+    if isinstance(rowcount, int) and rowcount >= 0:
+        return rowcount
+    return reader.rows_rendered
+
+
+@contextmanager
+def dbapi_cursor(conn: Connection) -> Iterator[Any]:
+    """
+    Open a DB-API cursor on the driver connection behind ``conn``.
+
+    The cursor runs in the SQLAlchemy connection's transaction, so rows it
+    COPYs are visible to (and committed with) statements run through ``conn``.
+    """
+    dbapi_connection = conn.connection.dbapi_connection
+    if dbapi_connection is None:
+        raise RuntimeError("SQLAlchemy connection has no DB-API connection")
+    cursor = dbapi_connection.cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def new_stage_table_name() -> str:
+    """Unique name for a session-local staging table."""
+    return f"_wdh_stage_{uuid.uuid4().hex[:16]}"
+
+
+def build_stage_table_sql(
+    stage_table: str, qualified_table: str, columns: Sequence[str]
+) -> str:
+    """
+    Build ``CREATE TEMP TABLE`` for a staging table shaped like the target.
+
+    Only the loaded columns are created, without constraints or defaults,
+    so identity/default columns the frame omits do not reject the COPY.
+    The table is dropped at commit.
+    """
+    col_list = ",".join(quote_identifier(col) for col in columns)
+    return (
+        f"CREATE TEMP TABLE {quote_identifier(stage_table)} ON COMMIT DROP AS "
+        f"SELECT {col_list} FROM {qualified_table} WITH NO DATA"
+    )
+
+
+def build_upsert_from_stage_sql(
+    qualified_table: str,
+    stage_table: str,
+    columns: List[str],
+    upsert_keys: List[str],
+    *,
+    return_keys: bool = False,
+) -> str:
+    """
+    Build the ``INSERT ... SELECT ... ON CONFLICT`` that merges a staging table.
+
+    Rows repeating a key keep the last one copied (matching the chunked
+    ``execute_values`` path, where later batches overwrite earlier ones).
+    The statement returns one row: ``(inserted_count, updated_count)``, or
+    with ``return_keys`` one row per merged record: ``(*upsert_keys,
+    inserted)``.
+    """
+    quoted_cols = ",".join(quote_identifier(col) for col in columns)
+    quoted_keys = ",".join(quote_identifier(key) for key in upsert_keys)
+    update_targets = [col for col in columns if col not in upsert_keys] or columns
+    set_clause = ", ".join(
+        f"{quote_identifier(col)} = EXCLUDED.{quote_identifier(col)}"
+        for col in update_targets
+    )
+    upsert = (
+        f"INSERT INTO {qualified_table} ({quoted_cols}) "
+        f"SELECT {quoted_cols} FROM ("
+        f"SELECT DISTINCT ON ({quoted_keys}) {quoted_cols} "
+        f"FROM {quote_identifier(stage_table)} ORDER BY {quoted_keys}, ctid DESC"
+        f") AS staged "
+        f"ON CONFLICT ({quoted_keys}) DO UPDATE SET {set_clause} "
+    )
+    if return_keys:
+        return f"{upsert}RETURNING {quoted_keys}, (xmax = 0) AS inserted"
+    return (
+        f"WITH upserted AS ({upsert}RETURNING (xmax = 0) AS inserted) "
+        f"SELECT COUNT(*) FILTER (WHERE inserted), "
+        f"COUNT(*) FILTER (WHERE NOT inserted) FROM upserted"
+    )
+
+
+def build_fill_null_from_stage_sql(
+    qualified_table: str,
+    stage_table: str,
+    columns: Sequence[str],
+    key: str,
+    *,
+    jsonb_merge_columns: Sequence[str] = (),
+) -> str:
+    """
+    Build the set-based fill-null backfill merging a staging table.
+
+    Existing rows get their NULL columns filled from the staged row
+    (``COALESCE(t.col, s.col)``; ``jsonb_merge_columns`` are merged as
+    distinct arrays) and are only rewritten when a value actually changes;
+    keys missing from the target are inserted. Returns one row per changed
+    key: ``(key, inserted)``.
+    """
+    quoted_key = quote_identifier(key)
+    quoted_cols = ",".join(quote_identifier(col) for col in columns)
+    jsonb_merge = set(jsonb_merge_columns)
+
+    assignments = []
+    changes = []
+    for col in columns:
+        if col == key:
+            continue
+        quoted = quote_identifier(col)
+        if col in jsonb_merge:
+            assignments.append(
+                f"{quoted} = CASE WHEN s.{quoted} IS NULL THEN t.{quoted} ELSE ("
+                f"SELECT jsonb_agg(DISTINCT elem) FROM jsonb_array_elements("
+                f"COALESCE(t.{quoted}, '[]'::jsonb) || s.{quoted}) AS elem) END"
+            )
+            changes.append(
+                f"(s.{quoted} IS NOT NULL "
+                f"AND NOT COALESCE(t.{quoted}, '[]'::jsonb) @> s.{quoted})"
+            )
+        else:
+            assignments.append(f"{quoted} = COALESCE(t.{quoted}, s.{quoted})")
+            changes.append(f"(t.{quoted} IS NULL AND s.{quoted} IS NOT NULL)")
+
+    ctes = [
+        f"staged AS (SELECT DISTINCT ON ({quoted_key}) {quoted_cols} "
+        f"FROM {quote_identifier(stage_table)} ORDER BY {quoted_key}, ctid DESC)",
+        f"inserted AS (INSERT INTO {qualified_table} ({quoted_cols}) "
+        f"SELECT {quoted_cols} FROM staged AS s WHERE NOT EXISTS ("
+        f"SELECT 1 FROM {qualified_table} AS e WHERE e.{quoted_key} = s.{quoted_key}"
+        f") ON CONFLICT ({quoted_key}) DO NOTHING RETURNING {quoted_key})",
+    ]
+    changed = f"SELECT {quoted_key}, TRUE FROM inserted"
+    if assignments:
+        ctes.append(
+            f"filled AS (UPDATE {qualified_table} AS t SET {', '.join(assignments)} "
+            f"FROM staged AS s WHERE t.{quoted_key} = s.{quoted_key} "
+            f"AND ({' OR '.join(changes)}) RETURNING t.{quoted_key})"
+        )
+        changed += f" UNION ALL SELECT {quoted_key}, FALSE FROM filled"
+    return f"WITH {', '.join(ctes)} {changed}"
+
+
+__all__ = [
+    "COPY_NULL",
+    "COPY_READ_SIZE",
+    "DataFrameCopyReader",
+    "build_copy_sql",
+    "build_fill_null_from_stage_sql",
+    "build_stage_table_sql",
+    "build_upsert_from_stage_sql",
+    "copy_dataframe",
+    "dbapi_cursor",
+    "format_copy_frame",
+    "new_stage_table_name",
+]
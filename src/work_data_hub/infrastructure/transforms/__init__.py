@@ -18,6 +18,7 @@ Components:
 - DropStep: Column removal
 - RenameStep: Column renaming (alias for MappingStep)
 - plan_portfolio_helpers: Plan/portfolio code normalization helpers (Story 7.4-6)
+- profiling: Opt-in per-step profiling (time, rows, memory, cProfile)
 
 Example:
     >>> from work_data_hub.infrastructure.transforms import (
@@ -38,6 +39,12 @@ from .plan_portfolio_helpers import (
     apply_plan_code_defaults,
     apply_portfolio_code_defaults,
 )
+from .profiling import (
+    PipelineProfiler,
+    PipelineProfileReport,
+    TransformStepProfile,
+    profile_pipelines,
+)
 from .standard_steps import (
     CalculationStep,
     DropStep,
@@ -61,6 +68,11 @@ __all__ = [
     "DropStep",
     "RenameStep",
     "coerce_numeric_columns",
+    # Profiling
+    "PipelineProfiler",
+    "PipelineProfileReport",
+    "TransformStepProfile",
+    "profile_pipelines",
     # Plan/Portfolio helpers (Story 7.4-6)
     "apply_plan_code_defaults",
     "apply_portfolio_code_defaults",
@@ -12,15 +12,27 @@ Design Principles:
 - Immutability: steps return new DataFrames, never mutate input
 - Vectorized operations for performance
 - Structured logging with context
+
+Execution planning:
+    ``Pipeline`` groups consecutive column-local steps (``in_place = True``)
+    into fused stages that run over one working frame owned by the pipeline,
+    so the frame is copied once per stage instead of once per step. Steps
+    declared ``pure`` hand back a frame the pipeline may own without copying.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
+import structlog
 
 from work_data_hub.domain.pipelines.types import PipelineContext
 
+from .profiling import PipelineProfiler, active_profiler
+
+logger = structlog.get_logger(__name__)
+
 
 class TransformStep(ABC):
     """
@@ -40,8 +52,23 @@ class TransformStep(ABC):
         ...
         ...     def apply(self, df, context):
         ...         return df.copy()
+
+    Attributes:
+        in_place: Step implements ``apply_in_place`` by adding, replacing,
+            renaming or dropping whole columns, so the pipeline may fuse it
+            with neighbouring column-local steps on a shared working frame.
+        pure: ``apply`` returns a new DataFrame that shares no data with its
+            input, so the pipeline can take ownership of it without a copy.
+        mutates_input: ``apply`` may modify the frame it receives. Steps
+            that only read their input set this to False so that
+            domain/pipelines/core.Pipeline in ``zero_copy`` mode hands them
+            the working frame without a defensive copy.
     """
 
+    in_place: bool = False
+    pure: bool = False
+    mutates_input: bool = True
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -62,6 +89,17 @@ class TransformStep(ABC):
         """
         pass
 
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """
+        Apply transformation to a DataFrame owned by the caller.
+
+        Column-local steps (``in_place = True``) override this to modify
+        ``df`` directly and return it; the default delegates to ``apply``.
+        """
+        return self.apply(df, context)
+
     def execute(
         self, dataframe: pd.DataFrame, context: PipelineContext
     ) -> pd.DataFrame:
@@ -74,13 +112,35 @@ class TransformStep(ABC):
         return self.apply(dataframe, context)
 
 
+# Execution stage: a single step, or a fused run of column-local steps
+_Stage = Union[TransformStep, Tuple[TransformStep, ...]]
+
+
+def _fusable(step: TransformStep) -> bool:
+    """
+    Whether ``step`` may run fused via ``apply_in_place``.
+
+    A subclass that overrides only ``apply`` of an ``in_place`` step would
+    have its new logic bypassed by the inherited ``apply_in_place``, so the
+    step is fused only when ``apply_in_place`` is defined at least as deep in
+    the MRO as ``apply``.
+    """
+    if not step.in_place:
+        return False
+    mro = type(step).__mro__
+    apply_owner = next(cls for cls in mro if "apply" in vars(cls))
+    in_place_owner = next(cls for cls in mro if "apply_in_place" in vars(cls))
+    return issubclass(in_place_owner, apply_owner)
+
+
 class Pipeline:
     """
     Compose multiple TransformSteps into a sequential pipeline.
 
     The pipeline executes steps in order, passing the output of each step
-    as input to the next. The input DataFrame is copied before processing
-    to ensure immutability.
+    as input to the next. The input DataFrame is never mutated: consecutive
+    column-local steps share one working copy, and steps declared ``pure``
+    are not copied around at all.
 
     Example:
         >>> from work_data_hub.infrastructure.transforms import (
@@ -93,14 +153,45 @@ class Pipeline:
         >>> result = pipeline.execute(df, context)
     """
 
-    def __init__(self, steps: List[TransformStep]) -> None:
+    def __init__(
+        self,
+        steps: List[TransformStep],
+        *,
+        dead_columns: Sequence[str] = (),
+        profiler: Optional[PipelineProfiler] = None,
+    ) -> None:
         """
         Initialize pipeline with a list of steps.
 
         Args:
             steps: Ordered list of TransformStep instances to execute
+            dead_columns: Input columns no step reads (e.g. a domain's
+                LEGACY_COLUMNS_TO_DELETE); dropped before the first step so
+                they are never carried through the pipeline
+            profiler: Records per-step profiles for this pipeline; when
+                omitted, the profiler activated by ``profile_pipelines``
+                (if any) is used
         """
         self.steps = steps
+        self.dead_columns = list(dead_columns)
+        self.profiler = profiler
+        self.last_step_timings: List[Tuple[str, float]] = []
+
+    def plan(self) -> List[_Stage]:
+        """Group consecutive ``in_place`` steps into fused stages."""
+        stages: List[_Stage] = []
+        fused: List[TransformStep] = []
+        for step in self.steps:
+            if _fusable(step):
+                fused.append(step)
+                continue
+            if fused:
+                stages.append(tuple(fused))
+                fused = []
+            stages.append(step)
+        if fused:
+            stages.append(tuple(fused))
+        return stages
 
     def execute(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
         """
@@ -113,7 +204,61 @@ class Pipeline:
         Returns:
             Transformed DataFrame after all steps have been applied
         """
-        result = df.copy()
-        for step in self.steps:
-            result = step.apply(result, context)
+        self.last_step_timings = []
+        profiler = self.profiler or active_profiler()
+
+        result = df
+        owned = False
+        dead = [col for col in self.dead_columns if col in df.columns]
+        if dead:
+            result = df.drop(columns=dead)
+            owned = True
+
+        for stage in self.plan():
+            if isinstance(stage, tuple):
+                if not owned:
+                    result = result.copy()
+                for step in stage:
+                    result = self._run_step(
+                        step, result, context, profiler=profiler, fused=True
+                    )
+                owned = True
+            else:
+                if result is df and not stage.pure:
+                    # Steps not declared pure never see the caller's frame
+                    result = df.copy()
+                result = self._run_step(
+                    stage, result, context, profiler=profiler, fused=False
+                )
+                owned = stage.pure
+
+        return df.copy() if result is df else result
+
+    def _run_step(
+        self,
+        step: TransformStep,
+        df: pd.DataFrame,
+        context: PipelineContext,
+        *,
+        profiler: Optional[PipelineProfiler],
+        fused: bool,
+    ) -> pd.DataFrame:
+        start = time.perf_counter()
+        if profiler is not None:
+            result = profiler.measure(
+                step, df, context, index=len(self.last_step_timings), fused=fused
+            )
+        elif fused:
+            result = step.apply_in_place(df, context)
+        else:
+            result = step.apply(df, context)
+        duration_ms = (time.perf_counter() - start) * 1000
+        self.last_step_timings.append((step.name, duration_ms))
+        logger.debug(
+            "pipeline_step_completed",
+            step=step.name,
+            pipeline=context.pipeline_name,
+            fused=fused,
+            duration_ms=round(duration_ms, 3),
+        )
         return result
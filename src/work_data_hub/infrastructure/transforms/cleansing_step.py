@@ -6,17 +6,26 @@ Architecture Decision AD-010: Infrastructure Layer & Pipeline Composition
 
 This module provides CleansingStep that integrates with infrastructure/cleansing/
 to apply domain-specific cleansing rules to DataFrame columns.
+
+Each column's rule chain is compiled once (see ``cleansing.compiler``) and
+executed column-wise: rules with a Series implementation run vectorized, the
+rest run once per distinct string value.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import structlog
 
 from work_data_hub.domain.pipelines.types import PipelineContext
 from work_data_hub.infrastructure.cleansing import registry
+from work_data_hub.infrastructure.cleansing.compiler import (
+    CompiledRuleChain,
+    compile_rule_chain,
+)
+from work_data_hub.infrastructure.cleansing.registry import RuleSpec
 
 from .base import TransformStep
 
@@ -42,6 +51,8 @@ class CleansingStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    in_place = True
+
     def __init__(
         self,
         domain: str,
@@ -59,21 +70,40 @@ class CleansingStep(TransformStep):
         self._domain = domain
         self._columns = columns
         self._rules_override = rules_override
+        # column -> (rule specs compiled from, compiled chain)
+        self._compiled: Dict[str, Tuple[List[RuleSpec], CompiledRuleChain]] = {}
 
     @property
     def name(self) -> str:
         """Return human-friendly step name used for logging."""
         return "CleansingStep"
 
+    def _compiled_chain(
+        self, column: str, rule_specs: Sequence[RuleSpec]
+    ) -> CompiledRuleChain:
+        """Return the compiled chain for a column, recompiling if specs changed."""
+        cached = self._compiled.get(column)
+        if cached is not None and cached[0] == rule_specs:
+            return cached[1]
+        chain = compile_rule_chain(rule_specs)
+        self._compiled[column] = (list(rule_specs), chain)
+        return chain
+
     def apply(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
         """Apply cleansing rules to specified columns."""
+        return self.apply_in_place(df.copy(), context)
+
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """Apply cleansing rules to the columns of ``df`` in place."""
         log = logger.bind(
             step=self.name,
             domain=self._domain,
             pipeline=context.pipeline_name,
         )
 
-        result = df.copy()
+        result = df
         columns_to_cleanse = self._columns or list(df.columns)
         cleansed_count = 0
         columns_processed = 0
@@ -84,7 +114,7 @@ class CleansingStep(TransformStep):
 
             # Get rules from override or registry
             if self._rules_override and column in self._rules_override:
-                rule_specs = self._rules_override[column]
+                rule_specs: Sequence[RuleSpec] = self._rules_override[column]
             else:
                 rule_specs = registry.get_domain_rules(self._domain, column)
 
@@ -94,10 +124,9 @@ class CleansingStep(TransformStep):
             columns_processed += 1
 
             try:
-                # Apply registry rules with support for rule kwargs via apply_rules
-                result[column] = result[column].apply(
-                    lambda value: registry.apply_rules(value, rule_specs)
-                )
+                # Same results as registry.apply_rules per cell, column at a time
+                chain = self._compiled_chain(column, rule_specs)
+                result[column] = chain.apply_series(result[column])
                 cleansed_count += len(rule_specs)
             except Exception as exc:  # noqa: BLE001
                 log.warning(
@@ -0,0 +1,241 @@
+"""
+Opt-in per-step profiling for infrastructure.transforms.Pipeline.
+
+``domain/pipelines/core.Pipeline`` records StepMetrics for every step; the
+transform Pipeline used by the domain pipeline builders only keeps step
+timings. This module adds a profiler that can be attached to a Pipeline (or
+activated for every Pipeline in the process with ``profile_pipelines``) and
+records, per step:
+
+- wall and CPU time
+- rows in / rows out
+- peak Python memory allocated during the step (tracemalloc)
+- bytes of the output frame (``DataFrame.memory_usage(deep=True)``)
+
+One step can additionally be captured with cProfile by name. Each step is
+logged as a ``pipeline_step_profile`` event and collected in a
+``PipelineProfileReport`` that serializes to JSON (see ``etl --profile``).
+
+Example:
+    >>> with profile_pipelines(capture_step="CleansingStep") as report:
+    ...     pipeline.execute(df, context)
+    >>> print(report.to_json())
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+import structlog
+
+from work_data_hub.domain.pipelines.types import PipelineContext
+
+if TYPE_CHECKING:
+    from .base import TransformStep
+
+logger = structlog.get_logger(__name__)
+
+_active_profiler: Optional["PipelineProfiler"] = None
+
+
+@dataclass
+class TransformStepProfile:
+    """
+    Measurements for one step execution.
+
+    Attributes:
+        pipeline: Pipeline name from the execution context
+        step: Step name
+        index: Position of the step in the pipeline
+        fused: Whether the step ran inside a fused in-place stage
+        wall_ms: Wall-clock time in milliseconds
+        cpu_ms: Process CPU time in milliseconds
+        rows_in: Rows of the input frame
+        rows_out: Rows of the output frame
+        peak_memory_bytes: Peak memory allocated during the step (tracemalloc)
+        frame_bytes: Deep memory usage of the output frame
+    """
+
+    pipeline: str
+    step: str
+    index: int
+    fused: bool
+    wall_ms: float
+    cpu_ms: float
+    rows_in: int
+    rows_out: int
+    peak_memory_bytes: int
+    frame_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PipelineProfileReport:
+    """
+    Collected step profiles plus the optional cProfile capture.
+
+    Attributes:
+        steps: Step profiles in execution order (across pipeline runs)
+        capture_step: Step name captured with cProfile, if any
+        cprofile_stats: pstats output for the captured step
+    """
+
+    steps: List[TransformStepProfile] = field(default_factory=list)
+    capture_step: Optional[str] = None
+    cprofile_stats: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "steps": [profile.to_dict() for profile in self.steps],
+            "totals": {
+                "wall_ms": round(sum(p.wall_ms for p in self.steps), 3),
+                "cpu_ms": round(sum(p.cpu_ms for p in self.steps), 3),
+                "peak_memory_bytes": max(
+                    (p.peak_memory_bytes for p in self.steps), default=0
+                ),
+            },
+            "capture_step": self.capture_step,
+            "cprofile_stats": self.cprofile_stats,
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+
+class PipelineProfiler:
+    """
+    Measure transform steps and collect the results in a report.
+
+    Args:
+        capture_step: Name of a step to run under cProfile (all executions
+            of that step are aggregated into one capture)
+        stats_limit: Number of cProfile rows kept, sorted by cumulative time
+    """
+
+    def __init__(
+        self, capture_step: Optional[str] = None, stats_limit: int = 30
+    ) -> None:
+        self.capture_step = capture_step
+        self.stats_limit = stats_limit
+        self.report = PipelineProfileReport(capture_step=capture_step)
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Start tracemalloc if it is not already tracing."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> PipelineProfileReport:
+        """Stop tracemalloc (if started here) and finalize the cProfile stats."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        if self._cprofile is not None:
+            buffer = io.StringIO()
+            stats = pstats.Stats(self._cprofile, stream=buffer)
+            stats.sort_stats("cumulative").print_stats(self.stats_limit)
+            self.report.cprofile_stats = buffer.getvalue()
+        return self.report
+
+    def measure(
+        self,
+        step: "TransformStep",
+        df: pd.DataFrame,
+        context: PipelineContext,
+        *,
+        index: int,
+        fused: bool,
+    ) -> pd.DataFrame:
+        """
+        Run ``step`` on ``df`` and record its profile.
+
+        Fused steps run through ``apply_in_place``, others through ``apply``.
+        """
+        self.start()
+        tracemalloc.reset_peak()
+        memory_before, _ = tracemalloc.get_traced_memory()
+
+        profiler: Optional[cProfile.Profile] = None
+        if self.capture_step is not None and step.name == self.capture_step:
+            if self._cprofile is None:
+                self._cprofile = cProfile.Profile()
+            profiler = self._cprofile
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            if fused:
+                result = step.apply_in_place(df, context)
+            else:
+                result = step.apply(df, context)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+        cpu_ms = (time.process_time() - cpu_start) * 1000
+        wall_ms = (time.perf_counter() - wall_start) * 1000
+        _, memory_peak = tracemalloc.get_traced_memory()
+
+        profile = TransformStepProfile(
+            pipeline=context.pipeline_name,
+            step=step.name,
+            index=index,
+            fused=fused,
+            wall_ms=round(wall_ms, 3),
+            cpu_ms=round(cpu_ms, 3),
+            rows_in=len(df),
+            rows_out=len(result),
+            peak_memory_bytes=max(memory_peak - memory_before, 0),
+            frame_bytes=int(result.memory_usage(deep=True).sum()),
+        )
+        self.report.steps.append(profile)
+        logger.info("pipeline_step_profile", **profile.to_dict())
+        return result
+
+
+def active_profiler() -> Optional[PipelineProfiler]:
+    """Return the process-wide profiler set by ``profile_pipelines``, if any."""
+    return _active_profiler
+
+
+@contextmanager
+def profile_pipelines(
+    capture_step: Optional[str] = None, stats_limit: int = 30
+) -> Iterator[PipelineProfileReport]:
+    """
+    Profile every transform Pipeline executed inside the ``with`` block.
+
+    Yields the report, which is complete once the block exits.
+    """
+    global _active_profiler
+    previous = _active_profiler
+    profiler = PipelineProfiler(capture_step=capture_step, stats_limit=stats_limit)
+    _active_profiler = profiler
+    try:
+        yield profiler.report
+    finally:
+        _active_profiler = previous
+        profiler.stop()
+
+
+__all__ = [
+    "PipelineProfileReport",
+    "PipelineProfiler",
+    "TransformStepProfile",
+    "active_profiler",
+    "profile_pipelines",
+]
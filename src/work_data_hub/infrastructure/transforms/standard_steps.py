@@ -18,8 +18,9 @@ Steps:
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import structlog
 
@@ -41,6 +42,8 @@ class MappingStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    in_place = True
+
     def __init__(self, column_mapping: Dict[str, str]) -> None:
         """
         Initialize the mapping step with column name mappings.
@@ -67,6 +70,12 @@ class MappingStep(TransformStep):
 
     def apply(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
         """Rename columns using Pandas vectorized operation."""
+        return self.apply_in_place(df.copy(), context)
+
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """Rename columns of ``df`` in place."""
         log = logger.bind(step=self.name, pipeline=context.pipeline_name)
 
         existing_columns = set(df.columns)
@@ -81,11 +90,11 @@ class MappingStep(TransformStep):
             log.warning("columns_not_found", missing=sorted(missing))
 
         if not effective_mapping:
-            return df.copy()
+            return df
 
-        result = df.rename(columns=effective_mapping)
+        df.rename(columns=effective_mapping, inplace=True)
         log.info("columns_renamed", count=len(effective_mapping))
-        return result
+        return df
 
 
 class ReplacementStep(TransformStep):
@@ -101,6 +110,8 @@ class ReplacementStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    in_place = True
+
     def __init__(self, column_mapping: Dict[str, Dict[Any, Any]]) -> None:
         """
         Initialize the replacement step with value mappings.
@@ -125,8 +136,14 @@ class ReplacementStep(TransformStep):
 
     def apply(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
         """Replace values using Pandas vectorized operation."""
+        return self.apply_in_place(df.copy(), context)
+
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """Replace values in the columns of ``df`` in place."""
         log = logger.bind(step=self.name, pipeline=context.pipeline_name)
-        result = df.copy()
+        result = df
         total_replacements = 0
 
         for column, mapping in self._column_mapping.items():
@@ -163,6 +180,8 @@ class CalculationStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    in_place = True
+
     def __init__(self, calculations: Dict[str, CalculationFunc]) -> None:
         """
         Initialize the calculation step with field definitions.
@@ -191,8 +210,14 @@ class CalculationStep(TransformStep):
 
     def apply(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
         """Add calculated fields to DataFrame."""
+        return self.apply_in_place(df.copy(), context)
+
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """Assign calculated fields to ``df`` in place."""
         log = logger.bind(step=self.name, pipeline=context.pipeline_name)
-        result = df.copy()
+        result = df
 
         for field, func in self._calculations.items():
             try:
@@ -224,6 +249,9 @@ class FilterStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    pure = True
+    mutates_input = False
+
     def __init__(
         self,
         predicate: FilterFunc,
@@ -280,6 +308,8 @@ class DropStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    in_place = True
+
     def __init__(self, columns: List[str]) -> None:
         """
         Initialize the drop step with columns to remove.
@@ -312,6 +342,21 @@ class DropStep(TransformStep):
         log.info("columns_dropped", count=len(existing), columns=existing)
         return result
 
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """Drop specified columns from ``df`` in place."""
+        log = logger.bind(step=self.name, pipeline=context.pipeline_name)
+
+        existing = [c for c in self._columns if c in df.columns]
+        if not existing:
+            log.info("no_columns_to_drop")
+            return df
+
+        df.drop(columns=existing, inplace=True)
+        log.info("columns_dropped", count=len(existing), columns=existing)
+        return df
+
 
 class RenameStep(TransformStep):
     """
@@ -324,6 +369,8 @@ class RenameStep(TransformStep):
         >>> df_out = step.apply(df_in, context)
     """
 
+    in_place = True
+
     def __init__(self, rename_mapping: Dict[str, str]) -> None:
         """
         Initialize the rename step with column mappings.
@@ -342,16 +389,48 @@ class RenameStep(TransformStep):
         """Rename columns using underlying MappingStep."""
         return self._mapping_step.apply(df, context)
 
+    def apply_in_place(
+        self, df: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        """Rename columns of ``df`` in place using underlying MappingStep."""
+        return self._mapping_step.apply_in_place(df, context)
+
+
+def _clean_cells(
+    series: pd.Series,
+    column: str,
+    cleaner: Callable[[Any, str], Optional[float]],
+) -> Tuple[List[float | None], List[int]]:
+    """Run ``cleaner`` cell by cell, collecting indices that raise ValueError."""
+    cleaned_values: List[float | None] = []
+    invalid_indices: List[int] = []
+    for idx, value in series.items():
+        try:
+            cleaned = cleaner(value, column)
+        except ValueError:
+            cleaned = None
+            invalid_indices.append(idx)
+        cleaned_values.append(cleaned)
+    return cleaned_values, invalid_indices
+
 
 def coerce_numeric_columns(
     dataframe: pd.DataFrame,
     columns: Sequence[str],
     *,
     cleaner: Callable[[Any, str], Optional[float]],
+    series_cleaner: Optional[
+        Callable[[pd.Series, str], Tuple[np.ndarray, np.ndarray]]
+    ] = None,
 ) -> Dict[str, List[int]]:
     """
     Clean and coerce numeric columns using provided cleaner.
 
+    If ``series_cleaner`` is given, each column is first cleaned in one
+    vectorized pass returning ``(values, decided)``; only cells it could not
+    decide go through ``cleaner``, so failing rows are still reported
+    individually.
+
     Returns a mapping of column name -> list of row indices that failed cleaning.
     """
     invalid_rows: Dict[str, List[int]] = {}
@@ -359,17 +438,21 @@ def coerce_numeric_columns(
         if column not in dataframe.columns:
             continue
         series = dataframe[column]
-        cleaned_values: List[float | None] = []
-        column_invalid_indices: List[int] = []
-        for idx, value in series.items():
-            try:
-                cleaned = cleaner(value, column)
-            except ValueError:
-                cleaned = None
-                column_invalid_indices.append(idx)
-            cleaned_values.append(cleaned)
+        if series_cleaner is None:
+            cleaned_values, column_invalid_indices = _clean_cells(
+                series, column, cleaner
+            )
+            converted = pd.to_numeric(cleaned_values, errors="coerce")
+        else:
+            values, decided = series_cleaner(series, column)
+            converted = np.array(values, dtype=float)
+            undecided = np.flatnonzero(~decided)
+            cleaned_values, column_invalid_indices = _clean_cells(
+                series.iloc[undecided], column, cleaner
+            )
+            if len(undecided):
+                converted[undecided] = pd.to_numeric(cleaned_values, errors="coerce")
 
-        converted = pd.to_numeric(cleaned_values, errors="coerce")
         dataframe[column] = converted
 
         if column_invalid_indices:
@@ -12,6 +12,7 @@ Components:
 - report_generator: CSV export and summary report generation
 - schema_helpers: Pandera schema validation helpers
 - domain_validators: Registry-driven validation for bronze/gold layers (Story 6.2-P13)
+- model_batch: Batch validation of DataFrames against Pydantic output models
 
 Usage:
     >>> from work_data_hub.infrastructure.validation import (
@@ -62,6 +63,13 @@ from work_data_hub.infrastructure.validation.failure_exporter import (
     generate_session_id,
 )
 
+# Batch model validation
+from work_data_hub.infrastructure.validation.model_batch import (
+    ModelBatchResult,
+    models_to_dataframe,
+    validate_model_batch,
+)
+
 # Report generation
 from work_data_hub.infrastructure.validation.report_generator import (
     export_error_csv,
@@ -121,6 +129,10 @@ __all__ = [
     "FailedRecord",
     "FailureExporter",
     "generate_session_id",
+    # Batch model validation
+    "ModelBatchResult",
+    "models_to_dataframe",
+    "validate_model_batch",
     # Report generation
     "export_error_csv",
     "export_error_details_csv",
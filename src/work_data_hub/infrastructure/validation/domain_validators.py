@@ -23,6 +23,7 @@ Usage:
 from __future__ import annotations
 
 import importlib
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
@@ -31,6 +32,7 @@ import pandera.pandas as pa
 from work_data_hub.infrastructure.cleansing import get_cleansing_registry
 from work_data_hub.infrastructure.cleansing.rules.numeric_rules import (
     clean_numeric_for_schema,
+    clean_numeric_series_for_schema,
 )
 from work_data_hub.infrastructure.models.shared import (
     BronzeValidationSummary,
@@ -228,6 +230,7 @@ def validate_bronze_layer(
     domain_name = domain_config.domain_name
     registry = get_cleansing_registry()
 
+    series_cleaner: Optional[Callable[..., Any]] = None
     if cleaner_override:
         cleaner = cleaner_override
     else:
@@ -237,6 +240,10 @@ def validate_bronze_layer(
                 value, field, domain=domain_name, registry=registry
             )
 
+        series_cleaner = partial(
+            clean_numeric_series_for_schema, domain=domain_name, registry=registry
+        )
+
     # Get numeric columns that apply to Bronze:
     # - intersection with domain's numeric_columns
     # - and present in required cols or incoming dataframe
@@ -250,6 +257,7 @@ def validate_bronze_layer(
         working_df,
         bronze_numeric,
         cleaner=cleaner,
+        series_cleaner=series_cleaner,
     )
 
     # Date parsing
@@ -0,0 +1,189 @@
+"""Batch validation of DataFrames against Pydantic output models.
+
+Replaces the per-row ``iterrows()`` + ``Model(**row_dict)`` loops of the
+domain ``convert_dataframe_to_models`` helpers. Required-field checks,
+NaN-to-None conversion and field filtering run column-wise; the remaining
+rows are validated by a single ``TypeAdapter(List[Model])`` call, so every
+field validator and ``model_validator`` of the model still applies, and
+dumped by the same adapter into the load-ready ``valid`` frame. Failed rows
+come back as a DataFrame (original rows plus an ``error`` column) instead of
+per-row log lines.
+
+Key Functions:
+- validate_model_batch: Validate a DataFrame into a valid and a failure frame
+- models_to_dataframe: Dump validated models into a DataFrame in one call
+
+Usage:
+    >>> from work_data_hub.infrastructure.validation.model_batch import (
+    ...     validate_model_batch,
+    ... )
+    >>> batch = validate_model_batch(
+    ...     df, AnnuityPerformanceOut, required=["计划代码"], not_null=["月度"]
+    ... )
+    >>> load_df = batch.valid  # validated rows, ready for loading
+    >>> batch.failed  # rows that were dropped, with an "error" column
+    >>> batch.records  # List[AnnuityPerformanceOut]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Generic, List, Sequence, Type, TypeVar
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+ERROR_COLUMN = "error"
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter[List[Any]]:
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+@dataclass
+class ModelBatchResult(Generic[ModelT]):
+    """Outcome of :func:`validate_model_batch`.
+
+    Attributes:
+        valid: Validated rows as a DataFrame ready for warehouse loading,
+            serialized like ``model_dump(mode="json", by_alias=True,
+            exclude_none=True)``
+        failed: Source rows that were dropped, with an ``error`` column
+        records: Validated models, in source row order
+        positions: Position in the source DataFrame of each valid row
+    """
+
+    valid: pd.DataFrame
+    failed: pd.DataFrame
+    records: List[ModelT]
+    positions: np.ndarray
+
+
+def _format_errors(errors: List[ErrorDetails]) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'][1:]) or 'row'}: {err['msg']}"
+        for err in errors
+    )
+
+
+def _missing_mask(
+    frame: pd.DataFrame, required: Sequence[str], not_null: Sequence[str]
+) -> pd.Series:
+    """Rows failing the required-field checks, evaluated column-wise."""
+    missing = pd.Series(False, index=frame.index)
+    for column in required:
+        if column not in frame.columns:
+            return pd.Series(True, index=frame.index)
+        values = frame[column]
+        # Falsy like ``not row_dict.get(column)``: None, "" and 0
+        missing |= values.isna() | values.isin(["", 0])
+    for column in not_null:
+        if column not in frame.columns:
+            return pd.Series(True, index=frame.index)
+        missing |= frame[column].isna()
+    return missing
+
+
+def validate_model_batch(
+    df: pd.DataFrame,
+    model: Type[ModelT],
+    *,
+    required: Sequence[str] = (),
+    not_null: Sequence[str] = (),
+) -> ModelBatchResult[ModelT]:
+    """Validate DataFrame rows against ``model`` as one batch.
+
+    Only columns that are model fields are passed to the model; NaN/NA
+    become ``None``. The validated rows are dumped by the same adapter, so
+    callers load ``valid`` instead of converting the records back.
+
+    Args:
+        df: DataFrame to validate (e.g. pipeline output)
+        model: Pydantic output model
+        required: Columns that must hold a truthy value
+        not_null: Columns that must not be NULL
+
+    Returns:
+        ModelBatchResult with the valid frame, the failure frame and the
+        validated records
+    """
+    allowed = [col for col in df.columns if col in model.model_fields]
+    frame = df[allowed].astype(object)
+    frame = frame.where(frame.notna(), None)
+
+    missing = _missing_mask(frame, required, not_null).to_numpy()
+    candidate_positions = np.flatnonzero(~missing)
+    rows = frame.iloc[candidate_positions].to_dict("records")
+
+    errors: Dict[int, str] = {}
+    adapter = _list_adapter(model)
+    try:
+        records = adapter.validate_python(rows)
+    except ValidationError as exc:
+        by_row: Dict[int, List[ErrorDetails]] = {}
+        for err in exc.errors(include_url=False):
+            by_row.setdefault(int(err["loc"][0]), []).append(err)
+        errors = {row: _format_errors(errs) for row, errs in by_row.items()}
+        # Row validation is independent: re-validate the rows that passed
+        records = adapter.validate_python(
+            [row for i, row in enumerate(rows) if i not in errors]
+        )
+    except Exception:
+        # A validator raised a non-validation error: isolate it row by row
+        records = []
+        for i, row in enumerate(rows):
+            try:
+                records.append(model.model_validate(row))
+            except Exception as exc:  # noqa: BLE001
+                errors[i] = str(exc)
+
+    valid = np.ones(len(rows), dtype=bool)
+    valid[list(errors)] = False
+    positions = candidate_positions[valid]
+
+    failed_positions = np.sort(
+        np.concatenate([np.flatnonzero(missing), candidate_positions[~valid]])
+    )
+    failed = df.iloc[failed_positions].copy()
+    reasons = pd.Series("missing required field", index=range(len(df)), dtype=object)
+    for i, message in errors.items():
+        reasons.iloc[candidate_positions[i]] = message
+    failed[ERROR_COLUMN] = reasons.iloc[failed_positions].to_numpy()
+
+    return ModelBatchResult(
+        valid=models_to_dataframe(records, model),
+        failed=failed,
+        records=records,
+        positions=positions,
+    )
+
+
+def models_to_dataframe(
+    records: Sequence[BaseModel], model: Type[BaseModel]
+) -> pd.DataFrame:
+    """Dump models to a DataFrame with one serializer call.
+
+    Matches ``model_dump(mode="json", by_alias=True, exclude_none=True)``
+    per record; an empty input gives an empty DataFrame.
+    """
+    if not records:
+        return pd.DataFrame()
+    return pd.DataFrame(
+        _list_adapter(model).dump_python(
+            list(records), mode="json", by_alias=True, exclude_none=True
+        )
+    )
+
+
+__all__ = [
+    "ERROR_COLUMN",
+    "ModelBatchResult",
+    "models_to_dataframe",
+    "validate_model_batch",
+]
@@ -26,6 +26,9 @@ from work_data_hub.domain.pipelines.types import PipelineContext
 class BronzeSchemaValidationStep:
     """Story 2.2: DataFrame-level validation for Bronze schema."""
 
+    # The validator works on its own copy; zero-copy pipelines skip theirs
+    mutates_input = False
+
     def __init__(self, failure_threshold: float = 0.10):
         self.failure_threshold = failure_threshold
 
@@ -56,6 +59,9 @@ class BronzeSchemaValidationStep:
 class GoldSchemaValidationStep:
     """Story 2.2: Gold-layer schema validation before database projection."""
 
+    # The validator works on its own copy; zero-copy pipelines skip theirs
+    mutates_input = False
+
     def __init__(self, project_columns: bool = True):
         self.project_columns = project_columns
 
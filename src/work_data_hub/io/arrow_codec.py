@@ -0,0 +1,314 @@
+"""Lossless pandas / row-dict <-> Arrow codec.
+
+Shared by the parsed-sheet read cache (``io/readers/read_cache.py``) and the
+Arrow IO manager used between Dagster ops. Plain Arrow conversion is lossy for
+the data this project moves around: Excel object columns mix ``202411`` with
+``"202411"``, distinguish ``NaN`` from ``None``, and processed rows carry
+``Decimal``/``date`` values. This module keeps those exact.
+
+- Homogeneous columns map to native Arrow types (zero-copy, memory-mappable).
+- Mixed columns fall back to a compact type-tagged string encoding
+  (``"i:202411"``, ``"s:202411"``, ``"M:1.50"``...).
+- Values with no lossless encoding raise ``UnsupportedFrameError`` so callers
+  can choose another storage path.
+"""
+
+import json
+from datetime import date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+FRAME_METADATA_KEY = b"wdh_frame"
+RECORDS_METADATA_KEY = b"wdh_records"
+
+
+class UnsupportedFrameError(ValueError):
+    """Raised when data cannot be represented losslessly in Arrow."""
+
+
+# --- Cell codec ----------------------------------------------------------------
+
+# Order matters: bool before int, Timestamp before datetime before date
+_ENCODERS: List[Tuple[Tuple[type, ...], Callable[[Any], str]]] = [
+    ((str,), lambda value: "s:" + value),
+    ((bool, np.bool_), lambda value: "b:1" if value else "b:0"),
+    ((int, np.integer), lambda value: f"i:{int(value)}"),
+    ((float, np.floating), lambda value: "f:" + repr(float(value))),
+    ((Decimal,), lambda value: "M:" + str(value)),
+    ((pd.Timestamp,), lambda value: "T:" + value.isoformat()),
+    ((datetime,), lambda value: "D:" + value.isoformat()),
+    ((date,), lambda value: "d:" + value.isoformat()),
+    ((dt_time,), lambda value: "t:" + value.isoformat()),
+    ((pd.Timedelta,), lambda value: f"P:{value.value}"),
+]
+
+_DECODERS: Dict[str, Callable[[str], Any]] = {
+    "s": lambda raw: raw,
+    "b": lambda raw: raw == "1",
+    "i": int,
+    "f": float,
+    "M": Decimal,
+    "T": pd.Timestamp,
+    "D": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "t": dt_time.fromisoformat,
+    "P": lambda raw: pd.Timedelta(int(raw), unit="ns"),
+}
+
+
+def encode_cell(value: Any) -> Optional[str]:
+    """Encode one cell as a type-tagged string (None stays None)."""
+    if value is None:
+        return None
+    if getattr(value, "tzinfo", None) is not None:
+        raise UnsupportedFrameError("timezone-aware values are not supported")
+    for types, encoder in _ENCODERS:
+        if isinstance(value, types):
+            return encoder(value)
+    raise UnsupportedFrameError(f"unsupported cell type {type(value).__name__}")
+
+
+def decode_cell(encoded: Optional[str]) -> Any:
+    """Decode a value produced by :func:`encode_cell`."""
+    if encoded is None:
+        return None
+    return _DECODERS[encoded[0]](encoded[2:])
+
+
+def _encode_tagged(values: Sequence[Any]) -> pa.Array:
+    return pa.array([encode_cell(value) for value in values], type=pa.string())
+
+
+def _decode_tagged(array: pa.ChunkedArray) -> List[Any]:
+    return [decode_cell(item) for item in array.to_pylist()]
+
+
+# --- DataFrame codec -------------------------------------------------------------
+
+
+def _is_plain_string_column(series: pd.Series) -> bool:
+    """True when non-missing cells are all ``str`` and missing cells are NaN."""
+    for value in series:
+        if isinstance(value, str):
+            continue
+        if isinstance(value, float) and np.isnan(value):
+            continue
+        return False
+    return True
+
+
+def _encode_series(series: pd.Series) -> Tuple[pa.Array, str]:
+    dtype = series.dtype
+    if pd.api.types.is_object_dtype(dtype):
+        if _is_plain_string_column(series):
+            return pa.array(series, type=pa.string(), from_pandas=True), "str"
+        return _encode_tagged(list(series)), "tagged"
+    is_extension = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    if dtype.kind in "biufmM" and not is_extension:
+        return pa.array(series.to_numpy(), from_pandas=False), "native"
+    raise UnsupportedFrameError(f"unsupported column dtype {dtype}")
+
+
+def _decode_series(array: pa.ChunkedArray, kind: str, dtype: str) -> pd.Series:
+    if kind == "str":
+        values = array.to_numpy(zero_copy_only=False).astype(object)
+        values[pd.isna(values)] = np.nan
+        return pd.Series(values, dtype=object)
+    if kind == "tagged":
+        values = np.empty(len(array), dtype=object)
+        values[:] = _decode_tagged(array)
+        return pd.Series(values, dtype=object)
+    series: pd.Series = pd.Series(array.to_numpy(zero_copy_only=False))
+    if str(series.dtype) != dtype:
+        series = series.astype(pd.api.types.pandas_dtype(dtype))
+    return series
+
+
+def _series_spec(series: pd.Series, label: Any, kind: str) -> Dict[str, Any]:
+    return {"label": encode_cell(label), "kind": kind, "dtype": str(series.dtype)}
+
+
+def frame_to_table(df: pd.DataFrame, preserve_index: bool = False) -> pa.Table:
+    """
+    Encode a DataFrame as an Arrow table (labels and dtypes kept in metadata).
+
+    Args:
+        df: Frame to encode
+        preserve_index: Store a non-default (flat) index; when False only a
+            default ``RangeIndex`` is accepted
+
+    Raises:
+        UnsupportedFrameError: If the frame cannot round-trip losslessly
+    """
+    index = df.index
+    default_index = (
+        isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+    )
+    if not default_index and (not preserve_index or index.nlevels != 1):
+        raise UnsupportedFrameError("only flat indexes can be encoded")
+    if df.shape[1] == 0:
+        raise UnsupportedFrameError("frames without columns are not encoded")
+
+    arrays: List[pa.Array] = []
+    columns: List[Dict[str, Any]] = []
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        array, kind = _encode_series(series)
+        arrays.append(array)
+        columns.append(_series_spec(series, df.columns[position], kind))
+
+    metadata: Dict[str, Any] = {
+        "columns": columns,
+        "columns_dtype": str(df.columns.dtype),
+        "rows": len(df),
+        "index": None,
+    }
+    names = [f"c{position}" for position in range(len(arrays))]
+    if not default_index:
+        index_series = index.to_series(index=pd.RangeIndex(len(index)))
+        array, kind = _encode_series(index_series)
+        arrays.append(array)
+        names.append("index")
+        metadata["index"] = _series_spec(index_series, index.name, kind)
+
+    table = pa.Table.from_arrays(arrays, names=names)
+    return table.replace_schema_metadata(
+        {FRAME_METADATA_KEY: json.dumps(metadata, ensure_ascii=False).encode("utf-8")}
+    )
+
+
+def table_to_frame(table: pa.Table) -> pd.DataFrame:
+    """Decode a table written by :func:`frame_to_table`."""
+    metadata = json.loads(table.schema.metadata[FRAME_METADATA_KEY].decode("utf-8"))
+    columns = metadata["columns"]
+    data = {
+        position: _decode_series(table.column(position), spec["kind"], spec["dtype"])
+        for position, spec in enumerate(columns)
+    }
+    df = pd.DataFrame(data)
+    df.columns = pd.Index(
+        [decode_cell(spec["label"]) for spec in columns],
+        dtype=metadata["columns_dtype"],
+    )
+    index_spec = metadata.get("index")
+    if index_spec is not None:
+        index_values = _decode_series(
+            table.column(len(columns)), index_spec["kind"], index_spec["dtype"]
+        )
+        df.index = pd.Index(index_values, name=decode_cell(index_spec["label"]))
+    return df
+
+
+# --- Row-dict codec --------------------------------------------------------------
+
+_ABSENT = object()
+
+# Exact Python type of every present value -> native Arrow type
+_NATIVE_RECORD_TYPES: Dict[type, pa.DataType] = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    date: pa.date32(),
+    datetime: pa.timestamp("us"),
+}
+
+
+def _encode_record_column(values: List[Any]) -> Tuple[pa.Array, str]:
+    present_types = {type(value) for value in values if value is not None}
+    if not present_types:
+        return pa.nulls(len(values)), "native"
+    if len(present_types) == 1:
+        (value_type,) = present_types
+        arrow_type = _NATIVE_RECORD_TYPES.get(value_type)
+        naive = value_type is not datetime or all(
+            value is None or value.tzinfo is None for value in values
+        )
+        if arrow_type is not None and naive:
+            try:
+                return pa.array(values, type=arrow_type, from_pandas=False), "native"
+            except (pa.ArrowInvalid, OverflowError):
+                pass  # e.g. integers beyond int64
+    return _encode_tagged(values), "tagged"
+
+
+def records_to_table(records: Sequence[Mapping[str, Any]]) -> pa.Table:
+    """
+    Encode row dictionaries column-wise, keeping keys, types and absent keys.
+
+    Raises:
+        UnsupportedFrameError: If a value cannot round-trip losslessly
+    """
+    keys: Dict[Any, None] = {}
+    for record in records:
+        for key in record:
+            keys.setdefault(key, None)
+
+    arrays: List[pa.Array] = []
+    names: List[str] = []
+    columns: List[Dict[str, Any]] = []
+    for position, key in enumerate(keys):
+        values = [record.get(key, _ABSENT) for record in records]
+        absent = [value is _ABSENT for value in values]
+        has_absent = any(absent)
+        if has_absent:
+            values = [None if value is _ABSENT else value for value in values]
+
+        array, kind = _encode_record_column(values)
+        arrays.append(array)
+        names.append(f"c{position}")
+        columns.append({"key": encode_cell(key), "kind": kind, "absent": has_absent})
+        if has_absent:
+            arrays.append(pa.array(absent, type=pa.bool_()))
+            names.append(f"a{position}")
+
+    metadata = {"columns": columns, "rows": len(records)}
+    table = pa.Table.from_arrays(arrays, names=names)
+    return table.replace_schema_metadata(
+        {RECORDS_METADATA_KEY: json.dumps(metadata, ensure_ascii=False).encode("utf-8")}
+    )
+
+
+def table_to_records(table: pa.Table) -> List[Dict[str, Any]]:
+    """Decode a table written by :func:`records_to_table`."""
+    metadata = json.loads(table.schema.metadata[RECORDS_METADATA_KEY].decode("utf-8"))
+    specs = metadata["columns"]
+    if not specs:
+        return [{} for _ in range(metadata["rows"])]
+
+    keys = [decode_cell(spec["key"]) for spec in specs]
+    column_values = []
+    for position, spec in enumerate(specs):
+        array = table.column(f"c{position}")
+        if spec["kind"] == "tagged":
+            column_values.append(_decode_tagged(array))
+        else:
+            column_values.append(array.to_pylist())
+
+    records = [dict(zip(keys, row)) for row in zip(*column_values)]
+    for position, spec in enumerate(specs):
+        if not spec["absent"]:
+            continue
+        mask = table.column(f"a{position}").to_numpy(zero_copy_only=False)
+        key = keys[position]
+        for row_index in np.flatnonzero(mask):
+            del records[row_index][key]
+    return records
+
+
+__all__ = [
+    "FRAME_METADATA_KEY",
+    "RECORDS_METADATA_KEY",
+    "UnsupportedFrameError",
+    "decode_cell",
+    "encode_cell",
+    "frame_to_table",
+    "records_to_table",
+    "table_to_frame",
+    "table_to_records",
+]
@@ -27,6 +27,7 @@ from work_data_hub.io.connectors.file_pattern_matcher import (
 )
 from work_data_hub.io.connectors.version_scanner import VersionedPath, VersionScanner
 from work_data_hub.io.readers.excel_reader import ExcelReader
+from work_data_hub.io.readers.read_cache import build_read_cache
 from work_data_hub.utils.logging import get_logger
 
 from .models import DataDiscoveryResult, DiscoveryMatch
@@ -48,11 +49,16 @@ class FileDiscoveryService:
         version_scanner: Optional[VersionScanner] = None,
         file_matcher: Optional[FilePatternMatcher] = None,
         excel_reader: Optional[ExcelReader] = None,
+        use_read_cache: bool = True,
     ):
         self.settings = settings or get_settings()
         self.version_scanner = version_scanner or VersionScanner()
         self.file_matcher = file_matcher or FilePatternMatcher()
-        self.excel_reader = excel_reader or ExcelReader()
+        engine = getattr(self.settings, "excel_reader_engine", None)
+        self.excel_reader = excel_reader or ExcelReader(
+            engine=engine if isinstance(engine, str) else None,
+            read_cache=build_read_cache(self.settings) if use_read_cache else None,
+        )
         self.logger = get_logger(__name__)
 
     def discover_file(
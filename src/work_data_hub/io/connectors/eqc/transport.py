@@ -1,5 +1,6 @@
 import logging
 import random
+import threading
 import time
 from collections import deque
 from http import HTTPStatus
@@ -109,6 +110,8 @@ class EQCTransport:
         # Rate limiting: track request timestamps using deque for efficient
         # sliding window
         self.request_times: Deque[float] = deque(maxlen=self.rate_limit)
+        # One limiter shared by every thread issuing requests on this transport
+        self._rate_lock = threading.Lock()
 
         logger.info(
             "EQC transport initialized",
@@ -156,6 +159,18 @@ class EQCTransport:
             )
             time.sleep(sleep_time)
 
+    def _acquire_rate_slot(self) -> None:
+        """
+        Wait for and claim one request slot in the sliding window.
+
+        Waiting and recording happen under one lock, so concurrent callers
+        (e.g. ``EqcProvider.lookup_many`` workers) queue for slots instead of
+        all passing the check at once; the HTTP call itself runs unlocked.
+        """
+        with self._rate_lock:
+            self._enforce_rate_limit()
+            self.request_times.append(time.time())
+
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
         Make HTTP request with retry logic and error handling.
@@ -178,11 +193,8 @@ class EQCTransport:
 
         for attempt in range(self.retry_max + 1):
             try:
-                # Enforce rate limiting before each request
-                self._enforce_rate_limit()
-
-                # Record request timestamp
-                self.request_times.append(time.time())
+                # Enforce rate limiting and record the request timestamp
+                self._acquire_rate_slot()
 
                 logger.debug(
                     "Making EQC API request",
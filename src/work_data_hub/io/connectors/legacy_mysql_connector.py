@@ -6,14 +6,15 @@ MySQL database, with support for connection pooling, retry logic, and
 incremental sync.
 """
 
+import itertools
 import logging
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Iterator, Optional, Tuple
 
 import pandas as pd
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.cursors import DictCursor, SSDictCursor
 
 from work_data_hub.config.settings import get_settings
 from work_data_hub.domain.reference_backfill.sync_models import (
@@ -167,48 +168,12 @@ class LegacyMySQLConnector:
             ValueError: If source_config is invalid
             pymysql.Error: If query execution fails
         """
-        # Parse source configuration
-        try:
-            source_config = LegacyMySQLSourceConfig(**table_config.source_config)
-        except Exception as e:
-            error_msg = f"Invalid Legacy MySQL source config: {e}"
-            self.logger.error(
-                f"Invalid Legacy MySQL config for table {table_config.target_table}: {str(e)}"
-            )
-            raise ValueError(error_msg)
-
-        # Build query
-        column_list = [mapping.source for mapping in source_config.columns]
-        query = f"SELECT {', '.join(column_list)} FROM {source_config.table}"
-
-        # Add incremental WHERE clause if configured
-        params: Dict[str, Any] = {}
-        incremental_used = False
-        if source_config.incremental:
-            last_synced_at = None
-            if state:
-                last_synced_at = state.get("last_synced_at") or state.get(
-                    "last_sync_at"
-                )
-
-            if last_synced_at is None:
-                self.logger.warning(
-                    "Incremental sync configured but no last_synced_at provided; falling back to full load",
-                    table=source_config.table,
-                )
-            else:
-                where_clause = source_config.incremental.where.replace(
-                    ":last_synced_at", "%(last_synced_at)s"
-                )
-                query += f" WHERE {where_clause}"
-                params["last_synced_at"] = last_synced_at
-                incremental_used = True
-                self.logger.info(
-                    f"Incremental sync configured for table {source_config.table}: {source_config.incremental.where}"
-                )
+        source_config = self._parse_source_config(table_config)
+        query, base_query, params = self._build_query(source_config, state)
 
         self.logger.info(
-            f"Fetching data from {source_config.table} -> {table_config.target_table} ({len(column_list)} columns)"
+            f"Fetching data from {source_config.table} -> "
+            f"{table_config.target_table} ({len(source_config.columns)} columns)"
         )
 
         # Execute query with retry logic
@@ -220,14 +185,14 @@ class LegacyMySQLConnector:
                 table_config,
             )
         except pymysql.Error as e:
-            if incremental_used and self._is_missing_incremental_column_error(e):
+            if params and self._is_missing_incremental_column_error(e):
                 self.logger.warning(
                     "Incremental column missing, falling back to full refresh",
                     table=source_config.table,
                     error=str(e),
                 )
                 df = self._execute_query_with_retry(
-                    f"SELECT {', '.join(column_list)} FROM {source_config.table}",
+                    base_query,
                     {},
                     source_config,
                     table_config,
@@ -244,6 +209,122 @@ class LegacyMySQLConnector:
 
         return df
 
+    def fetch_batches(
+        self,
+        table_config: ReferenceSyncTableConfig,
+        state: Optional[Dict[str, Any]] = None,
+        batch_size: int = 5000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream reference data from Legacy MySQL in chunks of ``batch_size`` rows.
+
+        Uses an unbuffered ``SSDictCursor``, so rows are read from the server
+        as they are consumed instead of being buffered client-side.
+        Connection errors are retried until the first chunk has been yielded.
+
+        Args:
+            table_config: Table sync configuration
+            state: Optional state for incremental sync (e.g., last_synced_at)
+            batch_size: Rows per yielded DataFrame
+
+        Yields:
+            DataFrames with target column names; nothing for an empty source
+
+        Raises:
+            ValueError: If source_config is invalid
+            pymysql.Error: If query execution fails
+        """
+        source_config = self._parse_source_config(table_config)
+        query, base_query, params = self._build_query(source_config, state)
+
+        self.logger.info(
+            f"Streaming data from {source_config.table} -> "
+            f"{table_config.target_table} (batch_size={batch_size})"
+        )
+
+        try:
+            chunks = self._stream_query_with_retry(
+                query, params, source_config, batch_size
+            )
+            first = next(chunks, None)
+        except pymysql.Error as e:
+            if not (params and self._is_missing_incremental_column_error(e)):
+                raise
+            self.logger.warning(
+                f"Incremental column missing for table {source_config.table}, "
+                f"falling back to full refresh: {e}"
+            )
+            chunks = self._stream_query_with_retry(
+                base_query, {}, source_config, batch_size
+            )
+            first = next(chunks, None)
+
+        total_rows = 0
+        if first is not None:
+            for chunk in itertools.chain([first], chunks):
+                total_rows += len(chunk)
+                yield self._apply_column_mappings(chunk, source_config)
+
+        self.logger.info(
+            f"Stream complete: {source_config.table} -> "
+            f"{table_config.target_table} ({total_rows} rows)"
+        )
+
+    def _parse_source_config(
+        self, table_config: ReferenceSyncTableConfig
+    ) -> LegacyMySQLSourceConfig:
+        """Validate the table's source_config as a Legacy MySQL source."""
+        try:
+            return LegacyMySQLSourceConfig(**table_config.source_config)
+        except Exception as e:
+            error_msg = f"Invalid Legacy MySQL source config: {e}"
+            self.logger.error(
+                f"Invalid Legacy MySQL config for table {table_config.target_table}: {str(e)}"
+            )
+            raise ValueError(error_msg)
+
+    def _build_query(
+        self,
+        source_config: LegacyMySQLSourceConfig,
+        state: Optional[Dict[str, Any]],
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Build the source query.
+
+        Returns:
+            Tuple of (query, full-load query, params); params are empty unless
+            the incremental WHERE clause is applied
+        """
+        column_list = [mapping.source for mapping in source_config.columns]
+        base_query = f"SELECT {', '.join(column_list)} FROM {source_config.table}"
+        query = base_query
+
+        # Add incremental WHERE clause if configured
+        params: Dict[str, Any] = {}
+        if source_config.incremental:
+            last_synced_at = None
+            if state:
+                last_synced_at = state.get("last_synced_at") or state.get(
+                    "last_sync_at"
+                )
+
+            if last_synced_at is None:
+                self.logger.warning(
+                    "Incremental sync configured but no last_synced_at provided; falling back to full load",
+                    table=source_config.table,
+                )
+            else:
+                where_clause = source_config.incremental.where.replace(
+                    ":last_synced_at", "%(last_synced_at)s"
+                )
+                query += f" WHERE {where_clause}"
+                params["last_synced_at"] = last_synced_at
+                self.logger.info(
+                    f"Incremental sync configured for table {source_config.table}: {source_config.incremental.where}"
+                )
+
+        return query, base_query, params
+
     def _execute_query_with_retry(
         self,
         query: str,
@@ -318,6 +399,61 @@ class LegacyMySQLConnector:
         )
         raise pymysql.Error(error_msg)
 
+    def _stream_query_with_retry(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        source_config: LegacyMySQLSourceConfig,
+        batch_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Execute query on an unbuffered cursor and yield ``fetchmany`` chunks.
+
+        Raises:
+            pymysql.Error: If query fails after all retries, or fails after
+                the first chunk was yielded
+        """
+        last_error = None
+
+        for attempt in range(1, self.max_retries + 1):
+            yielded = False
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor(SSDictCursor) as cursor:
+                        cursor.execute(query, params)
+                        while True:
+                            rows = cursor.fetchmany(batch_size)
+                            if not rows:
+                                break
+                            yielded = True
+                            yield pd.DataFrame(rows)
+                return
+
+            except pymysql.Error as e:
+                if yielded:
+                    raise
+                last_error = e
+                self.logger.warning(
+                    f"Stream query failed on attempt {attempt}/{self.max_retries} "
+                    f"for table {source_config.table}: {type(e).__name__}: {e}"
+                )
+
+                if attempt < self.max_retries:
+                    # Exponential backoff
+                    backoff_time = self.retry_backoff_base**attempt
+                    self.logger.info(f"Retrying query after {backoff_time}s backoff")
+                    time.sleep(backoff_time)
+
+        # All retries exhausted
+        error_msg = (
+            f"Failed to execute query on table '{source_config.table}' "
+            f"after {self.max_retries} attempts. Last error: {last_error}"
+        )
+        self.logger.error(
+            f"Query failed final for table {source_config.table}: {str(last_error)}"
+        )
+        raise pymysql.Error(error_msg)
+
     @staticmethod
     def _is_missing_incremental_column_error(err: pymysql.Error) -> bool:
         """Detect missing column errors to allow graceful full-refresh fallback."""
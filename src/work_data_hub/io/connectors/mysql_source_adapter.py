@@ -6,7 +6,7 @@ compatible interface for reference sync.
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
 import pandas as pd
 
@@ -56,3 +56,14 @@ class MySQLSourceAdapter:
         rename_map = {m.source: m.target for m in source_config.columns}
         df = df.rename(columns=rename_map)
         return df
+
+    def fetch_batches(
+        self,
+        table_config: ReferenceSyncTableConfig,
+        state: Optional[Dict[str, Any]] = None,
+        batch_size: int = 5000,
+    ) -> Iterator[pd.DataFrame]:
+        """Stream data in ``batch_size`` chunks via LegacyMySQLConnector."""
+        yield from self._delegate.fetch_batches(
+            table_config, state=state, batch_size=batch_size
+        )
@@ -5,11 +5,13 @@ This module provides an adapter for fetching reference data from PostgreSQL
 databases, supporting the generic data source adapter architecture.
 """
 
+import itertools
 import logging
 import os
 import time
+import uuid
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Iterator, Optional, Tuple
 
 import pandas as pd
 import psycopg2
@@ -172,9 +174,113 @@ class PostgresSourceAdapter:
             ValueError: If source_config is invalid
             psycopg2.Error: If query execution fails
         """
-        # Parse source configuration
+        source_config = self._parse_source_config(table_config)
+        query, base_query, params = self._build_query(source_config, state)
+
+        self.logger.info(
+            f"Fetching data from {source_config.source_schema}.{source_config.table} -> "
+            f"{table_config.target_table} ({len(source_config.columns)} columns)"
+        )
+
+        # Execute query with retry logic
+        try:
+            df = self._execute_query_with_retry(
+                query,
+                params,
+                source_config,
+                table_config,
+            )
+        except psycopg2.Error as e:
+            if params and self._is_missing_incremental_column_error(e):
+                self.logger.warning(
+                    "Incremental column missing, falling back to full refresh",
+                )
+                df = self._execute_query_with_retry(
+                    base_query,
+                    {},
+                    source_config,
+                    table_config,
+                )
+            else:
+                raise
+
+        # Apply column mappings
+        df = self._apply_column_mappings(df, source_config)
+
+        self.logger.info(
+            f"Fetch complete: {source_config.source_schema}.{source_config.table} -> "
+            f"{table_config.target_table} ({len(df)} rows)"
+        )
+
+        return df
+
+    def fetch_batches(
+        self,
+        table_config: ReferenceSyncTableConfig,
+        state: Optional[Dict[str, Any]] = None,
+        batch_size: int = 5000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream reference data from PostgreSQL in chunks of ``batch_size`` rows.
+
+        Uses a named (server-side) cursor, so only one chunk is held in
+        memory at a time. Connection errors are retried until the first
+        chunk has been yielded; after that they propagate.
+
+        Args:
+            table_config: Table sync configuration
+            state: Optional state for incremental sync (e.g., last_synced_at)
+            batch_size: Rows per yielded DataFrame
+
+        Yields:
+            DataFrames with target column names; nothing for an empty source
+
+        Raises:
+            ValueError: If source_config is invalid
+            psycopg2.Error: If query execution fails
+        """
+        source_config = self._parse_source_config(table_config)
+        query, base_query, params = self._build_query(source_config, state)
+
+        self.logger.info(
+            f"Streaming data from {source_config.source_schema}."
+            f"{source_config.table} -> {table_config.target_table} "
+            f"(batch_size={batch_size})"
+        )
+
+        try:
+            chunks = self._stream_query_with_retry(
+                query, params, source_config, batch_size
+            )
+            first = next(chunks, None)
+        except psycopg2.Error as e:
+            if not (params and self._is_missing_incremental_column_error(e)):
+                raise
+            self.logger.warning(
+                "Incremental column missing, falling back to full refresh",
+            )
+            chunks = self._stream_query_with_retry(
+                base_query, {}, source_config, batch_size
+            )
+            first = next(chunks, None)
+
+        total_rows = 0
+        if first is not None:
+            for chunk in itertools.chain([first], chunks):
+                total_rows += len(chunk)
+                yield self._apply_column_mappings(chunk, source_config)
+
+        self.logger.info(
+            f"Stream complete: {source_config.source_schema}.{source_config.table} -> "
+            f"{table_config.target_table} ({total_rows} rows)"
+        )
+
+    def _parse_source_config(
+        self, table_config: ReferenceSyncTableConfig
+    ) -> PostgresSourceConfig:
+        """Validate the table's source_config as a PostgreSQL source."""
         try:
-            source_config = PostgresSourceConfig(**table_config.source_config)
+            return PostgresSourceConfig(**table_config.source_config)
         except Exception as e:
             error_msg = f"Invalid PostgreSQL source config: {e}"
             self.logger.error(
@@ -182,16 +288,28 @@ class PostgresSourceAdapter:
             )
             raise ValueError(error_msg)
 
+    def _build_query(
+        self,
+        source_config: PostgresSourceConfig,
+        state: Optional[Dict[str, Any]],
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Build the source query.
+
+        Returns:
+            Tuple of (query, full-load query, params); params are empty unless
+            the incremental WHERE clause is applied
+        """
         # Build fully qualified table name (schema.table)
         full_table_name = f'"{source_config.source_schema}"."{source_config.table}"'
 
         # Build column list with proper quoting
         column_list = [f'"{mapping.source}"' for mapping in source_config.columns]
-        query = f"SELECT {', '.join(column_list)} FROM {full_table_name}"
+        base_query = f"SELECT {', '.join(column_list)} FROM {full_table_name}"
+        query = base_query
 
         # Add incremental WHERE clause if configured
         params: Dict[str, Any] = {}
-        incremental_used = False
         if source_config.incremental:
             last_synced_at = None
             if state:
@@ -210,48 +328,11 @@ class PostgresSourceAdapter:
                 )
                 query += f" WHERE {where_clause}"
                 params["last_synced_at"] = last_synced_at
-                incremental_used = True
                 self.logger.info(
                     f"Incremental sync configured for table {source_config.table}: {source_config.incremental.where}"
                 )
 
-        self.logger.info(
-            f"Fetching data from {source_config.source_schema}.{source_config.table} -> "
-            f"{table_config.target_table} ({len(source_config.columns)} columns)"
-        )
-
-        # Execute query with retry logic
-        try:
-            df = self._execute_query_with_retry(
-                query,
-                params,
-                source_config,
-                table_config,
-            )
-        except psycopg2.Error as e:
-            if incremental_used and self._is_missing_incremental_column_error(e):
-                self.logger.warning(
-                    "Incremental column missing, falling back to full refresh",
-                )
-                base_query = f"SELECT {', '.join(column_list)} FROM {full_table_name}"
-                df = self._execute_query_with_retry(
-                    base_query,
-                    {},
-                    source_config,
-                    table_config,
-                )
-            else:
-                raise
-
-        # Apply column mappings
-        df = self._apply_column_mappings(df, source_config)
-
-        self.logger.info(
-            f"Fetch complete: {source_config.source_schema}.{source_config.table} -> "
-            f"{table_config.target_table} ({len(df)} rows)"
-        )
-
-        return df
+        return query, base_query, params
 
     def _execute_query_with_retry(
         self,
@@ -327,6 +408,63 @@ class PostgresSourceAdapter:
         )
         raise psycopg2.Error(error_msg)
 
+    def _stream_query_with_retry(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        source_config: PostgresSourceConfig,
+        batch_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Execute query on a named cursor and yield ``fetchmany`` chunks.
+
+        Raises:
+            psycopg2.Error: If query fails after all retries, or fails after
+                the first chunk was yielded
+        """
+        last_error = None
+
+        for attempt in range(1, self.max_retries + 1):
+            yielded = False
+            try:
+                with self.get_connection() as conn:
+                    cursor_name = f"wdh_ref_sync_{uuid.uuid4().hex[:12]}"
+                    with conn.cursor(name=cursor_name) as cursor:
+                        cursor.itersize = batch_size
+                        cursor.execute(query, params)
+                        while True:
+                            rows = cursor.fetchmany(batch_size)
+                            if not rows:
+                                break
+                            yielded = True
+                            yield pd.DataFrame(rows)
+                return
+
+            except psycopg2.Error as e:
+                if yielded:
+                    raise
+                last_error = e
+                self.logger.warning(
+                    f"Stream query failed on attempt {attempt}/{self.max_retries} "
+                    f"for table {source_config.table}: {type(e).__name__}: {e}"
+                )
+
+                if attempt < self.max_retries:
+                    # Exponential backoff
+                    backoff_time = self.retry_backoff_base**attempt
+                    self.logger.info(f"Retrying query after {backoff_time}s backoff")
+                    time.sleep(backoff_time)
+
+        # All retries exhausted
+        error_msg = (
+            f"Failed to execute query on table '{source_config.table}' "
+            f"after {self.max_retries} attempts. Last error: {last_error}"
+        )
+        self.logger.error(
+            f"Query failed final for table {source_config.table}: {str(last_error)}"
+        )
+        raise psycopg2.Error(error_msg)
+
     @staticmethod
     def _is_missing_incremental_column_error(err: psycopg2.Error) -> bool:
         """Detect missing column errors to allow graceful full-refresh fallback."""
@@ -0,0 +1,45 @@
+"""
+COPY FROM STDIN support for bulk loads.
+
+``execute_values`` turns every row into a Python tuple and a VALUES literal,
+which dominates load time for detail tables with hundreds of thousands of
+rows. The ``copy`` load method streams a DataFrame to PostgreSQL with the
+COPY protocol (text format) instead; the COPY rendering and staging-table
+SQL live in ``infrastructure.sql.operations.bulk_copy`` and are re-exported
+here.
+
+Load methods (``output.load_method`` in data_sources.yml):
+    values: execute_values (default)
+    copy: COPY FROM STDIN
+"""
+
+from work_data_hub.infrastructure.sql.operations.bulk_copy import (
+    COPY_NULL,
+    COPY_READ_SIZE,
+    DataFrameCopyReader,
+    build_copy_sql,
+    build_stage_table_sql,
+    build_upsert_from_stage_sql,
+    copy_dataframe,
+    format_copy_frame,
+    new_stage_table_name,
+)
+
+LOAD_METHOD_VALUES = "values"
+LOAD_METHOD_COPY = "copy"
+LOAD_METHODS = (LOAD_METHOD_VALUES, LOAD_METHOD_COPY)
+
+__all__ = [
+    "COPY_NULL",
+    "COPY_READ_SIZE",
+    "LOAD_METHODS",
+    "LOAD_METHOD_COPY",
+    "LOAD_METHOD_VALUES",
+    "DataFrameCopyReader",
+    "build_copy_sql",
+    "build_stage_table_sql",
+    "build_upsert_from_stage_sql",
+    "copy_dataframe",
+    "format_copy_frame",
+    "new_stage_table_name",
+]
@@ -2,7 +2,7 @@ import logging
 import sys
 import time
 import uuid
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 # Static imports for compilation/linting, dynamic in methods for test patching
 if TYPE_CHECKING:
@@ -13,11 +13,31 @@ from functools import lru_cache
 import pandas as pd
 
 from work_data_hub.config import get_settings
+from work_data_hub.io.loader.copy_builder import (
+    LOAD_METHOD_COPY,
+    LOAD_METHOD_VALUES,
+    LOAD_METHODS,
+    build_stage_table_sql,
+    build_upsert_from_stage_sql,
+    copy_dataframe,
+    new_stage_table_name,
+)
 from work_data_hub.io.loader.models import DataWarehouseLoaderError, LoadResult
+from work_data_hub.io.loader.partition_swap import (
+    plan_partition_swap,
+    swap_month_partitions,
+)
+from work_data_hub.io.loader.refresh_builder import (
+    REFRESH_STRATEGIES,
+    REFRESH_STRATEGY_DELETE,
+    REFRESH_STRATEGY_PARTITION_SWAP,
+    build_delete_using_sql,
+)
 from work_data_hub.io.loader.sql_utils import quote_ident, quote_qualified
 from work_data_hub.utils.logging import get_logger
 
 logger = logging.getLogger(__name__)
+
 structured_logger = get_logger(__name__)
 
 
@@ -33,6 +53,9 @@ class WarehouseLoader:
         pool_size: Optional[int] = None,
         batch_size: Optional[int] = None,
         connect_timeout: int = 5,
+        load_method: str = LOAD_METHOD_VALUES,
+        *,
+        refresh_strategy: str = REFRESH_STRATEGY_DELETE,
     ):
         settings = get_settings()
         self.connection_url = (
@@ -40,8 +63,12 @@ class WarehouseLoader:
         )
         self.pool_size = pool_size or settings.DB_POOL_SIZE
         # Allow override but default to sensible batch size if not configured
-        self.batch_size = batch_size or getattr(settings, "DB_BATCH_SIZE", 5000)
+        self.batch_size: int = (
+            batch_size or getattr(settings, "DB_BATCH_SIZE", None) or 5000
+        )
         self.connect_timeout = connect_timeout
+        self.load_method = self._resolve_load_method(load_method)
+        self.refresh_strategy = self._resolve_refresh_strategy(refresh_strategy)
         self._pool: Optional[ThreadedConnectionPool] = None
         self._logger = structured_logger
 
@@ -49,6 +76,8 @@ class WarehouseLoader:
             "database.loader.initialized",
             pool_size=self.pool_size,
             batch_size=self.batch_size,
+            load_method=self.load_method,
+            refresh_strategy=self.refresh_strategy,
         )
         self._health_check()
 
@@ -184,6 +213,27 @@ class WarehouseLoader:
 
         return df[valid_cols]
 
+    def _resolve_load_method(self, load_method: Optional[str]) -> str:
+        """Validate a per-call load method, defaulting to the loader's."""
+        method = load_method or getattr(self, "load_method", LOAD_METHOD_VALUES)
+        if method not in LOAD_METHODS:
+            raise DataWarehouseLoaderError(
+                f"Unsupported load_method '{method}'. Valid: {list(LOAD_METHODS)}"
+            )
+        return method
+
+    def _resolve_refresh_strategy(self, refresh_strategy: Optional[str]) -> str:
+        """Validate a per-call refresh strategy, defaulting to the loader's."""
+        strategy = refresh_strategy or getattr(
+            self, "refresh_strategy", REFRESH_STRATEGY_DELETE
+        )
+        if strategy not in REFRESH_STRATEGIES:
+            raise DataWarehouseLoaderError(
+                f"Unsupported refresh_strategy '{strategy}'. "
+                f"Valid: {list(REFRESH_STRATEGIES)}"
+            )
+        return strategy
+
     def _chunk_dataframe(self, df: pd.DataFrame):
         """Yield DataFrame chunks respecting configured batch size."""
         for start in range(0, len(df), self.batch_size):
@@ -222,8 +272,15 @@ class WarehouseLoader:
         table: str,
         schema: str = "public",
         upsert_keys: Optional[List[str]] = None,
+        load_method: Optional[str] = None,
     ) -> LoadResult:
-        """Load a DataFrame into PostgreSQL with ACID guarantees."""
+        """
+        Load a DataFrame into PostgreSQL with ACID guarantees.
+
+        ``load_method`` overrides the loader default: ``"values"`` inserts
+        batches with ``execute_values``; ``"copy"`` streams the frame with
+        COPY FROM STDIN (upserts go through a temporary staging table).
+        """
         if not isinstance(df, pd.DataFrame):
             raise DataWarehouseLoaderError(
                 "load_dataframe() requires a pandas DataFrame"
@@ -240,9 +297,9 @@ class WarehouseLoader:
             )
             return LoadResult(True, 0, 0, 0.0, execution_id)
 
+        method = self._resolve_load_method(load_method)
         projected_df = self.project_columns(df, table, schema)
         columns = list(projected_df.columns)
-        query = self._build_insert_query(columns, table, schema, upsert_keys)
 
         conn = self._get_connection_with_retry()
         start_time = time.perf_counter()
@@ -254,34 +311,23 @@ class WarehouseLoader:
             table=table,
             schema=schema,
             rows=len(projected_df.index),
+            load_method=method,
             execution_id=execution_id,
         )
 
         try:
-            # Dynamic import to allow tests to patch execute_values via the facade
-            execute_values_func = self._get_dynamic_import(
-                "execute_values",
-                lambda: __import__(
-                    "psycopg2.extras", fromlist=["execute_values"]
-                ).execute_values,
-            )
-
             with conn.cursor() as cursor:
-                for batch in self._chunk_dataframe(projected_df):
-                    values = list(batch.itertuples(index=False, name=None))
-                    if not values:
-                        continue
-
-                    execute_values_func(
-                        cursor,
-                        query,
-                        values,
-                        page_size=min(len(values), self.batch_size),
+                if method == LOAD_METHOD_COPY:
+                    rows_inserted, rows_updated = self._copy_rows(
+                        cursor, projected_df, table, schema, upsert_keys
+                    )
+                else:
+                    query = self._build_insert_query(
+                        columns, table, schema, upsert_keys
+                    )
+                    rows_inserted, rows_updated = self._insert_values(
+                        cursor, projected_df, query
                     )
-                    result_flags = cursor.fetchall()
-                    inserted = sum(1 for (flag,) in result_flags if flag)
-                    rows_inserted += inserted
-                    rows_updated += len(result_flags) - inserted
             conn.commit()
         except Exception as exc:
             try:
@@ -311,6 +357,7 @@ class WarehouseLoader:
             execution_id=execution_id,
             rows_inserted=rows_inserted,
             rows_updated=rows_updated,
+            load_method=method,
             duration_ms=duration_ms,
         )
         return LoadResult(
@@ -321,12 +368,83 @@ class WarehouseLoader:
             execution_id=execution_id,
         )
 
+    def _insert_values(
+        self, cursor: Any, df: pd.DataFrame, query: str
+    ) -> Tuple[int, int]:
+        """Insert ``df`` in batches via execute_values; returns (inserted, updated)."""
+        # Dynamic import to allow tests to patch execute_values via the facade
+        execute_values_func = self._get_dynamic_import(
+            "execute_values",
+            lambda: __import__(
+                "psycopg2.extras", fromlist=["execute_values"]
+            ).execute_values,
+        )
+
+        rows_inserted = 0
+        rows_updated = 0
+        for batch in self._chunk_dataframe(df):
+            values = list(batch.itertuples(index=False, name=None))
+            if not values:
+                continue
+
+            execute_values_func(
+                cursor,
+                query,
+                values,
+                page_size=min(len(values), self.batch_size),
+            )
+            result_flags = cursor.fetchall()
+            inserted = sum(1 for (flag,) in result_flags if flag)
+            rows_inserted += inserted
+            rows_updated += len(result_flags) - inserted
+        return rows_inserted, rows_updated
+
+    def _copy_rows(
+        self,
+        cursor: Any,
+        df: pd.DataFrame,
+        table: str,
+        schema: str,
+        upsert_keys: Optional[List[str]],
+    ) -> Tuple[int, int]:
+        """
+        Load ``df`` with COPY FROM STDIN; returns (inserted, updated).
+
+        Plain inserts COPY straight into the target. Upserts COPY into a
+        temporary staging table (dropped at commit) and merge it with one
+        ``INSERT ... ON CONFLICT`` statement.
+        """
+        qualified_table = quote_qualified(schema, table)
+        columns = list(df.columns)
+        if not upsert_keys:
+            copied = copy_dataframe(
+                cursor, df, qualified_table, columns, chunk_rows=self.batch_size
+            )
+            return copied, 0
+
+        stage_table = new_stage_table_name()
+        cursor.execute(build_stage_table_sql(stage_table, qualified_table, columns))
+        copy_dataframe(
+            cursor, df, quote_ident(stage_table), columns, chunk_rows=self.batch_size
+        )
+        cursor.execute(
+            build_upsert_from_stage_sql(
+                qualified_table, stage_table, columns, list(upsert_keys)
+            )
+        )
+        inserted, updated = cursor.fetchone()
+        return int(inserted or 0), int(updated or 0)
+
     def load_with_refresh(
         self,
         df: pd.DataFrame,
         table: str,
         schema: str = "public",
         refresh_keys: Optional[List[str]] = None,
+        load_method: Optional[str] = None,
+        *,
+        refresh_strategy: Optional[str] = None,
+        partition_column: Optional[str] = None,
     ) -> LoadResult:
         """
         Load DataFrame using DELETE + INSERT pattern (Legacy-compatible refresh mode).
@@ -346,6 +464,17 @@ class WarehouseLoader:
                          matching unique combinations of these columns in the input
                          data will be deleted before inserting new records.
                          (Legacy equivalent: update_based_on_field)
+            load_method: "values" or "copy" for the insert step (defaults to
+                the loader's ``load_method``)
+            refresh_strategy: "delete" (default) removes the staged refresh-key
+                combinations with one ``DELETE ... USING``. "partition_swap"
+                replaces every month present in ``df`` as a whole: each month
+                is COPYed into a detached table and swapped in with
+                ``ATTACH PARTITION``. Only use it when each load carries
+                complete months; it falls back to "delete" when the table is
+                not range-partitioned by ``partition_column``.
+            partition_column: Month column for "partition_swap" (defaults to
+                the first refresh key)
 
         Returns:
             LoadResult with rows_inserted (new records) and rows_updated (deleted count)
@@ -387,13 +516,13 @@ class WarehouseLoader:
                 f"refresh_keys {missing_keys} not found in DataFrame columns"
             )
 
+        method = self._resolve_load_method(load_method)
+        strategy = self._resolve_refresh_strategy(refresh_strategy)
         projected_df = self.project_columns(df, table, schema)
         columns = list(projected_df.columns)
 
         # Extract unique combinations of refresh_keys from input data
-        unique_combinations = (
-            df[refresh_keys].drop_duplicates().to_dict(orient="records")
-        )
+        unique_combinations = df[refresh_keys].drop_duplicates()
 
         conn = self._get_connection_with_retry()
         start_time = time.perf_counter()
@@ -407,59 +536,58 @@ class WarehouseLoader:
             rows=len(projected_df.index),
             refresh_keys=refresh_keys,
             unique_combinations=len(unique_combinations),
+            load_method=method,
+            refresh_strategy=strategy,
             execution_id=execution_id,
         )
 
+        swap_plan = None
         try:
             with conn.cursor() as cursor:
-                # Step 1: DELETE existing records matching refresh_keys combinations
-                if unique_combinations:
-                    qualified_table = quote_qualified(schema, table)
-                    for combo in unique_combinations:
-                        conditions = []
-                        values = []
-                        for key in refresh_keys:
-                            val = combo[key]
-                            if val is None:
-                                conditions.append(f"{quote_ident(key)} IS NULL")
-                            else:
-                                conditions.append(f"{quote_ident(key)} = %s")
-                                values.append(val)
-
-                        delete_sql = (
-                            f"DELETE FROM {qualified_table} "
-                            f"WHERE {' AND '.join(conditions)}"
+                partition_column = partition_column or refresh_keys[0]
+                if strategy == REFRESH_STRATEGY_PARTITION_SWAP:
+                    swap_plan, skip_reason = plan_partition_swap(
+                        cursor, projected_df, table, schema, partition_column
+                    )
+                    if swap_plan is None:
+                        self._logger.warning(
+                            "database.refresh.partition_swap_skipped",
+                            table=table,
+                            schema=schema,
+                            partition_column=partition_column,
+                            reason=skip_reason,
                         )
-                        cursor.execute(delete_sql, values)
-                        rows_deleted += cursor.rowcount if cursor.rowcount > 0 else 0
 
-                # Step 2: INSERT all new records
-                insert_query = self._build_insert_query(
-                    columns, table, schema, upsert_keys=None
-                )
-
-                # Dynamic import for test compatibility
-                execute_values_func = self._get_dynamic_import(
-                    "execute_values",
-                    lambda: __import__(
-                        "psycopg2.extras", fromlist=["execute_values"]
-                    ).execute_values,
-                )
-
-                for batch in self._chunk_dataframe(projected_df):
-                    values = list(batch.itertuples(index=False, name=None))
-                    if not values:
-                        continue
-
-                    execute_values_func(
+                if swap_plan is not None:
+                    # Whole months: build detached tables and swap them in
+                    rows_deleted, rows_inserted = swap_month_partitions(
                         cursor,
-                        insert_query,
-                        values,
-                        page_size=min(len(values), self.batch_size),
+                        projected_df,
+                        table,
+                        schema,
+                        swap_plan,
+                        partition_column=partition_column,
+                        chunk_rows=self.batch_size,
                     )
-                    # For pure INSERT, all rows are inserted
-                    result_flags = cursor.fetchall()
-                    rows_inserted += len(result_flags)
+                else:
+                    # Step 1: DELETE existing records matching refresh_keys
+                    # combinations
+                    rows_deleted = self._delete_refresh_keys(
+                        cursor, unique_combinations, table, schema
+                    )
+
+                    # Step 2: INSERT all new records (pure INSERT: every row counts)
+                    if method == LOAD_METHOD_COPY:
+                        rows_inserted, _ = self._copy_rows(
+                            cursor, projected_df, table, schema, upsert_keys=None
+                        )
+                    else:
+                        insert_query = self._build_insert_query(
+                            columns, table, schema, upsert_keys=None
+                        )
+                        rows_inserted, _ = self._insert_values(
+                            cursor, projected_df, insert_query
+                        )
 
             conn.commit()
         except Exception as exc:
@@ -490,6 +618,7 @@ class WarehouseLoader:
             execution_id=execution_id,
             rows_deleted=rows_deleted,
             rows_inserted=rows_inserted,
+            partitions_swapped=len(swap_plan or []),
             duration_ms=duration_ms,
         )
         # Use rows_updated to report deleted count for consistency with LoadResult
@@ -501,3 +630,32 @@ class WarehouseLoader:
             duration_ms=duration_ms,
             execution_id=execution_id,
         )
+
+    def _delete_refresh_keys(
+        self, cursor: Any, key_frame: pd.DataFrame, table: str, schema: str
+    ) -> int:
+        """
+        Delete rows matching any refresh-key combination in one statement.
+
+        The combinations are COPYed into a temporary staging table and joined
+        with ``DELETE ... USING``; keys that hold NULLs in the input compare
+        with ``IS NOT DISTINCT FROM``.
+        """
+        if key_frame.empty:
+            return 0
+        qualified_table = quote_qualified(schema, table)
+        keys = list(key_frame.columns)
+        stage_table = new_stage_table_name()
+        cursor.execute(build_stage_table_sql(stage_table, qualified_table, keys))
+        copy_dataframe(
+            cursor,
+            key_frame,
+            quote_ident(stage_table),
+            keys,
+            chunk_rows=self.batch_size,
+        )
+        nullable_keys = [key for key in keys if key_frame[key].isna().any()]
+        cursor.execute(
+            build_delete_using_sql(qualified_table, stage_table, keys, nullable_keys)
+        )
+        return cursor.rowcount if cursor.rowcount > 0 else 0
@@ -1,5 +1,13 @@
 from typing import Any, Dict, List, Optional
 
+import pandas as pd
+
+from work_data_hub.io.loader.copy_builder import (
+    LOAD_METHOD_COPY,
+    LOAD_METHODS,
+    build_copy_sql,
+    copy_dataframe,
+)
 from work_data_hub.io.loader.insert_builder import (
     _adapt_param,
     _ensure_list_of_dicts,
@@ -319,6 +327,8 @@ def load(
     pk: Optional[List[str]] = None,
     chunk_size: int = 1000,
     conn: Any = None,
+    *,
+    load_method: str = "values",
 ) -> Dict[str, Any]:
     """
     Load data into PostgreSQL table with transactional safety.
@@ -330,6 +340,8 @@ def load(
         pk: Primary key columns (required for delete_insert)
         chunk_size: Rows per batch for chunking
         conn: psycopg2 connection object (None = return plan only)
+        load_method: "values" (chunked execute_values INSERTs) or "copy"
+            (one COPY FROM STDIN streamed in chunk_size row chunks)
 
     Returns:
         Dictionary with execution metadata:
@@ -352,6 +364,9 @@ def load(
     if mode == "delete_insert" and not pk:
         raise DataWarehouseLoaderError("Primary key required for delete_insert mode")
 
+    if load_method not in LOAD_METHODS:
+        raise DataWarehouseLoaderError(f"Invalid load_method: {load_method}")
+
     if not isinstance(rows, list):
         # Add check for rows type to be safe, though _ensure_list_of_dicts does it
         pass
@@ -430,14 +445,20 @@ def load(
     total_inserted = 0
     batches = 0
 
-    for i in range(0, len(rows), chunk_size):
-        chunk = rows[i : i + chunk_size]
-        insert_sql, insert_params = build_insert_sql(table, cols, chunk)
-
-        if insert_sql:
-            operations.append(("INSERT", insert_sql, insert_params))
-            total_inserted += len(chunk)
-            batches += 1
+    if load_method == LOAD_METHOD_COPY:
+        # Rows are streamed at execution time; the plan holds the statement only
+        operations.append(("COPY", build_copy_sql(quote_table(table), cols), []))
+        total_inserted = len(rows)
+        batches = 1
+    else:
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i : i + chunk_size]
+            insert_sql, insert_params = build_insert_sql(table, cols, chunk)
+
+            if insert_sql:
+                operations.append(("INSERT", insert_sql, insert_params))
+                total_inserted += len(chunk)
+                batches += 1
 
     result = {
         "mode": mode,
@@ -496,6 +517,15 @@ def load(
                         page_size=min(chunk_size, 1000),
                     )
                     logger.info(f"Inserted {len(row_data)} rows into {table}")
+                elif op_type == "COPY":
+                    copied = copy_dataframe(
+                        cursor,
+                        pd.DataFrame.from_records(rows, columns=cols),
+                        quote_table(table),
+                        cols,
+                        chunk_rows=chunk_size,
+                    )
+                    logger.info(f"Copied {copied} rows into {table}")
 
         # Commit if all operations succeed
         try:
@@ -0,0 +1,164 @@
+"""
+Month partition swap for ``WarehouseLoader.load_with_refresh``.
+
+Used by the "partition_swap" refresh strategy: every month present in the
+loaded frame is COPYed into a detached table and swapped in with
+``ATTACH PARTITION`` (SQL: ``refresh_builder``).
+"""
+
+import datetime as dt
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from work_data_hub.io.loader.copy_builder import copy_dataframe
+from work_data_hub.io.loader.refresh_builder import (
+    IDENTITY_COLUMNS_SQL,
+    PARTITION_KEY_SQL,
+    PARTITIONS_SQL,
+    build_default_partition_delete_sql,
+    build_identity_default_sql,
+    build_swap_partition_sql,
+    build_swap_table_sql,
+    month_bounds,
+    month_partition_name,
+    new_swap_table_name,
+    parse_range_bounds,
+)
+from work_data_hub.io.loader.sql_utils import quote_qualified
+
+# (month_bounds, existing_partition, default_partition, month_rows)
+SwapMonth = Tuple[Tuple[dt.date, dt.date], Optional[str], Optional[str], pd.DataFrame]
+
+
+def plan_partition_swap(
+    cursor: Any,
+    df: pd.DataFrame,
+    table: str,
+    schema: str,
+    partition_column: str,
+) -> Tuple[Optional[List[SwapMonth]], Optional[str]]:
+    """
+    Split ``df`` by month for a partition swap.
+
+    Returns ``(plan, None)`` with ``plan`` as ``[(month_bounds,
+    existing_partition, default_partition, month_rows), ...]``, or
+    ``(None, reason)`` when the table cannot be swapped by month, in which
+    case the caller falls back to the DELETE strategy. ``default_partition``
+    is set for months that do not have their own partition yet and may still
+    have rows in the DEFAULT partition.
+    """
+    qualified_table = quote_qualified(schema, table)
+    cursor.execute(PARTITION_KEY_SQL, (qualified_table,))
+    partition_keys = [row[0] for row in cursor.fetchall()]
+
+    if partition_keys != [partition_column]:
+        return None, "not_range_partitioned_by_column"
+    if partition_column not in df.columns or df[partition_column].isna().any():
+        return None, "missing_partition_values"
+
+    cursor.execute(PARTITIONS_SQL, (qualified_table,))
+    existing: Dict[Tuple[str, str], str] = {}
+    default_partition: Optional[str] = None
+    for name, bound_expr in cursor.fetchall():
+        range_bounds = parse_range_bounds(bound_expr)
+        if range_bounds is not None:
+            existing[range_bounds] = name
+        elif (bound_expr or "").strip() == "DEFAULT":
+            default_partition = name
+
+    months = pd.to_datetime(df[partition_column]).dt.to_period("M")
+    plan: List[SwapMonth] = []
+    for period, month_rows in df.groupby(months, sort=True):
+        bounds = month_bounds(period.start_time)
+        lower, upper = bounds[0].isoformat(), bounds[1].isoformat()
+        if any(
+            lo < upper and hi > lower and (lo, hi) != (lower, upper)
+            for lo, hi in existing
+        ):
+            return None, "partition_bounds_not_monthly"
+        old_partition = existing.get((lower, upper))
+        plan.append(
+            (
+                bounds,
+                old_partition,
+                None if old_partition else default_partition,
+                month_rows,
+            )
+        )
+    return plan, None
+
+
+def swap_month_partitions(
+    cursor: Any,
+    df: pd.DataFrame,
+    table: str,
+    schema: str,
+    plan: List[SwapMonth],
+    *,
+    partition_column: str,
+    chunk_rows: int,
+) -> Tuple[int, int]:
+    """
+    COPY each month into a detached table and swap it in.
+
+    Returns (rows_deleted, rows_inserted) where rows_deleted counts the
+    rows of the dropped month partitions and of the month's rows cleared
+    from the DEFAULT partition.
+    """
+    qualified_table = quote_qualified(schema, table)
+    columns = list(df.columns)
+    cursor.execute(IDENTITY_COLUMNS_SQL, (qualified_table,))
+    identity_columns = [row[0] for row in cursor.fetchall() if row[0] not in columns]
+
+    rows_deleted = 0
+    rows_inserted = 0
+    for bounds, old_partition, default_partition, month_rows in plan:
+        swap_table = new_swap_table_name()
+        cursor.execute(build_swap_table_sql(schema, swap_table, qualified_table))
+        for column in identity_columns:
+            cursor.execute(
+                build_identity_default_sql(
+                    schema, swap_table, qualified_table, column, drop=False
+                )
+            )
+        rows_inserted += copy_dataframe(
+            cursor,
+            month_rows,
+            quote_qualified(schema, swap_table),
+            columns,
+            chunk_rows=chunk_rows,
+        )
+        for column in identity_columns:
+            cursor.execute(
+                build_identity_default_sql(
+                    schema, swap_table, qualified_table, column, drop=True
+                )
+            )
+
+        if old_partition:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {quote_qualified(schema, old_partition)}"
+            )
+            rows_deleted += cursor.fetchone()[0]
+        if default_partition:
+            cursor.execute(
+                build_default_partition_delete_sql(
+                    schema, default_partition, partition_column, bounds
+                )
+            )
+            rows_deleted += cursor.rowcount if cursor.rowcount > 0 else 0
+        partition_name = old_partition or month_partition_name(table, bounds[0])
+        for statement in build_swap_partition_sql(
+            schema,
+            qualified_table,
+            swap_table,
+            partition_name,
+            bounds,
+            old_partition=old_partition,
+        ):
+            cursor.execute(statement)
+    return rows_deleted, rows_inserted
+
+
+__all__ = ["SwapMonth", "plan_partition_swap", "swap_month_partitions"]
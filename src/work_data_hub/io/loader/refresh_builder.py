@@ -0,0 +1,209 @@
+"""
+SQL builders for ``WarehouseLoader.load_with_refresh``.
+
+Refresh strategies:
+    delete: stage the distinct refresh-key combinations in a temp table and
+        remove matching rows with one ``DELETE ... USING`` join (default)
+    partition_swap: for tables range-partitioned by month, build each
+        refreshed month in a detached table and swap it in with
+        ``ATTACH PARTITION``; the old month partition is dropped, so no
+        dead tuples are left behind (partition DDL: ``ddl_generator``)
+"""
+
+import datetime as dt
+import re
+import uuid
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from work_data_hub.infrastructure.schema.ddl_generator import month_partition_name
+from work_data_hub.io.loader.sql_utils import quote_ident, quote_qualified
+
+REFRESH_STRATEGY_DELETE = "delete"
+REFRESH_STRATEGY_PARTITION_SWAP = "partition_swap"
+REFRESH_STRATEGIES = (REFRESH_STRATEGY_DELETE, REFRESH_STRATEGY_PARTITION_SWAP)
+
+# Columns a range-partitioned table is partitioned by (empty if not partitioned)
+PARTITION_KEY_SQL = """
+    SELECT a.attname
+    FROM pg_partitioned_table p
+    JOIN pg_attribute a
+      ON a.attrelid = p.partrelid AND a.attnum = ANY (p.partattrs::int2[])
+    WHERE p.partrelid = to_regclass(%s) AND p.partstrat = 'r'
+"""
+
+# Partitions of a table with their bound expressions
+PARTITIONS_SQL = """
+    SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = to_regclass(%s)
+"""
+
+# Identity columns the swap table must fill from the parent's sequence
+IDENTITY_COLUMNS_SQL = """
+    SELECT attname
+    FROM pg_attribute
+    WHERE attrelid = to_regclass(%s) AND attidentity <> '' AND NOT attisdropped
+"""
+
+_RANGE_BOUND = re.compile(r"FOR VALUES FROM \('([^']*)'\) TO \('([^']*)'\)")
+
+
+def build_delete_using_sql(
+    qualified_table: str,
+    stage_table: str,
+    refresh_keys: Sequence[str],
+    nullable_keys: Iterable[str] = (),
+) -> str:
+    """
+    Build a set-based DELETE of every row matching a staged key combination.
+
+    Keys listed in ``nullable_keys`` are compared with ``IS NOT DISTINCT
+    FROM`` so that NULL matches NULL. The other keys use ``=``, which keeps
+    hash joins and indexes available to the planner.
+
+    Example:
+        >>> build_delete_using_sql('"s"."t"', "k", ["月度"])
+        'DELETE FROM "s"."t" AS t USING "k" AS k WHERE t."月度" = k."月度"'
+    """
+    nullable = set(nullable_keys)
+    conditions = []
+    for key in refresh_keys:
+        operator = "IS NOT DISTINCT FROM" if key in nullable else "="
+        conditions.append(f"t.{quote_ident(key)} {operator} k.{quote_ident(key)}")
+    return (
+        f"DELETE FROM {qualified_table} AS t USING {quote_ident(stage_table)} AS k "
+        f"WHERE {' AND '.join(conditions)}"
+    )
+
+
+def month_bounds(value: Any) -> Tuple[dt.date, dt.date]:
+    """Return ``[first day, first day of next month)`` for a date-like value."""
+    start = pd.Timestamp(value).date().replace(day=1)
+    next_start = (start.replace(day=28) + dt.timedelta(days=4)).replace(day=1)
+    return start, next_start
+
+
+def parse_range_bounds(bound_expr: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Extract ``(from, to)`` from a single-column range partition bound.
+
+    Returns None for DEFAULT partitions and multi-column bounds.
+    """
+    match = _RANGE_BOUND.fullmatch((bound_expr or "").strip())
+    return (match.group(1), match.group(2)) if match else None
+
+
+def new_swap_table_name() -> str:
+    """Unique name for the table a month is built in before it is attached."""
+    return f"_wdh_swap_{uuid.uuid4().hex[:16]}"
+
+
+def build_swap_table_sql(schema: str, swap_table: str, qualified_table: str) -> str:
+    """
+    Build ``CREATE TABLE`` for a detached month table shaped like the parent.
+
+    Indexes are not copied: ``ATTACH PARTITION`` creates the parent's
+    partitioned indexes on the new table after it is loaded.
+    """
+    return (
+        f"CREATE TABLE {quote_qualified(schema, swap_table)} (LIKE {qualified_table} "
+        f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)"
+    )
+
+
+def build_identity_default_sql(
+    schema: str, swap_table: str, qualified_table: str, column: str, *, drop: bool
+) -> str:
+    """
+    Set (or drop) a default drawing ``column`` from the parent's identity.
+
+    Rows copied into the swap table get ids from the same sequence as rows
+    inserted through the parent; the default is dropped again before attach.
+    """
+    target = f"ALTER TABLE {quote_qualified(schema, swap_table)} ALTER COLUMN "
+    if drop:
+        return f"{target}{quote_ident(column)} DROP DEFAULT"
+    sequence = f"pg_get_serial_sequence('{_sql_literal(qualified_table)}', "
+    sequence += f"'{_sql_literal(column)}')"
+    return f"{target}{quote_ident(column)} SET DEFAULT nextval({sequence})"
+
+
+def build_default_partition_delete_sql(
+    schema: str,
+    default_partition: str,
+    partition_column: str,
+    bounds: Tuple[dt.date, dt.date],
+) -> str:
+    """
+    Build the DELETE clearing one month out of the DEFAULT partition.
+
+    Rows of a month without its own partition live in the DEFAULT partition;
+    they must go before the month is attached, or ``ATTACH PARTITION``
+    rejects the overlap.
+    """
+    column = quote_ident(partition_column)
+    return (
+        f"DELETE FROM {quote_qualified(schema, default_partition)} "
+        f"WHERE {column} >= '{bounds[0].isoformat()}' "
+        f"AND {column} < '{bounds[1].isoformat()}'"
+    )
+
+
+def build_swap_partition_sql(
+    schema: str,
+    qualified_table: str,
+    swap_table: str,
+    partition_name: str,
+    bounds: Tuple[dt.date, dt.date],
+    *,
+    old_partition: Optional[str] = None,
+) -> List[str]:
+    """
+    Build the statements that replace one month partition with the swap table.
+
+    Run inside the load transaction, so readers see either the old month
+    or the new one, never a partially loaded month.
+    """
+    statements = []
+    if old_partition:
+        old_qualified = quote_qualified(schema, old_partition)
+        statements.append(
+            f"ALTER TABLE {qualified_table} DETACH PARTITION {old_qualified}"
+        )
+        statements.append(f"DROP TABLE {old_qualified}")
+    statements.append(
+        f"ALTER TABLE {quote_qualified(schema, swap_table)} "
+        f"RENAME TO {quote_ident(partition_name)}"
+    )
+    statements.append(
+        f"ALTER TABLE {qualified_table} ATTACH PARTITION "
+        f"{quote_qualified(schema, partition_name)} "
+        f"FOR VALUES FROM ('{bounds[0].isoformat()}') TO ('{bounds[1].isoformat()}')"
+    )
+    return statements
+
+
+def _sql_literal(value: str) -> str:
+    return value.replace("'", "''")
+
+
+__all__ = [
+    "IDENTITY_COLUMNS_SQL",
+    "PARTITIONS_SQL",
+    "PARTITION_KEY_SQL",
+    "REFRESH_STRATEGIES",
+    "REFRESH_STRATEGY_DELETE",
+    "REFRESH_STRATEGY_PARTITION_SWAP",
+    "build_default_partition_delete_sql",
+    "build_delete_using_sql",
+    "build_identity_default_sql",
+    "build_swap_partition_sql",
+    "build_swap_table_sql",
+    "month_bounds",
+    "month_partition_name",
+    "new_swap_table_name",
+    "parse_range_bounds",
+]
@@ -0,0 +1,296 @@
+"""Pluggable workbook engines for ExcelReader.
+
+Every engine opens a workbook exactly once and serves both the sheet listing
+and the sheet parse from that single handle. Raw cell values are turned into a
+DataFrame through pandas' own ``TextParser`` so header handling, duplicate
+column mangling, NA detection and dtype inference match ``pd.read_excel``.
+
+Available engines:
+    - ``openpyxl``: streams ``values_only`` rows from a read-only workbook
+      (always available, default fallback)
+    - ``calamine``: Rust-based parser via the optional ``python-calamine``
+      package; considerably faster on large ``.xlsx`` files
+    - ``pandas``: legacy ``pd.ExcelFile`` parse, kept for parity checks
+    - ``auto``: ``calamine`` when installed, otherwise ``openpyxl``
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+import numpy as np
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser  # type: ignore[attr-defined]
+
+EXCEL_ENGINE_AUTO = "auto"
+
+
+def _trim_sheet_data(rows: List[List[Any]]) -> List[List[Any]]:
+    """Drop trailing empty cells/rows and pad ragged rows (pandas semantics)."""
+    last_row_with_data = -1
+    for row_number, row in enumerate(rows):
+        while row and row[-1] == "":
+            row.pop()
+        if row:
+            last_row_with_data = row_number
+
+    data = rows[: last_row_with_data + 1]
+    if data:
+        max_width = max(len(row) for row in data)
+        if min(len(row) for row in data) < max_width:
+            data = [row + [""] * (max_width - len(row)) for row in data]
+    return data
+
+
+def rows_to_frame(
+    data: List[List[Any]],
+    na_values: Optional[Sequence[str]] = None,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from raw sheet rows using the first row as header.
+
+    Mirrors the parsing stage of ``pd.read_excel(header=0)`` so that every
+    engine yields the same frame for the same workbook.
+    """
+    if not data:
+        return pd.DataFrame()
+
+    try:
+        parser = TextParser(
+            data,
+            header=0,
+            na_values=list(na_values) if na_values is not None else None,
+            nrows=nrows,
+            skip_blank_lines=False,
+        )
+        frame: pd.DataFrame = parser.read(nrows=nrows)
+    except EmptyDataError:
+        return pd.DataFrame()
+    return frame
+
+
+class ExcelWorkbook(ABC):
+    """An opened workbook; use as a context manager to release the handle."""
+
+    engine_name: str = ""
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+
+    @property
+    @abstractmethod
+    def sheet_names(self) -> List[str]:
+        """Return worksheet names in workbook order."""
+
+    @abstractmethod
+    def read_frame(
+        self,
+        sheet_name: str,
+        na_values: Optional[Sequence[str]] = None,
+        nrows: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Parse one worksheet (header on the first row) into a DataFrame."""
+
+    def close(self) -> None:
+        """Release the underlying workbook handle."""
+
+    def __enter__(self) -> "ExcelWorkbook":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class OpenpyxlStreamingWorkbook(ExcelWorkbook):
+    """Read-only openpyxl workbook streaming plain cell values."""
+
+    engine_name = "openpyxl"
+
+    def __init__(self, file_path: Path):
+        super().__init__(file_path)
+        from openpyxl import load_workbook
+        from openpyxl.cell.cell import ERROR_CODES
+
+        self._error_codes = frozenset(ERROR_CODES)
+        self._book = load_workbook(
+            self.file_path, read_only=True, data_only=True, keep_links=False
+        )
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return [sheet.title for sheet in self._book.worksheets]
+
+    def _convert(self, value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            if value.is_integer():
+                return int(value)
+            return value
+        if isinstance(value, str) and value in self._error_codes:
+            return np.nan
+        return value
+
+    def read_frame(
+        self,
+        sheet_name: str,
+        na_values: Optional[Sequence[str]] = None,
+        nrows: Optional[int] = None,
+    ) -> pd.DataFrame:
+        sheet = self._book[sheet_name]
+        # Read-only sheets may carry stale <dimension> tags from the writer
+        sheet.reset_dimensions()
+
+        rows_needed = None if nrows is None else nrows + 1
+        convert = self._convert
+        data: List[List[Any]] = []
+        for row in sheet.iter_rows(values_only=True):
+            data.append([convert(value) for value in row])
+            if rows_needed is not None and len(data) >= rows_needed:
+                break
+
+        return rows_to_frame(_trim_sheet_data(data), na_values, nrows)
+
+    def close(self) -> None:
+        self._book.close()
+
+
+class CalamineWorkbook(ExcelWorkbook):
+    """Workbook backed by the optional ``python-calamine`` package."""
+
+    engine_name = "calamine"
+
+    def __init__(self, file_path: Path):
+        super().__init__(file_path)
+        from python_calamine import CalamineWorkbook as _Workbook
+
+        self._book = _Workbook.from_path(str(self.file_path))
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._book.sheet_names)
+
+    @staticmethod
+    def _convert(value: Any) -> Any:
+        if isinstance(value, float):
+            if value.is_integer():
+                return int(value)
+            return value
+        if isinstance(value, (datetime, date)):
+            return pd.Timestamp(value)
+        if isinstance(value, timedelta):
+            return pd.Timedelta(value)
+        if isinstance(value, time):
+            return value
+        return value
+
+    def read_frame(
+        self,
+        sheet_name: str,
+        na_values: Optional[Sequence[str]] = None,
+        nrows: Optional[int] = None,
+    ) -> pd.DataFrame:
+        sheet = self._book.get_sheet_by_name(sheet_name)
+        rows_needed = None if nrows is None else nrows + 1
+        raw_rows = sheet.to_python(skip_empty_area=False, nrows=rows_needed)
+        convert = self._convert
+        data = [[convert(value) for value in row] for row in raw_rows]
+        return rows_to_frame(_trim_sheet_data(data), na_values, nrows)
+
+    def close(self) -> None:
+        close = getattr(self._book, "close", None)
+        if callable(close):
+            close()
+
+
+class PandasWorkbook(ExcelWorkbook):
+    """Legacy ``pd.ExcelFile`` parse (openpyxl cell objects)."""
+
+    engine_name = "pandas"
+
+    def __init__(self, file_path: Path):
+        super().__init__(file_path)
+        self._excel_file = pd.ExcelFile(self.file_path, engine="openpyxl")
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return [str(name) for name in self._excel_file.sheet_names]
+
+    def read_frame(
+        self,
+        sheet_name: str,
+        na_values: Optional[Sequence[str]] = None,
+        nrows: Optional[int] = None,
+    ) -> pd.DataFrame:
+        return self._excel_file.parse(
+            sheet_name, na_values=list(na_values or ()), nrows=nrows
+        )
+
+    def close(self) -> None:
+        self._excel_file.close()
+
+
+EXCEL_ENGINES: Dict[str, Type[ExcelWorkbook]] = {
+    OpenpyxlStreamingWorkbook.engine_name: OpenpyxlStreamingWorkbook,
+    CalamineWorkbook.engine_name: CalamineWorkbook,
+    PandasWorkbook.engine_name: PandasWorkbook,
+}
+
+
+def calamine_available() -> bool:
+    """Return True when the optional python-calamine package is importable."""
+    return importlib.util.find_spec("python_calamine") is not None
+
+
+def resolve_engine(engine: Optional[str] = None) -> str:
+    """
+    Resolve an engine name, expanding ``auto``/``None`` to the fastest one.
+
+    Raises:
+        ValueError: If the engine is unknown or its dependency is missing
+    """
+    name = (engine or EXCEL_ENGINE_AUTO).lower()
+    if name == EXCEL_ENGINE_AUTO:
+        return "calamine" if calamine_available() else "openpyxl"
+    if name not in EXCEL_ENGINES:
+        raise ValueError(
+            f"Unknown Excel engine '{engine}', "
+            f"expected one of: {[EXCEL_ENGINE_AUTO, *EXCEL_ENGINES]}"
+        )
+    if name == "calamine" and not calamine_available():
+        raise ValueError("Excel engine 'calamine' requires the python-calamine package")
+    return name
+
+
+def open_workbook(file_path: Path, engine: Optional[str] = None) -> ExcelWorkbook:
+    """
+    Open a workbook once with the requested (or auto-selected) engine.
+
+    Raises:
+        FileNotFoundError: If the file does not exist (raised uniformly,
+            native engines report missing files with their own error types)
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Excel file not found: {path}")
+    return EXCEL_ENGINES[resolve_engine(engine)](path)
+
+
+__all__ = [
+    "EXCEL_ENGINES",
+    "EXCEL_ENGINE_AUTO",
+    "CalamineWorkbook",
+    "ExcelWorkbook",
+    "OpenpyxlStreamingWorkbook",
+    "PandasWorkbook",
+    "calamine_available",
+    "open_workbook",
+    "resolve_engine",
+    "rows_to_frame",
+]
@@ -14,11 +14,20 @@ import zipfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 
 from work_data_hub.io.connectors.exceptions import DiscoveryError
+from work_data_hub.io.readers.excel_engines import (
+    EXCEL_ENGINE_AUTO,
+    open_workbook,
+    resolve_engine,
+)
+from work_data_hub.io.readers.read_cache import (
+    ParsedSheetCache,
+    get_default_read_cache,
+)
 from work_data_hub.utils.column_normalizer import (
     normalize_column_names,
     normalize_columns,
@@ -28,6 +37,9 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 logger.propagate = True
 
+# Cell values treated as missing in addition to pandas' defaults
+NA_VALUES = ["", " ", "N/A", "NA"]
+
 
 @dataclass
 class ExcelReadResult:
@@ -41,9 +53,23 @@ class ExcelReadResult:
     normalization_duration_ms: Optional[int]  # Time spent normalizing column headers
     duration_breakdown: Optional[
         Dict[str, int]
-    ]  # Detailed timing (read_ms, normalization_ms)
+    ]  # Detailed timing (read_ms total, open_ms, parse_ms, cleanup_ms, ...)
     file_path: Path  # Source file path
     read_at: datetime  # Timestamp of read operation
+    engine: str = "openpyxl"  # Workbook engine that parsed the sheet
+    from_cache: bool = False  # True when the parsed sheet came from the read cache
+
+
+@dataclass
+class SheetReadStats:
+    """Per-sheet outcome of a multi-sheet read."""
+
+    file_path: str
+    sheet: Union[str, int]  # Sheet as requested (name or index)
+    row_count: int = 0
+    duration_ms: int = 0  # Cache lookup or parse time for this sheet
+    from_cache: bool = False
+    error: Optional[str] = None  # Set when the sheet could not be read
 
 
 class ExcelReadError(Exception):
@@ -59,16 +85,36 @@ class ExcelReader:
     This class wraps pandas Excel reading functionality with additional
     error handling, validation, and standardization features needed for
     reliable data processing pipelines.
+
+    ``read_sheet`` and ``get_sheet_names`` go through a pluggable workbook
+    engine (see ``excel_engines``) that opens each file exactly once.
+
+    When a ``read_cache`` is given, parsed sheets are looked up by workbook
+    content hash before any parsing and stored after a miss (see
+    ``read_cache``).
     """
 
-    def __init__(self, max_rows: Optional[int] = None):
+    def __init__(
+        self,
+        max_rows: Optional[int] = None,
+        engine: Optional[str] = None,
+        read_cache: Optional[ParsedSheetCache] = None,
+    ):
         """
         Initialize Excel reader.
 
         Args:
             max_rows: Maximum number of rows to read (None = no limit)
+            engine: Workbook engine name ("auto", "openpyxl", "calamine",
+                "pandas"); None/"auto" picks calamine when installed
+            read_cache: Parsed-sheet cache to consult (None = always parse)
+
+        Raises:
+            ValueError: If the engine is unknown or its dependency is missing
         """
         self.max_rows = max_rows
+        self.engine = resolve_engine(engine or EXCEL_ENGINE_AUTO)
+        self.read_cache = read_cache
 
     def read_rows(
         self,
@@ -123,8 +169,22 @@ class ExcelReader:
             if self.max_rows is not None:
                 read_kwargs["nrows"] = self.max_rows
 
-            # Read Excel file
-            df = pd.read_excel(file_path, **read_kwargs)
+            cache_options = {
+                "reader": "read_rows",
+                "sheet": sheet,
+                "header": header,
+                "skip_rows": skip_rows,
+                "nrows": self.max_rows,
+            }
+            df = None
+            if self.read_cache is not None:
+                df = self.read_cache.get(file_path_obj, cache_options)
+
+            if df is None:
+                # Read Excel file
+                df = pd.read_excel(file_path, **read_kwargs)
+                if self.read_cache is not None:
+                    self.read_cache.put(file_path_obj, cache_options, df)
 
             logger.info(f"Successfully read {len(df)} rows from {file_path}")
 
@@ -169,6 +229,75 @@ class ExcelReader:
                 f"Unexpected error reading Excel file {file_path}: {e}"
             )
 
+    def read_sheet_frames(
+        self, file_path: str, sheets: Sequence[Union[str, int]]
+    ) -> List[Tuple[SheetReadStats, Optional[pd.DataFrame]]]:
+        """
+        Parse several sheets of one workbook through a single workbook handle.
+
+        Frames match ``read_rows`` (header on the first row, pandas default NA
+        markers). Read-cache entries are keyed by engine, since engines may
+        parse the same cells differently. The workbook is only opened when at
+        least one sheet misses the cache. Failures are reported per sheet
+        instead of raised.
+
+        Args:
+            file_path: Path to the Excel file
+            sheets: Sheet names or 0-based indexes, in the order to return
+
+        Returns:
+            One ``(stats, frame)`` pair per requested sheet; ``frame`` is None
+            when ``stats.error`` is set
+        """
+        file_path_obj = Path(file_path)
+        results: List[Tuple[SheetReadStats, Optional[pd.DataFrame]]] = []
+        workbook = None
+        try:
+            for sheet in sheets:
+                stats = SheetReadStats(file_path=str(file_path), sheet=sheet)
+                sheet_start = time.perf_counter()
+                df: Optional[pd.DataFrame] = None
+                try:
+                    cache_options = {
+                        "reader": "read_sheet_frames",
+                        "engine": self.engine,
+                        "sheet": sheet,
+                        "nrows": self.max_rows,
+                    }
+                    if self.read_cache is not None:
+                        df = self.read_cache.get(file_path_obj, cache_options)
+                    stats.from_cache = df is not None
+
+                    if df is None:
+                        if workbook is None:
+                            workbook = open_workbook(file_path_obj, self.engine)
+                        sheet_names = workbook.sheet_names
+                        if isinstance(sheet, int):
+                            if not 0 <= sheet < len(sheet_names):
+                                raise ExcelReadError(
+                                    f"Sheet '{sheet}' not found in {file_path}"
+                                )
+                            actual_sheet_name = sheet_names[sheet]
+                        elif sheet in sheet_names:
+                            actual_sheet_name = sheet
+                        else:
+                            raise ExcelReadError(
+                                f"Sheet '{sheet}' not found in {file_path}"
+                            )
+                        df = workbook.read_frame(actual_sheet_name, nrows=self.max_rows)
+                        if self.read_cache is not None:
+                            self.read_cache.put(file_path_obj, cache_options, df)
+                    stats.row_count = len(df)
+                except Exception as e:
+                    stats.error = str(e)
+                    df = None
+                stats.duration_ms = int((time.perf_counter() - sheet_start) * 1000)
+                results.append((stats, df))
+        finally:
+            if workbook is not None:
+                workbook.close()
+        return results
+
     def get_sheet_names(self, file_path: str) -> List[Union[str, int]]:
         """
         Get list of sheet names from Excel file.
@@ -189,8 +318,8 @@ class ExcelReader:
             raise FileNotFoundError(f"Excel file not found: {file_path}")
 
         try:
-            excel_file = pd.ExcelFile(file_path, engine="openpyxl")
-            return excel_file.sheet_names
+            with open_workbook(file_path_obj, self.engine) as workbook:
+                return list(workbook.sheet_names)
         except Exception as e:
             raise ExcelReadError(f"Cannot read sheet names from {file_path}: {e}")
 
@@ -207,7 +336,7 @@ class ExcelReader:
         """
         try:
             # Try to read just the header to validate
-            reader = ExcelReader(max_rows=1)
+            reader = ExcelReader(max_rows=1, engine=self.engine)
             reader.read_rows(file_path, sheet=sheet)
             return True
         except (ExcelReadError, FileNotFoundError):
@@ -314,26 +443,48 @@ class ExcelReader:
         )
 
         start_time = datetime.now()
+        available_sheets: List[str] = []
 
         try:
-            # Get available sheets for error messages
-            excel_file = pd.ExcelFile(file_path, engine="openpyxl")
-            available_sheets = excel_file.sheet_names
+            df: Optional[pd.DataFrame] = None
+            open_ms = 0
+            phase_start = time.perf_counter()
+            if self.read_cache is not None:
+                available_sheets = self.read_cache.get_sheet_names(file_path) or []
+                if available_sheets:
+                    actual_sheet_name = self._resolve_sheet_name(
+                        sheet_name, available_sheets, file_path
+                    )
+                    df = self.read_cache.get(
+                        file_path, self._sheet_cache_options(actual_sheet_name)
+                    )
+            from_cache = df is not None
+            parse_ms = int((time.perf_counter() - phase_start) * 1000)
+
+            if df is None:
+                # Single open: sheet listing and parse share one workbook handle
+                phase_start = time.perf_counter()
+                with open_workbook(file_path, self.engine) as workbook:
+                    open_ms = int((time.perf_counter() - phase_start) * 1000)
+                    available_sheets = workbook.sheet_names
+
+                    # Resolve sheet name if index provided
+                    actual_sheet_name = self._resolve_sheet_name(
+                        sheet_name, available_sheets, file_path
+                    )
 
-            # Resolve sheet name if index provided
-            actual_sheet_name = self._resolve_sheet_name(
-                sheet_name, available_sheets, file_path
-            )
+                    phase_start = time.perf_counter()
+                    df = workbook.read_frame(actual_sheet_name, na_values=NA_VALUES)
+                    parse_ms = int((time.perf_counter() - phase_start) * 1000)
 
-            # Read sheet
-            df = pd.read_excel(
-                file_path,
-                sheet_name=actual_sheet_name,
-                engine="openpyxl",
-                na_values=["", " ", "N/A", "NA"],
-            )
+                if self.read_cache is not None:
+                    self.read_cache.put_sheet_names(file_path, available_sheets)
+                    self.read_cache.put(
+                        file_path, self._sheet_cache_options(actual_sheet_name), df
+                    )
 
             # Handle empty rows
+            phase_start = time.perf_counter()
             empty_count = 0
             if skip_empty_rows:
                 original_count = len(df)
@@ -365,6 +516,7 @@ class ExcelReader:
 
             # Forward-fill merged cells so merged ranges share the first value
             df = df.ffill()
+            cleanup_ms = int((time.perf_counter() - phase_start) * 1000)
 
             # Apply column normalization if enabled
             columns_renamed: Dict[str, str] = {}
@@ -391,7 +543,12 @@ class ExcelReader:
                 df.columns = raw_columns
 
             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-            duration_breakdown: Dict[str, int] = {"read_ms": duration_ms}
+            duration_breakdown: Dict[str, int] = {
+                "read_ms": duration_ms,
+                "open_ms": open_ms,
+                "parse_ms": parse_ms,
+                "cleanup_ms": cleanup_ms,
+            }
             if normalization_duration_ms is not None:
                 duration_breakdown["normalization_ms"] = normalization_duration_ms
 
@@ -405,12 +562,14 @@ class ExcelReader:
                 duration_breakdown=duration_breakdown,
                 file_path=file_path,
                 read_at=start_time,
+                engine=self.engine,
+                from_cache=from_cache,
             )
 
             logger.info(
                 "excel_reading.completed file_path=%s sheet_name=%s row_count=%s "
                 "column_count=%s duration_ms=%s empty_rows_skipped=%s "
-                "normalization_ms=%s",
+                "normalization_ms=%s engine=%s open_ms=%s parse_ms=%s from_cache=%s",
                 file_path,
                 actual_sheet_name,
                 result.row_count,
@@ -418,6 +577,10 @@ class ExcelReader:
                 duration_ms,
                 empty_count,
                 normalization_duration_ms,
+                self.engine,
+                open_ms,
+                parse_ms,
+                from_cache,
             )
 
             return result
@@ -451,6 +614,15 @@ class ExcelReader:
                 message=f"Failed to read Excel file {file_path}: {str(e)}",
             )
 
+    def _sheet_cache_options(self, sheet_name: str) -> Dict[str, Any]:
+        """Read options that determine the parsed frame of ``read_sheet``."""
+        return {
+            "reader": "read_sheet",
+            "engine": self.engine,
+            "sheet": sheet_name,
+            "na_values": NA_VALUES,
+        }
+
     def _resolve_sheet_name(
         self,
         sheet_name: Union[str, int],
@@ -487,7 +659,10 @@ class ExcelReader:
 
 
 def read_excel_rows(
-    file_path: str, sheet: Union[str, int] = 0, max_rows: Optional[int] = None
+    file_path: str,
+    sheet: Union[str, int] = 0,
+    max_rows: Optional[int] = None,
+    use_read_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     Convenience function for reading Excel rows with default settings.
@@ -499,6 +674,8 @@ def read_excel_rows(
         file_path: Path to the Excel file
         sheet: Sheet name or index to read
         max_rows: Maximum number of rows to read (None = no limit)
+        use_read_cache: Consult the parsed-sheet cache configured in settings
+            (``WDH_READ_CACHE_ENABLED``); False always parses the workbook
 
     Returns:
         List of dictionaries representing Excel rows
@@ -507,5 +684,6 @@ def read_excel_rows(
         ExcelReadError: If file cannot be read
         FileNotFoundError: If file does not exist
     """
-    reader = ExcelReader(max_rows=max_rows)
+    read_cache = get_default_read_cache() if use_read_cache else None
+    reader = ExcelReader(max_rows=max_rows, read_cache=read_cache)
     return reader.read_rows(file_path, sheet=sheet)
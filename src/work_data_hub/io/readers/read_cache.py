@@ -0,0 +1,372 @@
+"""On-disk cache of parsed worksheets keyed by workbook content.
+
+Parsing a large ``.xlsx`` dominates repeated ETL runs over the same monthly
+files (re-runs, ``--sample`` validation passes, failed-load retries). This
+module stores the parsed DataFrame of a sheet as an Arrow IPC file so that a
+later read of the same workbook skips the Excel parse entirely.
+
+Cache layout (one flat directory):
+    - ``<fingerprint>.fp``: content digest for a (path, size, mtime) triple,
+      so unchanged files are not re-hashed on every read
+    - ``<digest>.sheets.json``: worksheet names of a workbook
+    - ``<entry>.arrow``: one parsed sheet for one set of read options
+
+Entries are keyed by the SHA-256 of the file content, so renamed or copied
+files still hit and any edit to the file misses. The directory is bounded by
+``max_bytes`` with least-recently-used eviction (file mtime is bumped on hit).
+
+Frames are encoded with ``io.arrow_codec`` so that mixed object cells
+(``202411`` next to ``"202411"``), ``NaN`` vs ``None`` and datetimes survive
+the round trip unchanged. Frames the codec cannot represent are simply not
+cached. Cache failures never fail a read; they are logged and bypassed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from work_data_hub.io.arrow_codec import (
+    UnsupportedFrameError,
+    frame_to_table,
+    table_to_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or codec changes to orphan old entries
+CACHE_FORMAT_VERSION = 2
+
+ENTRY_SUFFIX = ".arrow"
+SHEETS_SUFFIX = ".sheets.json"
+FINGERPRINT_SUFFIX = ".fp"
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ReadCacheStats:
+    """Counters for one cache instance (process-local)."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    skipped: int = 0  # Frames not cacheable (unsupported column types)
+    evictions: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+# --- Cache -------------------------------------------------------------------
+
+
+class ParsedSheetCache:
+    """Size-bounded on-disk LRU cache of parsed worksheets."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 1024 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache files (created on first write)
+            max_bytes: Upper bound for the total size of the cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = ReadCacheStats()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    # Keys ---------------------------------------------------------------
+
+    def content_digest(self, file_path: Path) -> str:
+        """
+        Return the SHA-256 of the file content.
+
+        The digest is memoized in memory and on disk per (path, size, mtime),
+        so only new or modified files are hashed.
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        identity = (str(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(identity)
+        if digest is not None:
+            return digest
+
+        fingerprint = hashlib.sha256(
+            "|".join(str(part) for part in identity).encode("utf-8")
+        ).hexdigest()
+        fingerprint_path = self.cache_dir / f"{fingerprint}{FINGERPRINT_SUFFIX}"
+        try:
+            digest = fingerprint_path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            digest = None
+
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(path, "rb") as handle:
+                for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._write_atomic(fingerprint_path, digest.encode("utf-8"))
+
+        self._digests[identity] = digest
+        return digest
+
+    def _digest_or_none(self, file_path: Path, operation: str) -> Optional[str]:
+        """Content digest, or None for missing/unreadable files (cache bypass)."""
+        if not Path(file_path).is_file():
+            return None
+        try:
+            return self.content_digest(file_path)
+        except Exception as exc:
+            self._record_error(operation, file_path, exc)
+            return None
+
+    @staticmethod
+    def entry_key(digest: str, options: Dict[str, Any]) -> str:
+        """Build the entry key from the content digest and read options."""
+        payload = json.dumps(
+            {
+                "format": CACHE_FORMAT_VERSION,
+                "pandas": pd.__version__,
+                "content": digest,
+                "options": options,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # Sheet names --------------------------------------------------------
+
+    def get_sheet_names(self, file_path: Path) -> Optional[List[str]]:
+        """Return cached worksheet names, or None on a miss."""
+        digest = self._digest_or_none(file_path, "get_sheet_names")
+        if digest is None:
+            return None
+        try:
+            path = self.cache_dir / f"{digest}{SHEETS_SUFFIX}"
+            if not path.exists():
+                return None
+            names = json.loads(path.read_text(encoding="utf-8"))
+            self._touch(path)
+            return [str(name) for name in names]
+        except Exception as exc:
+            self._record_error("get_sheet_names", file_path, exc)
+            return None
+
+    def put_sheet_names(self, file_path: Path, sheet_names: List[str]) -> None:
+        """Store worksheet names for a workbook."""
+        digest = self._digest_or_none(file_path, "put_sheet_names")
+        if digest is None:
+            return
+        try:
+            path = self.cache_dir / f"{digest}{SHEETS_SUFFIX}"
+            payload = json.dumps(list(sheet_names), ensure_ascii=False)
+            self._write_atomic(path, payload.encode("utf-8"))
+        except Exception as exc:
+            self._record_error("put_sheet_names", file_path, exc)
+
+    # Frames -------------------------------------------------------------
+
+    def get(self, file_path: Path, options: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Return the cached frame for ``file_path`` and ``options``, or None."""
+        digest = self._digest_or_none(file_path, "get")
+        if digest is None:
+            return None
+
+        key = self.entry_key(digest, options)
+        path = self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+        if not path.exists():
+            self.stats.misses += 1
+            return None
+
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            df = table_to_frame(table)
+        except Exception as exc:
+            # Corrupt or incompatible entry: drop it and re-parse
+            self._record_error("get", file_path, exc)
+            self._unlink(path)
+            self.stats.misses += 1
+            return None
+
+        self._touch(path)
+        self.stats.hits += 1
+        logger.debug("read_cache.hit file_path=%s key=%s", file_path, key[:12])
+        return df
+
+    def put(self, file_path: Path, options: Dict[str, Any], df: pd.DataFrame) -> bool:
+        """
+        Store a parsed frame; returns False when it was not cached.
+
+        Frames with cell types the codec cannot represent are skipped.
+        """
+        try:
+            table = frame_to_table(df)
+        except UnsupportedFrameError as exc:
+            self.stats.skipped += 1
+            logger.debug("read_cache.skipped file_path=%s reason=%s", file_path, exc)
+            return False
+        except Exception as exc:
+            self._record_error("put", file_path, exc)
+            return False
+
+        digest = self._digest_or_none(file_path, "put")
+        if digest is None:
+            return False
+        try:
+            key = self.entry_key(digest, options)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            self._write_atomic(
+                self.cache_dir / f"{key}{ENTRY_SUFFIX}",
+                sink.getvalue().to_pybytes(),
+            )
+        except Exception as exc:
+            self._record_error("put", file_path, exc)
+            return False
+
+        self.stats.stores += 1
+        self.evict()
+        return True
+
+    # Maintenance --------------------------------------------------------
+
+    def size_bytes(self) -> int:
+        """Total size of all cache files."""
+        return sum(size for _, size, _ in self._list_files())
+
+    def evict(self) -> int:
+        """Remove least-recently-used files until the size bound holds."""
+        files = self._list_files()
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for path, size, _ in sorted(files, key=lambda item: item[2]):
+            if total <= self.max_bytes:
+                break
+            if self._unlink(path):
+                total -= size
+                removed += 1
+        if removed:
+            self.stats.evictions += removed
+            logger.info(
+                "read_cache.evicted files=%s size_bytes=%s max_bytes=%s",
+                removed,
+                total,
+                self.max_bytes,
+            )
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cache file."""
+        for path, _, _ in self._list_files():
+            self._unlink(path)
+        self._digests.clear()
+
+    def _list_files(self) -> List[Tuple[Path, int, float]]:
+        if not self.cache_dir.is_dir():
+            return []
+        files = []
+        for path in self.cache_dir.iterdir():
+            if not path.name.endswith(
+                (ENTRY_SUFFIX, SHEETS_SUFFIX, FINGERPRINT_SUFFIX)
+            ):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _write_atomic(self, path: Path, payload: bytes) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        finally:
+            self._unlink(tmp_path)
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            now = time.time()
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def _record_error(self, operation: str, file_path: Path, exc: Exception) -> None:
+        self.stats.errors += 1
+        logger.warning(
+            "read_cache.bypassed operation=%s file_path=%s error=%s",
+            operation,
+            file_path,
+            exc,
+        )
+
+
+_DEFAULT_CACHES: Dict[Tuple[str, int], ParsedSheetCache] = {}
+
+
+def build_read_cache(settings: Any) -> Optional[ParsedSheetCache]:
+    """
+    Build the cache configured by ``settings`` (None when disabled).
+
+    Reuses one instance per (directory, size bound) so the in-memory digest
+    memo is shared by every reader in the process.
+    """
+    if getattr(settings, "read_cache_enabled", False) is not True:
+        return None
+    cache_dir = getattr(settings, "read_cache_dir", None)
+    max_mb = getattr(settings, "read_cache_max_mb", None)
+    if not isinstance(cache_dir, str) or not isinstance(max_mb, int):
+        return None
+
+    key = (str(Path(cache_dir).resolve()), max_mb * 1024 * 1024)
+    cache = _DEFAULT_CACHES.get(key)
+    if cache is None:
+        cache = ParsedSheetCache(Path(key[0]), max_bytes=key[1])
+        _DEFAULT_CACHES[key] = cache
+    return cache
+
+
+def get_default_read_cache() -> Optional[ParsedSheetCache]:
+    """Return the cache configured in application settings (None if disabled)."""
+    from work_data_hub.config.settings import get_settings
+
+    return build_read_cache(get_settings())
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "ParsedSheetCache",
+    "ReadCacheStats",
+    "UnsupportedFrameError",
+    "build_read_cache",
+    "frame_to_table",
+    "get_default_read_cache",
+    "table_to_frame",
+]
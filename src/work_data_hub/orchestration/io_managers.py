@@ -0,0 +1,218 @@
+"""Arrow-backed Dagster IO manager for op outputs.
+
+Dagster's default filesystem IO manager pickles every op output. For the
+``List[Dict[str, Any]]`` rows passed between ``read_data_op``,
+``process_domain_op_v2``, ``generic_backfill_refs_op`` and ``load_op`` the
+pickle costs several times the size of the data at each op boundary.
+
+``ArrowIOManager`` stores tabular outputs as uncompressed Arrow IPC files and
+memory-maps them on load:
+
+- ``pd.DataFrame`` and ``pa.Table`` outputs are stored natively
+- ``List[Dict]`` outputs are stored column-wise via ``io.arrow_codec``
+- everything else (file path lists, summary dicts, ...) and data the codec
+  cannot represent losslessly falls back to pickle
+
+On load the stored value is adapted to the input's annotation, so ops can
+start producing DataFrames while downstream ops that still take row dicts
+keep working (and vice versa).
+"""
+
+import pickle
+import typing
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+from dagster import (
+    ConfigurableIOManagerFactory,
+    InitResourceContext,
+    InputContext,
+    IOManager,
+    OutputContext,
+)
+from pydantic import Field
+
+from work_data_hub.io.arrow_codec import (
+    UnsupportedFrameError,
+    frame_to_table,
+    records_to_table,
+    table_to_frame,
+    table_to_records,
+)
+from work_data_hub.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ARROW_SUFFIX = ".arrow"
+PICKLE_SUFFIX = ".pkl"
+
+# Schema metadata key recording which Python shape was stored
+_KIND_METADATA_KEY = b"wdh_io_kind"
+KIND_DATAFRAME = "dataframe"
+KIND_TABLE = "table"
+KIND_RECORDS = "records"
+
+
+def _is_records(obj: Any) -> bool:
+    return (
+        isinstance(obj, list)
+        and len(obj) > 0
+        and all(isinstance(item, dict) for item in obj)
+    )
+
+
+def _encode_output(obj: Any) -> Optional[pa.Table]:
+    """Encode a tabular output as a tagged Arrow table (None = not tabular)."""
+    if isinstance(obj, pd.DataFrame):
+        table, kind = frame_to_table(obj, preserve_index=True), KIND_DATAFRAME
+    elif isinstance(obj, pa.Table):
+        table, kind = obj, KIND_TABLE
+    elif _is_records(obj):
+        table, kind = records_to_table(obj), KIND_RECORDS
+    else:
+        return None
+    metadata = dict(table.schema.metadata or {})
+    metadata[_KIND_METADATA_KEY] = kind.encode("utf-8")
+    return table.replace_schema_metadata(metadata)
+
+
+def _decode_output(table: pa.Table) -> Any:
+    """Rebuild the stored object in its original shape."""
+    kind = table.schema.metadata[_KIND_METADATA_KEY].decode("utf-8")
+    if kind == KIND_DATAFRAME:
+        return table_to_frame(table)
+    if kind == KIND_RECORDS:
+        return table_to_records(table)
+    metadata = dict(table.schema.metadata)
+    metadata.pop(_KIND_METADATA_KEY)
+    return table.replace_schema_metadata(metadata or None)
+
+
+def _to_frame(value: Any) -> Any:
+    if isinstance(value, pa.Table):
+        return value.to_pandas()
+    if isinstance(value, list):
+        return pd.DataFrame.from_records(value)
+    return value
+
+
+def _to_table(value: Any) -> Any:
+    if isinstance(value, pd.DataFrame):
+        return pa.Table.from_pandas(value, preserve_index=False)
+    if isinstance(value, list):
+        return pa.Table.from_pylist(value)
+    return value
+
+
+def _to_records(value: Any) -> Any:
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict("records")
+    if isinstance(value, pa.Table):
+        return value.to_pylist()
+    return value
+
+
+def adapt_to_type(value: Any, expected: Any) -> Any:
+    """
+    Convert between DataFrame, Arrow table and row dicts for an input type.
+
+    Values already matching (or inputs typed ``Any``/unannotated) pass
+    through unchanged.
+    """
+    if expected is pd.DataFrame:
+        return _to_frame(value)
+    if expected is pa.Table:
+        return _to_table(value)
+    if typing.get_origin(expected) is list:
+        return _to_records(value)
+    return value
+
+
+class ArrowIOManager(IOManager):
+    """Stores op outputs under ``base_dir/<run_id>/<step_key>/<output>``."""
+
+    def __init__(self, base_dir: str):
+        self.base_dir = Path(base_dir)
+
+    def _path(self, identifier: Sequence[str]) -> Path:
+        return self.base_dir.joinpath(*identifier)
+
+    def handle_output(self, context: OutputContext, obj: Any) -> None:
+        path = self._path(context.get_identifier())
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            table = _encode_output(obj)
+        except (UnsupportedFrameError, pa.ArrowException) as exc:
+            logger.info(
+                "arrow_io_manager.pickle_fallback",
+                step=context.step_key,
+                output=context.name,
+                reason=str(exc),
+            )
+            table = None
+
+        if table is None:
+            with open(path.with_suffix(PICKLE_SUFFIX), "wb") as handle:
+                pickle.dump(obj, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            return
+
+        with pa.OSFile(str(path.with_suffix(ARROW_SUFFIX)), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        context.add_output_metadata(
+            {
+                "storage": "arrow_ipc",
+                "rows": table.num_rows,
+                "bytes": table.nbytes,
+            }
+        )
+
+    def load_input(self, context: InputContext) -> Any:
+        upstream = context.upstream_output
+        if upstream is None:
+            raise ValueError("ArrowIOManager only loads outputs of upstream ops")
+        path = self._path(upstream.get_identifier())
+        arrow_path = path.with_suffix(ARROW_SUFFIX)
+        if not arrow_path.exists():
+            with open(path.with_suffix(PICKLE_SUFFIX), "rb") as handle:
+                return pickle.load(handle)
+
+        # Buffers keep the mapped region alive after the file is closed
+        with pa.memory_map(str(arrow_path), "r") as source:
+            value = _decode_output(pa.ipc.open_file(source).read_all())
+
+        dagster_type = context.dagster_type
+        expected = getattr(dagster_type, "typing_type", None) if dagster_type else None
+        return adapt_to_type(value, expected)
+
+
+class ArrowIOManagerFactory(ConfigurableIOManagerFactory[ArrowIOManager]):
+    """Configurable factory for :class:`ArrowIOManager`."""
+
+    base_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory for op outputs (default: the Dagster instance storage "
+            "directory, like the filesystem IO manager)"
+        ),
+    )
+
+    def create_io_manager(self, context: InitResourceContext) -> ArrowIOManager:
+        if self.base_dir:
+            return ArrowIOManager(self.base_dir)
+        if context.instance is None:
+            raise ValueError("base_dir is required without a Dagster instance")
+        return ArrowIOManager(context.instance.storage_directory())
+
+
+arrow_io_manager = ArrowIOManagerFactory()
+
+__all__ = [
+    "ArrowIOManager",
+    "ArrowIOManagerFactory",
+    "adapt_to_type",
+    "arrow_io_manager",
+]
@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 # Batch size limits for queue processing (Story 7.1-16)
 MIN_BATCH_SIZE = 1
 MAX_BATCH_SIZE = 500  # Reasonable upper bound to avoid memory issues
+MAX_QUEUE_WORKERS = 16  # Concurrent EQC lookups still share one rate limit
 
 
 class QueueProcessingConfig(Config):
@@ -28,6 +29,7 @@ class QueueProcessingConfig(Config):
 
     batch_size: int = 50
     plan_only: bool = True
+    workers: int = 1
 
     @field_validator("batch_size")
     @classmethod
@@ -39,6 +41,16 @@ class QueueProcessingConfig(Config):
             raise ValueError(f"Batch size cannot exceed {MAX_BATCH_SIZE}")
         return v
 
+    @field_validator("workers")
+    @classmethod
+    def validate_workers(cls, v: int) -> int:
+        """Validate worker count is within bounds."""
+        if v < 1:
+            raise ValueError("Workers must be at least 1")
+        if v > MAX_QUEUE_WORKERS:
+            raise ValueError(f"Workers cannot exceed {MAX_QUEUE_WORKERS}")
+        return v
+
 
 @op
 def process_company_lookup_queue_op(
@@ -154,7 +166,9 @@ def process_company_lookup_queue_op(
 
             # Process the queue
             processed_count = enrichment_service.process_lookup_queue(
-                batch_size=config.batch_size, observer=observer
+                batch_size=config.batch_size,
+                observer=observer,
+                workers=config.workers,
             )
 
             # Get final queue status
@@ -147,7 +147,7 @@ def process_annual_award_op(
             extra={"data_source": file_path},
         )
         result_df = pipeline.execute(df, pipeline_context)
-        records, failed_count = convert_dataframe_to_models(result_df)
+        records, failed_df = convert_dataframe_to_models(result_df)
         result_dicts = [
             model.model_dump(mode="json", by_alias=True, exclude_none=True)
             for model in records
@@ -160,7 +160,7 @@ def process_annual_award_op(
             file_path,
             len(excel_rows),
             len(result_dicts),
-            failed_count,
+            len(failed_df),
         )
         return result_dicts
     except Exception as e:
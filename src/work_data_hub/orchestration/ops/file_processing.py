@@ -11,7 +11,7 @@ This module contains ops for file discovery and Excel reading:
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 import yaml
 from dagster import Config, OpExecutionContext, op
@@ -24,6 +24,10 @@ from work_data_hub.io.connectors.file_connector import (
     FileDiscoveryService,
 )
 from work_data_hub.io.readers.excel_reader import read_excel_rows
+from work_data_hub.io.readers.multi_sheet_reader import (
+    MultiSheetReadResult,
+    read_excel_sheets_rows,
+)
 from work_data_hub.io.readers.multi_table_loader import MultiTableLoader
 
 from ._internal import _load_valid_domains
@@ -44,6 +48,8 @@ class DiscoverFilesConfig(Config):
     selection_strategy: str = "error"  # error, newest, oldest, first
     # Sprint Change Proposal 2026-01-08: Direct file processing
     file_path: Optional[str] = None  # Bypasses auto-discovery
+    # Consult the parsed-sheet cache (disabled by `etl --no-read-cache`)
+    use_read_cache: bool = True
 
     @field_validator("domain")
     @classmethod
@@ -130,7 +136,7 @@ def discover_files_op(
                     )
 
             # Use FileDiscoveryService for Epic 3 schema
-            file_discovery = FileDiscoveryService()
+            file_discovery = FileDiscoveryService(use_read_cache=config.use_read_cache)
 
             try:
                 # Call discover_file (discovery-only, no Excel loading)
@@ -275,21 +281,12 @@ def read_excel_op(
                 low_memory=False,  # Better type inference for large files
             )
 
-            rows = df.to_dict("records")
+            rows = cast(List[Dict[str, Any]], df.to_dict("records"))
             context.log.info(f"CSV file detected, loaded {len(rows)} rows")
         elif config.sheet_names:
             # Multi-sheet support: read and merge all specified sheets
-            rows = []
-            for sheet_name in config.sheet_names:
-                try:
-                    sheet_rows = read_excel_rows(file_path, sheet=sheet_name)
-                    rows.extend(sheet_rows)
-                    context.log.info(
-                        f"Multi-sheet read: sheet='{sheet_name}', rows={len(sheet_rows)}"
-                    )
-                except Exception as e:
-                    # Log warning but continue with other sheets
-                    context.log.warning(f"Failed to read sheet '{sheet_name}': {e}")
+            # (one workbook handle, failed sheets are skipped with a warning)
+            rows = _read_multi_sheet_rows(context, [file_path], config.sheet_names)
 
             context.log.info(
                 f"Multi-sheet reading completed: sheets={config.sheet_names}, "
@@ -341,6 +338,8 @@ class ReadDataOpConfig(Config):
     sheet: Any = 0
     sheet_names: Optional[List[str]] = None
     sample: Optional[str] = None
+    # Consult the parsed-sheet cache (disabled by `etl --no-read-cache`)
+    use_read_cache: bool = True
 
 
 @op
@@ -399,19 +398,20 @@ def _read_excel_files(
         import pandas as pd
 
         df = pd.read_csv(file_path, encoding="utf-8-sig", low_memory=False)
-        rows = df.to_dict("records")
+        rows = cast(List[Dict[str, Any]], df.to_dict("records"))
         context.log.info(f"CSV file loaded: {len(rows)} rows")
     elif config.sheet_names:
-        rows = []
-        for sheet_name in config.sheet_names:
-            try:
-                sheet_rows = read_excel_rows(file_path, sheet=sheet_name)
-                rows.extend(sheet_rows)
-            except Exception as e:
-                context.log.warning(f"Failed to read sheet '{sheet_name}': {e}")
+        rows = _read_multi_sheet_rows(
+            context,
+            [file_path],
+            config.sheet_names,
+            use_read_cache=config.use_read_cache,
+        )
         context.log.info(f"Multi-sheet read: {len(rows)} total rows")
     else:
-        rows = read_excel_rows(file_path, sheet=config.sheet)
+        rows = read_excel_rows(
+            file_path, sheet=config.sheet, use_read_cache=config.use_read_cache
+        )
 
     # Apply sampling if configured
     if config.sample and rows:
@@ -428,6 +428,60 @@ def _read_excel_files(
     return rows
 
 
+def _read_multi_sheet_rows(
+    context: OpExecutionContext,
+    file_paths: List[str],
+    sheet_names: List[str],
+    use_read_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Read several sheets and report per-sheet row counts and timings.
+
+    Each file is opened once; sheets are parsed in a process pool
+    (``settings.max_workers``) when the input is large enough to pay off.
+    Per-sheet statistics are attached as op output metadata.
+    """
+    settings = get_settings()
+    result: MultiSheetReadResult = read_excel_sheets_rows(
+        file_paths,
+        sheet_names,
+        use_read_cache=use_read_cache,
+        max_workers=getattr(settings, "max_workers", 1),
+        engine=getattr(settings, "excel_reader_engine", None),
+    )
+
+    for stats in result.sheets:
+        if stats.error:
+            context.log.warning(f"Failed to read sheet '{stats.sheet}': {stats.error}")
+        else:
+            context.log.info(
+                f"Multi-sheet read: sheet='{stats.sheet}', rows={stats.row_count}, "
+                f"duration_ms={stats.duration_ms}, from_cache={stats.from_cache}"
+            )
+    context.log.info(
+        f"Multi-sheet read finished in {result.duration_ms} ms "
+        f"(workers={result.workers})"
+    )
+    context.add_output_metadata(
+        {
+            "sheets": [
+                {
+                    "file_path": stats.file_path,
+                    "sheet": stats.sheet,
+                    "rows": stats.row_count,
+                    "duration_ms": stats.duration_ms,
+                    "from_cache": stats.from_cache,
+                    "error": stats.error,
+                }
+                for stats in result.sheets
+            ],
+            "read_duration_ms": result.duration_ms,
+            "read_workers": result.workers,
+        }
+    )
+    return result.rows
+
+
 class ReadProcessConfig(Config):
     """Configuration for reading and processing multiple trustee files."""
 
@@ -28,6 +28,7 @@ class LoadConfig(Config):
     table: str = "sandbox_trustee_performance"
     mode: str = "delete_insert"
     pk: List[str] = ["report_date", "plan_code", "company_code"]
+    load_method: str = "values"
     plan_only: bool = True
     skip: bool = False  # NEW: skip flag for early return
 
@@ -40,6 +41,15 @@ class LoadConfig(Config):
             raise ValueError(f"Mode '{v}' not supported. Valid: {valid_modes}")
         return v
 
+    @field_validator("load_method")
+    @classmethod
+    def validate_load_method(cls, v: str) -> str:
+        """Validate bulk load method is supported."""
+        valid_methods = ["values", "copy"]
+        if v not in valid_methods:
+            raise ValueError(f"Load method '{v}' not supported. Valid: {valid_methods}")
+        return v
+
     @model_validator(mode="after")
     def validate_delete_insert_requirements(self) -> "LoadConfig":
         """Ensure delete_insert mode has primary key defined."""
@@ -187,6 +197,7 @@ def load_op(
                 mode=config.mode,
                 pk=config.pk,
                 conn=conn,
+                load_method=config.load_method,
             )
         else:
             # Plan-only: no connection created
@@ -196,6 +207,7 @@ def load_op(
                 mode=config.mode,
                 pk=config.pk,
                 conn=None,
+                load_method=config.load_method,
             )
 
         # Enhanced logging with execution mode
@@ -105,7 +105,10 @@ def reference_sync_op(
     db_url = settings.get_database_connection_string()
     import psycopg2
 
-    engine = create_engine(db_url, module=psycopg2)
+    # One pooled connection per sync worker plus the one held for sync state
+    engine = create_engine(
+        db_url, module=psycopg2, pool_size=sync_config.concurrency + 1
+    )
 
     try:
         with engine.connect() as conn:
@@ -133,6 +136,8 @@ def reference_sync_op(
                 plan_only=config.plan_only,
                 state=sync_state,
                 default_batch_size=sync_config.batch_size,
+                concurrency=sync_config.concurrency,
+                connection_factory=engine.connect,
             )
 
             # Persist state for successful syncs (Story 6.2-p4)
@@ -173,6 +178,7 @@ def reference_sync_op(
                         "rows_deleted": r.rows_deleted,
                         "sync_mode": r.sync_mode,
                         "duration_seconds": r.duration_seconds,
+                        "wave": r.wave,
                         "error": r.error,
                     }
                     for r in results
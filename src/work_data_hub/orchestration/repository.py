@@ -11,6 +11,8 @@ code location registration.
 
 from dagster import Definitions
 
+from .io_managers import arrow_io_manager
+
 # Import jobs from the jobs module
 from .jobs import (
     annuity_performance_job,
@@ -43,4 +45,8 @@ defs = Definitions(
         trustee_new_files_sensor,
         trustee_data_quality_sensor,
     ],
+    # Deployed runs exchange op outputs (row lists, DataFrames) as Arrow IPC
+    # files instead of pickles (see io_managers.py). Jobs run by the CLI via
+    # execute_in_process keep Dagster's in-memory IO manager.
+    resources={"io_manager": arrow_io_manager},
 )
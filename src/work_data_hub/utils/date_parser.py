@@ -8,8 +8,9 @@ Chinese date formats commonly found in Excel files and business data.
 import logging
 import re
 from datetime import date, datetime
-from typing import Any, Callable, Hashable, List, Optional, Pattern, Tuple, Union
+from typing import Callable, Hashable, List, Optional, Pattern, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -28,11 +29,22 @@ SUPPORTED_FORMATS = (
 
 DateParser = Callable[[str, re.Match[str]], date]
 
+_FULLWIDTH_DIGITS = str.maketrans("０１２３４５６７８９", "0123456789")
+
+# Formats parsed column-wise by parse_date_series: YYYYMM, YYYYMMDD,
+# YYYY-MM, YYYY-MM-DD, YYYY年M月 and YYYY年M月D日
+_FAST_DATE_PATTERN = (
+    r"^(?P<year>[0-9]{4})(?:"
+    r"(?P<month_digits>[0-9]{2})(?P<day_digits>[0-9]{2})?"
+    r"|-(?P<month_iso>[0-9]{2})(?:-(?P<day_iso>[0-9]{2}))?"
+    r"|年(?P<month_cn>[0-9]{1,2})月(?:(?P<day_cn>[0-9]{1,2})日)?"
+    r")$"
+)
+
 
 def _normalize_fullwidth_digits(value: str) -> str:
     """Convert full-width digits (０-９) to half-width equivalents."""
-    translation_table = str.maketrans("０１２３４５６７８９", "0123456789")
-    return value.translate(translation_table)
+    return value.translate(_FULLWIDTH_DIGITS)
 
 
 def _validate_date_range(
@@ -223,25 +235,126 @@ def parse_report_date(value: Union[str, int, date, None]) -> Optional[date]:
         return None
 
 
-def parse_bronze_dates(series: pd.Series) -> Tuple[pd.Series, List[Hashable]]:
+def _parse_fast_formats(text: pd.Series) -> pd.Series:
     """
-    Parse date column using shared date parser; return parsed series and invalid
-    indices.
+    Parse the common formats column-wise; ``None`` where the value needs the
+    full ``parse_yyyymm_or_chinese`` cascade (other formats, impossible or
+    out-of-range dates).
     """
-    parsed_values: List[Any] = []
-    invalid_rows: List[Hashable] = []
-    for idx, value in series.items():
-        if value is None or (isinstance(value, str) and not value.strip()):
-            parsed_values.append(pd.NaT)
-            continue
+    parts = text.str.extract(_FAST_DATE_PATTERN)
+    year = pd.to_numeric(parts["year"])
+    month = pd.to_numeric(
+        parts["month_digits"]
+        .combine_first(parts["month_iso"])
+        .combine_first(parts["month_cn"])
+    )
+    day = pd.to_numeric(
+        parts["day_digits"]
+        .combine_first(parts["day_iso"])
+        .combine_first(parts["day_cn"])
+    ).fillna(1)
+    stamps = pd.to_datetime(
+        pd.DataFrame({"year": year, "month": month, "day": day}), errors="coerce"
+    )
+    in_range = (stamps.notna() & year.between(2000, 2030)).to_numpy(dtype=bool)
+    parsed = np.full(len(text), None, dtype=object)
+    parsed[in_range] = stamps[in_range].dt.date.to_numpy()
+    return pd.Series(parsed, index=text.index, dtype=object)
+
+
+def _factorize_values(
+    values: np.ndarray, *, by_type: bool
+) -> Tuple[np.ndarray, pd.Series]:
+    """
+    Factorize values (NA coded -1). With ``by_type``, equal values of different
+    types stay distinct: ``202411`` parses but ``202411.0`` does not.
+    """
+    codes, uniques = pd.factorize(values)
+    if not by_type:
+        return codes, pd.Series(uniques, dtype=object)
+
+    kinds, _ = pd.factorize(pd.Series(values, dtype=object).map(type).to_numpy())
+    present = codes >= 0
+    keys = codes[present].astype(np.int64) * (int(kinds.max()) + 1) + kinds[present]
+    typed_codes, _ = pd.factorize(keys)
+    codes = np.full(len(values), -1, dtype=np.intp)
+    codes[present] = typed_codes
+    _, first = np.unique(typed_codes, return_index=True)
+    return codes, pd.Series(values[present][first], dtype=object)
 
+
+def parse_date_series(series: pd.Series) -> Tuple[pd.Series, List[Hashable]]:
+    """
+    Parse a date column with ``parse_yyyymm_or_chinese`` semantics in one pass.
+
+    Distinct values are parsed once (a 月度 column usually holds a handful):
+    YYYYMM, YYYYMMDD, ISO and ``YYYY年MM月`` strings column-wise, leftovers
+    through the regex cascade. ``None`` and blank strings are missing, not
+    invalid.
+
+    Returns:
+        Tuple of (``date``/``None`` object series on ``series.index``, index
+        labels of values that could not be parsed)
+    """
+    if series.empty:
+        return pd.Series(index=series.index, dtype=object), []
+
+    values = series.to_numpy(dtype=object)
+    codes, uniques = _factorize_values(values, by_type=series.dtype == object)
+
+    # Positional over ``uniques`` (RangeIndex); None until a value parses
+    parsed = np.full(len(uniques), None, dtype=object)
+    invalid = np.zeros(len(uniques), dtype=bool)
+    blank = np.zeros(len(uniques), dtype=bool)
+
+    others = uniques[~uniques.map(lambda v: isinstance(v, date))]
+    text = others.astype(str).str.strip().str.translate(_FULLWIDTH_DIGITS)
+    is_blank = (text == "") & others.map(lambda v: isinstance(v, str))
+    blank[text.index[is_blank]] = True
+    text = text[~is_blank]
+    if not text.empty:
+        parsed[text.index] = _parse_fast_formats(text).to_numpy()
+
+    for position in np.flatnonzero(pd.isna(parsed) & ~blank):
         try:
-            parsed = parse_yyyymm_or_chinese(value)
-            parsed_values.append(pd.Timestamp(parsed))
+            parsed[position] = parse_yyyymm_or_chinese(uniques.iloc[position])
         except (ValueError, TypeError):
-            parsed_values.append(pd.NaT)
-            invalid_rows.append(idx)
-    return pd.Series(parsed_values, index=series.index), invalid_rows
+            invalid[position] = True
+
+    present = codes >= 0
+    result = np.full(len(values), None, dtype=object)
+    result[present] = parsed[codes[present]]
+    invalid_rows = np.zeros(len(values), dtype=bool)
+    invalid_rows[present] = invalid[codes[present]]
+
+    # Missing markers other than None (NaN, NaT, pd.NA) are not dates either
+    missing = np.flatnonzero(~present)
+    if len(missing):
+        invalid_rows[missing] = [values[i] is not None for i in missing]
+
+    if invalid.any():
+        logger.debug("Unable to parse %d distinct date values", int(invalid.sum()))
+    return (
+        pd.Series(result, index=series.index, dtype=object),
+        list(series.index[invalid_rows]),
+    )
+
+
+def parse_chinese_date_series(series: pd.Series) -> pd.Series:
+    """
+    Series counterpart of ``parse_chinese_date`` (``None`` for un-parseable
+    values), for pipeline steps that previously used ``.apply``.
+    """
+    return parse_date_series(series)[0]
+
+
+def parse_bronze_dates(series: pd.Series) -> Tuple[pd.Series, List[Hashable]]:
+    """
+    Parse date column using shared date parser; return parsed series and invalid
+    indices.
+    """
+    parsed, invalid_rows = parse_date_series(series)
+    return pd.to_datetime(parsed), invalid_rows
 
 
 def _parse_digits(value: str, fmt: str) -> date:
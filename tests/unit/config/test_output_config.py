@@ -10,7 +10,10 @@ import yaml
 from unittest.mock import patch
 from datetime import datetime
 
-from src.work_data_hub.config.output_config import get_domain_output_config
+from src.work_data_hub.config.output_config import (
+    get_domain_output_config,
+    get_domain_refresh_strategy,
+)
 from src.work_data_hub.infrastructure.settings.data_source_schema import (
     DataSourcesValidationError,
 )
@@ -32,7 +35,11 @@ def config_with_output(tmp_path):
                 "base_path": "reference/monthly/{YYYYMM}/数据采集",
                 "file_patterns": ["*.xlsx"],
                 "sheet_name": "Sheet1",
-                "output": {"table": "annuity_income", "schema_name": "analytics"},
+                "output": {
+                    "table": "annuity_income",
+                    "schema_name": "analytics",
+                    "refresh_strategy": "partition_swap",
+                },
             },
         },
     }
@@ -180,3 +187,23 @@ class TestGetDomainOutputConfig:
 
         # Should have _NEW suffix by default
         assert table_name == "annuity_performance_NEW"
+
+
+class TestGetDomainRefreshStrategy:
+    """Test cases for get_domain_refresh_strategy() function."""
+
+    def test_reads_configured_strategy(self, config_with_output):
+        assert (
+            get_domain_refresh_strategy("annuity_income", config_with_output)
+            == "partition_swap"
+        )
+
+    def test_defaults_to_delete(self, config_with_output, config_without_output):
+        assert (
+            get_domain_refresh_strategy("annuity_performance", config_with_output)
+            == "delete"
+        )
+        assert get_domain_refresh_strategy("test_domain", config_without_output) == (
+            "delete"
+        )
+        assert get_domain_refresh_strategy("unknown", config_with_output) == "delete"
@@ -6,7 +6,11 @@ from work_data_hub.domain.annuity_performance.schemas import (
     validate_bronze_dataframe,
     validate_gold_dataframe,
 )
+from work_data_hub.domain.pipelines.core import Pipeline
+from work_data_hub.domain.pipelines.pipeline_config import PipelineConfig, StepConfig
 from work_data_hub.domain.pipelines.types import PipelineContext
+from work_data_hub.infrastructure.transforms import FilterStep
+from work_data_hub.infrastructure.validation import schema_steps
 from work_data_hub.infrastructure.validation.schema_steps import (
     BronzeSchemaValidationStep,
     GoldSchemaValidationStep,
@@ -431,3 +435,52 @@ class TestGoldSchemaValidation:
         df = _build_gold_df()
         with pytest.raises(SchemaError):
             validate_gold_dataframe(df, project_columns=False)
+
+
+@pytest.mark.unit
+def test_zero_copy_pipeline_skips_copies_for_read_only_steps(monkeypatch):
+    validated_inputs = []
+    validated_outputs = []
+    filter_inputs = []
+    original_validate = schema_steps.validate_bronze_dataframe
+
+    def recording_validate(df, **kwargs):
+        validated_inputs.append(df)
+        validated_df, summary = original_validate(df, **kwargs)
+        validated_outputs.append(validated_df)
+        return validated_df, summary
+
+    def has_plan_code(df):
+        filter_inputs.append(df)
+        return df["计划代码"] != "PLAN002"
+
+    monkeypatch.setattr(schema_steps, "validate_bronze_dataframe", recording_validate)
+    config = PipelineConfig(
+        name="annuity_performance_zero_copy",
+        steps=[
+            StepConfig(
+                name="bronze_schema_validation",
+                import_path=(
+                    "work_data_hub.infrastructure.validation.schema_steps."
+                    "BronzeSchemaValidationStep"
+                ),
+            ),
+            StepConfig(
+                name="FilterStep",
+                import_path="work_data_hub.infrastructure.transforms.FilterStep",
+            ),
+        ],
+        copy_mode="zero_copy",
+    )
+    pipeline = Pipeline(
+        steps=[BronzeSchemaValidationStep(), FilterStep(has_plan_code)],
+        config=config,
+    )
+    input_df = _build_bronze_df()
+
+    result = pipeline.run(input_df)
+
+    assert validated_inputs[0] is input_df
+    assert filter_inputs[0] is validated_outputs[0]
+    assert result.output_data["计划代码"].tolist() == ["PLAN001"]
+    assert input_df["期初资产规模"].tolist() == ["1,000.00", 1500]
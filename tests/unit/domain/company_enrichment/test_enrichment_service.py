@@ -6,6 +6,8 @@ internal mappings with external EQC lookups, result caching, and async
 queue processing for comprehensive company ID resolution.
 """
 
+import threading
+import time
 from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 
@@ -627,6 +629,80 @@ class TestProcessLookupQueue:
         assert processed_count == 0
 
 
+class TestProcessLookupQueueWorkers:
+    """Test worker-pool queue processing with batched status updates."""
+
+    def test_worker_pool_batches_status_updates(
+        self, mock_loader, mock_queue, mock_eqc_client
+    ):
+        """Lookups overlap; each batch ends with one batched status update."""
+        observer = EnrichmentObserver()
+        service = CompanyEnrichmentService(
+            loader=mock_loader,
+            queue=mock_queue,
+            eqc_client=mock_eqc_client,
+            observer=observer,
+        )
+        in_flight = {"now": 0, "max": 0}
+        lock = threading.Lock()
+        search_result = mock_eqc_client.search_company.return_value
+
+        def slow_search(name):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            if name == "Unknown":
+                return []
+            if name == "Broken":
+                raise EQCClientError("EQC error")
+            return search_result
+
+        mock_eqc_client.search_company.side_effect = slow_search
+        cache_threads = []
+        mock_loader.cache_company_mapping.side_effect = lambda **_: (
+            cache_threads.append(threading.current_thread())
+        )
+        first = [Mock(id=i, name=f"Company {i}", attempts=0) for i in range(1, 5)]
+        second = [
+            Mock(id=5, name="Unknown", attempts=0),
+            Mock(id=6, name="Broken", attempts=2),
+        ]
+        mock_queue.dequeue.side_effect = [first, second, []]
+        mock_queue.get_queue_depth.side_effect = [10, 0]
+
+        with patch(
+            "src.work_data_hub.domain.company_enrichment.queue_drain.mark_request_batch"
+        ) as mark_batch:
+            processed_count = service.process_lookup_queue(batch_size=4, workers=4)
+
+        assert processed_count == 4
+        assert in_flight["max"] > 1
+        mock_queue.mark_done.assert_not_called()
+        mock_queue.mark_failed.assert_not_called()
+        assert mark_batch.call_count == 2
+        queue, done_ids, failures = mark_batch.call_args_list[0].args
+        assert queue is mock_queue
+        assert sorted(done_ids) == [1, 2, 3, 4]
+        assert failures == []
+        _, done_ids, failures = mark_batch.call_args_list[1].args
+        assert done_ids == []
+        assert sorted(failures) == [
+            (5, "No EQC search results found for 'Unknown'", 1),
+            (6, "EQC lookup error: EQC error", 3),
+        ]
+        assert cache_threads == [threading.main_thread()] * 4
+
+        stats = observer.get_stats()
+        assert stats.api_calls == 5
+        assert sum(c["processed"] for c in stats.worker_throughput.values()) == 6
+        assert len(stats.worker_throughput) > 1
+        assert stats.queue_drain_eta_seconds == 0.0
+        assert stats.queue_depth_after == 0
+
+
 class TestQueueStatusReporting:
     """Test queue status and statistics reporting."""
 
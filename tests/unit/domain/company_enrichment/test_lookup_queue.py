@@ -22,6 +22,7 @@ from src.work_data_hub.domain.company_enrichment.lookup_queue import (
     normalize_name,
 )
 from src.work_data_hub.domain.company_enrichment.models import LookupRequest
+from src.work_data_hub.domain.company_enrichment.queue_drain import mark_request_batch
 
 
 @pytest.fixture
@@ -387,6 +388,45 @@ class TestMarkDoneAndFailedOperations:
         with pytest.raises(LookupQueueError):
             lookup_queue.mark_failed(request_id=456, error_message="Error", attempts=1)
 
+    def test_mark_batch_single_statement(self, lookup_queue, mock_connection):
+        """Test mark_request_batch writes done, retry and failed rows at once."""
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.rowcount = 3
+
+        updated = mark_request_batch(
+            lookup_queue,
+            [11],
+            [(12, "No EQC search results", 1), (13, "EQC lookup error", 3)],
+        )
+
+        assert updated == 3
+        mock_cursor.execute.assert_called_once()
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "FROM (VALUES" in sql
+        assert "WHERE r.id = v.id AND r.status = 'processing'" in sql
+        assert sql.count("::bigint") == 3
+        rows = [tuple(params[i : i + 5]) for i in range(0, len(params), 5)]
+        assert rows[0] == (11, "done", None, None, None)
+        assert rows[1][:4] == (12, "pending", "No EQC search results", 1)
+        assert rows[1][4] > datetime.now(timezone.utc)
+        assert rows[2] == (13, "failed", "EQC lookup error", 3, None)
+
+    def test_mark_batch_partial_update_and_empty(self, lookup_queue, mock_connection):
+        """Test mark_request_batch tolerates stale rows and skips empty batches."""
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.rowcount = 1
+
+        assert mark_request_batch(lookup_queue, [1, 2]) == 1
+        assert mark_request_batch(lookup_queue, [], []) == 0
+        mock_cursor.execute.assert_called_once()
+
+        with pytest.raises(ValueError, match="Request ID must be positive"):
+            mark_request_batch(lookup_queue, [0])
+
+        mock_cursor.execute.side_effect = psycopg2.Error("Database error")
+        with pytest.raises(LookupQueueError):
+            mark_request_batch(lookup_queue, [1])
+
 
 class TestTempIdGeneration:
     """Test HMAC-based temporary ID generation (Story 6-2-P1)."""
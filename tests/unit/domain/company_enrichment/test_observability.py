@@ -257,6 +257,28 @@ class TestEnrichmentObserver:
         stats = observer.get_stats()
         assert stats.queue_depth_after == 120
 
+    def test_record_worker_throughput_and_drain_eta(self) -> None:
+        """Test per-worker throughput counters and queue drain ETA."""
+        observer = EnrichmentObserver()
+        observer.record_worker_throughput("eqc-queue_0", processed=1, seconds=0.5)
+        observer.record_worker_throughput("eqc-queue_0", processed=3, seconds=1.5)
+        observer.record_worker_throughput("eqc-queue_1", processed=1, seconds=0.0)
+        observer.set_queue_drain_eta(42.04)
+
+        stats = observer.get_stats()
+        assert stats.worker_rates() == {"eqc-queue_0": 2.0, "eqc-queue_1": 0.0}
+        result = stats.to_dict()
+        assert result["worker_throughput"]["eqc-queue_0"] == {
+            "processed": 4,
+            "seconds": 2.0,
+            "per_second": 2.0,
+        }
+        assert result["queue_drain_eta_seconds"] == 42.0
+
+        merged = stats.merge(stats)
+        assert merged.worker_throughput["eqc-queue_0"]["processed"] == 8
+        assert stats.worker_throughput["eqc-queue_0"]["processed"] == 4
+
     def test_get_unknown_companies_sorted_by_occurrence(self) -> None:
         """Test unknown companies are sorted by occurrence count DESC (AC3)."""
         observer = EnrichmentObserver()
@@ -281,6 +281,44 @@ class TestCleansingRuleStepExecution:
         assert result.row["text"] == "hello_custom"
 
 
+class TestCleansingRuleStepBatch:
+    """Test CleansingRuleStep.apply_batch parity with per-row apply."""
+
+    def _failing_step(self, target_fields=None):
+        def failing_rule(value, field_name=""):
+            if value == "fail":
+                raise ValueError("Rule failed")
+            return f"{field_name}:{value}"
+
+        rule = CleansingRule(
+            name="failing_rule",
+            category=RuleCategory.STRING,
+            func=failing_rule,
+            description="Failing rule",
+        )
+        return CleansingRuleStep(rule=rule, target_fields=target_fields)
+
+    def test_apply_batch_matches_apply_per_row(self):
+        step = self._failing_step(target_fields=["a", "missing"])
+        records = [{"a": "x", "b": "y"}, {"a": "fail", "b": "z"}]
+
+        batch = step.apply_batch(records, {})
+        per_row = [step.apply(record, {}) for record in records]
+
+        assert batch.rows == [result.row for result in per_row]
+        assert batch.warnings == [w for result in per_row for w in result.warnings]
+        assert batch.row_errors == {1: per_row[1].errors}
+
+    def test_apply_batch_does_not_mutate_records(self):
+        step = self._failing_step()
+        records = [{"a": "x"}]
+
+        batch = step.apply_batch(records, {})
+
+        assert records == [{"a": "x"}]
+        assert batch.rows == [{"a": "a:x"}]
+
+
 class TestCleansingRuleStepWithRealRules:
     """Test CleansingRuleStep with actual cleansing rules."""
 
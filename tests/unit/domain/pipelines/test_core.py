@@ -16,6 +16,7 @@ from src.work_data_hub.domain.pipelines.core import Pipeline
 from src.work_data_hub.domain.pipelines.examples import build_reference_pipeline
 from src.work_data_hub.domain.pipelines.exceptions import PipelineStepError, StepSkipped
 from src.work_data_hub.domain.pipelines.types import (
+    BatchStepResult,
     DataFrameStep,
     PipelineContext,
     PipelineResult,
@@ -770,3 +771,311 @@ def test_execute_stop_on_error_true():
 
     with pytest.raises(PipelineStepError):
         pipeline.execute({"value": 1})
+
+
+# ============================================================================
+# Zero-copy execution mode
+# ============================================================================
+
+
+class PureAddOneStep(DataFrameStep):
+    """DataFrame step that never mutates its input (safe to share)."""
+
+    mutates_input = False
+
+    def __init__(self):
+        self._name = "pure_add_one"
+        self.received: List[pd.DataFrame] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def execute(
+        self, dataframe: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        self.received.append(dataframe)
+        return dataframe.assign(value=dataframe["value"] + 1)
+
+
+class InPlaceFlakyStep(DataFrameStep):
+    """Mutates its input in place, then fails with a retryable error once."""
+
+    def __init__(self):
+        self._name = "in_place_flaky"
+        self.seen_values: List[int] = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def execute(
+        self, dataframe: pd.DataFrame, context: PipelineContext
+    ) -> pd.DataFrame:
+        self.seen_values.append(int(dataframe.loc[0, "value"]))
+        dataframe["value"] = dataframe["value"] * 10
+        if len(self.seen_values) == 1:
+            raise ConnectionResetError("network connection reset")
+        return dataframe
+
+
+def _zero_copy_config(*step_names: str, **overrides) -> PipelineConfig:
+    return PipelineConfig(
+        name="zero_copy_test",
+        steps=[
+            StepConfig(
+                name=step_name,
+                import_path="tests.unit.domain.pipelines.test_core.AddOneStep",
+            )
+            for step_name in step_names
+        ],
+        copy_mode="zero_copy",
+        **overrides,
+    )
+
+
+@pytest.mark.unit
+def test_copy_mode_defaults_to_defensive():
+    config = PipelineConfig(
+        name="defaults",
+        steps=[
+            StepConfig(
+                name="add_one",
+                import_path="tests.unit.domain.pipelines.test_core.AddOneStep",
+            )
+        ],
+    )
+    assert config.copy_mode == "defensive"
+
+
+@pytest.mark.unit
+def test_zero_copy_shares_frame_with_pure_steps():
+    first, second = PureAddOneStep(), PureAddOneStep()
+    second._name = "pure_add_one_again"
+    pipeline = Pipeline(
+        steps=[first, second],
+        config=_zero_copy_config("pure_add_one", "pure_add_one_again"),
+    )
+    input_df = pd.DataFrame([{"value": 1}, {"value": 2}])
+
+    result = pipeline.run(input_df)
+
+    assert first.received[0] is input_df
+    assert result.output_data is not input_df
+    assert result.output_data["value"].tolist() == [3, 4]
+    assert input_df["value"].tolist() == [1, 2]
+
+
+@pytest.mark.unit
+def test_defensive_mode_copies_for_pure_steps():
+    step = PureAddOneStep()
+    config = _zero_copy_config("pure_add_one").model_copy(
+        update={"copy_mode": "defensive"}
+    )
+    input_df = pd.DataFrame([{"value": 1}])
+
+    Pipeline(steps=[step], config=config).run(input_df)
+
+    assert step.received[0] is not input_df
+
+
+@pytest.mark.unit
+def test_zero_copy_protects_caller_frame_from_mutating_steps():
+    pipeline = Pipeline(steps=[AddOneStep()], config=_zero_copy_config("add_one"))
+    input_df = pd.DataFrame([{"value": 1}])
+
+    result = pipeline.run(input_df)
+
+    assert result.output_data["value"].tolist() == [2]
+    assert input_df["value"].tolist() == [1]
+
+
+@pytest.mark.unit
+def test_zero_copy_retry_sees_original_frame():
+    step = InPlaceFlakyStep()
+    pipeline = Pipeline(
+        steps=[step],
+        config=_zero_copy_config("in_place_flaky", retry_backoff_base=0.1),
+    )
+    input_df = pd.DataFrame([{"value": 1}])
+
+    result = pipeline.run(input_df)
+
+    assert step.seen_values == [1, 1]
+    assert result.output_data["value"].tolist() == [10]
+    assert input_df["value"].tolist() == [1]
+
+
+@pytest.mark.unit
+def test_zero_copy_skipped_step_passes_frame_through():
+    pipeline = Pipeline(
+        steps=[PureAddOneStep(), OptionalStep("not configured")],
+        config=_zero_copy_config("pure_add_one", "optional_enrichment"),
+    )
+
+    result = pipeline.run(pd.DataFrame([{"value": 1}]))
+
+    assert result.output_data["value"].tolist() == [2]
+    assert result.warnings == ["Step skipped: not configured"]
+
+
+# ============================================================================
+# Batched row-level execution (apply_batch)
+# ============================================================================
+
+
+class BatchDoubleStep:
+    """Batch-capable row step; `apply` exists only as a per-row fallback."""
+
+    def __init__(self, failing_values=()):
+        self._name = "batch_double"
+        self.failing_values = set(failing_values)
+        self.batch_sizes: List[int] = []
+        self.apply_calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def apply(self, row: Row, context: PipelineContext) -> StepResult:
+        self.apply_calls += 1
+        if row["value"] in self.failing_values:
+            raise ValueError(f"bad value {row['value']}")
+        return StepResult(row={**row, "value": row["value"] * 2})
+
+    def apply_batch(self, records, context) -> BatchStepResult:
+        self.batch_sizes.append(len(records))
+        rows = []
+        row_errors = {}
+        for position, record in enumerate(records):
+            if record["value"] in self.failing_values:
+                row_errors[position] = [f"bad value {record['value']}"]
+                rows.append(record)
+            else:
+                rows.append({**record, "value": record["value"] * 2})
+        return BatchStepResult(rows=rows, row_errors=row_errors)
+
+
+class ExplodingBatchStep(BatchDoubleStep):
+    def apply_batch(self, records, context) -> BatchStepResult:
+        raise RuntimeError("batch exploded")
+
+
+class BatchOnlyExplodingStep:
+    """Batch step without a per-row ``apply`` to fall back on."""
+
+    name = "batch_only"
+
+    def apply_batch(self, records, context) -> BatchStepResult:
+        raise RuntimeError("batch exploded")
+
+
+def _batch_config(stop_on_error: bool, row_batch_size: int = 2) -> PipelineConfig:
+    return PipelineConfig(
+        name="batch_row_test",
+        steps=[
+            StepConfig(
+                name="batch_double",
+                import_path="tests.unit.domain.pipelines.test_core.BatchDoubleStep",
+            )
+        ],
+        stop_on_error=stop_on_error,
+        row_batch_size=row_batch_size,
+    )
+
+
+@pytest.mark.unit
+def test_batch_row_step_preferred_over_apply():
+    step = BatchDoubleStep()
+    pipeline = Pipeline(steps=[step], config=_batch_config(stop_on_error=True))
+
+    result = pipeline.run(pd.DataFrame({"value": [1, 2, 3, 4, 5]}))
+
+    assert result.success
+    assert result.output_data["value"].tolist() == [2, 4, 6, 8, 10]
+    assert step.batch_sizes == [2, 2, 1]
+    assert step.apply_calls == 0
+    assert result.metrics.step_details[0].rows_processed == 5
+
+
+@pytest.mark.unit
+def test_batch_row_step_collects_error_rows_with_absolute_index():
+    step = BatchDoubleStep(failing_values={4})
+    pipeline = Pipeline(steps=[step], config=_batch_config(stop_on_error=False))
+
+    result = pipeline.run(pd.DataFrame({"value": [1, 2, 3, 4, 5]}))
+
+    assert not result.success
+    assert result.errors == ["bad value 4"]
+    assert len(result.error_rows) == 1
+    assert result.error_rows[0]["row_index"] == 3
+    assert result.error_rows[0]["row_data"] == {"value": 4}
+    assert result.error_rows[0]["step_name"] == "batch_double"
+    assert result.output_data["value"].tolist() == [2, 4, 6, 4, 10]
+
+
+@pytest.mark.unit
+def test_batch_row_step_stop_on_error_reports_row_index():
+    pipeline = Pipeline(
+        steps=[BatchDoubleStep(failing_values={3})],
+        config=_batch_config(stop_on_error=True),
+    )
+
+    with pytest.raises(PipelineStepError) as exc_info:
+        pipeline.run(pd.DataFrame({"value": [1, 2, 3]}))
+
+    assert "row_index=2" in str(exc_info.value)
+
+
+@pytest.mark.unit
+def test_batch_row_step_exception_replays_chunk_per_row():
+    step = ExplodingBatchStep(failing_values={2})
+    pipeline = Pipeline(
+        steps=[step],
+        config=_batch_config(stop_on_error=False, row_batch_size=10),
+    )
+
+    result = pipeline.run(pd.DataFrame({"value": [1, 2, 3]}))
+
+    assert step.apply_calls == 3
+    assert [row["row_index"] for row in result.error_rows] == [1]
+    assert result.errors == ["Row 1: bad value 2"]
+    assert result.output_data["value"].tolist() == [2, 2, 6]
+
+
+@pytest.mark.unit
+def test_batch_row_step_exception_replay_stop_on_error_reports_row_index():
+    pipeline = Pipeline(
+        steps=[ExplodingBatchStep(failing_values={3})],
+        config=_batch_config(stop_on_error=True, row_batch_size=2),
+    )
+
+    with pytest.raises(PipelineStepError) as exc_info:
+        pipeline.run(pd.DataFrame({"value": [1, 2, 3, 4]}))
+
+    assert "row_index=2" in str(exc_info.value)
+
+
+@pytest.mark.unit
+def test_batch_row_step_exception_without_apply_marks_chunk_rows_failed():
+    pipeline = Pipeline(
+        steps=[BatchOnlyExplodingStep()],
+        config=_batch_config(stop_on_error=False, row_batch_size=10),
+    )
+
+    result = pipeline.run(pd.DataFrame({"value": [1, 2]}))
+
+    assert [row["row_index"] for row in result.error_rows] == [0, 1]
+    assert result.output_data["value"].tolist() == [1, 2]
+
+
+@pytest.mark.unit
+def test_batch_row_step_preserves_columns_for_empty_frame():
+    pipeline = Pipeline(
+        steps=[BatchDoubleStep()], config=_batch_config(stop_on_error=True)
+    )
+
+    result = pipeline.run(pd.DataFrame({"value": pd.Series([], dtype="int64")}))
+
+    assert result.output_data.empty
+    assert list(result.output_data.columns) == ["value"]
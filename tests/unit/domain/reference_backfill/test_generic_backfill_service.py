@@ -487,7 +487,7 @@ class TestGenericBackfillServiceIntegration:
         assert result.tables_processed[0]["skipped"] == 2  # two unique candidates
 
     def test_fill_null_only_postgresql_query(self):
-        """fill_null_only should issue ON CONFLICT DO UPDATE with null guards."""
+        """fill_null_only merges a COPY-loaded staging table in one statement."""
         service = GenericBackfillService("test_domain")
 
         config = ForeignKeyConfig(
@@ -504,12 +504,11 @@ class TestGenericBackfillServiceIntegration:
 
         mock_conn = MagicMock()
         mock_conn.dialect.name = "postgresql"
-        # Mock two execute calls: 1. check existing keys 2. insert
-        mock_existing_result = Mock()
-        mock_existing_result.fetchall.return_value = []
-        mock_insert_result = Mock()
-        mock_insert_result.rowcount = 2
-        mock_conn.execute.side_effect = [mock_existing_result, mock_insert_result]
+        cursor = mock_conn.connection.dbapi_connection.cursor.return_value
+        # Mock two execute calls: 1. create staging table 2. merge
+        merge_result = Mock()
+        merge_result.fetchall.return_value = [("key1", True), ("key2", False)]
+        mock_conn.execute.side_effect = [MagicMock(), merge_result]
 
         candidates_df = pd.DataFrame(
             [
@@ -518,16 +517,63 @@ class TestGenericBackfillServiceIntegration:
             ]
         )
 
-        inserted = service.backfill_table(
+        changed = service.backfill_table(
             candidates_df, config, mock_conn, add_tracking_fields=False
         )
 
-        assert inserted == 2
-        sql_text = mock_conn.execute.call_args[0][0].text
-        assert "DO UPDATE" in sql_text
-        assert "CASE WHEN" in sql_text
+        assert changed == 2
+        create_sql, merge_sql = (
+            c.args[0].text for c in mock_conn.execute.call_args_list
+        )
+        stage = create_sql.split('"')[1]
+        assert create_sql.startswith(f'CREATE TEMP TABLE "{stage}" ON COMMIT DROP')
+        assert cursor.copy_expert.call_args.args[0].startswith(f'COPY "{stage}"')
+        assert '"value" = COALESCE(t."value", s."value")' in merge_sql
+        assert " IN (" not in merge_sql
         mock_conn.commit.assert_called_once()
 
+    def test_fill_null_only_generic_updates_in_one_executemany(self):
+        """Non-PostgreSQL fill_null_only fills existing rows with one UPDATE."""
+        service = GenericBackfillService("test_domain")
+
+        config = ForeignKeyConfig(
+            name="fk_test",
+            source_column="source_col",
+            target_table="test_table",
+            target_key="primary_key",
+            mode="fill_null_only",
+            backfill_columns=[
+                BackfillColumnMapping(source="source_col", target="primary_key"),
+                BackfillColumnMapping(source="value_col", target="value"),
+            ],
+        )
+
+        mock_conn = MagicMock()
+        mock_conn.dialect.name = "sqlite"
+        existing = [("key1",), ("key2",)]
+        mock_conn.execute.side_effect = [
+            Mock(fetchall=lambda: existing),
+            Mock(fetchall=lambda: existing),
+            Mock(rowcount=2),
+        ]
+
+        candidates_df = pd.DataFrame(
+            [
+                {"primary_key": "key1", "value": "value1"},
+                {"primary_key": "key2", "value": "value2"},
+            ]
+        )
+
+        inserted = service.backfill_table(
+            candidates_df, config, mock_conn, add_tracking_fields=False
+        )
+
+        assert inserted == 0
+        assert mock_conn.execute.call_count == 3
+        update_call = mock_conn.execute.call_args_list[2]
+        assert "COALESCE" in update_call.args[0].text
+        assert len(update_call.args[1]) == 2
+
     def test_derive_candidates_filters_blank_strings(self):
         """Blank strings should be treated as missing values."""
         service = GenericBackfillService("test_domain")
@@ -766,6 +812,50 @@ class TestMaxByAggregation:
         candidates = service.derive_candidates(df, config)
         assert candidates.iloc[0]["主拓代码"] == "ORG-C"
 
+    def test_max_by_interleaved_groups_keep_first_of_ties(self):
+        """Winners are per group; ties keep the earliest row."""
+        service = GenericBackfillService("test_domain")
+
+        config = ForeignKeyConfig(
+            name="fk_plan",
+            source_column="计划代码",
+            target_table="年金计划",
+            target_key="年金计划号",
+            backfill_columns=[
+                BackfillColumnMapping(source="计划代码", target="年金计划号"),
+                BackfillColumnMapping(
+                    source="机构代码",
+                    target="主拓代码",
+                    aggregation=AggregationConfig(
+                        type="max_by", order_column="期末资产规模"
+                    ),
+                ),
+                BackfillColumnMapping(
+                    source="机构名称",
+                    target="主拓机构",
+                    aggregation=AggregationConfig(
+                        type="max_by", order_column="期末资产规模"
+                    ),
+                ),
+            ],
+        )
+
+        df = pd.DataFrame(
+            {
+                "计划代码": ["P002", "P001", "P002", "P001", "P001"],
+                "机构代码": ["B1", "A1", "B2", "A2", "A3"],
+                "机构名称": ["乙一", "甲一", "乙二", "甲二", "甲三"],
+                # P002 has no numeric value: falls back to its first row
+                "期末资产规模": [None, 10.0, "n/a", 30.0, 30.0],
+            }
+        )
+
+        candidates = service.derive_candidates(df, config)
+
+        assert candidates["年金计划号"].tolist() == ["P002", "P001"]
+        assert candidates["主拓代码"].tolist() == ["B1", "A2"]
+        assert candidates["主拓机构"].tolist() == ["乙一", "甲二"]
+
 
 class TestConcatDistinctAggregation:
     """Test concat_distinct aggregation strategy."""
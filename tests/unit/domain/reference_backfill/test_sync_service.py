@@ -4,6 +4,9 @@ Unit tests for ReferenceSyncService.
 Tests the core sync logic, tracking fields, and sync modes.
 """
 
+import threading
+from contextlib import contextmanager
+
 import pytest
 import pandas as pd
 from unittest.mock import Mock, MagicMock, patch
@@ -14,7 +17,9 @@ from work_data_hub.domain.reference_backfill.sync_service import (
     SyncResult,
     DataSourceAdapter,
 )
+from work_data_hub.domain.reference_backfill.sync_waves import plan_sync_waves
 from work_data_hub.domain.reference_backfill.sync_models import (
+    ReferenceSyncConfig,
     ReferenceSyncTableConfig,
 )
 
@@ -363,3 +368,237 @@ class TestSyncResult:
 
         assert result.error == "Connection failed"
         assert result.rows_synced == 0
+
+
+def _table_config(name, depends_on=()):
+    return ReferenceSyncTableConfig(
+        name=name,
+        target_table=name,
+        source_type="legacy_mysql",
+        source_config={"table": name},
+        primary_key="id",
+        depends_on=list(depends_on),
+    )
+
+
+class TestConcurrentSyncAll:
+    """Test suite for dependency waves and concurrent table sync."""
+
+    def test_plan_sync_waves_orders_dependencies(self):
+        """Tables land in the first wave after their dependencies."""
+        configs = [
+            _table_config("portfolio", depends_on=["plan"]),
+            _table_config("plan"),
+            _table_config("org"),
+            _table_config("detail", depends_on=["portfolio", "external"]),
+        ]
+
+        waves = plan_sync_waves(configs)
+
+        assert [[c.name for c in wave] for wave in waves] == [
+            ["plan", "org"],
+            ["portfolio"],
+            ["detail"],
+        ]
+
+    def test_plan_sync_waves_rejects_cycles(self):
+        """Circular dependencies are reported instead of looping."""
+        configs = [
+            _table_config("a", depends_on=["b"]),
+            _table_config("b", depends_on=["a"]),
+        ]
+
+        with pytest.raises(ValueError, match="Circular depends_on"):
+            plan_sync_waves(configs)
+
+    def test_config_rejects_unknown_dependency(self):
+        """depends_on must name another table sync."""
+        with pytest.raises(ValueError, match="unknown syncs"):
+            ReferenceSyncConfig(tables=[_table_config("a", depends_on=["missing"])])
+
+    def test_sync_all_runs_wave_concurrently_on_own_connections(self, sample_data):
+        """Independent tables overlap, each on its own connection."""
+        service = ReferenceSyncService()
+        barrier = threading.Barrier(2, timeout=5)
+        fetched = []
+        opened = []
+
+        class Adapter:
+            def fetch_data(self, table_config, state=None):
+                if table_config.name in ("plan", "org"):
+                    barrier.wait()  # Both wave-0 tables are in flight at once
+                fetched.append(table_config.name)
+                return sample_data
+
+        @contextmanager
+        def connection_factory():
+            worker_conn = MagicMock()
+            opened.append(worker_conn)
+            yield worker_conn
+
+        configs = [
+            _table_config("portfolio", depends_on=["plan"]),
+            _table_config("plan"),
+            _table_config("org"),
+        ]
+        main_conn = MagicMock()
+
+        results = service.sync_all(
+            configs,
+            {"legacy_mysql": Adapter()},
+            main_conn,
+            plan_only=True,
+            concurrency=3,
+            connection_factory=connection_factory,
+        )
+
+        assert [r.table for r in results] == ["portfolio", "plan", "org"]
+        assert [r.wave for r in results] == [1, 0, 0]
+        assert all(r.error is None for r in results)
+        assert fetched[-1] == "portfolio"
+        assert len(opened) == 3
+        main_conn.execute.assert_not_called()
+
+    def test_sync_all_reports_connection_failures_per_table(self, sample_data):
+        """A worker that cannot get a connection fails only its table."""
+        service = ReferenceSyncService()
+        adapter = Mock(spec=DataSourceAdapter)
+        adapter.fetch_data.return_value = sample_data
+
+        def connection_factory():
+            raise RuntimeError("pool exhausted")
+
+        results = service.sync_all(
+            [_table_config("plan"), _table_config("org")],
+            {"legacy_mysql": adapter},
+            MagicMock(),
+            concurrency=2,
+            connection_factory=connection_factory,
+        )
+
+        assert [r.error for r in results] == ["pool exhausted"] * 2
+        assert all(r.duration_seconds >= 0 for r in results)
+        adapter.fetch_data.assert_not_called()
+
+
+class TestStreamingSync:
+    """Test suite for chunked sync of streaming-enabled tables."""
+
+    class StreamingAdapter:
+        def __init__(self, chunks):
+            self.chunks = chunks
+            self.batch_size = None
+
+        def fetch_data(self, table_config, state=None):
+            raise AssertionError("streaming tables must not fetch in full")
+
+        def fetch_batches(self, table_config, state=None, batch_size=5000):
+            self.batch_size = batch_size
+            yield from self.chunks
+
+    def test_upsert_writes_each_chunk(self, sample_config, sample_data):
+        """Each streamed chunk is upserted as it arrives."""
+        service = ReferenceSyncService(enable_audit_logging=False)
+        config = sample_config.model_copy(update={"streaming": True})
+        adapter = self.StreamingAdapter([sample_data[:2], sample_data[2:]])
+        upserted = []
+        service._sync_upsert = lambda df, *_, **__: upserted.append(df) or len(df)
+
+        result = service.sync_table(
+            config, adapter, MagicMock(), default_batch_size=1000
+        )
+
+        assert [len(df) for df in upserted] == [2, 1]
+        assert all(df["_source"].eq("authoritative").all() for df in upserted)
+        assert result.rows_synced == 3
+        assert adapter.batch_size == 1000
+
+    def test_delete_insert_commits_chunks_once(self, sample_config, sample_data):
+        """Delete and every chunk insert share a single transaction."""
+        service = ReferenceSyncService(enable_audit_logging=False)
+        config = sample_config.model_copy(
+            update={"streaming": True, "sync_mode": "delete_insert"}
+        )
+        adapter = self.StreamingAdapter([sample_data[:2], sample_data[2:]])
+        conn = MagicMock()
+        trans = MagicMock()
+        conn.begin.return_value = trans
+        conn.execute.side_effect = lambda query, params=None: MagicMock(
+            rowcount=len(params) if params else 4
+        )
+
+        result = service.sync_table(config, adapter, conn)
+
+        statements = [str(c.args[0]).strip() for c in conn.execute.call_args_list]
+        assert statements[0].startswith("DELETE")
+        assert sum(s.startswith("INSERT") for s in statements) == 2
+        assert (result.rows_deleted, result.rows_synced) == (4, 3)
+        trans.commit.assert_called_once()
+        conn.commit.assert_not_called()
+
+    def test_empty_stream_leaves_table_untouched(self, sample_config):
+        """No chunks means no delete, just like an empty full fetch."""
+        service = ReferenceSyncService()
+        config = sample_config.model_copy(
+            update={"streaming": True, "sync_mode": "delete_insert"}
+        )
+        conn = MagicMock()
+
+        result = service.sync_table(config, self.StreamingAdapter([]), conn)
+
+        assert result.rows_synced == 0
+        conn.execute.assert_not_called()
+
+
+class TestStagedUpsert:
+    """Test suite for the COPY + staging-table upsert (load_method: copy)."""
+
+    def test_upsert_merges_staging_table_in_one_statement(
+        self, sample_config, sample_data, mock_connection
+    ):
+        """Rows are copied to a temp table and merged with RETURNING keys."""
+        service = ReferenceSyncService()
+        config = sample_config.model_copy(update={"load_method": "copy"})
+        df = service._add_authoritative_tracking_fields(sample_data)
+        cursor = mock_connection.connection.dbapi_connection.cursor.return_value
+        cursor.rowcount = 3
+        merge_result = MagicMock()
+        merge_result.fetchall.return_value = [("A001", True), ("A002", False)]
+        mock_connection.execute.side_effect = [MagicMock(), merge_result]
+
+        with patch(
+            "work_data_hub.domain.reference_backfill.observability."
+            "ReferenceDataAuditLogger"
+        ) as audit_cls:
+            rows = service._sync_upsert(df, config, mock_connection, batch_size=1000)
+
+        create_sql, merge_sql = (
+            str(c.args[0]) for c in mock_connection.execute.call_args_list
+        )
+        stage = create_sql.split('"')[1]
+        assert create_sql.startswith(f'CREATE TEMP TABLE "{stage}" ON COMMIT DROP')
+        copy_sql = cursor.copy_expert.call_args.args[0]
+        assert copy_sql.startswith(f'COPY "{stage}" ("id","name","type"')
+        assert 'ON CONFLICT ("id") DO UPDATE' in merge_sql
+        assert merge_sql.endswith('RETURNING "id", (xmax = 0) AS inserted')
+        assert " IN (" not in merge_sql
+        assert rows == 2
+        audit = audit_cls.return_value
+        assert audit.log_insert.call_args.kwargs["record_key"] == "A001"
+        assert audit.log_update.call_args.kwargs["record_key"] == "A002"
+        mock_connection.commit.assert_called_once()
+
+    def test_copy_falls_back_to_statements_off_postgres(
+        self, sample_config, sample_data, mock_connection
+    ):
+        """Non-PostgreSQL targets keep the statement-based upsert."""
+        service = ReferenceSyncService(enable_audit_logging=False)
+        config = sample_config.model_copy(update={"load_method": "copy"})
+        mock_connection.dialect.name = "mysql"
+
+        service._sync_upsert(sample_data, config, mock_connection, batch_size=1000)
+
+        assert "ON DUPLICATE KEY UPDATE" in str(
+            mock_connection.execute.call_args.args[0]
+        )
+        mock_connection.connection.dbapi_connection.cursor.assert_not_called()
@@ -0,0 +1,197 @@
+"""Parity tests: compiled/memoized normalize_customer_name vs the legacy body.
+
+``_legacy_normalize`` is a frozen copy of the per-call-regex implementation the
+compiled version replaced. Outputs must stay byte-identical on historical
+names and on generated marker/bracket/whitespace combinations.
+"""
+
+import itertools
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from work_data_hub.infrastructure.cleansing.constants import (
+    FULLWIDTH_CHAR_END,
+    FULLWIDTH_CHAR_START,
+    FULLWIDTH_TO_HALFWIDTH_OFFSET,
+)
+from work_data_hub.infrastructure.cleansing.normalizers import (
+    ENTERPRISE_TYPES,
+    INVALID_PLACEHOLDERS,
+    PROTECTED_NAMES,
+    STATUS_MARKERS,
+    normalize_customer_name,
+    normalize_customer_names,
+)
+
+GOLDEN_PARQUET = (
+    Path(__file__).parents[4]
+    / "fixtures"
+    / "annuity_performance"
+    / "golden_legacy.parquet"
+)
+
+HISTORICAL_NAMES = [
+    "中国平安",
+    "中国平安-已转出",
+    "(原)中国平安",
+    "（原）中国平安保险（集团）股份有限公司",
+    "已转出-中国平安",
+    "中国平安——待转出",
+    "中国平安（已转出）",
+    "中国平安(保留账户)",
+    "  ABC  公司  ",
+    "ＡＢＣ公司（普通合伙）",
+    "「中国人寿」",
+    "『中国人寿』保险股份有限公司",
+    '"中国石化"',
+    "中国石油及下属子企业",
+    "中国石化(团托)",
+    "中国石化（团托）",
+    "华为技术有限公司-ChinaHolding",
+    "华为技术有限公司-BSU280",
+    "国网江苏省电力公司-养老",
+    "国网江苏省电力公司-福利",
+    "北京市（贰号）职业年金计划",
+    "湖北省（肆号）职业年金计划",
+    "XX公司（企业年金计划）",
+    "保留账户管理",
+    "保留账户管理-已转出",
+    "公司（集团）",
+    "中心（另一个名字）",
+    "深圳市某某投资合伙企业（有限合伙）",
+    "某某会计师事务所（特殊普通合伙）",
+    "中国平安。",
+    "中国平安-",
+    "中国平安（）",
+    "中国\t平安\n公司",
+    "中国　平安",
+    "China Life",
+    "原存量-转移终止-某某集团",
+    "某某集团-已转移终止（本部）",
+    "null",
+    " - ",
+    "",
+]
+
+
+def _legacy_normalize(name):
+    """Frozen pre-compilation implementation (do not optimise)."""
+    if name is None or not isinstance(name, str):
+        return ""
+    name_upper = name.strip().upper()
+    if name_upper in {n.upper() for n in PROTECTED_NAMES}:
+        return name_upper
+    if name.strip() in INVALID_PLACEHOLDERS:
+        return ""
+
+    result = name.replace("　", " ")
+    result = re.sub(r"\s+", "", result)
+    for char in '「」『』"':
+        result = result.replace(char, "")
+    result = re.sub(r"^[（\(][^）\)]*[）\)]", "", result)
+    result = re.sub(r"及下属子企业", "", result)
+    result = re.sub(
+        r"(?:\(团托\)|（团托）|-[A-Za-z][A-Za-z0-9]*|-\d+|-养老|-福利)$", "", result
+    )
+    for marker in sorted(STATUS_MARKERS, key=len, reverse=True):
+        result = re.sub(rf"^[\(\（]?{re.escape(marker)}[\)\）]?[\-]?", "", result)
+        result = re.sub(rf"[—\-\(\（]{re.escape(marker)}[\)\）]?$", "", result)
+        result = re.sub(rf"[\(\（]{re.escape(marker)}[\)\）]$", "", result)
+
+    match = re.search(r"[（\(]([^）\)]+)[）\)]$", result)
+    if match:
+        content = match.group(1)
+        if not any(etype in content for etype in ENTERPRISE_TYPES):
+            result = result[: match.start()]
+
+    result = "".join(
+        chr(ord(char) - FULLWIDTH_TO_HALFWIDTH_OFFSET)
+        if FULLWIDTH_CHAR_START <= ord(char) <= FULLWIDTH_CHAR_END
+        else char
+        for char in result
+    )
+    result = result.replace("(", "（").replace(")", "）")
+    result = re.sub(r"[—\-\.。]+$", "", result)
+    result = re.sub(r"（）$", "", result)
+    result = re.sub(r"[—\-]+$", "", result)
+    return result.upper()
+
+
+def _generated_names():
+    bases = ["中国平安", "ＡＢＣ有限公司", "某某集团（普通合伙）"]
+    forms = [
+        "{m}-{b}",
+        "({m}){b}",
+        "（{m}）{b}",
+        "{b}-{m}",
+        "{b}——{m}",
+        "{b}({m})",
+        "{b}（{m}）",
+        "{b}（{m}",
+        "{b} - {m} ",
+        "{b}-{m}（{m2}）",
+        "{m}{m2}-{b}-{m2}",
+    ]
+    markers = STATUS_MARKERS + ["集团", "团托", "ChinaHolding"]
+    for base, form, marker in itertools.product(bases, forms, markers):
+        yield form.format(b=base, m=marker, m2="已转出")
+        yield form.format(b=base, m=marker, m2=marker)
+
+
+def _golden_names():
+    if not GOLDEN_PARQUET.exists():
+        return []
+    frame = pd.read_parquet(GOLDEN_PARQUET, columns=["客户名称"])
+    return frame["客户名称"].dropna().unique().tolist()
+
+
+@pytest.mark.unit
+def test_byte_identical_to_legacy_implementation():
+    names = HISTORICAL_NAMES + _golden_names() + list(_generated_names())
+    names += INVALID_PLACEHOLDERS + [f" {value} " for value in INVALID_PLACEHOLDERS]
+
+    mismatches = [
+        (name, normalize_customer_name(name), _legacy_normalize(name))
+        for name in names
+        if normalize_customer_name(name) != _legacy_normalize(name)
+    ]
+
+    assert len(names) > 3000
+    assert mismatches == []
+
+
+@pytest.mark.unit
+def test_repeated_calls_are_memoized():
+    normalize_customer_name("中国平安-已转出")
+    from work_data_hub.infrastructure.cleansing.normalizers import customer_name
+
+    before = customer_name._normalize_str.cache_info().hits
+    assert normalize_customer_name("中国平安-已转出") == "中国平安"
+    assert customer_name._normalize_str.cache_info().hits == before + 1
+
+
+@pytest.mark.unit
+def test_bulk_api_matches_scalar_function():
+    names = pd.Series(
+        ["中国平安-已转出", None, "中国平安-已转出", np.nan, 123, "abc公司", "null"],
+        index=[10, 11, 12, 13, 14, 15, 16],
+        name="客户名称",
+    )
+
+    result = normalize_customer_names(names)
+
+    expected = names.map(normalize_customer_name)
+    pd.testing.assert_series_equal(result, expected.astype(object))
+    assert result.tolist() == ["中国平安", "", "中国平安", "", "", "ABC公司", ""]
+
+
+@pytest.mark.unit
+def test_bulk_api_handles_empty_series():
+    result = normalize_customer_names(pd.Series([], dtype=object, name="客户名称"))
+
+    assert result.empty
+    assert result.name == "客户名称"
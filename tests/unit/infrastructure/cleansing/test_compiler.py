@@ -0,0 +1,212 @@
+"""Tests for compiled cleansing rule chains (cleansing.compiler)."""
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import work_data_hub.infrastructure.cleansing  # noqa: F401  (registers rules)
+from work_data_hub.infrastructure.cleansing.compiler import compile_rule_chain
+from work_data_hub.infrastructure.cleansing.registry import registry
+
+MIXED_VALUES = [
+    "  中国平安-已转出 ",
+    "中国平安-已转出",
+    "　ABC公司　",
+    "¥1,234.50",
+    " $ 1 000 ",
+    "￥2,000万元",
+    "12.5%",
+    "１２％",
+    "-",
+    " N/A ",
+    "NULL",
+    "null",
+    "",
+    "暂无",
+    "0.035",
+    "350",
+    "2024年11月",
+    None,
+    np.nan,
+    1,
+    1.5,
+    True,
+    Decimal("3.25"),
+    date(2024, 11, 1),
+    datetime(2024, 11, 1, 8, 30),
+]
+
+# Rules that legitimately raise on some MIXED_VALUES are exercised separately
+CHAINS = [
+    ["trim_whitespace"],
+    ["trim_whitespace", "normalize_company_name"],
+    ["standardize_null_values"],
+    ["remove_currency_symbols", "clean_comma_separated_number"],
+    ["standardize_null_values", "remove_currency_symbols", "trim_whitespace"],
+    [
+        "remove_currency_symbols",
+        "clean_comma_separated_number",
+        "convert_chinese_amount_units",
+    ],
+    ["trim_whitespace", "parse_chinese_date_value"],
+]
+
+
+def _reference(series: pd.Series, specs, **common_kwargs) -> pd.Series:
+    return series.apply(
+        lambda value: registry.apply_rules(value, specs, **common_kwargs)
+    )
+
+
+def _assert_same(actual: pd.Series, expected: pd.Series) -> None:
+    pd.testing.assert_series_equal(actual, expected)
+    # assert_series_equal treats None and NaN alike in object columns
+    assert [type(value) for value in actual] == [type(value) for value in expected]
+
+
+@pytest.mark.unit
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("specs", CHAINS, ids=lambda specs: "+".join(specs))
+def test_apply_series_matches_per_cell_apply_rules(specs):
+    series = pd.Series(MIXED_VALUES * 3, name="col", index=range(100, 175))
+    chain = compile_rule_chain(specs)
+
+    _assert_same(chain.apply_series(series), _reference(series, specs))
+    assert chain(MIXED_VALUES[0]) == registry.apply_rules(MIXED_VALUES[0], specs)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("field_name", ["", "当期收益率"])
+def test_percentage_chain_matches_per_cell(field_name):
+    specs = [
+        "remove_currency_symbols",
+        "clean_comma_separated_number",
+        "handle_percentage_conversion",
+    ]
+    series = pd.Series(["12.5%", "１２％", "350", "0.035", None, 250.0, 0.5, "-"])
+    chain = compile_rule_chain(specs, common_kwargs={"field_name": field_name})
+
+    expected = _reference(series, specs, field_name=field_name)
+    _assert_same(chain.apply_series(series), expected)
+
+
+@pytest.mark.unit
+def test_result_dtype_is_inferred_like_series_apply():
+    floats = pd.Series(["1.5%", "20%", None])
+    chain = compile_rule_chain(["handle_percentage_conversion"])
+
+    result = chain.apply_series(floats)
+
+    assert result.dtype == "float64"
+    ints = pd.Series([1, 2, 3])
+    assert compile_rule_chain(["trim_whitespace"]).apply_series(ints).dtype == "int64"
+
+
+@pytest.mark.unit
+def test_invalid_percentage_raises_value_error():
+    chain = compile_rule_chain(["handle_percentage_conversion"])
+
+    with pytest.raises(ValueError, match="Invalid percentage format"):
+        chain.apply_series(pd.Series(["abc%"]))
+
+
+@pytest.mark.unit
+def test_scalar_rules_run_once_per_distinct_string():
+    chain = compile_rule_chain(["parse_chinese_date_value"])
+    rule = chain.rules[0].rule
+    series = pd.Series(["2024年11月", "2024年11月", "202412", "2024年11月", None, None])
+
+    with patch.object(rule, "func", wraps=rule.func) as func:
+        result = chain.apply_series(series)
+
+    assert result.tolist()[:3] == [
+        date(2024, 11, 1),
+        date(2024, 11, 1),
+        date(2024, 12, 1),
+    ]
+    # two distinct strings + one call per non-string value
+    assert func.call_count == 4
+
+
+AMOUNT_VALUES = [
+    "1,000万元",
+    " 2亿 ",
+    "１２万",
+    "-3.5万",
+    "+.5亿元",
+    "N/A万",
+    "-万",
+    "约1.5万",
+    "万",
+    "1000",
+    "  ",
+    "",
+    None,
+    2.5,
+]
+
+
+@pytest.mark.unit
+def test_amount_units_series_matches_per_cell():
+    series = pd.Series(AMOUNT_VALUES * 2, name="reg_cap")
+    specs = ["convert_chinese_amount_units"]
+
+    chain = compile_rule_chain(specs)
+
+    _assert_same(chain.apply_series(series), _reference(series, specs))
+
+
+@pytest.mark.unit
+def test_amount_units_series_raises_like_scalar_rule():
+    chain = compile_rule_chain(["convert_chinese_amount_units"])
+
+    with pytest.raises(ValueError, match="1.2.3"):
+        chain.apply_series(pd.Series(["1万", "1.2.3万"]))
+
+
+DECIMAL_VALUES = [
+    "¥1,234.56785",
+    " $ 1 000 ",
+    "12.5%",
+    "１２％",
+    "-",
+    "N/A",
+    "",
+    "0.00005",
+    "1e3",
+    None,
+    1,
+    1.5,
+    0.1 + 0.2,
+    -2.675,
+    Decimal("3.14159"),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("field_name", ["", "期末资产规模", "当期收益率", "fund_scale"])
+def test_comprehensive_decimal_cleaning_series_matches_per_cell(field_name):
+    series = pd.Series(DECIMAL_VALUES * 2, index=range(50, 80))
+    specs = ["comprehensive_decimal_cleaning"]
+    chain = compile_rule_chain(specs, common_kwargs={"field_name": field_name})
+
+    expected = _reference(series, specs, field_name=field_name)
+    _assert_same(chain.apply_series(series), expected)
+
+
+@pytest.mark.unit
+def test_comprehensive_decimal_cleaning_series_reports_original_value():
+    chain = compile_rule_chain(["comprehensive_decimal_cleaning"])
+
+    with pytest.raises(ValueError, match="Invalid numeric value for field '': ¥12abc"):
+        chain.apply_series(pd.Series(["1", "¥12abc"]))
+
+
+@pytest.mark.unit
+def test_unknown_rule_fails_at_compile_time():
+    with pytest.raises(ValueError, match="not registered"):
+        compile_rule_chain(["no_such_rule"])
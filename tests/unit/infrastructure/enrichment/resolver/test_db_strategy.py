@@ -0,0 +1,179 @@
+"""Tests for set-based enrichment_index resolution (db_strategy)."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from work_data_hub.infrastructure.cleansing.normalizers import (
+    normalize_customer_name,
+)
+from work_data_hub.infrastructure.enrichment.resolver.db_strategy import (
+    resolve_via_db_cache,
+)
+from work_data_hub.infrastructure.enrichment.types import (
+    EnrichmentIndexRecord,
+    LookupType,
+    ResolutionStatistics,
+    ResolutionStrategy,
+    SourceType,
+)
+
+PRIORITY = [
+    (LookupType.PLAN_CODE, "plan_code", "DB-P1"),
+    (LookupType.CUSTOMER_NAME, "customer_name", "DB-P2"),
+    (LookupType.PLAN_CUSTOMER, "plan_customer", "DB-P3"),
+    (LookupType.FORMER_NAME, "former_name", "DB-P4"),
+]
+SENTINELS = {"N", "NA", "N/A", "NONE", "NULL", "NAN"}
+
+
+def _record(lookup_type: LookupType, key: str, company_id: str):
+    return EnrichmentIndexRecord(
+        lookup_key=key,
+        lookup_type=lookup_type,
+        company_id=company_id,
+        source=SourceType.YAML,
+    )
+
+
+def _row_by_row_reference(df, mask, strategy, results):
+    """Row-at-a-time priority walk the set-based version must reproduce."""
+    resolved = pd.Series(pd.NA, index=df.index, dtype=object)
+    hits = {label: 0 for _, label, _ in PRIORITY}
+    paths, used = {}, []
+    for idx in df[mask].index:
+        plan = df.loc[idx].get(strategy.plan_code_column)
+        name = df.loc[idx].get(strategy.customer_name_column)
+        normalized = normalize_customer_name(str(name)) if pd.notna(name) else ""
+        candidates = {
+            LookupType.PLAN_CODE: str(plan) if pd.notna(plan) else None,
+            LookupType.CUSTOMER_NAME: normalized or None,
+            LookupType.PLAN_CUSTOMER: (
+                f"{plan}|{normalized}" if pd.notna(plan) and normalized else None
+            ),
+            LookupType.FORMER_NAME: normalized or None,
+        }
+        segments = []
+        for lookup_type, label, path_label in PRIORITY:
+            key = candidates[lookup_type]
+            record = results.get((lookup_type, key)) if key else None
+            if record is None:
+                segments.append(f"{path_label}:MISS")
+                continue
+            company_id = str(record.company_id).strip()
+            if not company_id or company_id.upper() in SENTINELS:
+                segments.append(f"{path_label}:INVALID")
+                continue
+            resolved.loc[idx] = company_id
+            hits[label] += 1
+            used.append((lookup_type, key))
+            segments.append(f"{path_label}:HIT")
+            break
+        paths[idx] = "→".join(segments)
+    return resolved, hits, paths, used
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(7)
+    size = 400
+    plans = np.array(["P1", "P2", "P3", "P4", None], dtype=object)
+    names = np.array(
+        ["公司A", " 公司A-已转出", "公司B", "公司C（集团）", "", None, 123],
+        dtype=object,
+    )
+    return pd.DataFrame(
+        {
+            "计划代码": plans[rng.integers(0, len(plans), size)],
+            "客户名称": names[rng.integers(0, len(names), size)],
+            "company_id": np.where(rng.random(size) < 0.2, "KNOWN", None),
+        },
+        index=pd.RangeIndex(1000, 1000 + size),
+    )
+
+
+@pytest.fixture
+def lookup_results():
+    return {
+        (LookupType.PLAN_CODE, "P1"): _record(LookupType.PLAN_CODE, "P1", "C_P1"),
+        (LookupType.PLAN_CODE, "P2"): _record(LookupType.PLAN_CODE, "P2", " n/a "),
+        (LookupType.CUSTOMER_NAME, "公司A"): _record(
+            LookupType.CUSTOMER_NAME, "公司A", "C_A"
+        ),
+        (LookupType.CUSTOMER_NAME, "公司B"): _record(
+            LookupType.CUSTOMER_NAME, "公司B", "NULL"
+        ),
+        (LookupType.PLAN_CUSTOMER, "P3|公司B"): _record(
+            LookupType.PLAN_CUSTOMER, "P3|公司B", "C_P3B"
+        ),
+        (LookupType.FORMER_NAME, "公司C"): _record(
+            LookupType.FORMER_NAME, "公司C", "C_FORMER"
+        ),
+        (LookupType.CUSTOMER_NAME, "123"): _record(
+            LookupType.CUSTOMER_NAME, "123", "C_NUM"
+        ),
+    }
+
+
+@pytest.mark.unit
+def test_matches_row_by_row_priority_walk(frame, lookup_results):
+    strategy = ResolutionStrategy()
+    mask = frame["company_id"].isna()
+    repo = MagicMock()
+    repo.lookup_enrichment_index_batch.return_value = lookup_results
+    stats = ResolutionStatistics()
+
+    resolved, hits = resolve_via_db_cache(frame, mask, strategy, stats, repo)
+
+    exp_resolved, exp_hits, exp_paths, exp_used = _row_by_row_reference(
+        frame, mask, strategy, lookup_results
+    )
+    pd.testing.assert_series_equal(resolved, exp_resolved)
+    assert hits == exp_hits
+    expected_counts = pd.Series(list(exp_paths.values())).value_counts().to_dict()
+    assert stats.db_decision_path_counts == expected_counts
+    assert [call.args for call in repo.update_hit_count.call_args_list] == [
+        (key, lookup_type) for lookup_type, key in exp_used
+    ]
+    # Every outcome kind is exercised by the fixture
+    joined = "".join(exp_paths.values())
+    for outcome in ("DB-P1:HIT", "DB-P1:INVALID", "DB-P2:INVALID", "DB-P3:HIT"):
+        assert outcome in joined
+    assert "DB-P4:HIT" in joined
+
+
+@pytest.mark.unit
+def test_requested_keys_are_deduplicated_and_normalized(frame, lookup_results):
+    repo = MagicMock()
+    repo.lookup_enrichment_index_batch.return_value = lookup_results
+
+    resolve_via_db_cache(
+        frame, frame["company_id"].isna(), ResolutionStrategy(), None, repo
+    )
+
+    (keys_by_type,), _ = repo.lookup_enrichment_index_batch.call_args
+    assert sorted(keys_by_type[LookupType.PLAN_CODE]) == ["P1", "P2", "P3", "P4"]
+    assert sorted(keys_by_type[LookupType.CUSTOMER_NAME]) == [
+        "123",
+        "公司A",
+        "公司B",
+        "公司C",
+    ]
+    assert "P1|公司A" in keys_by_type[LookupType.PLAN_CUSTOMER]
+    assert LookupType.FORMER_NAME not in keys_by_type
+
+
+@pytest.mark.unit
+def test_no_keys_skips_lookup():
+    df = pd.DataFrame({"计划代码": [None], "客户名称": ["  "]})
+    repo = MagicMock()
+
+    resolved, hits = resolve_via_db_cache(
+        df, pd.Series([True]), ResolutionStrategy(), None, repo
+    )
+
+    repo.lookup_enrichment_index_batch.assert_not_called()
+    assert resolved.isna().all()
+    assert sum(hits.values()) == 0
@@ -0,0 +1,190 @@
+"""
+Unit tests for concurrent EQC lookups (EqcProvider.lookup_many).
+
+Covers exact budget accounting with several requests in flight, per-request
+raw payload isolation, the shared transport rate limiter and merging results
+back to every row of a de-duplicated name.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from work_data_hub.infrastructure.enrichment.eqc_lookup_config import (
+    EqcLookupConfig,
+)
+from work_data_hub.infrastructure.enrichment.eqc_provider import EqcProvider
+from work_data_hub.infrastructure.enrichment.resolver.eqc_strategy import (
+    resolve_via_eqc_sync,
+)
+from work_data_hub.infrastructure.enrichment.types import ResolutionStrategy
+from work_data_hub.io.connectors.eqc_client import (
+    EQCAuthenticationError,
+    EQCClient,
+)
+
+
+class SlowClient:
+    """EQC client stub that records concurrency and echoes the query."""
+
+    def __init__(self, delay: float = 0.05, fail_on: str = "") -> None:
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def search_company_with_raw(self, name):
+        with self._lock:
+            self.calls.append(name)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if name == self.fail_on:
+                raise EQCAuthenticationError("expired")
+            return (
+                [SimpleNamespace(company_id=f"ID-{name}", official_name=name)],
+                {"list": [{"companyId": f"ID-{name}"}]},
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def get_business_info_with_raw(self, company_id):
+        time.sleep(self.delay / 2)
+        return None, {"company_id": company_id}
+
+    def get_label_info_with_raw(self, company_id):
+        return None, {"labels": company_id}
+
+
+@pytest.fixture
+def provider() -> EqcProvider:
+    with patch(
+        "work_data_hub.infrastructure.enrichment.eqc_provider.get_settings"
+    ) as mock_settings:
+        mock_settings.return_value.eqc_token = ""
+        mock_settings.return_value.eqc_base_url = "https://eqc.test.com"
+        mock_settings.return_value.company_sync_lookup_limit = 5
+        mock_settings.return_value.eqc_rate_limit = 10
+
+        provider = EqcProvider(
+            token="test_token_12345678901234567890",
+            budget=6,
+            base_url="https://eqc.test.com",
+        )
+    provider.client = SlowClient()
+    return provider
+
+
+class TestLookupMany:
+    def test_budget_is_exact_with_requests_in_flight(self, provider) -> None:
+        names = [f"公司{i}" for i in range(10)]
+
+        start = time.perf_counter()
+        results = provider.lookup_many(names, max_workers=4)
+        elapsed = time.perf_counter() - start
+
+        assert set(results) == set(names[:6])
+        assert all(results[name].company_id == f"ID-{name}" for name in results)
+        assert provider.remaining_budget == 0
+        assert len(provider.client.calls) == 6
+        assert 1 < provider.client.max_in_flight <= 4
+        # 6 serial lookups would take >= 6 * 0.075s
+        assert elapsed < 6 * 0.075
+
+    def test_results_are_cached_on_calling_thread_with_own_payloads(
+        self, provider
+    ) -> None:
+        provider.mapping_repository = object()
+        cached = []
+
+        def record(company_name, result, raw_json):
+            cached.append(
+                (
+                    company_name,
+                    result.company_id,
+                    provider._raw_business_info["company_id"],
+                    provider._raw_biz_label["labels"],
+                    threading.current_thread() is threading.main_thread(),
+                )
+            )
+
+        with patch.object(provider, "_cache_result", side_effect=record):
+            provider.lookup_many(["甲", "乙", "丙", "丁"], max_workers=3)
+
+        assert sorted(cached) == [
+            (name, f"ID-{name}", f"ID-{name}", f"ID-{name}", True)
+            for name in sorted(["甲", "乙", "丙", "丁"])
+        ]
+
+    def test_unauthorized_stops_new_submissions(self, provider) -> None:
+        provider.client = SlowClient(fail_on="公司0")
+        provider.budget = provider.remaining_budget = 20
+
+        results = provider.lookup_many([f"公司{i}" for i in range(20)], max_workers=2)
+
+        assert results["公司0"] is None
+        # At most the other in-flight request completes after the 401
+        assert len(provider.client.calls) <= 2
+        assert provider.remaining_budget == 20 - len(provider.client.calls)
+
+    def test_serial_mode_matches_lookup(self, provider) -> None:
+        progress = []
+
+        results = provider.lookup_many(
+            ["甲", "乙"], max_workers=1, on_result=lambda n, r: progress.append(n)
+        )
+
+        assert progress == ["甲", "乙"]
+        assert provider.client.max_in_flight == 1
+        assert results["乙"].company_id == "ID-乙"
+        assert provider.remaining_budget == 4
+
+
+def test_transport_rate_limit_is_shared_across_threads() -> None:
+    client = EQCClient(
+        token="test_token_12345678901234567890", rate_limit=3, rate_limit_window=1
+    )
+    granted: list = []
+    lock = threading.Lock()
+
+    def acquire():
+        client._acquire_rate_slot()
+        with lock:
+            granted.append(time.time())
+
+    threads = [threading.Thread(target=acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    granted.sort()
+    # No sliding one-second window admits more than rate_limit requests
+    assert all(granted[i + 3] - granted[i] >= 1.0 for i in range(len(granted) - 3))
+
+
+def test_eqc_sync_merges_results_to_all_rows(provider) -> None:
+    df = pd.DataFrame({"客户名称": ["甲公司", " 甲公司", "乙公司", None, "丙公司"]})
+    mask = pd.Series(True, index=df.index)
+
+    resolved, hits, remaining = resolve_via_eqc_sync(
+        df,
+        mask,
+        ResolutionStrategy(),
+        EqcLookupConfig(enabled=True, sync_budget=2, sync_concurrency=3),
+        provider,
+        None,
+        None,
+    )
+
+    assert resolved.tolist() == ["ID-甲公司", "ID-甲公司", "ID-乙公司", pd.NA, pd.NA]
+    assert hits == 3
+    assert remaining == 0
@@ -0,0 +1,217 @@
+"""Tests for the local enrichment_index snapshot (index_snapshot)."""
+
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from work_data_hub.infrastructure.enrichment import (
+    CompanyIdResolver,
+    EqcLookupConfig,
+    ResolutionStrategy,
+)
+from work_data_hub.infrastructure.enrichment.index_snapshot import (
+    EnrichmentIndexSnapshot,
+    SnapshotMappingRepository,
+)
+from work_data_hub.infrastructure.enrichment.repository import (
+    CompanyMappingRepository,
+)
+from work_data_hub.infrastructure.enrichment.types import (
+    EnrichmentIndexRecord,
+    LookupType,
+    SourceType,
+)
+
+T0 = datetime(2025, 1, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def _row(lookup_type, key, company_id, updated_at=T0, **extra):
+    return {
+        "lookup_key": key,
+        "lookup_type": lookup_type.value,
+        "company_id": company_id,
+        "confidence": Decimal("0.90"),
+        "source": SourceType.EQC_API.value,
+        "source_domain": extra.get("source_domain"),
+        "source_table": None,
+        "hit_count": extra.get("hit_count", 0),
+        "last_hit_at": None,
+        "created_at": T0,
+        "updated_at": updated_at,
+    }
+
+
+class FakeConnection:
+    """Answers the snapshot's three queries from an in-memory table."""
+
+    def __init__(self, rows):
+        self.rows = {(row["lookup_type"], row["lookup_key"]): row for row in rows}
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        self.statements.append(sql)
+        result = MagicMock()
+        if sql.startswith("SELECT COUNT(*)"):
+            result.scalar_one.return_value = len(self.rows)
+            return result
+        rows = list(self.rows.values())
+        if params and "watermark" in params:
+            rows = [row for row in rows if row["updated_at"] >= params["watermark"]]
+        result.mappings.return_value.all.return_value = rows
+        return result
+
+
+@pytest.fixture
+def connection():
+    return FakeConnection(
+        [
+            _row(LookupType.PLAN_CODE, "FP0001", "C1", hit_count=3),
+            _row(LookupType.CUSTOMER_NAME, "中国平安", "C2", source_domain="annuity"),
+            _row(LookupType.PLAN_CUSTOMER, "FP0001|中国平安", "C3"),
+        ]
+    )
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    return EnrichmentIndexSnapshot(tmp_path / "snap" / "enrichment_index.arrow")
+
+
+@pytest.mark.unit
+def test_full_refresh_then_lookup_returns_db_equivalent_records(snapshot, connection):
+    assert snapshot.refresh(connection) == "full"
+
+    results = snapshot.lookup_batch(
+        {
+            LookupType.PLAN_CODE: ["FP0001", "FP9999"],
+            LookupType.CUSTOMER_NAME: ["中国平安"],
+            LookupType.FORMER_NAME: ["中国平安"],
+        }
+    )
+
+    assert set(results) == {
+        (LookupType.PLAN_CODE, "FP0001"),
+        (LookupType.CUSTOMER_NAME, "中国平安"),
+    }
+    expected = EnrichmentIndexRecord.from_dict(
+        _row(LookupType.CUSTOMER_NAME, "中国平安", "C2", source_domain="annuity")
+    )
+    assert results[(LookupType.CUSTOMER_NAME, "中国平安")] == expected
+    assert results[(LookupType.PLAN_CODE, "FP0001")].hit_count == 3
+    assert snapshot.stats.hits == 2
+    assert snapshot.stats.misses == 2
+    assert snapshot.metrics()["hit_rate"] == 0.5
+
+
+@pytest.mark.unit
+def test_incremental_refresh_merges_changed_rows(snapshot, connection):
+    snapshot.refresh(connection)
+    later = T0 + timedelta(hours=1)
+    connection.rows[("plan_code", "FP0001")] = _row(
+        LookupType.PLAN_CODE, "FP0001", "C1-NEW", updated_at=later
+    )
+    connection.rows[("plan_code", "FP0002")] = _row(
+        LookupType.PLAN_CODE, "FP0002", "C4", updated_at=later
+    )
+
+    assert snapshot.refresh(connection) == "incremental"
+
+    results = snapshot.lookup_batch({LookupType.PLAN_CODE: ["FP0001", "FP0002"]})
+    assert results[(LookupType.PLAN_CODE, "FP0001")].company_id == "C1-NEW"
+    assert results[(LookupType.PLAN_CODE, "FP0002")].company_id == "C4"
+    assert snapshot.row_count == 4
+    assert snapshot.watermark == later
+    assert "WHERE updated_at >= :watermark" in connection.statements[-2]
+
+
+@pytest.mark.unit
+def test_deleted_rows_trigger_full_rebuild(snapshot, connection):
+    snapshot.refresh(connection)
+    del connection.rows[("customer_name", "中国平安")]
+
+    assert snapshot.refresh(connection) == "full"
+    assert snapshot.lookup_batch({LookupType.CUSTOMER_NAME: ["中国平安"]}) == {}
+    assert snapshot.stats.full_refreshes == 2
+
+
+@pytest.mark.unit
+def test_snapshot_is_reloaded_from_disk_and_staleness_tracked(snapshot, connection):
+    snapshot.refresh(connection)
+    old = snapshot.path.stat().st_mtime - 3600
+    os.utime(snapshot.path, (old, old))
+
+    reopened = EnrichmentIndexSnapshot(snapshot.path, max_staleness_seconds=600)
+
+    assert reopened.load()
+    assert reopened.row_count == 3
+    assert reopened.staleness_seconds >= 3600
+    assert reopened.refresh_if_stale(connection) == "unchanged"
+    assert reopened.staleness_seconds < 600
+    assert reopened.refresh_if_stale(connection) == "fresh"
+
+
+@pytest.mark.unit
+def test_unrefreshed_snapshot_misses_everything(snapshot):
+    assert snapshot.lookup_batch({LookupType.PLAN_CODE: ["FP0001"]}) == {}
+    assert snapshot.staleness_seconds is None
+    assert snapshot.stats.misses == 1
+
+
+@pytest.mark.unit
+def test_repository_wrapper_forwards_only_misses(snapshot, connection):
+    snapshot.refresh(connection)
+    inner = MagicMock()
+    inner._normalize_lookup_key = CompanyMappingRepository._normalize_lookup_key
+    db_record = EnrichmentIndexRecord.from_dict(
+        _row(LookupType.CUSTOMER_NAME, "新公司", "C9")
+    )
+    inner.lookup_enrichment_index_batch.return_value = {
+        (LookupType.CUSTOMER_NAME, "新公司"): db_record
+    }
+    repo = SnapshotMappingRepository(inner, snapshot)
+
+    results = repo.lookup_enrichment_index_batch(
+        {
+            LookupType.PLAN_CODE: ["FP0001"],
+            LookupType.CUSTOMER_NAME: ["  新公司 ", "中国平安"],
+        }
+    )
+
+    inner.lookup_enrichment_index_batch.assert_called_once_with(
+        {LookupType.CUSTOMER_NAME: ["  新公司 "]}
+    )
+    assert results[(LookupType.PLAN_CODE, "FP0001")].company_id == "C1"
+    assert results[(LookupType.CUSTOMER_NAME, "中国平安")].company_id == "C2"
+    assert results[(LookupType.CUSTOMER_NAME, "新公司")] is db_record
+    # Everything else goes to the wrapped repository
+    repo.update_hit_count("FP0001", LookupType.PLAN_CODE)
+    inner.update_hit_count.assert_called_once_with("FP0001", LookupType.PLAN_CODE)
+
+
+@pytest.mark.unit
+def test_resolver_consults_snapshot_before_postgres(snapshot, connection):
+    inner = MagicMock()
+    inner.connection = connection
+    inner._normalize_lookup_key = CompanyMappingRepository._normalize_lookup_key
+    inner.lookup_enrichment_index_batch.return_value = {}
+    resolver = CompanyIdResolver(
+        eqc_config=EqcLookupConfig.disabled(),
+        yaml_overrides={},
+        mapping_repository=inner,
+        index_snapshot=snapshot,
+    )
+    df = pd.DataFrame({"计划代码": ["FP0001"], "客户名称": ["中国平安"]})
+
+    result = resolver.resolve_batch(df, ResolutionStrategy(generate_temp_ids=False))
+
+    assert result.data["company_id"].tolist() == ["C1"]
+    assert snapshot.stats.full_refreshes == 1
+    assert result.statistics.to_dict()["index_snapshot"]["hits"] >= 1
+    for call in inner.lookup_enrichment_index_batch.call_args_list:
+        (keys_by_type,), _ = call
+        assert LookupType.PLAN_CODE not in keys_by_type
@@ -4,7 +4,15 @@ import pandas as pd
 import pytest
 
 from work_data_hub.domain.pipelines.types import PipelineContext
-from work_data_hub.infrastructure.transforms import Pipeline, TransformStep
+from work_data_hub.infrastructure.transforms import (
+    CalculationStep,
+    DropStep,
+    FilterStep,
+    MappingStep,
+    Pipeline,
+    ReplacementStep,
+    TransformStep,
+)
 
 
 class ConcreteStep(TransformStep):
@@ -96,3 +104,101 @@ class TestPipeline:
         result = pipeline.execute(sample_dataframe, pipeline_context)
 
         assert all(col.endswith("_only") for col in result.columns)
+
+
+class CountingCopies(TransformStep):
+    """Non-fusable step that records the frames it receives."""
+
+    def __init__(self) -> None:
+        self.seen: list = []
+
+    @property
+    def name(self) -> str:
+        return "CountingCopies"
+
+    def apply(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
+        self.seen.append(df)
+        return df.assign(seen=True)
+
+
+class UpperMappingStep(MappingStep):
+    """Overrides only ``apply`` of a column-local step."""
+
+    def apply(self, df: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
+        result = super().apply(df, context)
+        result.columns = [col.upper() for col in result.columns]
+        return result
+
+
+class TestPipelinePlanner:
+    """Tests for fused execution of column-local steps."""
+
+    @staticmethod
+    def _steps() -> list:
+        return [
+            MappingStep({"old_col": "new_col"}),
+            CalculationStep({"total": lambda df: df["a"] + df["b"]}),
+            ReplacementStep({"status": {"draft": "pending"}}),
+            FilterStep(lambda df: df["total"] > 15),
+            CalculationStep({"double": lambda df: df["total"] * 2}),
+            DropStep(["b"]),
+        ]
+
+    def test_plan_fuses_consecutive_column_local_steps(self) -> None:
+        """In-place steps are grouped; other steps stay on their own."""
+        steps = self._steps()
+        plan = Pipeline(steps).plan()
+
+        assert plan == [tuple(steps[:3]), steps[3], tuple(steps[4:])]
+
+    def test_subclass_overriding_only_apply_is_not_fused(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """The inherited apply_in_place must not bypass an overridden apply."""
+        step = UpperMappingStep({"old_col": "new_col"})
+        calc = CalculationStep({"total": lambda df: df["A"] + df["B"]})
+
+        assert Pipeline([step, calc]).plan() == [step, (calc,)]
+        result = Pipeline([step, calc]).execute(sample_dataframe, pipeline_context)
+        assert "NEW_COL" in result.columns
+        assert "total" in result.columns
+
+    def test_fused_execution_matches_step_by_step(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """Fused execution gives the same frame as applying steps one by one."""
+        original = sample_dataframe.copy()
+        expected = sample_dataframe
+        for step in self._steps():
+            expected = step.apply(expected, pipeline_context)
+
+        pipeline = Pipeline(self._steps())
+        result = pipeline.execute(sample_dataframe, pipeline_context)
+
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(sample_dataframe, original)
+        assert [name for name, _ in pipeline.last_step_timings] == [
+            step.name for step in self._steps()
+        ]
+
+    def test_dead_columns_are_dropped_before_first_step(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """Dead columns never reach the steps and the input keeps them."""
+        step = CountingCopies()
+        pipeline = Pipeline([step], dead_columns=["old_col", "missing"])
+
+        result = pipeline.execute(sample_dataframe, pipeline_context)
+
+        assert "old_col" not in step.seen[0].columns
+        assert "old_col" not in result.columns
+        assert "old_col" in sample_dataframe.columns
+
+    def test_steps_not_declared_pure_get_a_copy_of_the_input(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """The caller's frame is only handed to steps declared pure."""
+        step = CountingCopies()
+        Pipeline([step]).execute(sample_dataframe, pipeline_context)
+
+        assert step.seen[0] is not sample_dataframe
@@ -0,0 +1,97 @@
+"""Tests for opt-in transform pipeline profiling."""
+
+import json
+import tracemalloc
+
+import pandas as pd
+
+from work_data_hub.domain.pipelines.types import PipelineContext
+from work_data_hub.infrastructure.transforms import (
+    CalculationStep,
+    FilterStep,
+    Pipeline,
+    PipelineProfiler,
+    profile_pipelines,
+)
+
+
+def _pipeline(**kwargs) -> Pipeline:
+    return Pipeline(
+        [
+            CalculationStep({"total": lambda df: df["a"] + df["b"]}),
+            FilterStep(lambda df: df["total"] > 15),
+        ],
+        **kwargs,
+    )
+
+
+class TestProfilePipelines:
+    """Tests for the process-wide profiling context manager."""
+
+    def test_records_one_profile_per_step(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """Each step reports timings, row counts and frame size."""
+        with profile_pipelines() as report:
+            result = _pipeline().execute(sample_dataframe, pipeline_context)
+
+        calc, filt = report.steps
+        assert (calc.step, calc.index, calc.fused) == ("CalculationStep", 0, True)
+        assert (filt.step, filt.index, filt.fused) == ("FilterStep", 1, False)
+        assert (calc.rows_in, calc.rows_out) == (3, 3)
+        assert (filt.rows_in, filt.rows_out) == (3, len(result))
+        assert filt.frame_bytes == int(result.memory_usage(deep=True).sum())
+        assert all(p.pipeline == "test_pipeline" for p in report.steps)
+        assert all(p.wall_ms >= 0 and p.peak_memory_bytes >= 0 for p in report.steps)
+        assert not tracemalloc.is_tracing()
+
+    def test_captures_named_step_with_cprofile(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """Only the named step runs under cProfile."""
+        with profile_pipelines(capture_step="FilterStep") as report:
+            _pipeline().execute(sample_dataframe, pipeline_context)
+
+        assert report.capture_step == "FilterStep"
+        assert "function calls" in report.cprofile_stats
+
+    def test_report_is_json_serializable(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """The report round-trips through JSON with per-step entries."""
+        with profile_pipelines() as report:
+            _pipeline().execute(sample_dataframe, pipeline_context)
+
+        payload = json.loads(report.to_json())
+        assert [s["step"] for s in payload["steps"]] == [
+            "CalculationStep",
+            "FilterStep",
+        ]
+        assert payload["cprofile_stats"] is None
+        assert payload["totals"]["wall_ms"] >= 0
+
+    def test_inactive_by_default(
+        self, sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+    ) -> None:
+        """Without a profiler, steps are only timed."""
+        pipeline = _pipeline()
+        with profile_pipelines() as report:
+            pass
+
+        pipeline.execute(sample_dataframe, pipeline_context)
+
+        assert report.steps == []
+        assert len(pipeline.last_step_timings) == 2
+
+
+def test_pipeline_level_profiler(
+    sample_dataframe: pd.DataFrame, pipeline_context: PipelineContext
+) -> None:
+    """A profiler passed to one Pipeline only records that pipeline."""
+    profiler = PipelineProfiler()
+    _pipeline(profiler=profiler).execute(sample_dataframe, pipeline_context)
+    _pipeline().execute(sample_dataframe, pipeline_context)
+
+    report = profiler.stop()
+
+    assert [p.step for p in report.steps] == ["CalculationStep", "FilterStep"]
@@ -1,9 +1,16 @@
 """Tests for standard transformation steps (AC 5.6.2, 5.6.4)."""
 
+from functools import partial
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from work_data_hub.domain.pipelines.types import PipelineContext
+from work_data_hub.infrastructure.cleansing.rules.numeric_rules import (
+    clean_numeric_for_schema,
+    clean_numeric_series_for_schema,
+)
 from work_data_hub.infrastructure.transforms import (
     CalculationStep,
     DropStep,
@@ -11,6 +18,7 @@ from work_data_hub.infrastructure.transforms import (
     MappingStep,
     RenameStep,
     ReplacementStep,
+    coerce_numeric_columns,
 )
 
 
@@ -299,3 +307,68 @@ class TestRenameStep:
         """RenameStep raises ValueError for empty mapping."""
         with pytest.raises(ValueError, match="cannot be empty"):
             RenameStep({})
+
+
+class TestCoerceNumericColumns:
+    """Tests for coerce_numeric_columns with a vectorized series cleaner."""
+
+    @staticmethod
+    def _frame() -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "期末资产规模": ["¥1,234.5", "-", "abc", " 2 000 ", 3, None, "1_000"],
+                "当期收益率": ["5%", "0.035", 350, "１２％", "N/A", np.nan, "x%"],
+                "供款": [1.5, 2.5, np.nan, 4.0, 5.0, 6.0, 7.0],
+            },
+            index=[10, 11, 12, 13, 14, 15, 16],
+        )
+
+    @pytest.mark.parametrize(
+        ("domain", "expected_invalid"),
+        [
+            ("annuity_performance", {"期末资产规模": [12], "当期收益率": [16]}),
+            (
+                "no_such_domain",
+                {"期末资产规模": [10, 11, 12, 13], "当期收益率": [10, 13, 14, 16]},
+            ),
+        ],
+    )
+    def test_series_cleaner_matches_scalar_cleaner(
+        self, domain: str, expected_invalid: dict
+    ) -> None:
+        """Vectorized cleaning gives the same values and invalid rows."""
+        columns = ["期末资产规模", "当期收益率", "供款"]
+        scalar_cleaner = partial(clean_numeric_for_schema, domain=domain)
+
+        expected_df = self._frame()
+        expected = coerce_numeric_columns(expected_df, columns, cleaner=scalar_cleaner)
+        actual_df = self._frame()
+        actual = coerce_numeric_columns(
+            actual_df,
+            columns,
+            cleaner=scalar_cleaner,
+            series_cleaner=partial(clean_numeric_series_for_schema, domain=domain),
+        )
+
+        pd.testing.assert_frame_equal(actual_df, expected_df)
+        assert actual == expected == expected_invalid
+
+    def test_only_undecided_cells_use_scalar_cleaner(self) -> None:
+        """Cells decided by the series cleaner skip the scalar cleaner."""
+        calls = []
+
+        def cleaner(value, column):
+            calls.append(value)
+            raise ValueError("bad")
+
+        def series_cleaner(series, column):
+            return np.array([1.0, np.nan, 3.0]), np.array([True, False, True])
+
+        df = pd.DataFrame({"amount": ["1", "?", "3"]})
+        invalid = coerce_numeric_columns(
+            df, ["amount"], cleaner=cleaner, series_cleaner=series_cleaner
+        )
+
+        assert calls == ["?"]
+        assert invalid == {"amount": [1]}
+        assert df["amount"].tolist()[::2] == [1.0, 3.0]
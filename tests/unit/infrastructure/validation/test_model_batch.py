@@ -0,0 +1,79 @@
+"""Tests for infrastructure.validation.model_batch module."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from work_data_hub.infrastructure.validation import (
+    models_to_dataframe,
+    validate_model_batch,
+)
+
+
+class SampleOut(BaseModel):
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    code: str = Field(..., min_length=1)
+    amount: Optional[float] = Field(None, serialization_alias="金额")
+    note: Optional[str] = None
+
+    @field_validator("amount", mode="before")
+    @classmethod
+    def reject_text(cls, v):
+        if isinstance(v, str):
+            raise ValueError(f"not numeric: {v}")
+        return v
+
+
+@pytest.fixture
+def sample_dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "code": ["A", "", "C", "D"],
+            "amount": [1.5, 2.0, "bad", float("nan")],
+            "extra": ["x", "y", "z", "w"],
+        },
+        index=[10, 11, 12, 13],
+    )
+
+
+class TestValidateModelBatch:
+    def test_splits_valid_and_failed_rows(self, sample_dataframe):
+        batch = validate_model_batch(sample_dataframe, SampleOut, required=["code"])
+
+        assert [r.code for r in batch.records] == ["A", "D"]
+        assert batch.positions.tolist() == [0, 3]
+        assert batch.records[1].amount is None  # NaN becomes None
+        assert batch.failed.index.tolist() == [11, 12]
+        assert batch.failed.loc[11, "error"] == "missing required field"
+        assert "not numeric: bad" in batch.failed.loc[12, "error"]
+
+    def test_missing_required_column_fails_all_rows(self, sample_dataframe):
+        batch = validate_model_batch(sample_dataframe, SampleOut, not_null=["note"])
+
+        assert batch.records == []
+        assert len(batch.failed) == len(sample_dataframe)
+
+    def test_valid_frame_matches_model_dump(self, sample_dataframe):
+        batch = validate_model_batch(sample_dataframe, SampleOut, required=["code"])
+
+        expected = pd.DataFrame(
+            [
+                r.model_dump(mode="json", by_alias=True, exclude_none=True)
+                for r in batch.records
+            ]
+        )
+        pd.testing.assert_frame_equal(batch.valid, expected)
+
+    def test_all_rows_failing_give_empty_valid_frame(self, sample_dataframe):
+        batch = validate_model_batch(sample_dataframe, SampleOut, not_null=["note"])
+
+        assert batch.valid.empty
+        assert batch.failed["error"].eq("missing required field").all()
+
+    def test_empty_records_give_empty_frame(self):
+        assert models_to_dataframe([], SampleOut).empty
@@ -1,5 +1,6 @@
 import sys
 import types
+from contextlib import contextmanager
 
 import pandas as pd
 import pytest
@@ -59,6 +60,67 @@ def test_postgres_fetch_maps_columns_and_incremental(monkeypatch):
     assert "enterprise" in captured["query"]
 
 
+def test_postgres_fetch_batches_uses_named_cursor(monkeypatch):
+    adapter = PostgresSourceAdapter(connection_env_prefix="WDH_LEGACY")
+    cursors = []
+
+    class FakeCursor:
+        def __init__(self, name):
+            self.name = name
+            self.itersize = None
+            self.pages = [
+                [{"plan_code": "A1", "plan_name": "Foo"}] * 2,
+                [{"plan_code": "A2", "plan_name": "Bar"}],
+                [],
+            ]
+            cursors.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, query, params):
+            self.query = query
+
+        def fetchmany(self, size):
+            return self.pages.pop(0)
+
+    class FakeConn:
+        def cursor(self, name=None):
+            return FakeCursor(name)
+
+    @contextmanager
+    def fake_connection():
+        yield FakeConn()
+
+    monkeypatch.setattr(adapter, "get_connection", fake_connection)
+
+    cfg = ReferenceSyncTableConfig(
+        name="plan",
+        target_table="年金计划",
+        source_type="postgres",
+        source_config={
+            "schema": "enterprise",
+            "table": "annuity_plan",
+            "columns": [
+                {"source": "plan_code", "target": "年金计划号"},
+                {"source": "plan_name", "target": "计划名称"},
+            ],
+        },
+        primary_key="年金计划号",
+    )
+
+    chunks = list(adapter.fetch_batches(cfg, batch_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert list(chunks[0].columns) == ["年金计划号", "计划名称"]
+    assert cursors[0].name.startswith("wdh_ref_sync_")
+    assert cursors[0].itersize == 2
+    assert cursors[0].query.endswith('FROM "enterprise"."annuity_plan"')
+
+
 def test_postgres_env_prefix_fallback(monkeypatch):
     # Only legacy prefix provided -> should still be picked up
     # Story 7.1-9: Also set WDH_LEGACY_* to override any existing defaults
@@ -119,6 +181,42 @@ def test_mysql_adapter_wraps_legacy(monkeypatch):
     assert calls["state"] == {"k": "v"}
 
 
+def test_mysql_adapter_streams_through_legacy(monkeypatch):
+    calls = {}
+
+    class FakeLegacy:
+        def __init__(self, **kwargs):
+            pass
+
+        def fetch_batches(self, table_config, state=None, batch_size=5000):
+            calls["args"] = (table_config.name, state, batch_size)
+            yield pd.DataFrame([{"列A": "x"}])
+            yield pd.DataFrame([{"列A": "y"}])
+
+    monkeypatch.setattr(
+        sys.modules["work_data_hub.io.connectors.mysql_source_adapter"],
+        "LegacyMySQLConnector",
+        FakeLegacy,
+    )
+
+    adapter = MySQLSourceAdapter()
+    cfg = ReferenceSyncTableConfig(
+        name="plan",
+        target_table="t",
+        source_type="legacy_mysql",
+        source_config={
+            "table": "legacy_table",
+            "columns": [{"source": "col_a", "target": "列A"}],
+        },
+        primary_key="列A",
+    )
+
+    chunks = list(adapter.fetch_batches(cfg, batch_size=1000))
+
+    assert [chunk["列A"].tolist() for chunk in chunks] == [["x"], ["y"]]
+    assert calls["args"] == ("plan", None, 1000)
+
+
 def test_adapter_factory_creates_and_caches(monkeypatch):
     fake_pg_instances = []
     fake_mysql_instances = []
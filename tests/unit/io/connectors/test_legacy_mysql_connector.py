@@ -200,6 +200,44 @@ class TestLegacyMySQLConnector:
         assert df["计划号"].tolist() == ["A001", "A002", "A003"]
         assert df["计划名称"].tolist() == ["Plan 1", "Plan 2", "Plan 3"]
 
+    @patch("work_data_hub.io.connectors.legacy_mysql_connector.get_settings")
+    @patch.object(LegacyMySQLConnector, "get_connection")
+    def test_fetch_batches_streams_unbuffered_chunks(
+        self,
+        mock_get_connection,
+        mock_get_settings,
+        mock_settings,
+        sample_table_config,
+        sample_mysql_data,
+    ):
+        """Test streaming fetch yields mapped chunks from an SSDictCursor."""
+        mock_get_settings.return_value = mock_settings
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = [
+            sample_mysql_data[:2],
+            sample_mysql_data[2:],
+            [],
+        ]
+        mock_cursor.__enter__ = Mock(return_value=mock_cursor)
+        mock_cursor.__exit__ = Mock(return_value=False)
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_conn.__enter__ = Mock(return_value=mock_conn)
+        mock_conn.__exit__ = Mock(return_value=False)
+
+        mock_get_connection.return_value = mock_conn
+
+        connector = LegacyMySQLConnector()
+        chunks = list(connector.fetch_batches(sample_table_config, batch_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert chunks[1]["计划号"].tolist() == ["A003"]
+        mock_conn.cursor.assert_called_once_with(pymysql.cursors.SSDictCursor)
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.fetchall.assert_not_called()
+
     @patch("work_data_hub.io.connectors.legacy_mysql_connector.get_settings")
     @patch.object(LegacyMySQLConnector, "get_connection")
     def test_fetch_data_empty_result(
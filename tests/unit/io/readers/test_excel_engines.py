@@ -0,0 +1,109 @@
+"""Unit tests for pluggable Excel workbook engines."""
+
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from work_data_hub.io.readers.excel_engines import (
+    calamine_available,
+    open_workbook,
+    resolve_engine,
+)
+from work_data_hub.io.readers.excel_reader import NA_VALUES, ExcelReader
+
+ENGINES = [
+    "openpyxl",
+    "pandas",
+    pytest.param(
+        "calamine",
+        marks=pytest.mark.skipif(
+            not calamine_available(), reason="python-calamine not installed"
+        ),
+    ),
+]
+
+
+@pytest.fixture
+def mixed_types_excel_file(tmp_path) -> Path:
+    """Workbook exercising header quirks, NA markers and mixed cell types."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "规模明细"
+    sheet.append(["月度", "计划代码", None, "金额", "金额", "标志", "日期"])
+    sheet.append([202411, "P1", "x", 1.0, 2.5, True, datetime(2024, 11, 1)])
+    sheet.append([None] * 7)
+    sheet.append(["202411", " ", "N/A", 3, "#DIV/0!", False, datetime(2024, 1, 2)])
+    sheet.append(["NA", "", "null", 1e20, None, None, None])
+    sheet.append([None, "tail"])
+    workbook.create_sheet("Empty")
+
+    path = tmp_path / "mixed.xlsx"
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_matches_pandas_read_excel(mixed_types_excel_file, engine):
+    expected = pd.read_excel(
+        mixed_types_excel_file,
+        sheet_name="规模明细",
+        engine="openpyxl",
+        na_values=NA_VALUES,
+    )
+
+    with open_workbook(mixed_types_excel_file, engine) as workbook:
+        assert workbook.sheet_names == ["规模明细", "Empty"]
+        actual = workbook.read_frame("规模明细", na_values=NA_VALUES)
+        empty = workbook.read_frame("Empty", na_values=NA_VALUES)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert empty.empty
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_nrows_limits_data_rows(mixed_types_excel_file, engine):
+    with open_workbook(mixed_types_excel_file, engine) as workbook:
+        frame = workbook.read_frame("规模明细", na_values=NA_VALUES, nrows=1)
+
+    assert len(frame) == 1
+    assert frame["计划代码"].iloc[0] == "P1"
+
+
+@pytest.mark.unit
+def test_resolve_engine_auto_prefers_calamine():
+    expected = "calamine" if calamine_available() else "openpyxl"
+    assert resolve_engine("auto") == expected
+    assert resolve_engine(None) == expected
+
+
+@pytest.mark.unit
+def test_resolve_engine_rejects_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown Excel engine"):
+        resolve_engine("xlrd")
+
+
+@pytest.mark.unit
+def test_open_workbook_missing_file_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_workbook(tmp_path / "missing.xlsx", "openpyxl")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", ENGINES)
+def test_read_sheet_reports_engine_and_phase_timings(mixed_types_excel_file, engine):
+    result = ExcelReader(engine=engine).read_sheet(mixed_types_excel_file, sheet_name=0)
+
+    assert result.engine == engine
+    assert result.sheet_name == "规模明细"
+    assert set(result.duration_breakdown) >= {
+        "read_ms",
+        "open_ms",
+        "parse_ms",
+        "cleanup_ms",
+        "normalization_ms",
+    }
@@ -5,6 +5,7 @@ This module tests:
 - read_rows() legacy API (max_rows, headers, NaN handling, string cleaning)
 - read_excel_rows() convenience function
 - get_sheet_names() and validate_file() utilities
+- read_excel_sheets_rows() multi-sheet reads
 """
 
 from datetime import datetime
@@ -20,6 +21,7 @@ from work_data_hub.io.readers.excel_reader import (
     ExcelReadError,
     read_excel_rows,
 )
+from work_data_hub.io.readers.multi_sheet_reader import read_excel_sheets_rows
 from work_data_hub.io.connectors.exceptions import DiscoveryError
 
 
@@ -590,3 +592,72 @@ class TestExcelReaderUtilities:
         bad_file.write_text("not excel")
         reader = ExcelReader()
         assert reader.validate_file(str(bad_file)) is False
+
+
+class TestReadExcelSheetsRows:
+    """Test multi-sheet reads through one workbook handle."""
+
+    @pytest.mark.unit
+    def test_matches_per_sheet_reads(self, multi_sheet_excel_file):
+        """Merged rows equal sequential read_excel_rows calls, in sheet order."""
+        sheets = ["Summary", "规模明细"]
+        expected = []
+        for sheet in sheets:
+            expected.extend(read_excel_rows(str(multi_sheet_excel_file), sheet=sheet))
+
+        result = read_excel_sheets_rows(
+            [str(multi_sheet_excel_file)], sheets, use_read_cache=False
+        )
+
+        assert result.rows == expected
+        assert [stats.sheet for stats in result.sheets] == sheets
+        assert [stats.row_count for stats in result.sheets] == [2, 3]
+        assert all(stats.error is None for stats in result.sheets)
+        assert result.workers == 1
+
+    @pytest.mark.unit
+    def test_opens_workbook_once(self, multi_sheet_excel_file):
+        """All requested sheets are parsed from a single workbook handle."""
+        from work_data_hub.io.readers import excel_reader
+
+        with patch.object(
+            excel_reader, "open_workbook", wraps=excel_reader.open_workbook
+        ) as opener:
+            ExcelReader().read_sheet_frames(
+                str(multi_sheet_excel_file), ["规模明细", "Summary", 2]
+            )
+
+        assert opener.call_count == 1
+
+    @pytest.mark.unit
+    def test_failed_sheet_is_reported_and_skipped(self, multi_sheet_excel_file):
+        """A missing sheet does not abort the other sheets."""
+        result = read_excel_sheets_rows(
+            [str(multi_sheet_excel_file)], ["Missing", "Notes"], use_read_cache=False
+        )
+
+        assert len(result.rows) == 1
+        assert "not found" in result.sheets[0].error
+        assert result.sheets[1].row_count == 1
+
+    @pytest.mark.unit
+    def test_process_pool_matches_in_process_read(
+        self, multi_sheet_excel_file, tmp_path
+    ):
+        """Fan-out across worker processes keeps rows and order identical."""
+        from work_data_hub.io.readers import multi_sheet_reader
+
+        second_file = tmp_path / "second.xlsx"
+        second_file.write_bytes(multi_sheet_excel_file.read_bytes())
+        files = [str(multi_sheet_excel_file), str(second_file)]
+        sheets = ["规模明细", "Summary", "Notes"]
+        serial = read_excel_sheets_rows(files, sheets, use_read_cache=False)
+        with patch.object(multi_sheet_reader, "PARALLEL_READ_MIN_BYTES", 0):
+            parallel = read_excel_sheets_rows(
+                files, sheets, use_read_cache=False, max_workers=4
+            )
+
+        # One worker per file, each reading all sheets of its workbook
+        assert parallel.workers == 2
+        assert parallel.rows == serial.rows
+        assert [s.row_count for s in parallel.sheets] == [3, 2, 1, 3, 2, 1]
@@ -0,0 +1,254 @@
+"""Unit tests for the content-keyed parsed-sheet cache."""
+
+import os
+from datetime import datetime, time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from work_data_hub.io.readers.excel_reader import ExcelReader, read_excel_rows
+from work_data_hub.io.readers.read_cache import (
+    ParsedSheetCache,
+    UnsupportedFrameError,
+    build_read_cache,
+    frame_to_table,
+    table_to_frame,
+)
+
+
+def _write_workbook(path: Path, rows) -> Path:
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "规模明细"
+    for row in rows:
+        sheet.append(row)
+    workbook.create_sheet("其他")
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture
+def workbook_file(tmp_path) -> Path:
+    return _write_workbook(
+        tmp_path / "annuity.xlsx",
+        [
+            ["月度", "计划代码", "客户名称", "期末资产规模"],
+            [202411, "P0001", "公司A", 1000.5],
+            ["202411", "P0002", None, 2000],
+            [None, "P0003", "公司C", None],
+        ],
+    )
+
+
+@pytest.fixture
+def cache(tmp_path) -> ParsedSheetCache:
+    return ParsedSheetCache(tmp_path / "cache")
+
+
+@pytest.mark.unit
+def test_codec_round_trips_mixed_object_columns():
+    df = pd.DataFrame(
+        {
+            "mixed": [202411, "202411", np.nan, None, True, 1.5],
+            "strings": ["a", np.nan, "b", "c", "d", "e"],
+            "stamps": [pd.Timestamp("2024-11-01")] * 5 + [datetime(2024, 1, 2)],
+            "times": [time(8, 30), None, None, None, None, None],
+            "ints": np.arange(6, dtype="int64"),
+            "floats": [1.0, np.nan, 3.0, 4.0, 5.0, 6.0],
+            "flags": [True, False, True, False, True, False],
+            "dates": pd.to_datetime(["2024-01-01"] * 6),
+        }
+    )
+    df.columns = ["mixed", "strings", "stamps", "times", 2024, "floats", "f", "d"]
+
+    restored = table_to_frame(frame_to_table(df))
+
+    pd.testing.assert_frame_equal(restored, df)
+    assert restored["mixed"].iloc[2] is not None  # NaN stays NaN
+    assert restored["mixed"].iloc[3] is None
+    assert isinstance(restored["mixed"].iloc[0], int)
+    assert isinstance(restored["mixed"].iloc[1], str)
+
+
+@pytest.mark.unit
+def test_codec_rejects_unsupported_cells():
+    with pytest.raises(UnsupportedFrameError):
+        frame_to_table(pd.DataFrame({"a": [object()]}))
+    with pytest.raises(UnsupportedFrameError):
+        frame_to_table(pd.DataFrame({"a": [1]}, index=[5]))
+
+
+@pytest.mark.unit
+def test_read_sheet_second_read_hits_cache(workbook_file, cache):
+    reader = ExcelReader(engine="openpyxl", read_cache=cache)
+
+    first = reader.read_sheet(workbook_file, sheet_name="规模明细")
+    with patch("work_data_hub.io.readers.excel_reader.open_workbook") as opener:
+        second = reader.read_sheet(workbook_file, sheet_name=0)
+        opener.assert_not_called()
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.sheet_name == "规模明细"
+    pd.testing.assert_frame_equal(second.df, first.df)
+    assert cache.stats.hits == 1
+    assert cache.stats.stores == 1
+
+
+@pytest.mark.unit
+def test_cached_sheet_names_still_reject_unknown_sheet(workbook_file, cache):
+    from work_data_hub.io.connectors.exceptions import DiscoveryError
+
+    reader = ExcelReader(engine="openpyxl", read_cache=cache)
+    reader.read_sheet(workbook_file, sheet_name=0)
+
+    with pytest.raises(DiscoveryError, match="not found"):
+        reader.read_sheet(workbook_file, sheet_name="missing")
+
+
+@pytest.mark.unit
+def test_cache_is_keyed_by_content_not_path(workbook_file, cache, tmp_path):
+    ExcelReader(read_cache=cache).read_sheet(workbook_file, sheet_name=0)
+
+    copy_path = tmp_path / "copy.xlsx"
+    copy_path.write_bytes(workbook_file.read_bytes())
+    assert ExcelReader(read_cache=cache).read_sheet(copy_path, 0).from_cache
+
+    modified = _write_workbook(
+        tmp_path / "annuity.xlsx", [["月度", "计划代码"], [202412, "P9"]]
+    )
+    stat = modified.stat()
+    os.utime(modified, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    result = ExcelReader(read_cache=cache).read_sheet(modified, 0)
+
+    assert not result.from_cache
+    assert result.df["计划代码"].tolist() == ["P9"]
+
+
+@pytest.mark.unit
+def test_cache_is_keyed_by_engine(workbook_file, cache):
+    ExcelReader(engine="openpyxl", read_cache=cache).read_sheet(workbook_file, 0)
+
+    result = ExcelReader(engine="pandas", read_cache=cache).read_sheet(workbook_file, 0)
+
+    assert not result.from_cache
+    assert result.engine == "pandas"
+    assert cache.stats.stores == 2
+
+
+@pytest.mark.unit
+def test_read_rows_uses_cache(workbook_file, cache):
+    reader = ExcelReader(read_cache=cache)
+    expected = reader.read_rows(str(workbook_file))
+
+    with patch("pandas.read_excel") as read_excel:
+        rows = reader.read_rows(str(workbook_file))
+        read_excel.assert_not_called()
+
+    assert rows == expected
+
+
+@pytest.mark.unit
+def test_read_sheet_frames_keeps_its_own_entries(workbook_file, cache):
+    reader = ExcelReader(engine="openpyxl", read_cache=cache)
+    reader.read_rows(str(workbook_file))
+
+    [(first, _)] = reader.read_sheet_frames(str(workbook_file), [0])
+    [(second, _)] = reader.read_sheet_frames(str(workbook_file), [0])
+    [(other_engine, _)] = ExcelReader(
+        engine="pandas", read_cache=cache
+    ).read_sheet_frames(str(workbook_file), [0])
+
+    assert not first.from_cache
+    assert second.from_cache
+    assert not other_engine.from_cache
+
+
+@pytest.mark.unit
+def test_read_excel_rows_honours_settings(workbook_file, tmp_path):
+    settings = SimpleNamespace(
+        read_cache_enabled=True,
+        read_cache_dir=str(tmp_path / "settings_cache"),
+        read_cache_max_mb=16,
+    )
+    with patch("work_data_hub.config.settings.get_settings", return_value=settings):
+        read_excel_rows(str(workbook_file))
+        assert any((tmp_path / "settings_cache").glob("*.arrow"))
+
+        with patch("pandas.read_excel", side_effect=AssertionError) as read_excel:
+            read_excel_rows(str(workbook_file))
+            read_excel.assert_not_called()
+
+        with patch("pandas.read_excel", wraps=pd.read_excel) as read_excel:
+            read_excel_rows(str(workbook_file), use_read_cache=False)
+            read_excel.assert_called_once()
+
+
+@pytest.mark.unit
+def test_build_read_cache_disabled_or_unconfigured():
+    assert build_read_cache(SimpleNamespace(read_cache_enabled=False)) is None
+    assert build_read_cache(SimpleNamespace(read_cache_enabled=True)) is None
+
+
+@pytest.mark.unit
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = ParsedSheetCache(tmp_path / "cache", max_bytes=10**9)
+    frame = pd.DataFrame({"value": np.arange(50_000, dtype="int64")})
+    entries = {}
+    for index in range(3):
+        source = tmp_path / f"source_{index}.bin"
+        source.write_bytes(f"workbook-{index}".encode())
+        assert cache.put(source, {"sheet": 0}, frame)
+        key = cache.entry_key(cache.content_digest(source), {"sheet": 0})
+        entries[source] = tmp_path / "cache" / f"{key}.arrow"
+        os.utime(entries[source], (1_000 + index, 1_000 + index))
+
+    sources = list(entries)
+    # A hit on the oldest entry makes it the most recently used one
+    assert cache.get(sources[0], {"sheet": 0}) is not None
+
+    cache.max_bytes = entries[sources[0]].stat().st_size * 2 + 4096
+    cache.evict()
+
+    assert entries[sources[0]].exists()
+    assert not entries[sources[1]].exists()
+    assert entries[sources[2]].exists()
+    assert cache.stats.evictions >= 1
+
+
+@pytest.mark.unit
+def test_missing_file_bypasses_cache(cache, tmp_path):
+    missing = tmp_path / "missing.xlsx"
+
+    assert cache.get(missing, {}) is None
+    assert cache.get_sheet_names(missing) is None
+    assert cache.stats.errors == 0
+
+
+@pytest.mark.unit
+def test_read_cache_is_off_by_default():
+    from work_data_hub.config.settings import Settings
+
+    assert Settings.model_fields["read_cache_enabled"].default is False
+
+
+@pytest.mark.unit
+def test_file_discovery_service_honours_use_read_cache(tmp_path):
+    from work_data_hub.io.connectors.discovery import FileDiscoveryService
+
+    settings = SimpleNamespace(
+        read_cache_enabled=True,
+        read_cache_dir=str(tmp_path / "settings_cache"),
+        read_cache_max_mb=16,
+    )
+
+    cached = FileDiscoveryService(settings=settings)
+    uncached = FileDiscoveryService(settings=settings, use_read_cache=False)
+
+    assert isinstance(cached.excel_reader.read_cache, ParsedSheetCache)
+    assert uncached.excel_reader.read_cache is None
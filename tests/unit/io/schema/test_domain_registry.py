@@ -301,3 +301,54 @@ class TestBronzeGoldConfiguration:
         assert len(schema.bronze_required) > 0
         assert "月度" in schema.bronze_required
         assert "固费" in schema.bronze_required
+
+
+class TestMonthPartitionedDdl:
+    """Test range partitioning of fact tables by 月度."""
+
+    def test_fact_tables_are_partitioned_by_month(self) -> None:
+        """Fact tables should be partitioned with the month in the PK."""
+        from work_data_hub.infrastructure.schema.ddl_generator import (
+            generate_create_table_ddl,
+        )
+
+        for domain_name in ("annuity_performance", "annuity_income"):
+            ddl = generate_create_table_ddl(domain_name)
+            assert ddl.endswith(') PARTITION BY RANGE ("月度");')
+            assert 'PRIMARY KEY ("id", "月度")' in ddl
+            assert "IDENTITY PRIMARY KEY" not in ddl
+
+    def test_mapping_tables_stay_unpartitioned(self) -> None:
+        """Tables without partition_column keep their inline primary key."""
+        from work_data_hub.infrastructure.schema.ddl_generator import (
+            generate_create_table_ddl,
+            generate_partitions_ddl,
+        )
+
+        ddl = generate_create_table_ddl("annuity_plans")
+        assert "PARTITION BY" not in ddl
+        assert "NOT NULL PRIMARY KEY" in ddl
+        assert generate_partitions_ddl("annuity_plans") == []
+
+    def test_partition_ddl(self) -> None:
+        """DEFAULT and month partitions use the loader's naming."""
+        import datetime as dt
+
+        from work_data_hub.infrastructure.schema.ddl_generator import (
+            generate_month_partition_ddl,
+            generate_partitions_ddl,
+        )
+
+        assert generate_partitions_ddl("annuity_performance") == [
+            'CREATE TABLE IF NOT EXISTS business."规模明细_default" '
+            'PARTITION OF business."规模明细" DEFAULT;'
+        ]
+        assert generate_month_partition_ddl(
+            "annuity_performance", dt.date(2024, 12, 15)
+        ) == (
+            'CREATE TABLE IF NOT EXISTS business."规模明细_202412" '
+            'PARTITION OF business."规模明细" '
+            "FOR VALUES FROM ('2024-12-01') TO ('2025-01-01');"
+        )
+        with pytest.raises(ValueError):
+            generate_month_partition_ddl("annuity_plans", dt.date(2024, 1, 1))
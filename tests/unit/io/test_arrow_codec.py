@@ -0,0 +1,109 @@
+"""Unit tests for the lossless pandas / row-dict <-> Arrow codec."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from work_data_hub.io.arrow_codec import (
+    UnsupportedFrameError,
+    decode_cell,
+    encode_cell,
+    frame_to_table,
+    records_to_table,
+    table_to_frame,
+    table_to_records,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        "202411",
+        202411,
+        1.5,
+        float("nan"),
+        True,
+        Decimal("1.50"),
+        date(2024, 11, 1),
+        datetime(2024, 11, 1, 8, 30),
+        pd.Timestamp("2024-11-01 00:00:00.000000001"),
+        pd.Timedelta(days=1),
+    ],
+)
+def test_cell_round_trip_keeps_type_and_value(value):
+    decoded = decode_cell(encode_cell(value))
+
+    assert type(decoded) is type(value)
+    if isinstance(value, float) and np.isnan(value):
+        assert np.isnan(decoded)
+    else:
+        assert decoded == value
+        assert str(decoded) == str(value)
+
+
+@pytest.mark.unit
+def test_frame_round_trip_with_custom_index():
+    df = pd.DataFrame(
+        {"amount": [1.0, 2.0, np.nan], "code": ["A", np.nan, 3]},
+        index=pd.Index([10, 20, 30], name="row"),
+    )
+
+    restored = table_to_frame(frame_to_table(df, preserve_index=True))
+
+    pd.testing.assert_frame_equal(restored, df)
+    with pytest.raises(UnsupportedFrameError):
+        frame_to_table(df)
+
+
+@pytest.mark.unit
+def test_records_round_trip_is_exact():
+    records = [
+        {
+            "月度": date(2024, 11, 1),
+            "计划代码": "P0001",
+            "期末资产规模": Decimal("1050000.00"),
+            "当期收益率": 0.055,
+            "company_id": None,
+            "mixed": 202411,
+        },
+        {
+            "月度": date(2024, 11, 1),
+            "计划代码": "P0002",
+            "期末资产规模": Decimal("20.5"),
+            "当期收益率": float("nan"),
+            "company_id": "614810477",
+            "mixed": "202411",
+        },
+        {"计划代码": "P0003", "extra": True},
+    ]
+
+    table = records_to_table(records)
+    restored = table_to_records(table)
+
+    assert len(restored) == 3
+    assert restored[0] == records[0]
+    assert restored[2] == records[2]
+    assert "月度" not in restored[2]
+    assert str(restored[1]["期末资产规模"]) == "20.5"
+    assert np.isnan(restored[1]["当期收益率"])
+    assert type(restored[1]["mixed"]) is str
+    # Homogeneous columns stay native Arrow types
+    assert str(table.schema.field("c1").type) == "string"
+    assert str(table.schema.field("c0").type) == "date32[day]"
+
+
+@pytest.mark.unit
+def test_records_round_trip_handles_empty_and_huge_ints():
+    assert table_to_records(records_to_table([{}, {}])) == [{}, {}]
+    records = [{"big": 2**70}, {"big": 1}]
+    assert table_to_records(records_to_table(records)) == records
+
+
+@pytest.mark.unit
+def test_unsupported_values_are_rejected():
+    with pytest.raises(UnsupportedFrameError):
+        records_to_table([{"value": object()}, {"value": 1}])
@@ -0,0 +1,121 @@
+"""Unit tests for the Arrow-backed Dagster IO manager."""
+
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from dagster import DagsterInstance, job, op
+
+from work_data_hub.orchestration.io_managers import (
+    ArrowIOManagerFactory,
+    adapt_to_type,
+)
+from work_data_hub.orchestration.jobs import generic_domain_job
+
+ROWS = [
+    {"计划代码": "P0001", "期末资产规模": Decimal("100.50"), "客户名称": "公司A"},
+    {"计划代码": "P0002", "期末资产规模": Decimal("7"), "客户名称": None},
+]
+
+
+@op
+def emit_rows() -> List[Dict[str, Any]]:
+    return [dict(row) for row in ROWS]
+
+
+@op
+def rows_to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    assert rows == ROWS
+    return pd.DataFrame(rows)
+
+
+@op
+def frame_as_rows(rows: List[Dict[str, Any]]) -> List[str]:
+    # Upstream produced a DataFrame; the IO manager adapts it to row dicts
+    assert isinstance(rows, list)
+    return [row["计划代码"] for row in rows]
+
+
+@op
+def rows_as_frame(frame: pd.DataFrame) -> int:
+    assert isinstance(frame, pd.DataFrame)
+    return len(frame)
+
+
+def _build_job(base_dir: str):
+    @job(resource_defs={"io_manager": ArrowIOManagerFactory(base_dir=base_dir)})
+    def arrow_job():
+        rows = emit_rows()
+        frame = rows_to_frame(rows)
+        frame_as_rows(frame)
+        rows_as_frame(rows)
+
+    return arrow_job
+
+
+@pytest.mark.unit
+def test_ops_exchange_rows_and_frames_through_arrow(tmp_path):
+    result = _build_job(str(tmp_path)).execute_in_process()
+
+    assert result.success
+    assert result.output_for_node("frame_as_rows") == ["P0001", "P0002"]
+    assert result.output_for_node("rows_as_frame") == 2
+
+    stored = {path.suffix for path in tmp_path.rglob("*") if path.is_file()}
+    # Row lists and frames as Arrow IPC; the List[str]/int outputs as pickle
+    assert stored == {".arrow", ".pkl"}
+    assert len(list(tmp_path.rglob("emit_rows/result.arrow"))) == 1
+
+
+@pytest.mark.unit
+def test_adapt_to_type_converts_between_shapes():
+    frame = pd.DataFrame({"a": [1, 2]})
+
+    assert adapt_to_type(frame, List[Dict[str, Any]]) == [{"a": 1}, {"a": 2}]
+    assert isinstance(adapt_to_type([{"a": 1}], pd.DataFrame), pd.DataFrame)
+    assert isinstance(adapt_to_type(frame, pa.Table), pa.Table)
+    assert adapt_to_type(frame, Any) is frame
+
+
+@pytest.mark.unit
+def test_cli_domain_job_keeps_op_outputs_in_memory(tmp_path):
+    """execute_in_process (the CLI path) writes no files at op boundaries."""
+    source = tmp_path / "rows.csv"
+    pd.DataFrame(ROWS).to_csv(source, index=False)
+    storage = tmp_path / "dagster"
+
+    result = generic_domain_job.execute_in_process(
+        run_config={
+            "ops": {
+                "discover_files_op": {
+                    "config": {
+                        "domain": "annuity_performance",
+                        "file_path": str(source),
+                    }
+                },
+                "read_data_op": {
+                    "config": {"domain": "annuity_performance", "use_read_cache": False}
+                },
+            }
+        },
+        op_selection=["discover_files_op", "read_data_op"],
+        instance=DagsterInstance.ephemeral(tempdir=str(storage)),
+    )
+
+    assert result.success
+    assert len(result.output_for_node("read_data_op")) == len(ROWS)
+    assert [path for path in storage.rglob("*") if path.is_file()] == []
+
+
+@pytest.mark.unit
+def test_deployed_definitions_bind_arrow_io_manager():
+    from work_data_hub.orchestration.repository import defs
+
+    job_def = defs.get_job_def(generic_domain_job.name)
+
+    io_manager = job_def.resource_defs["io_manager"]
+    assert getattr(io_manager, "configurable_resource_cls", None) is (
+        ArrowIOManagerFactory
+    )
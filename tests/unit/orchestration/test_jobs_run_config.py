@@ -108,3 +108,24 @@ def test_build_run_config_enrichment_sync_budget_defaults_zero():
     run_config = build_run_config(args, domain="annuity_performance")
     op_cfg = run_config["ops"]["process_domain_op_v2"]["config"]
     assert op_cfg["enrichment_sync_budget"] == 0
+
+
+def test_build_run_config_no_read_cache_reaches_discovery_and_read():
+    """--no-read-cache disables the parsed-sheet cache for both file ops."""
+    args = SimpleNamespace(
+        mode="delete_insert",
+        plan_only=True,
+        execute=False,
+        sheet=0,
+        max_files=1,
+        pk=None,
+        backfill_refs=None,
+        backfill_mode="insert_missing",
+        no_read_cache=True,
+    )
+
+    run_config = build_run_config(args, domain="annuity_performance")
+
+    ops = run_config["ops"]
+    assert ops["discover_files_op"]["config"]["use_read_cache"] is False
+    assert ops["read_data_op"]["config"]["use_read_cache"] is False
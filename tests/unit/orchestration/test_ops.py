@@ -538,6 +538,7 @@ class TestLoadOp:
                         mode="delete_insert",
                         pk=["id"],
                         conn=mock_conn,
+                        load_method="values",
                     )
 
                     # Verify connection cleanup
@@ -812,6 +813,7 @@ class TestLoadOpConnectionLifecycle:
                         mode="delete_insert",
                         pk=["id"],
                         conn=mock_conn,
+                        load_method="values",
                     )
 
                     # Verify connection cleanup in finally block
@@ -960,6 +962,7 @@ class TestLoadOpConnectionLifecycle:
                         mode="delete_insert",
                         pk=["id"],
                         conn=mock_conn,
+                        load_method="values",
                     )
 
     def test_load_op_plan_only_mode_no_connection_created(self):
@@ -997,6 +1000,7 @@ class TestLoadOpConnectionLifecycle:
                     mode="delete_insert",
                     pk=["id"],
                     conn=None,
+                    load_method="values",
                 )
                 assert result == mock_result
 
@@ -1087,6 +1091,7 @@ class TestLoadOpConnectionLifecycle:
                         mode="delete_insert",
                         pk=["id"],
                         conn=mock_conn,
+                        load_method="values",
                     )
 
                     # Verify connection cleanup
@@ -3,10 +3,15 @@ Tests for unified date parsing utilities.
 """
 
 import pytest
-from datetime import date
+from datetime import date, datetime
+
+import pandas as pd
 
 from src.work_data_hub.utils.date_parser import (
+    parse_bronze_dates,
     parse_chinese_date,
+    parse_chinese_date_series,
+    parse_date_series,
     parse_yyyymm_or_chinese,
     extract_year_month_from_date,
     format_date_as_chinese,
@@ -234,3 +239,73 @@ class TestParseYYYYMMOrChinese:
 
     def test_fullwidth_digit_normalization(self):
         assert _normalize_fullwidth_digits("０１２３４５６７８９") == "0123456789"
+
+
+class TestParseDateSeries:
+    """Test the column-level parser against the scalar parser."""
+
+    VALUES = [
+        202411,
+        "202411",
+        "20241115",
+        "2024-11",
+        "2024-11-15",
+        "2024年11月",
+        "２０２４年１１月",
+        "2024年11月15日",
+        "24年11月",
+        datetime(2024, 11, 15, 8, 30),
+        date(2024, 11, 1),
+        "202413",
+        "1999-01",
+        "invalid",
+        202411.0,
+        None,
+        "   ",
+    ]
+
+    def test_matches_scalar_parser(self):
+        series = pd.Series(self.VALUES, index=range(100, 100 + len(self.VALUES)))
+
+        parsed, invalid = parse_date_series(series)
+
+        assert parsed.tolist() == [parse_chinese_date(v) for v in self.VALUES]
+        assert parsed.index.equals(series.index)
+        assert invalid == [111, 112, 113, 114]
+
+    def test_blank_strings_parse_to_none(self):
+        series = pd.Series(["", "   ", "202411"])
+
+        parsed, invalid = parse_date_series(series)
+
+        assert parsed.iloc[0] is None
+        assert parsed.iloc[1] is None
+        assert parsed.iloc[2] == date(2024, 11, 1)
+        assert invalid == []
+
+    def test_out_of_range_values_parse_to_none(self):
+        series = pd.Series([datetime(1999, 1, 1), "1999-01", 202411])
+
+        parsed, invalid = parse_date_series(series)
+
+        assert parsed.iloc[0] is None
+        assert parsed.iloc[1] is None
+        assert parsed.iloc[2] == date(2024, 11, 1)
+        assert invalid == [0, 1]
+
+    def test_repeated_values_share_result(self):
+        series = pd.Series(["2024年11月"] * 3 + [202410] * 2)
+
+        assert (
+            parse_chinese_date_series(series).tolist()
+            == [date(2024, 11, 1)] * 3 + [date(2024, 10, 1)] * 2
+        )
+
+    def test_nan_counts_as_invalid_for_bronze(self):
+        series = pd.Series(["202411", float("nan"), None])
+
+        parsed, invalid = parse_bronze_dates(series)
+
+        assert parsed.iloc[0] == pd.Timestamp(2024, 11, 1)
+        assert parsed.iloc[1:].isna().all()
+        assert invalid == [1]